@@ -0,0 +1,102 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Measures CPU time and memory of a whole process tree (Python plus child
+processes such as Chromium) using /proc, so no extra dependencies are needed.
+"""
+import asyncio
+import os
+import time
+from typing import Dict, List, Tuple
+
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+
+def _process_table() -> Tuple[Dict[int, List[int]], Dict[int, Tuple[int, int]]]:
+    """Read (children by ppid, (cpu ticks, rss pages) by pid) from /proc."""
+    children: Dict[int, List[int]] = {}
+    stats: Dict[int, Tuple[int, int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        pid = int(entry)
+        children.setdefault(int(fields[1]), []).append(pid)
+        # utime + stime, rss
+        stats[pid] = (int(fields[11]) + int(fields[12]), int(fields[21]))
+    return children, stats
+
+
+def _tree(root_pid: int, children: Dict[int, List[int]]) -> List[int]:
+    """List a process and all its descendants."""
+    pids = []
+    stack = [root_pid]
+    while stack:
+        pid = stack.pop()
+        pids.append(pid)
+        stack.extend(children.get(pid, []))
+    return pids
+
+
+def process_tree_cpu_seconds(root_pid: int) -> float:
+    """Sum user+system CPU time of a process and all its descendants."""
+    children, stats = _process_table()
+    ticks = sum(stats.get(pid, (0, 0))[0] for pid in _tree(root_pid, children))
+    return ticks / CLOCK_TICKS
+
+
+def process_tree_rss_mb(root_pid: int) -> float:
+    """Sum resident memory of a process and all its descendants in MiB."""
+    children, stats = _process_table()
+    pages = sum(stats.get(pid, (0, 0))[1] for pid in _tree(root_pid, children))
+    return pages * PAGE_SIZE / (1024 * 1024)
+
+
+async def measure_cpu(duration: float, root_pid: int = None) -> float:
+    """Return CPU usage of the process tree in percent of one core."""
+    pid = root_pid or os.getpid()
+    cpu_start = process_tree_cpu_seconds(pid)
+    wall_start = time.monotonic()
+    await asyncio.sleep(duration)
+    cpu = process_tree_cpu_seconds(pid) - cpu_start
+    wall = time.monotonic() - wall_start
+    return cpu / wall * 100
+
+
+class LoopLagProbe:
+    """Measures event loop scheduling lag with a periodic sleep."""
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.samples: List[float] = []
+        self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - expected) * 1000)
+
+    def start(self):
+        self.samples = []
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> Dict[str, float]:
+        """Stop probing and return lag statistics in milliseconds."""
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        samples = sorted(self.samples) or [0.0]
+        return {
+            "mean_ms": sum(samples) / len(samples),
+            "p99_ms": samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+            "max_ms": samples[-1],
+        }
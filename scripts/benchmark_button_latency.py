@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Measure button-to-LED latency while the browser is under heavy load.
+
+Simulates GPIO button presses the way gpiozero delivers them (from a
+separate thread into the asyncio loop) and measures the time until the LED
+state is set, in three scenarios:
+
+    idle        no browser load (baseline)
+    inprocess   BrowserController on the orchestrator loop, under load
+    worker      BrowserWorkerClient (browser in a worker process), under load
+
+The load is a loop of full-page screenshots and large page.evaluate()
+payloads on a heavy page.
+
+Usage:
+    python scripts/benchmark_button_latency.py
+    python scripts/benchmark_button_latency.py --duration 30 --payload-mb 8
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.orchestrator.browser_controller import BrowserController
+from src.orchestrator.browser_worker import BrowserWorkerClient
+from src.orchestrator.gpio_handler import GPIOHandler, LEDState
+from src.utils.config import load_config
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger("benchmark_button_latency", level="INFO")
+
+# Large DOM so screenshots and layout are expensive
+HEAVY_PAGE = (
+    "data:text/html,<script>for(let i=0;i<3000;i++){document.write("
+    "'<p style=\"background:hsl('+i+',80%,60%)\">row '+i+'</p>')}</script>"
+)
+
+
+async def run_presses(gpio: GPIOHandler, duration: float, interval: float = 0.1) -> list:
+    """Press the (simulated) button from another thread and collect latencies."""
+    loop = asyncio.get_running_loop()
+    latencies = []
+    stop = threading.Event()
+    states = [LEDState.YELLOW, LEDState.GREEN]
+
+    def on_press(pressed_at: float, state: LEDState):
+        gpio.set_led_state(state)
+        latencies.append((time.perf_counter() - pressed_at) * 1000)
+
+    def presser():
+        i = 0
+        while not stop.is_set():
+            loop.call_soon_threadsafe(on_press, time.perf_counter(), states[i % 2])
+            i += 1
+            time.sleep(interval)
+
+    thread = threading.Thread(target=presser, daemon=True)
+    thread.start()
+    await asyncio.sleep(duration)
+    stop.set()
+    thread.join()
+    await asyncio.sleep(interval)
+    return latencies
+
+
+async def browser_load(browser, payload_mb: float, stop: asyncio.Event):
+    """Keep the browser busy with screenshots and large evaluate payloads."""
+    shot = str(Path(tempfile.gettempdir()) / "raspberrymeet-latency.png")
+    expression = f"() => 'x'.repeat({int(payload_mb * 1024 * 1024)})"
+    while not stop.is_set():
+        await browser.screenshot(path=shot, full_page=True)
+        await browser.evaluate(expression)
+
+
+async def scenario(name: str, browser, gpio: GPIOHandler, args) -> list:
+    """Run one scenario and return press latencies in milliseconds."""
+    stop = asyncio.Event()
+    load_task = None
+
+    if browser:
+        await browser.start()
+        await browser.evaluate(f"() => {{ location.href = {HEAVY_PAGE!r}; }}")
+        await asyncio.sleep(2)
+        load_task = asyncio.create_task(browser_load(browser, args.payload_mb, stop))
+
+    logger.info(f"Scenario '{name}': measuring for {args.duration:.0f}s...")
+    try:
+        return await run_presses(gpio, args.duration)
+    finally:
+        stop.set()
+        if load_task:
+            try:
+                await load_task
+            except Exception as e:
+                logger.warning(f"Load task ended with: {e}")
+        if browser:
+            await browser.cleanup()
+
+
+def summarize(latencies: list) -> str:
+    """Format p50/p99/max of a latency list."""
+    if not latencies:
+        return "no samples"
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return (
+        f"p50 {statistics.median(ordered):7.2f} ms   "
+        f"p99 {p99:7.2f} ms   max {ordered[-1]:7.2f} ms   (n={len(ordered)})"
+    )
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--duration", type=float, default=20, help="Seconds per scenario")
+    parser.add_argument("--payload-mb", type=float, default=4, help="page.evaluate payload size")
+    parser.add_argument("--headed", action="store_true", help="Show the browser window")
+    args = parser.parse_args()
+
+    config = load_config()
+    gpio = GPIOHandler(config.gpio)
+    headless = not args.headed
+
+    results = {
+        "idle": await scenario("idle", None, gpio, args),
+        "inprocess": await scenario(
+            "inprocess",
+            BrowserController(config.bbb, headless=headless, kiosk_mode=False),
+            gpio, args,
+        ),
+        "worker": await scenario(
+            "worker",
+            BrowserWorkerClient(config.bbb, headless=headless, kiosk_mode=False),
+            gpio, args,
+        ),
+    }
+
+    print("\n" + "=" * 72)
+    print("  Button-to-LED latency under browser load")
+    print("=" * 72)
+    for name, latencies in results.items():
+        print(f"  {name:<10} {summarize(latencies)}")
+    print("=" * 72)
+
+    gpio.cleanup()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Compare CalDAV sync latency and connection reuse of the two transports.
+
+Runs the incremental sync engine (CalDAVClient.sync_events) with the
+caldav library transport and with the native asyncio httpx transport and
+reports sync latency, requests, new connections and TLS handshakes. As a
+baseline the original client path is measured too: a date search with
+server-side expansion (calendar.date_search(expand=True)) on every sync.
+The baseline only fetches the next 24 hours, the sync engine mirrors the
+whole collection into its event store, so their bytes and full-sync times
+cover different amounts of data.
+
+Without --calendar-url a local mock CalDAV server with synthetic events is
+started. It serves plain HTTP unless --https is given, which uses a
+self-signed certificate (created with the openssl CLI, not verified by the
+clients) so TLS handshakes and connection reuse are measured as well. For
+representative numbers point it at the real server:
+
+Usage:
+    python scripts/benchmark_caldav_transport.py
+    python scripts/benchmark_caldav_transport.py --https --events 1000 --rounds 20
+    python scripts/benchmark_caldav_transport.py \\
+        --calendar-url https://nextcloud.example.eu/remote.php/dav/calendars/room-1/meetings/ \\
+        --username room-1@example.eu --password app-token
+"""
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import caldav
+import urllib3
+import urllib3.connection
+import urllib3.connectionpool
+
+from mock_caldav_server import (
+    MockCalDAVServer,
+    generate_calendar,
+    generate_event,
+    generate_self_signed_cert,
+)
+from src.orchestrator.caldav_transport import CaldavLibTransport, create_caldav_transport
+from src.orchestrator.calendar_sync import CalDAVClient
+from src.orchestrator.event_store import EventStore
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger("benchmark_caldav_transport", level="WARNING")
+logging.getLogger("src.orchestrator.calendar_sync").setLevel(logging.WARNING)
+
+
+class Urllib3ConnectionCounter:
+    """Counts urllib3 (requests/caldav) requests, new connections and TLS handshakes."""
+
+    def __init__(self):
+        self.requests = 0
+        self.connections = 0
+        self.tls_handshakes = 0
+        self._originals = {}
+
+    def install(self):
+        """Wrap the connect methods of urllib3's connection classes and urlopen."""
+        pool = urllib3.connectionpool.HTTPConnectionPool
+        original_urlopen = pool.urlopen
+        self._originals[pool] = ("urlopen", original_urlopen)
+
+        def urlopen(conn_pool, *args, **kwargs):
+            self.requests += 1
+            return original_urlopen(conn_pool, *args, **kwargs)
+
+        pool.urlopen = urlopen
+
+        for cls in (urllib3.connection.HTTPConnection, urllib3.connection.HTTPSConnection):
+            original = cls.connect
+            self._originals[cls] = ("connect", original)
+            is_tls = cls is urllib3.connection.HTTPSConnection
+
+            def connect(conn, _original=original, _is_tls=is_tls):
+                # HTTPSConnection.connect does TCP + TLS in one call
+                if _is_tls or not isinstance(conn, urllib3.connection.HTTPSConnection):
+                    self.connections += 1
+                    self.tls_handshakes += int(_is_tls)
+                return _original(conn)
+
+            cls.connect = connect
+
+    def uninstall(self):
+        """Restore the original methods."""
+        for cls, (name, original) in self._originals.items():
+            setattr(cls, name, original)
+
+
+def make_client(mode: str, args) -> CalDAVClient:
+    """Build a CalDAVClient bound to one calendar URL without discovery."""
+    calendar_url, username, password = args.calendar_url, args.username, args.password
+    dav = caldav.DAVClient(
+        url=calendar_url, username=username, password=password, ssl_verify_cert=args.verify
+    )
+    client = CalDAVClient(calendar_url, username, password, transport_mode=mode)
+    client.client = dav
+    client.calendars = [dav.calendar(url=calendar_url)]
+    client.transport = create_caldav_transport(mode, dav, username, password)
+    return client
+
+
+async def run_scenario(mode: str, args, server: MockCalDAVServer, offset: int) -> dict:
+    """
+    Run full and incremental syncs with one transport.
+
+    Args:
+        mode: Transport mode ("caldav" or "httpx")
+        args: Parsed command line arguments
+        server: Mock server (None for a real server)
+        offset: First mock object changed between incremental syncs
+
+    Returns:
+        Dictionary with latencies and connection counters
+    """
+    counter = Urllib3ConnectionCounter()
+    counter.install()
+    client = make_client(mode, args)
+    transport = client.transport
+    wire_before = server.bytes_sent if server else 0
+
+    full, incremental = [], []
+    try:
+        # Cold syncs: empty store, everything is fetched
+        for _ in range(args.rounds):
+            client.event_store = EventStore()
+            t0 = time.perf_counter()
+            await client.sync_events()
+            full.append((time.perf_counter() - t0) * 1000)
+
+        # Warm syncs: one event changed between syncs
+        for i in range(args.rounds):
+            if server:
+                uid = f"bench-{offset + i:06d}"
+                server.update(f"{uid}.ics", generate_event(uid, datetime.now(timezone.utc)))
+            t0 = time.perf_counter()
+            await client.sync_events()
+            incremental.append((time.perf_counter() - t0) * 1000)
+    finally:
+        stats = transport.get_stats()
+        await client.close_transport()
+        counter.uninstall()
+
+    if isinstance(transport, CaldavLibTransport):
+        stats["connections_opened"] = counter.connections
+        stats["tls_handshakes"] = counter.tls_handshakes
+
+    return {
+        "full": full,
+        "incremental": incremental,
+        "requests": client.metrics.requests,
+        "bytes": client.metrics.bytes_received,
+        "wire_bytes": server.bytes_sent - wire_before if server else None,
+        "partial": client.metrics.partial_retrieval,
+        "connections": stats["connections_opened"],
+        "tls_handshakes": stats["tls_handshakes"],
+        "http_version": stats.get("http_version"),
+    }
+
+
+def run_baseline(args, server: MockCalDAVServer, offset: int) -> dict:
+    """
+    Run the original client path: date_search(expand=True) on every sync.
+
+    The caldav library sends a calendar-query REPORT with server-side
+    expansion and the full objects; there is no incremental mode, so cold
+    and warm syncs do the same work.
+
+    Args:
+        args: Parsed command line arguments
+        server: Mock server (None for a real server)
+        offset: First mock object changed between warm syncs
+
+    Returns:
+        Dictionary with latencies and connection counters
+    """
+    counter = Urllib3ConnectionCounter()
+    counter.install()
+    client = make_client("caldav", args)
+    calendar = client.calendars[0]
+    wire_before = server.bytes_sent if server else 0
+
+    def search() -> float:
+        start = datetime.now()
+        t0 = time.perf_counter()
+        objects = calendar.date_search(start=start, end=start + timedelta(hours=24), expand=True)
+        for obj in objects:
+            for component in obj.icalendar_instance.walk("VEVENT"):
+                client._parse_vevent(component)
+        return (time.perf_counter() - t0) * 1000
+
+    full, incremental = [], []
+    try:
+        for _ in range(args.rounds):
+            full.append(search())
+        for i in range(args.rounds):
+            if server:
+                uid = f"bench-{offset + i:06d}"
+                server.update(f"{uid}.ics", generate_event(uid, datetime.now(timezone.utc)))
+            incremental.append(search())
+    finally:
+        counter.uninstall()
+
+    return {
+        "full": full,
+        "incremental": incremental,
+        "requests": counter.requests,
+        "bytes": None,
+        "wire_bytes": server.bytes_sent - wire_before if server else None,
+        "partial": False,
+        "connections": counter.connections,
+        "tls_handshakes": counter.tls_handshakes,
+        "http_version": None,
+    }
+
+
+def summarize(values: list) -> str:
+    """Format p50 and mean of a latency list."""
+    return f"p50 {statistics.median(values):8.1f} ms   mean {statistics.mean(values):8.1f} ms"
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calendar-url", help="Calendar collection URL (default: local mock server)")
+    parser.add_argument("--username", default="bench")
+    parser.add_argument("--password", default="bench")
+    parser.add_argument("--events", type=int, default=500, help="Events on the mock server")
+    parser.add_argument("--rounds", type=int, default=10, help="Syncs per scenario")
+    parser.add_argument("--extras", action="store_true",
+                        help="Mock events with HTML descriptions, attachments, alarms and attendees")
+    parser.add_argument("--https", action="store_true",
+                        help="Serve the mock calendar over HTTPS with a self-signed certificate")
+    args = parser.parse_args()
+
+    args.verify = True
+    server = None
+    if not args.calendar_url:
+        certfile, keyfile = generate_self_signed_cert() if args.https else (None, None)
+        server = MockCalDAVServer(
+            generate_calendar(args.events, extras=args.extras), certfile=certfile, keyfile=keyfile
+        ).start()
+        args.calendar_url = server.calendar_url
+        if args.https:
+            # Self-signed: encrypt, but do not verify
+            args.verify = False
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        print(f"Mock CalDAV server with {args.events} events at {server.calendar_url}")
+
+    try:
+        results = {
+            "date_search (baseline)": await asyncio.to_thread(run_baseline, args, server, 0),
+            "caldav": await run_scenario("caldav", args, server, offset=args.rounds),
+            "httpx": await run_scenario("httpx", args, server, offset=2 * args.rounds),
+        }
+    finally:
+        if server:
+            server.stop()
+
+    print("\n" + "=" * 72)
+    print(f"  CalDAV transport comparison ({args.rounds} syncs per scenario)")
+    print("=" * 72)
+    for name, result in results.items():
+        print(f"  {name}:")
+        print(f"    full sync:         {summarize(result['full'])}")
+        print(f"    incremental sync:  {summarize(result['incremental'])}")
+        print(f"    requests:          {result['requests']}")
+        if result["bytes"] is not None:
+            print(f"    bytes received:    {result['bytes'] / 1024:.0f} KiB "
+                  f"(partial retrieval: {'yes' if result['partial'] else 'no'})")
+        if result["wire_bytes"] is not None:
+            print(f"    bytes on the wire: {result['wire_bytes'] / 1024:.0f} KiB (mock server, gzip)")
+        print(f"    new connections:   {result['connections']}")
+        print(f"    TLS handshakes:    {result['tls_handshakes']}")
+        if result.get("http_version"):
+            print(f"    HTTP version:      {result['http_version']}")
+    print("  Note: date_search fetches only the next 24 hours; caldav and httpx")
+    print("  sync the whole collection into the event store.")
+    print("=" * 72)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
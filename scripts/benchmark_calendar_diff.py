@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Measure scheduler work per sync: full rebuild vs calendar event diff.
+
+Feeds the scheduler a calendar of N events, then syncs that change a few
+events each. Compares the previous approach (fingerprint all events,
+rebuild the meeting list, hand every meeting URL to the URL cache) with
+the event diff (EventDiffTracker): how many events the consumers touch per
+sync and how long a sync takes in the scheduler. Unchanged syncs (every
+calendar reported an unchanged CTag/sync-token) skip the comparison and
+only advance the window, like the scheduler. Also checks that both
+approaches track the same meetings.
+
+Usage:
+    python scripts/benchmark_calendar_diff.py
+    python scripts/benchmark_calendar_diff.py --events 500 5000 20000 --changes 3
+"""
+import argparse
+import logging
+import random
+import sys
+import time
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.orchestrator.calendar_diff import EventDiffTracker, event_key
+from src.orchestrator.calendar_sync import MeetingEvent
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger("benchmark_calendar_diff", level="WARNING")
+logging.getLogger("src.orchestrator.calendar_diff").setLevel(logging.WARNING)
+
+SYNCS = 50
+
+
+def make_events(count: int) -> list:
+    """Room calendar with every other event a BBB meeting."""
+    now = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+    return [
+        MeetingEvent(
+            uid=f"event-{i}",
+            summary=f"Meeting {i}",
+            description="",
+            start_time=now + timedelta(minutes=15 * i),
+            end_time=now + timedelta(minutes=15 * i + 30),
+            location="",
+            bbb_url=f"https://bbb.example.org/b/room-{i % 50}" if i % 2 == 0 else None,
+        )
+        for i in range(count)
+    ]
+
+
+def edit(events: list, changes: int, rng: random.Random) -> list:
+    """Move a few events by 30 minutes."""
+    events = list(events)
+    for i in rng.sample(range(len(events)), changes):
+        event = events[i]
+        events[i] = replace(
+            event,
+            start_time=event.start_time + timedelta(minutes=30),
+            end_time=event.end_time + timedelta(minutes=30),
+        )
+    return events
+
+
+class RebuildConsumer:
+    """Previous scheduler behaviour: every sync rebuilds everything."""
+
+    def __init__(self):
+        self.fingerprint = None
+        self.meetings = []
+        self.touched = 0
+
+    def sync(self, events: list, unchanged: bool) -> bool:
+        fingerprint = hash(frozenset(
+            (e.uid, e.recurrence_id, e.start_time, e.end_time, e.summary, e.bbb_url, e.bbb_password)
+            for e in events
+        ))
+        changed = fingerprint != self.fingerprint
+        self.fingerprint = fingerprint
+        self.meetings = [e for e in events if e.bbb_url]
+        urls = [e.bbb_url for e in self.meetings]  # URL cache prefetch
+        self.touched += len(events) + len(urls)
+        return changed
+
+
+class DiffConsumer:
+    """Scheduler with the event diff: consumers apply only the changes."""
+
+    def __init__(self):
+        self.tracker = EventDiffTracker()
+        self.tracker.subscribe(self.apply)
+        self.meetings = {}
+        self.touched = 0
+        self.window_end = 0
+
+    def apply(self, diff):
+        for event in diff.removed:
+            self.meetings.pop(event_key(event), None)
+            self.touched += 1
+        for event in diff.current_events():
+            if event.bbb_url:
+                self.meetings[event_key(event)] = event
+            else:
+                self.meetings.pop(event_key(event), None)
+            self.touched += 1
+
+    def sync(self, events: list, unchanged: bool) -> bool:
+        # The window does not move in this benchmark: nothing new enters it
+        previous_end, self.window_end = self.window_end, max(e.start_ts for e in events) + 1
+        if unchanged and previous_end:
+            return bool(self.tracker.advance(events, previous_end))
+        return bool(self.tracker.update(events))
+
+
+def run(consumer, syncs: list) -> dict:
+    """Feed all syncs to a consumer, timing changed and unchanged syncs apart."""
+    consumer.sync(syncs[0], False)
+    consumer.touched = 0
+    seconds = {False: [], True: []}
+    changed = 0
+    for previous, events in zip(syncs, syncs[1:]):
+        unchanged = events is previous
+        started = time.perf_counter()
+        changed += consumer.sync(events, unchanged)
+        seconds[unchanged].append(time.perf_counter() - started)
+    return {
+        "ms_changed": sum(seconds[False]) * 1000 / len(seconds[False]),
+        "ms_unchanged": sum(seconds[True]) * 1000 / len(seconds[True]),
+        "touched": consumer.touched / (len(syncs) - 1),
+        "changed": changed,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, nargs="+", default=[500, 2000, 10000], help="Calendar sizes")
+    parser.add_argument("--changes", type=int, default=2, help="Changed events per sync")
+    args = parser.parse_args()
+
+    print("\n" + "=" * 74)
+    print(f"  {SYNCS} syncs, {args.changes} changed event(s) per sync "
+          f"(every 5th sync unchanged)")
+    print("=" * 74)
+    print(f"  {'events':>7} {'mode':<8} {'ms/changed':>11} {'ms/unchanged':>13} "
+          f"{'touched/sync':>13} {'changed syncs':>14}")
+
+    ok = True
+    for count in args.events:
+        rng = random.Random(count)
+        syncs = [make_events(count)]
+        for i in range(SYNCS):
+            syncs.append(syncs[-1] if i % 5 == 4 else edit(syncs[-1], args.changes, rng))
+
+        rebuild, diff = RebuildConsumer(), DiffConsumer()
+        results = {"rebuild": run(rebuild, syncs), "diff": run(diff, syncs)}
+        same = (
+            sorted(map(event_key, rebuild.meetings)) == sorted(diff.meetings)
+            and results["rebuild"]["changed"] == results["diff"]["changed"]
+        )
+        ok = ok and same
+        for mode, result in results.items():
+            print(f"  {count if mode == 'rebuild' else '':>7} {mode:<8} {result['ms_changed']:>11.2f} "
+                  f"{result['ms_unchanged']:>13.2f} {result['touched']:>13.1f} {result['changed']:>14}")
+        print(f"  {'':>7} same meetings and change detection: {'yes' if same else 'NO'}")
+
+    print("=" * 74)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
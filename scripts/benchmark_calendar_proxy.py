@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Measure upstream CalDAV load of a device fleet: direct sync vs calendar proxy.
+
+Simulates one hour of a fleet whose devices all show the same room
+calendar (served by the mock CalDAV server, with two calendar edits during
+the hour):
+
+- direct: every device runs the incremental CalDAV sync every 5 minutes
+- proxy: the fleet calendar proxy syncs upstream every minute, devices
+  fetch the room schedule from it every 5 minutes (conditional GET)
+
+Reports upstream requests and bytes per hour and the time devices spend
+syncing, for growing fleet sizes. Also checks that devices see the same
+events through the proxy as with direct sync, and that a device falls back
+to direct sync as soon as the proxy is gone.
+
+Usage:
+    python scripts/benchmark_calendar_proxy.py
+    python scripts/benchmark_calendar_proxy.py --events 500 --fleet 1 10 60 120
+"""
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import caldav
+
+from mock_caldav_server import MockCalDAVServer, generate_calendar, generate_event
+from src.orchestrator.caldav_transport import create_caldav_transport
+from src.orchestrator.calendar_federation import CalendarFederation, CalendarSource
+from src.orchestrator.calendar_sync import CalDAVClient
+from src.orchestrator.fleet_proxy import FleetProxyClient
+from src.proxy.calendar_proxy import CalendarProxy
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger("benchmark_calendar_proxy", level="WARNING")
+for name in ("src.orchestrator.calendar_sync", "src.proxy.calendar_proxy"):
+    logging.getLogger(name).setLevel(logging.WARNING)
+# The fallback check makes the client warn about the stopped proxy
+logging.getLogger("src.orchestrator.fleet_proxy").setLevel(logging.ERROR)
+
+ROOM = "room-1"
+DEVICE_POLLS = 12  # every 5 minutes
+PROXY_SYNCS_PER_POLL = 5  # every minute
+EDIT_ROUNDS = (3, 8)
+
+
+def make_client(calendar_url: str) -> CalDAVClient:
+    """Build a CalDAVClient bound to one calendar URL without discovery."""
+    dav = caldav.DAVClient(url=calendar_url, username="bench", password="bench")
+    client = CalDAVClient(calendar_url, "bench", "bench")
+    client.client = dav
+    client.calendars = [dav.calendar(url=calendar_url)]
+    client.transport = create_caldav_transport("httpx", dav, "bench", "bench")
+    return client
+
+
+def edit(server: MockCalDAVServer, round_no: int):
+    """Move one meeting into the next hours (a calendar edit)."""
+    name = sorted(server.objects)[round_no]
+    uid = name.removesuffix(".ics")
+    start = datetime.now(timezone.utc).replace(second=0, microsecond=0) + timedelta(hours=round_no)
+    server.update(name, generate_event(uid, start, minutes=30))
+
+
+def event_keys(events: list) -> list:
+    """Comparable content of events."""
+    return sorted(
+        (e.uid, e.recurrence_id or "", e.start_time.isoformat(), e.end_time.isoformat(),
+         e.summary, e.bbb_url or "")
+        for e in events
+    )
+
+
+async def run_direct(server: MockCalDAVServer, devices: int) -> dict:
+    """Every device syncs the calendar itself."""
+    clients = [make_client(server.calendar_url) for _ in range(devices)]
+    requests, sent = server.requests, server.bytes_sent
+    device_seconds = 0.0
+    events = []
+    for round_no in range(DEVICE_POLLS):
+        if round_no in EDIT_ROUNDS:
+            edit(server, round_no)
+        for client in clients:
+            started = time.perf_counter()
+            events = await client.sync_events()
+            device_seconds += time.perf_counter() - started
+    for client in clients:
+        await client.close_transport()
+    return {
+        "requests": server.requests - requests,
+        "bytes": server.bytes_sent - sent,
+        "device_ms": device_seconds * 1000 / (devices * DEVICE_POLLS),
+    }
+
+
+async def run_proxy(server: MockCalDAVServer, devices: int) -> dict:
+    """The proxy syncs upstream, the devices ask the proxy."""
+    source = CalendarSource(name=ROOM, client=make_client(server.calendar_url), connected=True)
+    proxy = CalendarProxy(
+        CalendarFederation([source]), {ROOM: [ROOM]}, host="127.0.0.1", port=0,
+        sync_interval=3600,
+    )
+    requests, sent = server.requests, server.bytes_sent
+    await proxy.start()
+    await proxy.sync()
+    clients = [
+        FleetProxyClient(f"http://127.0.0.1:{proxy.port}", ROOM, retry_seconds=3600)
+        for _ in range(devices)
+    ]
+
+    device_seconds = 0.0
+    for round_no in range(DEVICE_POLLS):
+        if round_no in EDIT_ROUNDS:
+            edit(server, round_no)
+        for _ in range(PROXY_SYNCS_PER_POLL):
+            await proxy.sync()
+        for client in clients:
+            started = time.perf_counter()
+            await client.fetch()
+            device_seconds += time.perf_counter() - started
+
+    result = {
+        "requests": server.requests - requests,
+        "bytes": server.bytes_sent - sent,
+        "device_ms": device_seconds * 1000 / (devices * DEVICE_POLLS),
+        "device_bytes": sum(client.bytes_received for client in clients) / devices,
+        "not_modified": proxy.not_modified,
+    }
+
+    # Same events as a device syncing directly right now
+    reference = make_client(server.calendar_url)
+    expected = await reference.sync_events()
+    await reference.close_transport()
+    result["same"] = event_keys(await clients[-1].fetch()) == event_keys(expected)
+
+    # Proxy gone: the device must notice at once and sync directly
+    await proxy.stop()
+    started = time.perf_counter()
+    fallback = await clients[0].fetch()
+    result["fallback_ms"] = (time.perf_counter() - started) * 1000
+    result["fallback_ok"] = fallback is None
+    for client in clients:
+        await client.close()
+    return result
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=200, help="Events in the room calendar")
+    parser.add_argument("--fleet", type=int, nargs="+", default=[1, 10, 30, 60], help="Fleet sizes")
+    args = parser.parse_args()
+
+    print("\n" + "=" * 78)
+    print(f"  One hour of a device fleet on one room calendar ({args.events} events, "
+          f"{len(EDIT_ROUNDS)} edits)")
+    print(f"  devices poll every 5 min, the proxy syncs upstream every minute")
+    print("=" * 78)
+    print(f"  {'devices':>7} {'mode':<7} {'upstream req/h':>15} {'upstream KiB/h':>15} "
+          f"{'device sync':>12} {'device KiB/h':>13}")
+
+    ok = True
+    for devices in args.fleet:
+        results = {}
+        for mode, run in (("direct", run_direct), ("proxy", run_proxy)):
+            server = MockCalDAVServer(generate_calendar(args.events)).start()
+            try:
+                results[mode] = await run(server, devices)
+            finally:
+                server.stop()
+
+        direct, proxy = results["direct"], results["proxy"]
+        ok = ok and proxy["same"] and proxy["fallback_ok"]
+        print(f"  {devices:>7} {'direct':<7} {direct['requests']:>15} "
+              f"{direct['bytes'] / 1024:>15.0f} {direct['device_ms']:>9.1f} ms {'':>13}")
+        print(f"  {'':>7} {'proxy':<7} {proxy['requests']:>15} "
+              f"{proxy['bytes'] / 1024:>15.0f} {proxy['device_ms']:>9.1f} ms "
+              f"{proxy['device_bytes'] / 1024:>13.1f}")
+        print(f"  {'':>7} upstream requests direct/proxy {direct['requests'] / max(proxy['requests'], 1):.1f}, "
+              f"{proxy['not_modified']} of {devices * DEVICE_POLLS} device polls answered 304, "
+              f"same events: {'yes' if proxy['same'] else 'NO'}")
+
+    print("=" * 78)
+    print(f"  Proxy down: device falls back to direct sync after {proxy['fallback_ms']:.1f} ms "
+          f"({'ok' if proxy['fallback_ok'] else 'FAILED'})")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Measure scheduler meeting queries: sorted list scan vs time-ordered index.
+
+For calendars with thousands of meetings compares the previous scheduler
+queries (sort all meetings for the next one, scan all for the running
+ones, datetime.now() per event) with MeetingIndex (binary search over UTC
+epoch seconds), plus the cost of keeping the index up to date and the
+memory of an event record before (__dict__, two datetimes) and after
+(__slots__, epoch seconds and the time zone). Checks that both
+give the same answers and that calendars mixing floating, UTC and TZID
+times work (the previous comparisons raised TypeError).
+
+Usage:
+    python scripts/benchmark_event_index.py
+    python scripts/benchmark_event_index.py --events 1000 10000 50000
+"""
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List, Optional
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.orchestrator.calendar_diff import event_key
+from src.orchestrator.calendar_sync import MeetingEvent
+from src.orchestrator.event_index import MeetingIndex
+
+
+@dataclass
+class LegacyMeetingEvent:
+    """MeetingEvent before the change (no slots, no epoch fields)."""
+
+    uid: str
+    summary: str
+    description: str
+    start_time: datetime
+    end_time: datetime
+    location: str
+    bbb_url: Optional[str] = None
+    bbb_password: Optional[str] = None
+    organizer: Optional[str] = None
+    attendees: List[str] = None
+    recurrence_id: Optional[str] = None
+
+
+def legacy_next(meetings: list):
+    """Previous get_next_meeting: sort, then scan."""
+    now = datetime.now(timezone.utc)
+    for meeting in sorted(meetings, key=lambda e: e.start_time):
+        if meeting.start_time > now:
+            return meeting
+    return None
+
+
+def legacy_current(meetings: list) -> list:
+    """Previous get_current_meetings: scan all."""
+    now = datetime.now(timezone.utc)
+    return [e for e in meetings if e.start_time <= now <= e.end_time]
+
+
+def make_events(count: int, rng: random.Random, cls=MeetingEvent) -> list:
+    """Meetings over the next days, 15 to 120 minutes long."""
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    events = []
+    for i in range(count):
+        start = now + timedelta(minutes=rng.randint(-180, 7 * 24 * 60))
+        events.append(cls(
+            uid=f"event-{i}", summary=f"Meeting {i}", description="Weekly sync\nJoin: https://bbb.example.org/b/room",
+            start_time=start, end_time=start + timedelta(minutes=rng.choice((15, 30, 60, 120))),
+            location="Room 1", bbb_url="https://bbb.example.org/b/room", attendees=["a@example.org"],
+        ))
+    return events
+
+
+def per_call_us(func, calls: int) -> float:
+    """Mean microseconds per call."""
+    started = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - started) * 1e6 / calls
+
+
+def record_bytes(cls, count: int, rng: random.Random) -> float:
+    """Memory per event record (object, attribute storage and datetimes)."""
+    tracemalloc.start()
+    events = make_events(count, rng, cls)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del events
+    return size / count
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, nargs="+", default=[1000, 5000, 20000], help="Calendar sizes")
+    args = parser.parse_args()
+    rng = random.Random(7)
+
+    print("\n" + "=" * 78)
+    print("  Scheduler queries (next + current meetings, as in get_status)")
+    print("=" * 78)
+    print(f"  {'events':>7} {'list scan':>12} {'index':>10} {'speedup':>9} "
+          f"{'index update':>14} {'same results':>13}")
+
+    ok = True
+    for count in args.events:
+        events = make_events(count, rng)
+        index = MeetingIndex()
+        for event in events:
+            index.add(event)
+
+        calls = max(20, 200000 // count)
+        legacy = per_call_us(lambda: (legacy_next(events), legacy_current(events)), calls)
+        indexed = per_call_us(lambda: (index.next_after(time.time()), index.active_at(time.time())), calls * 20)
+
+        # One diff: move 10 meetings by an hour
+        moved = [replace(e, start_time=e.start_time + timedelta(hours=1), end_time=e.end_time + timedelta(hours=1))
+                 for e in rng.sample(events, 10)]
+        started = time.perf_counter()
+        for event in moved:
+            index.add(event)
+        update_us = (time.perf_counter() - started) * 1e6 / len(moved)
+        by_key = {event_key(e): e for e in events}
+        by_key.update((event_key(e), e) for e in moved)
+        current = list(by_key.values())
+
+        same = (
+            legacy_next(current) is index.next_after(time.time())
+            and sorted(map(event_key, legacy_current(current))) == sorted(map(event_key, index.active_at(time.time())))
+        )
+        ok = ok and same
+        print(f"  {count:>7} {legacy:>9.1f} us {indexed:>7.2f} us {legacy / indexed:>8.0f}x "
+              f"{update_us:>11.1f} us {'yes' if same else 'NO':>13}")
+
+    print("\n" + "=" * 78)
+    print("  Event record size")
+    print("=" * 78)
+    legacy_size = record_bytes(LegacyMeetingEvent, 5000, random.Random(1))
+    slots_size = record_bytes(MeetingEvent, 5000, random.Random(1))
+    print(f"  dataclass with __dict__      {legacy_size:>7.0f} bytes/event")
+    print(f"  __slots__, epoch seconds only{slots_size:>7.0f} bytes/event")
+
+    print("\n" + "=" * 78)
+    print("  Calendar mixing floating, UTC and TZID times")
+    print("=" * 78)
+    now = datetime.now()
+    mixed = [
+        MeetingEvent("floating", "floating", "", now + timedelta(minutes=30), now + timedelta(minutes=60), ""),
+        MeetingEvent("utc", "utc", "", datetime.now(timezone.utc) + timedelta(minutes=10),
+                     datetime.now(timezone.utc) + timedelta(minutes=40), ""),
+    ]
+    try:
+        legacy_next(mixed)
+        legacy_result = "ok"
+    except TypeError as e:
+        legacy_result = f"TypeError ({e})"
+    index = MeetingIndex()
+    for event in mixed:
+        index.add(event)
+    next_meeting = index.next_after(time.time())
+    print(f"  list scan: {legacy_result}")
+    print(f"  index:     next meeting '{next_meeting.uid}'")
+    ok = ok and next_meeting.uid == "utc"
+    print("=" * 78)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
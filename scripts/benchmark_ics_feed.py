@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Measure polling cost of a published iCalendar feed: naive vs ICSFeedClient.
+
+Serves a synthetic feed (one .ics file with all meetings, 10 % recurring)
+from a local HTTP server and polls it the way the scheduler does:
+
+- naive: download the whole feed and parse it with icalendar on every poll
+- ICSFeedClient with a server that sends ETag / Last-Modified (304 path)
+- ICSFeedClient with a server that sends no validators (content hash path)
+- ICSFeedClient after one meeting in the feed changed (per-UID reparse)
+
+Also checks that ICSFeedClient yields the same events as parsing every
+meeting as a CalDAV object.
+
+Usage:
+    python scripts/benchmark_ics_feed.py
+    python scripts/benchmark_ics_feed.py --events 2000 --polls 20
+"""
+import argparse
+import asyncio
+import email.utils
+import gzip
+import hashlib
+import logging
+import re
+import statistics
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from icalendar import Calendar
+
+from mock_caldav_server import generate_calendar
+from src.orchestrator.calendar_sync import CalDAVClient
+from src.orchestrator.ics_source import ICSFeedClient
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger("benchmark_ics_feed", level="WARNING")
+for name in ("src.orchestrator.calendar_sync", "src.orchestrator.ics_source"):
+    logging.getLogger(name).setLevel(logging.WARNING)
+
+
+def build_feed(objects: dict) -> str:
+    """Concatenate calendar objects into one published feed."""
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//Benchmark//Feed//EN"]
+    for data in objects.values():
+        body = re.search(r"BEGIN:VEVENT.*END:VEVENT", data, re.DOTALL).group(0)
+        lines.extend(body.splitlines())
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(lines) + "\r\n"
+
+
+class FeedServer:
+    """Serves the feed gzip-compressed, with or without HTTP validators."""
+
+    def __init__(self, feed: str, validators: bool):
+        self.validators = validators
+        self.requests = 0
+        self.bytes_sent = 0
+        self.set_feed(feed)
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                server.requests += 1
+                if server.validators and self.headers.get("If-None-Match") == server.etag:
+                    self.send_response(304)
+                    self.send_header("ETag", server.etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                gzipped = "gzip" in self.headers.get("Accept-Encoding", "")
+                body = server.gzipped if gzipped else server.body
+                server.bytes_sent += len(body)
+                self.send_response(200)
+                self.send_header("Content-Type", "text/calendar; charset=utf-8")
+                if gzipped:
+                    self.send_header("Content-Encoding", "gzip")
+                if server.validators:
+                    self.send_header("ETag", server.etag)
+                    self.send_header("Last-Modified", server.last_modified)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def set_feed(self, feed: str):
+        self.body = feed.encode("utf-8")
+        self.gzipped = gzip.compress(self.body)
+        self.etag = f'"{hashlib.md5(self.body).hexdigest()}"'
+        self.last_modified = email.utils.formatdate(usegmt=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/calendar.ics"
+
+    def close(self):
+        self.httpd.shutdown()
+
+
+def naive_poll(url: str, start: datetime, end: datetime) -> int:
+    """Download and fully parse the feed (what a simple implementation does)."""
+    import urllib.request
+    with urllib.request.urlopen(url) as response:
+        data = response.read()
+    calendar = Calendar.from_ical(data)
+    return sum(1 for _ in calendar.walk("VEVENT"))
+
+
+async def timed_polls(client: ICSFeedClient, polls: int, start: datetime, end: datetime) -> float:
+    """Median milliseconds per sync_events call."""
+    timings = []
+    for _ in range(polls):
+        t0 = time.perf_counter()
+        await client.sync_events(start, end)
+        timings.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(timings)
+
+
+def event_keys(events: list) -> list:
+    """Comparable content of events."""
+    return sorted(
+        (e.uid, e.recurrence_id or "", e.start_time.isoformat(), e.end_time.isoformat(),
+         e.summary, e.bbb_url or "")
+        for e in events
+    )
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=1000, help="Meetings in the feed")
+    parser.add_argument("--polls", type=int, default=10, help="Polls per scenario")
+    args = parser.parse_args()
+
+    objects = generate_calendar(args.events, recurring_ratio=0.1, extras=True)
+    feed = build_feed(objects)
+    start = datetime.now()
+    end = start + timedelta(hours=24)
+    results = {}
+
+    # Reference: every meeting parsed as its own CalDAV object
+    reference = CalDAVClient("bench", "bench", "bench")
+    expected = []
+    for name, data in objects.items():
+        obj = reference._build_stored_object(f"/cal/{name}", '"1"', data)
+        expected.extend(reference._object_events(obj, start, end))
+
+    # Naive full download and parse
+    server = FeedServer(feed, validators=True)
+    timings = []
+    for _ in range(args.polls):
+        t0 = time.perf_counter()
+        naive_poll(server.url, start, end)
+        timings.append((time.perf_counter() - t0) * 1000)
+    results["naive (download + parse)"] = (statistics.median(timings), server.bytes_sent // args.polls)
+
+    # Conditional GET with validators
+    client = ICSFeedClient(server.url)
+    first = await client.sync_events(start, end)
+    equal = event_keys(first) == event_keys(expected)
+    sent = server.bytes_sent
+    results["ICS source, unchanged (304)"] = (
+        await timed_polls(client, args.polls, start, end), (server.bytes_sent - sent) // args.polls
+    )
+
+    # One meeting changed: only its UID is parsed again
+    uid = next(iter(objects)).removesuffix(".ics")
+    changed = feed.replace(f"UID:{uid}\r\n", f"UID:{uid}\r\nCOMMENT:moved\r\n", 1)
+    timings = []
+    for i in range(args.polls):
+        server.set_feed(changed if i % 2 == 0 else feed)
+        t0 = time.perf_counter()
+        await client.sync_events(start, end)
+        timings.append((time.perf_counter() - t0) * 1000)
+    results["ICS source, one event changed"] = (statistics.median(timings), len(server.gzipped))
+    await client.close_transport()
+    server.close()
+
+    # No validators: content hash avoids the parse
+    server = FeedServer(feed, validators=False)
+    client = ICSFeedClient(server.url)
+    await client.sync_events(start, end)
+    sent = server.bytes_sent
+    results["ICS source, unchanged (hash)"] = (
+        await timed_polls(client, args.polls, start, end), (server.bytes_sent - sent) // args.polls
+    )
+    await client.close_transport()
+    server.close()
+
+    print("\n" + "=" * 72)
+    print(f"  Polling a published feed ({args.events} meetings, "
+          f"{len(feed.encode()) / 1024:.0f} KiB, {args.polls} polls per scenario)")
+    print("=" * 72)
+    print(f"  {'scenario':<34} {'per poll':>12} {'transferred':>14}")
+    for name, (ms, transferred) in results.items():
+        print(f"  {name:<34} {ms:>9.1f} ms {transferred / 1024:>10.1f} KiB")
+    print("=" * 72)
+    print(f"  Events match per-object parsing: {'yes' if equal else 'NO'} ({len(first)} events)")
+    return 0 if equal else 1
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Measure auto-join timing: 30-second meeting poll vs exact join timers.
+
+- accuracy: arms join timers with the TriggerScheduler at random times over
+  the next seconds and measures how late they fire; with the poll a join
+  waits for the next check (simulated)
+- wakeups: event loop wakeups per day caused by joining, for an idle room
+  and for a room with several meetings
+- import cost: APScheduler (if installed) vs the trigger core, measured
+  with python -X importtime in fresh interpreters (median of several
+  runs), on top of the modules the scheduler imports anyway (asyncio,
+  datetime, dataclasses and the logger)
+
+Usage:
+    python scripts/benchmark_join_triggers.py
+    python scripts/benchmark_join_triggers.py --joins 50 --seconds 20 --meetings 12
+"""
+import argparse
+import asyncio
+import math
+import random
+import statistics
+import subprocess
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.orchestrator.triggers import TriggerScheduler
+
+
+POLL_SECONDS = 30
+DAY_SECONDS = 24 * 3600
+
+# Imported by the calendar scheduler whichever trigger core it uses
+IMPORT_BASELINE = "import asyncio, datetime, dataclasses, src.utils.logger"
+IMPORT_MARKER = "-- measured imports --"
+
+
+def percentile(values: list, fraction: float) -> float:
+    """Value below which the given fraction of values lies."""
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def summarize(lateness: list) -> str:
+    """Mean, p95 and max of lateness values in seconds."""
+    return (f"mean {sum(lateness) / len(lateness) * 1000:>9.1f} ms   "
+            f"p95 {percentile(lateness, 0.95) * 1000:>9.1f} ms   "
+            f"max {max(lateness) * 1000:>9.1f} ms")
+
+
+async def measure_timers(joins: int, seconds: float, rng: random.Random) -> list:
+    """Arm join timers and record when they fire."""
+    triggers = TriggerScheduler()
+    done = asyncio.Event()
+    lateness = []
+    start = datetime.now()
+    offsets = [rng.uniform(0.5, seconds) for _ in range(joins)]
+
+    def join(when: datetime):
+        lateness.append((datetime.now() - when).total_seconds())
+        if len(lateness) == joins:
+            done.set()
+
+    for i, offset in enumerate(offsets):
+        when = start + timedelta(seconds=offset)
+        triggers.call_at(f"join:{i}", when, join, when)
+    await asyncio.wait_for(done.wait(), timeout=seconds + 10)
+    stats = triggers.get_stats()
+    triggers.shutdown()
+    assert stats["lateness_ms"]["samples"] == min(joins, 100)
+    return lateness
+
+
+def simulate_poll(count: int, rng: random.Random) -> list:
+    """Lateness of joins with a check every POLL_SECONDS.
+
+    Meetings start at arbitrary times, so a join waits for a uniformly
+    distributed part of the poll interval.
+    """
+    return [rng.uniform(0, POLL_SECONDS) for _ in range(count)]
+
+
+def timer_wakeups(join_times: list, max_sleep: float) -> int:
+    """Wakeups of the trigger core over a day with the given join times."""
+    wakeups, previous = 0, 0.0
+    for join_time in sorted(join_times):
+        wakeups += math.ceil((join_time - previous) / max_sleep)
+        previous = join_time
+    return wakeups
+
+
+def import_ms(statement: str, runs: int) -> Optional[Tuple[float, float, float]]:
+    """
+    Import time of a statement on top of IMPORT_BASELINE.
+
+    Each run is a fresh interpreter with -X importtime; the cost is the sum
+    of the cumulative times of the top-level imports the statement adds
+    (modules already imported by the baseline are not imported again).
+
+    Returns:
+        (median, min, max) in milliseconds, or None if the import fails
+    """
+    code = "import sys; sys.path.insert(0, %r); %s; sys.stderr.write(%r); %s" % (
+        str(project_root), IMPORT_BASELINE, IMPORT_MARKER + "\n", statement
+    )
+    samples = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            return None
+        measured = result.stderr.split(IMPORT_MARKER, 1)[1]
+        micros = 0
+        for line in measured.splitlines():
+            # "import time: self [us] | cumulative | name", top level = one space
+            parts = line.split("|")
+            if len(parts) == 3 and parts[2].startswith(" ") and not parts[2].startswith("  "):
+                micros += int(parts[1])
+        samples.append(micros / 1000)
+    return statistics.median(samples), min(samples), max(samples)
+
+
+def format_import(result: Optional[Tuple[float, float, float]]) -> str:
+    """Median and range of an import measurement."""
+    if result is None:
+        return "not installed"
+    median, low, high = result
+    return f"{median:>7.1f} ms   (min {low:.1f}, max {high:.1f})"
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--joins", type=int, default=30, help="Join timers to arm")
+    parser.add_argument("--seconds", type=float, default=10.0, help="Spread of the join times")
+    parser.add_argument("--meetings", type=int, default=8, help="Meetings per day for the wakeup count")
+    parser.add_argument("--import-runs", type=int, default=21, help="Fresh interpreters per import measurement")
+    args = parser.parse_args()
+    rng = random.Random(42)
+
+    print("\n" + "=" * 74)
+    print(f"  Join accuracy ({args.joins} joins within {args.seconds:.0f} s)")
+    print("=" * 74)
+    lateness = await measure_timers(args.joins, args.seconds, rng)
+    poll = simulate_poll(args.joins, rng)
+    print(f"  poll every {POLL_SECONDS} s   {summarize(poll)}")
+    print(f"  join timers       {summarize(lateness)}")
+
+    print("\n" + "=" * 74)
+    print("  Event loop wakeups per day for joins")
+    print("=" * 74)
+    max_sleep = TriggerScheduler().max_sleep
+    join_times = sorted(rng.uniform(8 * 3600, 18 * 3600) for _ in range(args.meetings))
+    print(f"  {'room':<26} {'poll':>8} {'join timers':>12}")
+    print(f"  {'idle':<26} {DAY_SECONDS // POLL_SECONDS:>8} {0:>12}")
+    print(f"  {f'{args.meetings} meetings, 8:00-18:00':<26} {DAY_SECONDS // POLL_SECONDS:>8} "
+          f"{timer_wakeups(join_times, max_sleep):>12}")
+
+    print("\n" + "=" * 74)
+    print(f"  Import cost (-X importtime, median of {args.import_runs} fresh interpreters)")
+    print("  on top of: asyncio, datetime, dataclasses, src.utils.logger")
+    print("=" * 74)
+    aps = import_ms(
+        "import apscheduler.schedulers.asyncio, apscheduler.triggers.date, "
+        "apscheduler.triggers.interval",
+        args.import_runs,
+    )
+    core = import_ms("import src.orchestrator.triggers", args.import_runs)
+    print(f"  APScheduler   {format_import(aps)}")
+    print(f"  trigger core  {format_import(core)}")
+    print("=" * 74)
+
+    return 0 if max(lateness) < 0.1 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Compare meeting link extraction: previous regex chain vs MeetingLinkExtractor.
+
+Runs both implementations over a corpus of event descriptions as they come
+from Nextcloud, Outlook, Thunderbird, Google Calendar and learning
+platforms (scripts/data/meeting_link_corpus.jsonl: Greenlight v2/v3 rooms,
+API join links, Teams/Zoom/Jitsi invitations, German and English access
+codes, false friends like "code of conduct") and reports accuracy and
+throughput.
+
+Usage:
+    python scripts/benchmark_meeting_links.py
+    python scripts/benchmark_meeting_links.py --repeat 2000 --verbose
+"""
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.orchestrator.meeting_links import extract_meeting_links
+
+
+CORPUS = Path(__file__).parent / "data" / "meeting_link_corpus.jsonl"
+
+
+def legacy_extract(description: str, location: str) -> Tuple[Optional[str], Optional[str]]:
+    """The previous CalDAVClient._extract_bbb_info (reference)."""
+    bbb_url = None
+    bbb_password = None
+    search_text = f"{description}\n{location}"
+
+    url_patterns = [
+        r'https?://[^\s]+/b/[a-z0-9-]+',
+        r'https?://[^\s]+/bigbluebutton/[^\s]+',
+        r'https?://bbb\.[^\s]+',
+    ]
+    for pattern in url_patterns:
+        match = re.search(pattern, search_text, re.IGNORECASE)
+        if match:
+            bbb_url = match.group(0).strip('.,;:)')
+            break
+
+    password_patterns = [
+        r'(?:password|passwort|kennwort|code)[\s:]+([a-zA-Z0-9_-]+)',
+        r'(?:pin|access code)[\s:]+([0-9]+)',
+    ]
+    for pattern in password_patterns:
+        match = re.search(pattern, search_text, re.IGNORECASE)
+        if match:
+            bbb_password = match.group(1).strip()
+            break
+
+    return bbb_url, bbb_password
+
+
+def engine_extract(description: str, location: str) -> Tuple[Optional[str], Optional[str]]:
+    """MeetingLinkExtractor, reduced to (best URL, access code)."""
+    info = extract_meeting_links(description, location)
+    return (info.best.url if info.best else None), info.access_code
+
+
+def load_corpus() -> List[Dict]:
+    """Load the labelled corpus."""
+    with open(CORPUS, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def evaluate(extract: Callable, corpus: List[Dict]) -> dict:
+    """
+    Check an implementation against the labels.
+
+    Args:
+        extract: (description, location) -> (url, access code)
+        corpus: Labelled entries
+
+    Returns:
+        Dictionary with correct URL/code counts and the failing entries
+    """
+    url_ok = code_ok = 0
+    failures = []
+    for entry in corpus:
+        url, code = extract(entry["description"], entry["location"])
+        url_match = url == entry["expected_url"]
+        code_match = code == entry["expected_access_code"]
+        url_ok += url_match
+        code_ok += code_match
+        if not (url_match and code_match):
+            failures.append((entry["id"], url, code))
+    return {"url_ok": url_ok, "code_ok": code_ok, "failures": failures}
+
+
+def throughput(extract: Callable, corpus: List[Dict], repeat: int) -> float:
+    """Events per second over the corpus, repeated."""
+    texts = [(entry["description"], entry["location"]) for entry in corpus] * repeat
+    t0 = time.perf_counter()
+    for description, location in texts:
+        extract(description, location)
+    return len(texts) / (time.perf_counter() - t0)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=500, help="Corpus repetitions for throughput")
+    parser.add_argument("--verbose", action="store_true", help="List misclassified entries")
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    implementations = {"regex chain": legacy_extract, "extractor": engine_extract}
+    results = {}
+    for name, extract in implementations.items():
+        results[name] = evaluate(extract, corpus)
+        results[name]["rate"] = throughput(extract, corpus, args.repeat)
+
+    total = len(corpus)
+    print("\n" + "=" * 72)
+    print(f"  Meeting link extraction ({total} labelled events, "
+          f"{total * args.repeat} extractions for throughput)")
+    print("=" * 72)
+    for name, result in results.items():
+        print(f"  {name + ':':<14} links {result['url_ok']:3d}/{total}   "
+              f"access codes {result['code_ok']:3d}/{total}   "
+              f"{result['rate']:9.0f} events/s")
+        if args.verbose:
+            for entry_id, url, code in result["failures"]:
+                print(f"      {entry_id}: url={url!r} code={code!r}")
+    print("=" * 72)
+    return 0 if not results["extractor"]["failures"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark how many concurrent rooms one host can sustain in multi-room mode.
+
+Uses the same building blocks as RoomHost (one shared Chromium, one browser
+context per room, all on one event loop) and adds rooms one at a time. After
+each room is added it measures process-tree CPU, process-tree memory and
+event loop lag, and stops once a limit is exceeded.
+
+Usage:
+    python scripts/benchmark_multi_room.py
+    python scripts/benchmark_multi_room.py --url https://bbb.example.eu/b/load-test --join
+    python scripts/benchmark_multi_room.py --max-rooms 8 --cpu-limit 70 --duration 20
+
+With --join each room actually joins the given BBB room (use a test room),
+which is the realistic load: one WebRTC session per room. Without --join the
+rooms load the URL only.
+"""
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from bench_utils import LoopLagProbe, measure_cpu, process_tree_rss_mb
+from src.orchestrator.browser_controller import BrowserController
+from src.orchestrator.room_host import SharedBrowser
+from src.utils.config import load_config
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger("benchmark_multi_room", level="INFO")
+
+# Continuously repainting page as a stand-in for a meeting
+ANIMATED_PAGE = (
+    "data:text/html,<style>div{width:50vw;height:50vh;background:red;"
+    "animation:m 1s infinite alternate}@keyframes m{to{transform:translateX(40vw)}}"
+    "</style><div></div>"
+)
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default=ANIMATED_PAGE, help="Page or BBB room to load per room")
+    parser.add_argument("--join", action="store_true", help="Join the BBB room in every context")
+    parser.add_argument("--max-rooms", type=int, default=12, help="Stop after this many rooms")
+    parser.add_argument("--duration", type=float, default=15, help="Seconds per measurement")
+    parser.add_argument("--cpu-limit", type=float, default=80, help="Max CPU in %% of all cores")
+    parser.add_argument("--lag-limit-ms", type=float, default=100, help="Max p99 event loop lag")
+    parser.add_argument("--headless", action="store_true", help="Run Chromium headless")
+    args = parser.parse_args()
+
+    config = load_config()
+    cores = os.cpu_count() or 1
+    shared = SharedBrowser(headless=args.headless)
+    browser = await shared.start()
+    rooms = []
+    results = []
+    sustainable = 0
+
+    try:
+        for count in range(1, args.max_rooms + 1):
+            room = BrowserController(
+                bbb_config=config.bbb,
+                headless=args.headless,
+                kiosk_mode=False,
+                shared_browser=browser,
+            )
+            await room.start()
+            rooms.append(room)
+
+            if args.join:
+                joined = await room.join_meeting(
+                    room_url=args.url, username=f"Benchmark-{count}"
+                )
+                if not joined:
+                    logger.error(f"Room {count} failed to join - stopping")
+                    break
+            else:
+                await room.page.goto(args.url)
+
+            await asyncio.sleep(3)  # Let the room settle
+
+            probe = LoopLagProbe()
+            probe.start()
+            cpu = await measure_cpu(args.duration)
+            lag = await probe.stop()
+            rss = process_tree_rss_mb(os.getpid())
+
+            cpu_total = cpu / cores
+            ok = cpu_total <= args.cpu_limit and lag["p99_ms"] <= args.lag_limit_ms
+            results.append((count, cpu_total, rss, lag["p99_ms"], ok))
+            logger.info(
+                f"{count} room(s): CPU {cpu_total:.1f}% of {cores} cores, "
+                f"RSS {rss:.0f} MiB, loop lag p99 {lag['p99_ms']:.1f} ms"
+            )
+
+            if not ok:
+                break
+            sustainable = count
+
+    finally:
+        for room in rooms:
+            await room.cleanup()
+        await shared.stop()
+
+    print("\n" + "=" * 64)
+    print("  Multi-room capacity")
+    print("=" * 64)
+    print(f"  {'Rooms':>5}  {'CPU (all cores)':>15}  {'RSS':>9}  {'Loop lag p99':>12}")
+    for count, cpu_total, rss, lag_p99, ok in results:
+        marker = "" if ok else "  <- limit exceeded"
+        print(f"  {count:>5}  {cpu_total:>14.1f}%  {rss:>5.0f} MiB  {lag_p99:>9.1f} ms{marker}")
+    print("-" * 64)
+    print(f"  Sustainable rooms on this host: {sustainable}")
+    print(f"  Limits: CPU {args.cpu_limit:.0f}% of {cores} cores, "
+          f"loop lag p99 {args.lag_limit_ms:.0f} ms")
+    print("=" * 64)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
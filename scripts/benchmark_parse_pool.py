@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Measure the speedup of process-pool iCalendar parsing per batch size.
+
+Parses batches of synthetic calendar objects (HTML descriptions,
+attachments, alarms, attendee lists; 10 % recurring) once in-process and
+once through CalendarParsePool, the way a first sync or full resync does,
+and checks that both produce the same events. The worker processes are
+started before timing, as they are after the first bulk sync.
+
+The speedup depends on the number of cores: run it on the target device
+(a Raspberry Pi 4 has 4 cores, so 3 workers by default).
+
+Usage:
+    python scripts/benchmark_parse_pool.py
+    python scripts/benchmark_parse_pool.py --workers 2 --sizes 50 200 1000
+"""
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from mock_caldav_server import generate_calendar
+from src.orchestrator.caldav_protocol import SyncObject
+from src.orchestrator.calendar_sync import CalDAVClient
+from src.orchestrator.parse_pool import CalendarParsePool
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger("benchmark_parse_pool", level="WARNING")
+logging.getLogger("src.orchestrator.calendar_sync").setLevel(logging.WARNING)
+
+
+def make_objects(count: int, recurring_ratio: float) -> list:
+    """Synthetic calendar objects as returned by a multiget REPORT."""
+    objects = generate_calendar(count, recurring_ratio=recurring_ratio, extras=True)
+    return [
+        SyncObject(href=f"/cal/{name}", etag=f'"{i}"', data=data)
+        for i, (name, data) in enumerate(objects.items())
+    ]
+
+
+def event_keys(stored: list) -> list:
+    """Comparable content of parsed objects."""
+    return sorted(
+        (obj.href, event.uid, event.start_time.isoformat(), event.end_time.isoformat(),
+         event.summary, event.bbb_url)
+        for obj in stored for event in obj.events
+    )
+
+
+async def bench_size(pool: CalendarParsePool, objects: list, rounds: int) -> dict:
+    """
+    Parse one batch size in-process and in the pool.
+
+    Args:
+        pool: Started parse pool
+        objects: Calendar objects of this batch
+        rounds: Repetitions (fresh parse cache each time)
+
+    Returns:
+        Dictionary with median timings and the correctness result
+    """
+    serial_ms, pool_ms = [], []
+    for _ in range(rounds):
+        client = CalDAVClient("bench", "bench", "bench")
+        t0 = time.perf_counter()
+        serial = [client._build_stored_object(o.href, o.etag, o.data) for o in objects]
+        serial_ms.append((time.perf_counter() - t0) * 1000)
+
+        client = CalDAVClient("bench", "bench", "bench", parse_pool=pool)
+        t0 = time.perf_counter()
+        pooled = await client._parse_in_pool(objects)
+        pool_ms.append((time.perf_counter() - t0) * 1000)
+
+    return {
+        "serial": statistics.median(serial_ms),
+        "pool": statistics.median(pool_ms),
+        "equal": event_keys([obj for obj in serial if obj]) == event_keys(pooled),
+    }
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=3, help="Worker processes")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[25, 50, 100, 200, 500, 1000, 2000],
+                        help="Batch sizes (calendar objects per bulk parse)")
+    parser.add_argument("--rounds", type=int, default=3, help="Repetitions per batch size")
+    parser.add_argument("--recurring", type=float, default=0.1,
+                        help="Fraction of recurring objects (parsed in the main process)")
+    args = parser.parse_args()
+
+    pool = CalendarParsePool(workers=args.workers)
+    # Start the workers outside the measurement
+    await pool.parse([obj.data for obj in make_objects(pool.batch_size, 0.0)])
+
+    results = {}
+    try:
+        for size in args.sizes:
+            print(f"Batch of {size} objects ...")
+            results[size] = await bench_size(pool, make_objects(size, args.recurring), args.rounds)
+    finally:
+        pool.shutdown()
+
+    print("\n" + "=" * 72)
+    print(f"  Bulk parsing: in-process vs {args.workers} worker process(es) "
+          f"({os.cpu_count()} CPU core(s))")
+    print("=" * 72)
+    print(f"  {'objects':>8} {'in-process':>14} {'pool':>12} {'speedup':>9}")
+    for size, result in results.items():
+        marker = "" if result["equal"] else "   DIFFERENT RESULTS"
+        print(f"  {size:>8} {result['serial']:>11.1f} ms {result['pool']:>9.1f} ms "
+              f"{result['serial'] / result['pool']:>8.2f}x{marker}")
+    print("=" * 72)
+    return 0 if all(result["equal"] for result in results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Compare server-side and local expansion of recurring meetings.
+
+Two measurements:
+
+1. Expansion only (no network). Every sync re-evaluates all recurring
+   series for the current 24 h window. Compares the generic
+   recurring_ical_events expansion with RecurrenceExpander (dateutil rules,
+   cached per ETag and window) over a series of syncs 5 minutes apart, and
+   checks that both produce exactly the same occurrences.
+2. Full date search against a local mock CalDAV server: server-side
+   expansion (calendar-query with <expand>, one VEVENT per instance) versus
+   fetching masters and overrides and expanding locally.
+
+Recurring series use TZID=Europe/Berlin, EXDATEs and moved instances
+(RECURRENCE-ID), so the comparison covers the tricky cases.
+
+Usage:
+    python scripts/benchmark_recurrence_expansion.py
+    python scripts/benchmark_recurrence_expansion.py --series 500 --rounds 96
+"""
+import argparse
+import logging
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import caldav
+import recurring_ical_events
+
+from mock_caldav_server import MockCalDAVServer, generate_calendar, generate_event
+from src.orchestrator.calendar_sync import CalDAVClient
+from src.orchestrator.recurrence import RecurrenceExpander
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger("benchmark_recurrence_expansion", level="WARNING")
+logging.getLogger("src.orchestrator.calendar_sync").setLevel(logging.WARNING)
+
+DAILY_RULE = "FREQ=DAILY;BYDAY=MO,TU,WE,TH,FR;COUNT=400"
+WEEKLY_RULE = "FREQ=WEEKLY;COUNT=104"
+
+
+def generate_series(count: int, seed: int = 7) -> Dict[str, str]:
+    """
+    Generate recurring meetings that started in the past weeks.
+
+    Args:
+        count: Number of series
+        seed: Random seed
+
+    Returns:
+        Dictionary of object name -> iCalendar text
+    """
+    rng = random.Random(seed)
+    now = datetime.now().replace(minute=0, second=0, microsecond=0)
+    objects = {}
+    for i in range(count):
+        uid = f"series-{i:06d}"
+        daily = rng.random() < 0.5
+        start = now - timedelta(days=rng.randint(1, 56), hours=rng.randint(-6, 6))
+        objects[f"{uid}.ics"] = generate_event(
+            uid,
+            start,
+            minutes=rng.choice((30, 45, 60)),
+            recurring=True,
+            rrule=DAILY_RULE if daily else WEEKLY_RULE,
+            tzid="Europe/Berlin",
+            override=not daily and rng.random() < 0.5,
+        )
+    return objects
+
+
+def occurrence_keys(events: List) -> set:
+    """Comparable identity of expanded occurrences."""
+    return {
+        (e.uid, e.start_ts, e.end_ts, e.summary)
+        for e in events
+    }
+
+
+def bench_expansion(series: Dict[str, str], rounds: int) -> dict:
+    """
+    Measure expansion cost per sync without network.
+
+    Args:
+        series: Recurring calendar objects
+        rounds: Number of syncs (5 minutes apart)
+
+    Returns:
+        Dictionary with per-sync timings and the correctness result
+    """
+    client = CalDAVClient("bench", "bench", "bench")
+    objects = [
+        client._build_stored_object(f"/cal/{name}", f'"{i}"', data)
+        for i, (name, data) in enumerate(series.items())
+    ]
+    expander = RecurrenceExpander(client._parse_vevent)
+    # Aware window: recurring_ical_events reads naive times in the event's zone
+    first_window = datetime.now().astimezone()
+
+    reference_ms, local_ms = [], []
+    mismatches = 0
+    for r in range(rounds):
+        start = first_window + timedelta(minutes=5 * r)
+        end = start + timedelta(hours=24)
+
+        t0 = time.perf_counter()
+        reference = []
+        for obj in objects:
+            for component in recurring_ical_events.of(obj.calendar).between(start, end):
+                event = client._parse_vevent(component)
+                if event:
+                    reference.append(event)
+        reference_ms.append((time.perf_counter() - t0) * 1000)
+
+        t0 = time.perf_counter()
+        local = []
+        for obj in objects:
+            local.extend(expander.expand(obj, start, end))
+        local_ms.append((time.perf_counter() - t0) * 1000)
+
+        if occurrence_keys(reference) != occurrence_keys(local):
+            mismatches += 1
+
+    return {
+        "reference": reference_ms,
+        "local_cold": local_ms[0],
+        "local_warm": local_ms[1:] or local_ms,
+        "occurrences": len(local),
+        "mismatches": mismatches,
+        "cache": expander.get_stats(),
+    }
+
+
+def make_client(calendar_url: str, expand_mode: str) -> CalDAVClient:
+    """Build a full-sync CalDAVClient bound to one calendar URL."""
+    dav = caldav.DAVClient(url=calendar_url, username="bench", password="bench")
+    client = CalDAVClient(
+        calendar_url, "bench", "bench", sync_mode="full", expand_mode=expand_mode
+    )
+    client.client = dav
+    client.calendars = [dav.calendar(url=calendar_url)]
+    return client
+
+
+def bench_fetch(server: MockCalDAVServer, fetches: int) -> dict:
+    """
+    Measure full date searches with server-side and local expansion.
+
+    Args:
+        server: Running mock server
+        fetches: Date searches per mode
+
+    Returns:
+        Dictionary of mode -> latencies, bytes per fetch and event count
+    """
+    results = {}
+    for mode in ("server", "local"):
+        client = make_client(server.calendar_url, mode)
+        latencies = []
+        bytes_before = server.bytes_sent
+        for _ in range(fetches):
+            start = datetime.now()
+            t0 = time.perf_counter()
+            events = client.fetch_events(start, start + timedelta(hours=24))
+            latencies.append((time.perf_counter() - t0) * 1000)
+        results[mode] = {
+            "latency": latencies,
+            "bytes": (server.bytes_sent - bytes_before) / fetches,
+            "events": len(events),
+        }
+    return results
+
+
+def summarize(values: list) -> str:
+    """Format p50 and mean of a latency list."""
+    return f"p50 {statistics.median(values):8.1f} ms   mean {statistics.mean(values):8.1f} ms"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--series", type=int, default=200, help="Recurring series")
+    parser.add_argument("--singles", type=int, default=300, help="Single events on the mock server")
+    parser.add_argument("--rounds", type=int, default=48, help="Syncs in the expansion benchmark")
+    parser.add_argument("--fetches", type=int, default=5, help="Date searches per mode")
+    args = parser.parse_args()
+
+    series = generate_series(args.series)
+
+    print(f"Expansion: {args.series} series, {args.rounds} syncs 5 minutes apart ...")
+    expansion = bench_expansion(series, args.rounds)
+
+    print(f"Date search: mock server with {args.series} series + {args.singles} single events ...")
+    objects = generate_calendar(args.singles, recurring_ratio=0.0)
+    objects.update(series)
+    server = MockCalDAVServer(objects).start()
+    try:
+        fetch = bench_fetch(server, args.fetches)
+    finally:
+        server.stop()
+
+    print("\n" + "=" * 72)
+    print("  Recurrence expansion")
+    print("=" * 72)
+    print(f"  Occurrences in last window:    {expansion['occurrences']}")
+    print(f"  recurring_ical_events:         {summarize(expansion['reference'])}")
+    print(f"  local, cold cache:             {expansion['local_cold']:8.1f} ms")
+    print(f"  local, warm cache:             {summarize(expansion['local_warm'])}")
+    print(f"  Cache:                         {expansion['cache']}")
+    print(f"  Windows with differences:      {expansion['mismatches']} of {args.rounds}")
+    print("-" * 72)
+    print("  Full date search (24 h window)")
+    for mode, result in fetch.items():
+        print(f"  {mode + ' expansion:':<18} {summarize(result['latency'])}   "
+              f"{result['bytes'] / 1024:7.1f} KiB   {result['events']} events")
+    print("=" * 72)
+    return 1 if expansion["mismatches"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Measure the CPU cost of the live kiosk preview (CDP screencast).
+
+Launches Chromium via BrowserController, loads a page and measures the CPU
+time of the whole process tree (Python + all Chromium processes) for the
+same duration twice: once without a preview viewer and once with one.
+
+Usage:
+    python scripts/benchmark_screencast.py
+    python scripts/benchmark_screencast.py --url https://bbb.example.eu/b/room --duration 60
+    python scripts/benchmark_screencast.py --fps 5 --quality 70
+
+Run this on the Raspberry Pi during a meeting (pass the room URL) to get
+representative numbers. The default page is a local CSS animation that
+repaints continuously, which is a worst case for the screencast.
+"""
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from bench_utils import measure_cpu
+from src.orchestrator.browser_controller import BrowserController
+from src.orchestrator.screencast import KioskScreencast
+from src.utils.config import load_config
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger("benchmark_screencast", level="INFO")
+
+# Continuously repainting page (worst case for frame production)
+ANIMATED_PAGE = (
+    "data:text/html,<style>div{width:50vw;height:50vh;background:red;"
+    "animation:m 1s infinite alternate}@keyframes m{to{transform:translateX(40vw)}}"
+    "</style><div></div>"
+)
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default=ANIMATED_PAGE, help="Page to load")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds per measurement")
+    parser.add_argument("--fps", type=float, default=None, help="Preview max fps")
+    parser.add_argument("--quality", type=int, default=None, help="Preview JPEG quality")
+    parser.add_argument("--headless", action="store_true", help="Run Chromium headless")
+    args = parser.parse_args()
+
+    config = load_config()
+    screencast = KioskScreencast(
+        max_fps=args.fps if args.fps is not None else config.web.preview_max_fps,
+        jpeg_quality=args.quality if args.quality is not None else config.web.preview_jpeg_quality,
+        max_width=config.web.preview_max_width,
+        max_height=config.web.preview_max_width * 9 // 16,
+    )
+
+    browser = BrowserController(
+        bbb_config=config.bbb,
+        headless=args.headless,
+        kiosk_mode=False,
+        screencast=screencast,
+    )
+
+    await browser.start()
+    try:
+        await browser.page.goto(args.url)
+        await asyncio.sleep(3)  # Let the page settle
+
+        logger.info(f"Measuring baseline for {args.duration:.0f}s (no viewer)...")
+        baseline = await measure_cpu(args.duration)
+
+        async def viewer(frame: str):
+            pass
+
+        await browser.add_preview_viewer(viewer)
+        logger.info(f"Measuring with preview viewer for {args.duration:.0f}s...")
+        with_preview = await measure_cpu(args.duration)
+        await browser.remove_preview_viewer(viewer)
+
+        stats = screencast.get_stats()
+        cores = os.cpu_count() or 1
+        overhead = with_preview - baseline
+
+        print("\n" + "=" * 60)
+        print("  Live preview CPU cost")
+        print("=" * 60)
+        print(f"  Settings:      {screencast.max_fps} fps, quality {screencast.jpeg_quality}")
+        print(f"  Baseline:      {baseline:6.1f}% of one core")
+        print(f"  With preview:  {with_preview:6.1f}% of one core")
+        print(f"  Overhead:      {overhead:6.1f}% of one core "
+              f"({overhead / cores:.1f}% of {cores} cores)")
+        print(f"  Frames sent:   {stats['frames_sent']} "
+              f"({stats['frames_sent'] / args.duration:.1f} fps, "
+              f"{stats['bytes_sent'] / max(stats['frames_sent'], 1) / 1024:.1f} KiB/frame)")
+        print("=" * 60)
+
+    finally:
+        await browser.cleanup()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Compare peak memory and throughput of materialised and streaming calendar parsing.
+
+A synthetic calendar (default 10,000 events with HTML descriptions,
+attachments, alarms and attendee lists) is served as one calendar-query
+multistatus response by a local HTTP server. Each pipeline runs in its own
+subprocess, so the peak RSS of one run does not hide the other:
+
+- materialised: read the whole response body, parse every object into an
+  icalendar tree, then convert the trees into MeetingEvents
+- streaming:    CalDAVClient.iter_events() - the response is parsed while
+  it arrives and each VEVENT is tokenized on its own
+
+Reported are the growth of the peak RSS over the baseline after imports,
+the wall time and events per second.
+
+Usage:
+    python scripts/benchmark_streaming_parse.py
+    python scripts/benchmark_streaming_parse.py --events 20000 --plain
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import quote
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from mock_caldav_server import CALENDAR_PATH, _response, generate_calendar
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger("benchmark_streaming_parse", level="WARNING")
+logging.getLogger("src.orchestrator.calendar_sync").setLevel(logging.WARNING)
+
+CHUNK_SIZE = 64 * 1024
+
+
+def write_multistatus(path: str, events: int, days: int, extras: bool) -> int:
+    """
+    Write a calendar-query response with all synthetic events.
+
+    Args:
+        path: Output file
+        events: Number of calendar objects
+        days: Spread events over this many days
+        extras: Add HTML descriptions, attachments, alarms and attendees
+
+    Returns:
+        Size of the response in bytes
+    """
+    from xml.sax.saxutils import escape
+
+    objects = generate_calendar(events, days=days, recurring_ratio=0.0, extras=extras)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(
+            '<?xml version="1.0" encoding="utf-8"?>'
+            '<d:multistatus xmlns:d="DAV:" xmlns:cal="urn:ietf:params:xml:ns:caldav">'
+        )
+        for i, (name, data) in enumerate(objects.items()):
+            f.write(_response(
+                CALENDAR_PATH + quote(name),
+                f'<d:getetag>"{i}-1"</d:getetag>'
+                f"<cal:calendar-data>{escape(data)}</cal:calendar-data>",
+            ))
+        f.write("</d:multistatus>")
+    return os.path.getsize(path)
+
+
+class StaticReportServer:
+    """Answers every REPORT with the same multistatus file, sent in chunks."""
+
+    def __init__(self, path: str):
+        body_path = path
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_REPORT(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                self.rfile.read(length)
+                self.send_response(207)
+                self.send_header("Content-Type", 'application/xml; charset="utf-8"')
+                self.send_header("Content-Length", str(os.path.getsize(body_path)))
+                self.end_headers()
+                with open(body_path, "rb") as f:
+                    while chunk := f.read(CHUNK_SIZE):
+                        self.wfile.write(chunk)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    @property
+    def calendar_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}{CALENDAR_PATH}"
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process (Linux reports KiB)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def run_child(mode: str, calendar_url: str, days: int) -> dict:
+    """
+    Run one pipeline (in a subprocess).
+
+    Args:
+        mode: "materialized" or "streaming"
+        calendar_url: Calendar URL of the static server
+        days: Event spread, for the query window
+
+    Returns:
+        Dictionary with event count, timings and RSS figures
+    """
+    import caldav
+    from icalendar import Calendar
+
+    from src.orchestrator.caldav_protocol import build_calendar_query, iter_calendar_objects
+    from src.orchestrator.caldav_transport import HttpxCalDAVTransport
+    from src.orchestrator.calendar_sync import CalDAVClient
+
+    dav = caldav.DAVClient(url=calendar_url, username="bench", password="bench")
+    client = CalDAVClient(calendar_url, "bench", "bench", sync_mode="full", partial_retrieval=False)
+    client.client = dav
+    client.calendars = [dav.calendar(url=calendar_url)]
+    client.transport = HttpxCalDAVTransport("bench", "bench", timeout=300.0)
+
+    start = datetime.now(timezone.utc) - timedelta(days=2)
+    end = start + timedelta(days=days + 4)
+    baseline = peak_rss_mb()
+
+    t0 = time.perf_counter()
+    count = 0
+    if mode == "materialized":
+        response = await client.transport.report(calendar_url, build_calendar_query(start, end))
+        calendars = [Calendar.from_ical(obj.data) for obj in iter_calendar_objects(response.content)]
+        events = [
+            client._parse_vevent(component)
+            for calendar in calendars
+            for component in calendar.walk("VEVENT")
+        ]
+        count = sum(1 for event in events if event)
+    else:
+        async for _ in client.iter_events(start, end):
+            count += 1
+    elapsed = time.perf_counter() - t0
+
+    await client.close_transport()
+    return {
+        "events": count,
+        "seconds": elapsed,
+        "baseline_mb": baseline,
+        "peak_mb": peak_rss_mb(),
+    }
+
+
+def run_pipeline(mode: str, calendar_url: str, days: int) -> dict:
+    """Run a pipeline in a fresh interpreter and return its measurements."""
+    output = subprocess.run(
+        [sys.executable, __file__, "--child", mode, "--calendar-url", calendar_url,
+         "--days", str(days)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=10000, help="Events in the calendar")
+    parser.add_argument("--days", type=int, default=30, help="Spread events over this many days")
+    parser.add_argument("--plain", action="store_true",
+                        help="Plain events without HTML descriptions, attachments and attendees")
+    parser.add_argument("--child", choices=("materialized", "streaming"), help=argparse.SUPPRESS)
+    parser.add_argument("--calendar-url", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(asyncio.run(run_child(args.child, args.calendar_url, args.days))))
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        body_path = os.path.join(tmp, "multistatus.xml")
+        print(f"Generating {args.events} events ...")
+        size = write_multistatus(body_path, args.events, args.days, extras=not args.plain)
+
+        server = StaticReportServer(body_path)
+        try:
+            results = {
+                mode: run_pipeline(mode, server.calendar_url, args.days)
+                for mode in ("materialized", "streaming")
+            }
+        finally:
+            server.stop()
+
+    print("\n" + "=" * 72)
+    print(f"  Calendar parsing: {args.events} events, response {size / 1024 / 1024:.1f} MiB")
+    print("=" * 72)
+    for mode, result in results.items():
+        growth = result["peak_mb"] - result["baseline_mb"]
+        print(f"  {mode + ':':<14} peak RSS +{growth:7.1f} MiB "
+              f"(total {result['peak_mb']:6.1f} MiB)   "
+              f"{result['seconds']:6.2f} s   {result['events'] / result['seconds']:8.0f} events/s")
+    print("=" * 72)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
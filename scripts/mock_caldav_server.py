@@ -0,0 +1,528 @@
+#!/usr/bin/env python3
+"""
+Minimal CalDAV server with synthetic events for the calendar benchmarks.
+
+Serves one calendar collection over HTTP/1.1 keep-alive and answers the
+requests used by the sync engine: PROPFIND (getctag, sync-token),
+sync-collection REPORT and calendar-multiget REPORT, plus calendar-query
+REPORT with time-range and optional server-side expansion (like Nextcloud:
+expanded instances carry RECURRENCE-ID and no RRULE). Partial calendar-data
+retrieval (VEVENT property selection) is honoured. Responses are gzipped
+when the client accepts it. With a certificate it serves HTTPS, e.g. with
+a self-signed one from generate_self_signed_cert(). Discovery (principal,
+calendar-home-set) is not implemented - benchmarks talk to the calendar URL
+directly.
+
+Usage:
+    python scripts/mock_caldav_server.py --events 500 --port 5232
+    python scripts/mock_caldav_server.py --https
+"""
+import argparse
+import gzip
+import random
+import re
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote, unquote
+from xml.sax.saxutils import escape
+
+import recurring_ical_events
+from icalendar import Calendar, Event
+
+
+CALENDAR_PATH = "/dav/calendars/room/meetings/"
+
+
+def generate_event(
+    uid: str,
+    start: datetime,
+    minutes: int = 60,
+    recurring: bool = False,
+    description_lines: int = 3,
+    rrule: str = "FREQ=WEEKLY;COUNT=52",
+    tzid: Optional[str] = None,
+    override: bool = False,
+    extras: bool = False
+) -> str:
+    """
+    Generate one iCalendar object with a BigBlueButton meeting.
+
+    Args:
+        uid: Event UID
+        start: Start time (UTC)
+        minutes: Duration
+        recurring: Add an RRULE with one EXDATE
+        description_lines: Filler lines in the description
+        rrule: Recurrence rule of recurring events
+        tzid: Time zone of start/end (local wall-clock time instead of UTC)
+        override: Move the fourth occurrence of a recurring event by one hour
+        extras: Add what real clients send along: HTML description,
+            attachment, alarm and a long attendee list
+
+    Returns:
+        iCalendar text with CRLF line endings
+    """
+    fmt = "%Y%m%dT%H%M%SZ"
+    end = start + timedelta(minutes=minutes)
+
+    def stamp(name: str, value: datetime) -> str:
+        if tzid:
+            return f"{name};TZID={tzid}:{value.strftime(fmt[:-1])}"
+        return f"{name}:{value.strftime(fmt)}"
+
+    filler = "\\n".join(f"Agenda item {i}: status update and discussion" for i in range(description_lines))
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//RaspberryMeet//Benchmark//EN",
+        "BEGIN:VEVENT",
+        f"UID:{uid}",
+        f"DTSTAMP:{start.strftime(fmt)}",
+        stamp("DTSTART", start),
+        stamp("DTEND", end),
+        f"SUMMARY:Meeting {uid}",
+        f"DESCRIPTION:Join: https://bbb.example.eu/b/room-{uid[-6:]}\\nPasswort: 123456\\n{filler}",
+        "LOCATION:Konferenzraum 1",
+        "ORGANIZER:mailto:organizer@example.eu",
+        "ATTENDEE:mailto:room-1@example.eu",
+        "ATTENDEE:mailto:team@example.eu",
+    ]
+    if extras:
+        html = "".join(f"<p>Agenda item {i}: <b>status update</b> and discussion</p>" for i in range(description_lines))
+        lines.append(f"X-ALT-DESC;FMTTYPE=text/html:<html><body>{html}</body></html>")
+        lines.append("ATTACH;FMTTYPE=application/pdf:https://cloud.example.eu/s/agenda.pdf")
+        lines += [f"ATTENDEE;CN=Participant {i};PARTSTAT=NEEDS-ACTION:mailto:p{i}@example.eu" for i in range(20)]
+        lines += ["BEGIN:VALARM", "ACTION:DISPLAY", "DESCRIPTION:Reminder", "TRIGGER:-PT15M", "END:VALARM"]
+    if recurring:
+        lines.append(f"RRULE:{rrule}")
+        lines.append(stamp("EXDATE", start + timedelta(weeks=2)))
+    lines.append("END:VEVENT")
+    if recurring and override:
+        # Fourth occurrence of a daily or weekly series, one hour later
+        step = timedelta(days=1) if "FREQ=DAILY" in rrule else timedelta(weeks=1)
+        original = start + 3 * step
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:{uid}",
+            f"DTSTAMP:{start.strftime(fmt)}",
+            stamp("RECURRENCE-ID", original),
+            stamp("DTSTART", original + timedelta(hours=1)),
+            stamp("DTEND", original + timedelta(hours=1, minutes=minutes)),
+            f"SUMMARY:Meeting {uid} (moved)",
+            f"DESCRIPTION:Join: https://bbb.example.eu/b/room-{uid[-6:]}",
+            "END:VEVENT",
+        ]
+    lines += ["END:VCALENDAR", ""]
+    return "\r\n".join(lines)
+
+
+def generate_calendar(
+    count: int,
+    days: int = 14,
+    recurring_ratio: float = 0.1,
+    seed: int = 42,
+    extras: bool = False
+) -> Dict[str, str]:
+    """
+    Generate a calendar of synthetic meetings.
+
+    Args:
+        count: Number of calendar objects
+        days: Spread events over this many days around now
+        recurring_ratio: Fraction of recurring events
+        seed: Random seed (reproducible calendars)
+        extras: Add HTML descriptions, attachments, alarms and attendees
+
+    Returns:
+        Dictionary of object name -> iCalendar text
+    """
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    objects = {}
+    for i in range(count):
+        start = now + timedelta(hours=rng.randint(-24, days * 24), minutes=rng.choice((0, 15, 30, 45)))
+        uid = f"bench-{i:06d}"
+        objects[f"{uid}.ics"] = generate_event(
+            uid,
+            start,
+            minutes=rng.choice((30, 45, 60, 90)),
+            recurring=rng.random() < recurring_ratio,
+            extras=extras,
+        )
+    return objects
+
+
+def generate_self_signed_cert(directory: Optional[str] = None) -> Tuple[str, str]:
+    """
+    Create a self-signed certificate for 127.0.0.1/localhost with the openssl CLI.
+
+    Args:
+        directory: Target directory (default: a new temporary directory)
+
+    Returns:
+        (certificate file, key file)
+    """
+    directory = Path(directory or tempfile.mkdtemp(prefix="mock-caldav-"))
+    certfile, keyfile = directory / "cert.pem", directory / "key.pem"
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "2",
+            "-subj", "/CN=localhost", "-addext", "subjectAltName=IP:127.0.0.1,DNS:localhost",
+            "-keyout", str(keyfile), "-out", str(certfile),
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return str(certfile), str(keyfile)
+
+
+class MockCalDAVServer:
+    """Threaded HTTP server holding one calendar collection."""
+
+    def __init__(
+        self,
+        objects: Dict[str, str],
+        host: str = "127.0.0.1",
+        port: int = 0,
+        partial_retrieval: bool = True,
+        certfile: Optional[str] = None,
+        keyfile: Optional[str] = None
+    ):
+        """
+        Initialize server.
+
+        Args:
+            objects: Object name -> iCalendar text
+            host: Bind address
+            port: Port (0 = any free port)
+            partial_retrieval: Honour calendar-data property selection
+                (False: ignore it and always send full objects)
+            certfile: TLS certificate (PEM); serves HTTPS if given
+            keyfile: TLS private key (PEM)
+        """
+        self.objects = dict(objects)
+        self.etags = {name: f'"{i}-1"' for i, name in enumerate(self.objects)}
+        self.version = 1
+        # Changes per version: version -> {name: deleted?}
+        self.history: Dict[int, Dict[str, bool]] = {}
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.bytes_sent = 0
+        self.partial_retrieval = partial_retrieval
+        # Parsed objects for calendar-query: name -> (etag, Calendar)
+        self._parsed: Dict[str, tuple] = {}
+
+        handler = type("Handler", (_Handler,), {"server_state": self})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self.tls = certfile is not None
+        if self.tls:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(certfile, keyfile)
+            # Handshake in the request thread, not in the accept loop
+            self.httpd.socket = context.wrap_socket(
+                self.httpd.socket, server_side=True, do_handshake_on_connect=False
+            )
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server."""
+        host, port = self.httpd.server_address[:2]
+        return f"{'https' if self.tls else 'http'}://{host}:{port}"
+
+    @property
+    def calendar_url(self) -> str:
+        """URL of the calendar collection."""
+        return self.url + CALENDAR_PATH
+
+    @property
+    def sync_token(self) -> str:
+        """Current sync token."""
+        return f"http://raspberrymeet.local/sync/{self.version}"
+
+    def start(self) -> "MockCalDAVServer":
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def update(self, name: str, data: Optional[str]):
+        """
+        Change, add (data) or delete (None) an object.
+
+        Args:
+            name: Object name (e.g. bench-000001.ics)
+            data: New iCalendar text, or None to delete
+        """
+        with self.lock:
+            self.version += 1
+            if data is None:
+                self.objects.pop(name, None)
+                self.etags.pop(name, None)
+            else:
+                self.objects[name] = data
+                self.etags[name] = f'"{name}-{self.version}"'
+            self.history[self.version] = {name: data is None}
+
+    def parsed(self, name: str) -> Calendar:
+        """Parsed iCalendar of an object (cached per ETag, call with lock held)."""
+        etag = self.etags[name]
+        cached = self._parsed.get(name)
+        if cached is None or cached[0] != etag:
+            cached = (etag, Calendar.from_ical(self.objects[name]))
+            self._parsed[name] = cached
+        return cached[1]
+
+
+def _response(href: str, props: str, status: str = "HTTP/1.1 200 OK") -> str:
+    return (
+        f"<d:response><d:href>{escape(href)}</d:href>"
+        f"<d:propstat><d:prop>{props}</d:prop><d:status>{status}</d:status></d:propstat>"
+        "</d:response>"
+    )
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in two writes; with Nagle and delayed ACKs
+    # every keep-alive response after the first would wait ~40 ms
+    disable_nagle_algorithm = True
+    server_state: MockCalDAVServer
+
+    def log_message(self, format, *args):
+        pass
+
+    def setup(self):
+        if isinstance(self.request, ssl.SSLSocket):
+            self.request.do_handshake()
+        super().setup()
+
+    def _body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _send(self, status: int, body: str):
+        state = self.server_state
+        data = body.encode("utf-8")
+        headers = {"Content-Type": 'application/xml; charset="utf-8"'}
+        if "gzip" in (self.headers.get("Accept-Encoding") or ""):
+            data = gzip.compress(data, compresslevel=5)
+            headers["Content-Encoding"] = "gzip"
+
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+        with state.lock:
+            state.requests += 1
+            state.bytes_sent += len(data)
+
+    def _multistatus(self, responses: str, token: str = "") -> str:
+        token_element = f"<d:sync-token>{escape(token)}</d:sync-token>" if token else ""
+        return (
+            '<?xml version="1.0" encoding="utf-8"?>'
+            '<d:multistatus xmlns:d="DAV:" xmlns:cal="urn:ietf:params:xml:ns:caldav" '
+            'xmlns:cs="http://calendarserver.org/ns/">'
+            f"{responses}{token_element}</d:multistatus>"
+        )
+
+    def do_PROPFIND(self):
+        self._body()
+        state = self.server_state
+        props = (
+            f"<cs:getctag>{state.version}</cs:getctag>"
+            f"<d:sync-token>{escape(state.sync_token)}</d:sync-token>"
+        )
+        self._send(207, self._multistatus(_response(CALENDAR_PATH, props)))
+
+    def do_REPORT(self):
+        body = self._body().decode("utf-8")
+        if "sync-collection" in body:
+            self._sync_collection(body)
+        elif "calendar-multiget" in body:
+            self._multiget(body)
+        elif "calendar-query" in body:
+            self._calendar_query(body)
+        else:
+            self._send(501, "")
+
+    def _sync_collection(self, body: str):
+        state = self.server_state
+        with_data = "calendar-data" in body
+        match = re.search(r"<D:sync-token>([^<]*)</D:sync-token>", body, re.IGNORECASE)
+        token = match.group(1).strip() if match else ""
+
+        with state.lock:
+            if token:
+                try:
+                    since = int(token.rsplit("/", 1)[1])
+                except (IndexError, ValueError):
+                    since = -1
+                if since < 1 or since > state.version:
+                    self._send(403, '<d:error xmlns:d="DAV:"><d:valid-sync-token/></d:error>')
+                    return
+                changes: Dict[str, bool] = {}
+                for version in range(since + 1, state.version + 1):
+                    changes.update(state.history.get(version, {}))
+            else:
+                changes = {name: False for name in state.objects}
+
+            parts = []
+            for name, deleted in changes.items():
+                href = CALENDAR_PATH + quote(name)
+                if deleted:
+                    parts.append(
+                        f"<d:response><d:href>{href}</d:href>"
+                        "<d:status>HTTP/1.1 404 Not Found</d:status></d:response>"
+                    )
+                    continue
+                data = f"<cal:calendar-data>{escape(state.objects[name])}</cal:calendar-data>" if with_data else ""
+                parts.append(_response(href, f"<d:getetag>{state.etags[name]}</d:getetag>{data}"))
+            body = self._multistatus("".join(parts), state.sync_token)
+
+        self._send(207, body)
+
+    def _selection(self, body: str) -> Optional[set]:
+        """Requested VEVENT properties of a partial calendar-data request."""
+        match = re.search(r'<\w+:comp name="VEVENT">(.*?)</\w+:comp>', body, re.DOTALL)
+        if not match or not self.server_state.partial_retrieval:
+            return None
+        return set(re.findall(r'<\w+:prop name="([^"]+)"', match.group(1)))
+
+    def _multiget(self, body: str):
+        state = self.server_state
+        selection = self._selection(body)
+        parts = []
+        with state.lock:
+            for href in re.findall(r"<D:href>([^<]*)</D:href>", body, re.IGNORECASE):
+                name = unquote(href).rsplit("/", 1)[-1]
+                if name not in state.objects:
+                    parts.append(
+                        f"<d:response><d:href>{href}</d:href>"
+                        "<d:status>HTTP/1.1 404 Not Found</d:status></d:response>"
+                    )
+                    continue
+                data = state.objects[name]
+                if selection is not None:
+                    data = _selected(state.parsed(name), selection)
+                parts.append(_response(
+                    href,
+                    f"<d:getetag>{state.etags[name]}</d:getetag>"
+                    f"<cal:calendar-data>{escape(data)}</cal:calendar-data>",
+                ))
+        self._send(207, self._multistatus("".join(parts)))
+
+    def _calendar_query(self, body: str):
+        state = self.server_state
+        match = re.search(r'time-range start="([^"]+)" end="([^"]+)"', body)
+        if not match:
+            self._send(400, "")
+            return
+        start, end = (
+            datetime.strptime(value, "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc)
+            for value in match.groups()
+        )
+        expand = re.search(r"<\w+:expand\b", body) is not None
+        selection = self._selection(body)
+
+        parts = []
+        with state.lock:
+            for name in state.objects:
+                calendar = state.parsed(name)
+                occurrences = recurring_ical_events.of(calendar).between(start, end)
+                if not occurrences:
+                    continue
+                data = state.objects[name]
+                if expand:
+                    data = _expanded(calendar, occurrences)
+                if selection is not None:
+                    data = _selected(Calendar.from_ical(data) if expand else calendar, selection)
+                parts.append(_response(
+                    CALENDAR_PATH + quote(name),
+                    f"<d:getetag>{state.etags[name]}</d:getetag>"
+                    f"<cal:calendar-data>{escape(data)}</cal:calendar-data>",
+                ))
+        self._send(207, self._multistatus("".join(parts)))
+
+
+def _expanded(calendar: Calendar, occurrences: List) -> str:
+    """Server-side expansion: one VEVENT per instance, no recurrence rules."""
+    expanded = Calendar()
+    for key, value in calendar.items():
+        expanded.add(key, value)
+    for occurrence in occurrences:
+        for key in ("RRULE", "RDATE", "EXDATE"):
+            occurrence.pop(key, None)
+        if "RECURRENCE-ID" not in occurrence and "RRULE" in calendar.walk("VEVENT")[0]:
+            occurrence.add("RECURRENCE-ID", occurrence["DTSTART"].dt)
+        expanded.add_component(occurrence)
+    return expanded.to_ical().decode("utf-8")
+
+
+def _selected(calendar: Calendar, properties: set) -> str:
+    """Partial retrieval: VERSION, time zones and the selected VEVENT properties."""
+    selected = Calendar()
+    selected["VERSION"] = calendar.get("VERSION", "2.0")
+    for component in calendar.subcomponents:
+        if component.name == "VTIMEZONE":
+            selected.add_component(component)
+        elif component.name == "VEVENT":
+            event = Event()
+            for key, value in component.items():
+                if key in properties:
+                    event[key] = value
+            selected.add_component(event)
+    return selected.to_ical().decode("utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a synthetic CalDAV calendar")
+    parser.add_argument("--events", type=int, default=500, help="Number of calendar objects")
+    parser.add_argument("--days", type=int, default=14, help="Spread events over this many days")
+    parser.add_argument("--port", type=int, default=5232, help="Port to listen on")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address")
+    parser.add_argument("--extras", action="store_true",
+                        help="Add HTML descriptions, attachments, alarms and attendees")
+    parser.add_argument("--ignore-partial", action="store_true",
+                        help="Ignore partial calendar-data requests (always send full objects)")
+    parser.add_argument("--https", action="store_true", help="Serve HTTPS with a self-signed certificate")
+    args = parser.parse_args()
+
+    certfile, keyfile = generate_self_signed_cert() if args.https else (None, None)
+    server = MockCalDAVServer(
+        generate_calendar(args.events, days=args.days, extras=args.extras),
+        host=args.host,
+        port=args.port,
+        partial_retrieval=not args.ignore_partial,
+        certfile=certfile,
+        keyfile=keyfile,
+    )
+    print(f"Serving {args.events} events at {server.calendar_url}")
+    try:
+        server.start()
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
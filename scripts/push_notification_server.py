@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for calendar change notifications.
+
+Lets you test notification-driven sync without a CalDAV server that
+supports WebDAV-Push. Offers both channels the orchestrator understands:
+
+- Long-poll: GET /changes holds the request (If-None-Match, ?wait=) until
+  the next change and answers with a new ETag, or 304 when the wait is
+  over. Point CALDAV_PUSH_LONGPOLL_URL at it.
+- Webhook: every change is also POSTed to the --webhook URLs (the
+  orchestrator's receiver or the web app's /api/calendar/notify).
+
+Changes are raised with POST /trigger, by pressing Enter, or every
+--every seconds.
+
+Usage:
+    python scripts/push_notification_server.py
+    python scripts/push_notification_server.py --port 8767 --every 60 \\
+        --webhook http://127.0.0.1:8766/notify --token secret
+    curl -X POST http://127.0.0.1:8767/trigger
+"""
+import argparse
+import json
+import sys
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+
+class ChangeFeed:
+    """Version counter that long-poll requests wait on."""
+
+    def __init__(self, webhooks: List[str], token: Optional[str]):
+        self.version = 1
+        self.webhooks = webhooks
+        self.token = token
+        self._condition = threading.Condition()
+
+    @property
+    def etag(self) -> str:
+        return f'"v{self.version}"'
+
+    def trigger(self, reason: str):
+        """Raise a change: wake long-poll clients and call the webhooks."""
+        with self._condition:
+            self.version += 1
+            self._condition.notify_all()
+        print(f"{time.strftime('%H:%M:%S')} change {self.etag} ({reason})", flush=True)
+
+        for url in self.webhooks:
+            request = urllib.request.Request(url, data=b"", method="POST")
+            if self.token:
+                request.add_header("X-Notify-Token", self.token)
+            try:
+                with urllib.request.urlopen(request, timeout=5) as response:
+                    print(f"  webhook {url}: HTTP {response.status}", flush=True)
+            except Exception as e:
+                print(f"  webhook {url}: {e}", flush=True)
+
+    def wait(self, etag: Optional[str], timeout: float) -> bool:
+        """Wait until the ETag differs from etag; False on timeout."""
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while etag == self.etag:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+
+def make_handler(feed: ChangeFeed, max_wait: float):
+    """Request handler bound to a change feed."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def _reply(self, status: int, body: bytes = b"", etag: Optional[str] = None):
+            self.send_response(status)
+            if etag:
+                self.send_header("ETag", etag)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _authorized(self, query: dict) -> bool:
+            provided = self.headers.get("X-Notify-Token") or query.get("token", [None])[0]
+            return not feed.token or provided == feed.token
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            query = parse_qs(url.query)
+            if url.path != "/changes":
+                return self._reply(404)
+            if not self._authorized(query):
+                return self._reply(403)
+
+            wait = min(float(query.get("wait", ["30"])[0]), max_wait)
+            etag = self.headers.get("If-None-Match")
+            if etag and not feed.wait(etag, wait):
+                return self._reply(304, etag=etag)
+            body = json.dumps({"version": feed.version}).encode()
+            self._reply(200, body, etag=feed.etag)
+
+        def do_POST(self):
+            url = urlsplit(self.path)
+            length = int(self.headers.get("Content-Length", "0") or 0)
+            if length:
+                self.rfile.read(length)
+            if url.path != "/trigger":
+                return self._reply(404)
+            if not self._authorized(parse_qs(url.query)):
+                return self._reply(403)
+            feed.trigger("POST /trigger")
+            self._reply(204)
+
+    return Handler
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address")
+    parser.add_argument("--port", type=int, default=8767, help="Port")
+    parser.add_argument("--every", type=float, default=0, help="Raise a change every N seconds (0: off)")
+    parser.add_argument("--webhook", action="append", default=[], help="POST every change to this URL")
+    parser.add_argument("--token", help="Required X-Notify-Token, also sent to webhooks")
+    parser.add_argument("--max-wait", type=float, default=300, help="Longest long-poll hold in seconds")
+    args = parser.parse_args()
+
+    feed = ChangeFeed(args.webhook, args.token)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(feed, args.max_wait))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    print(f"Long-poll:  http://{args.host}:{args.port}/changes")
+    print(f"Trigger:    curl -X POST http://{args.host}:{args.port}/trigger  (or press Enter)")
+    for url in args.webhook:
+        print(f"Webhook:    {url}")
+
+    if args.every > 0:
+        def periodic():
+            while True:
+                time.sleep(args.every)
+                feed.trigger(f"every {args.every:g}s")
+        threading.Thread(target=periodic, daemon=True).start()
+
+    try:
+        if sys.stdin.isatty():
+            for _ in sys.stdin:
+                feed.trigger("Enter")
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,7 @@ Audio and video device management for RaspberryMeet.
 Handles automatic detection and configuration of conference speakerphones
 and webcams for optimal BigBlueButton experience.
 """
+import json
 import subprocess
 from pathlib import Path
 from typing import List, Optional, Dict
@@ -377,3 +378,75 @@ class AudioVideoManager:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.cleanup()
+
+
+# Per-page device routing for multi-room mode. All rooms share one Chromium
+# process, so PulseAudio defaults can't tell them apart; instead each room's
+# browser context picks its own microphone (getUserMedia constraint) and
+# speaker (setSinkId) by device label.
+_AUDIO_ROUTING_SCRIPT = """
+(() => {
+    const INPUT = %(input)s;
+    const OUTPUT = %(output)s;
+    const media = navigator.mediaDevices;
+    if (!media) {
+        return;
+    }
+
+    async function findDevice(kind, label) {
+        const devices = await media.enumerateDevices();
+        const device = devices.find(
+            (d) => d.kind === kind && d.label.toLowerCase().includes(label)
+        );
+        return device ? device.deviceId : null;
+    }
+
+    if (INPUT) {
+        const getUserMedia = media.getUserMedia.bind(media);
+        media.getUserMedia = async (constraints) => {
+            if (constraints && constraints.audio) {
+                const deviceId = await findDevice("audioinput", INPUT);
+                if (deviceId) {
+                    const audio = typeof constraints.audio === "object" ? constraints.audio : {};
+                    constraints = { ...constraints, audio: { ...audio, deviceId: { exact: deviceId } } };
+                }
+            }
+            return getUserMedia(constraints);
+        };
+    }
+
+    if (OUTPUT) {
+        const play = HTMLMediaElement.prototype.play;
+        HTMLMediaElement.prototype.play = function () {
+            if (!this.__raspberrymeetSink && this.setSinkId) {
+                this.__raspberrymeetSink = true;
+                findDevice("audiooutput", OUTPUT).then((id) => id && this.setSinkId(id));
+            }
+            return play.apply(this, arguments);
+        };
+    }
+})();
+"""
+
+
+def build_audio_routing_script(
+    input_label: Optional[str] = None,
+    output_label: Optional[str] = None,
+) -> Optional[str]:
+    """
+    Build a browser init script that routes a page to specific audio devices.
+
+    Args:
+        input_label: Microphone label substring (case-insensitive)
+        output_label: Speaker label substring (case-insensitive)
+
+    Returns:
+        JavaScript source, or None if no routing is configured
+    """
+    if not input_label and not output_label:
+        return None
+
+    return _AUDIO_ROUTING_SCRIPT % {
+        "input": json.dumps(input_label.lower() if input_label else None),
+        "output": json.dumps(output_label.lower() if output_label else None),
+    }
@@ -2,8 +2,9 @@
 Browser automation controller for BigBlueButton using Playwright
 """
 import asyncio
+import inspect
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional
 from urllib.parse import urlparse
 
 from playwright.async_api import (
@@ -15,6 +16,9 @@ from playwright.async_api import (
     TimeoutError as PlaywrightTimeoutError,
 )
 
+from src.orchestrator.flight_recorder import JoinFlightRecorder
+from src.orchestrator.meeting_observer import OBSERVER_BINDING, OBSERVER_SCRIPT
+from src.orchestrator.screencast import FrameCallback, KioskScreencast
 from src.utils.logger import setup_logger
 from src.utils.config import BigBlueButtonConfig
 
@@ -22,6 +26,16 @@ from src.utils.config import BigBlueButtonConfig
 logger = setup_logger(__name__)
 
 
+# Chromium launch arguments shared by single- and multi-room mode
+LAUNCH_ARGS = [
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-infobars",
+    "--disable-session-crashed-bubble",
+    "--disable-dev-shm-usage",
+]
+
+
 class BrowserController:
     """
     Controls Chromium browser for automated BigBlueButton meeting joins.
@@ -34,6 +48,11 @@ class BrowserController:
         bbb_config: BigBlueButtonConfig,
         headless: bool = False,
         kiosk_mode: bool = True,
+        screencast: Optional[KioskScreencast] = None,
+        flight_recorder: Optional[JoinFlightRecorder] = None,
+        shared_browser: Optional[Browser] = None,
+        window_bounds: Optional[Dict[str, int]] = None,
+        init_scripts: Optional[List[str]] = None,
     ):
         """
         Initialize browser controller.
@@ -42,16 +61,31 @@ class BrowserController:
             bbb_config: BigBlueButton configuration
             headless: Run browser in headless mode (no GUI)
             kiosk_mode: Run browser in fullscreen kiosk mode
+            screencast: Live preview screencast (default settings if not provided)
+            flight_recorder: Join flight recorder for diagnostics (optional)
+            shared_browser: Already running Chromium to open an isolated context in
+                (multi-room mode). The browser is not closed on cleanup.
+            window_bounds: Window placement (left, top, width, height) for this
+                controller's page, e.g. to put a room on its own display
+            init_scripts: Additional scripts injected into every page of the context
         """
         self.bbb_config = bbb_config
         self.headless = headless
         self.kiosk_mode = kiosk_mode
+        self.screencast = screencast or KioskScreencast()
+        self.flight_recorder = flight_recorder
+        self.shared_browser = shared_browser
+        self.window_bounds = window_bounds
+        self.init_scripts = init_scripts or []
 
         self.playwright: Optional[Playwright] = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
 
+        # Callback for in-meeting state changes pushed by the page observer
+        self._meeting_state_callback: Optional[Callable[[Dict[str, Any]], Any]] = None
+
         self._is_running = False
 
     async def start(self) -> None:
@@ -63,29 +97,27 @@ class BrowserController:
         logger.info("Starting Playwright browser...")
 
         try:
-            self.playwright = await async_playwright().start()
-
-            # Browser launch arguments
-            launch_args = [
-                "--no-first-run",
-                "--no-default-browser-check",
-                "--disable-infobars",
-                "--disable-session-crashed-bubble",
-                "--disable-dev-shm-usage",
-            ]
-
-            # Add kiosk mode arguments if enabled
-            if self.kiosk_mode and not self.headless:
-                launch_args.extend([
-                    "--kiosk",
-                    "--start-fullscreen",
-                ])
-
-            # Launch browser
-            self.browser = await self.playwright.chromium.launch(
-                headless=self.headless,
-                args=launch_args,
-            )
+            if self.shared_browser:
+                # Multi-room mode: only this room's context is ours
+                self.browser = self.shared_browser
+            else:
+                self.playwright = await async_playwright().start()
+
+                # Browser launch arguments
+                launch_args = list(LAUNCH_ARGS)
+
+                # Add kiosk mode arguments if enabled
+                if self.kiosk_mode and not self.headless:
+                    launch_args.extend([
+                        "--kiosk",
+                        "--start-fullscreen",
+                    ])
+
+                # Launch browser
+                self.browser = await self.playwright.chromium.launch(
+                    headless=self.headless,
+                    args=launch_args,
+                )
 
             # Create browser context with permissions
             self.context = await self.browser.new_context(
@@ -93,9 +125,20 @@ class BrowserController:
                 viewport={"width": 1920, "height": 1080} if not self.kiosk_mode else None,
             )
 
+            # Expose the state binding and inject the observer on every navigation
+            await self.context.expose_function(
+                OBSERVER_BINDING, self._on_meeting_state_changed
+            )
+            await self.context.add_init_script(OBSERVER_SCRIPT)
+            for script in self.init_scripts:
+                await self.context.add_init_script(script)
+
             # Create new page
             self.page = await self.context.new_page()
 
+            if self.window_bounds and not self.headless:
+                await self._place_window(self.window_bounds)
+
             self._is_running = True
             logger.info("Browser started successfully")
 
@@ -104,6 +147,64 @@ class BrowserController:
             await self.cleanup()
             raise
 
+    async def _place_window(self, bounds: Dict[str, int]) -> None:
+        """
+        Move the page's window to the given bounds (and fullscreen it in kiosk mode).
+
+        Args:
+            bounds: Dictionary with left, top, width and height in pixels
+        """
+        try:
+            session = await self.context.new_cdp_session(self.page)
+            window = await session.send("Browser.getWindowForTarget")
+            window_id = window["windowId"]
+
+            # Leave fullscreen first, Chromium ignores moves of fullscreen windows
+            await session.send("Browser.setWindowBounds", {
+                "windowId": window_id,
+                "bounds": {"windowState": "normal"},
+            })
+            await session.send("Browser.setWindowBounds", {
+                "windowId": window_id,
+                "bounds": {
+                    "left": bounds.get("left", 0),
+                    "top": bounds.get("top", 0),
+                    "width": bounds.get("width", 1920),
+                    "height": bounds.get("height", 1080),
+                },
+            })
+            if self.kiosk_mode:
+                await session.send("Browser.setWindowBounds", {
+                    "windowId": window_id,
+                    "bounds": {"windowState": "fullscreen"},
+                })
+            await session.detach()
+            logger.info(f"Placed browser window at {bounds}")
+
+        except Exception as e:
+            logger.warning(f"Failed to place browser window: {e}")
+
+    def set_meeting_state_callback(self, callback: Callable[[Dict[str, Any]], Any]):
+        """
+        Set callback for in-meeting state changes (mute, participants, talking).
+
+        Args:
+            callback: Function (sync or async) receiving a dict of changed fields
+        """
+        self._meeting_state_callback = callback
+
+    async def _on_meeting_state_changed(self, changes: Dict[str, Any]) -> None:
+        """Receive change events from the injected page observer."""
+        if not self._meeting_state_callback or not isinstance(changes, dict):
+            return
+
+        try:
+            result = self._meeting_state_callback(changes)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.error(f"Error in meeting state callback: {e}")
+
     async def join_meeting(
         self,
         room_url: Optional[str] = None,
@@ -138,45 +239,84 @@ class BrowserController:
 
         logger.info(f"Joining BBB meeting as '{username}': {room_url}")
 
+        recorder = self.flight_recorder
+        if recorder:
+            await recorder.begin(self.page, room_url)
+
+        success = False
+        try:
+            success = await self._join_meeting_steps(room_url, username, password, timeout)
+            return success
+        finally:
+            if recorder:
+                await recorder.finish(success)
+
+    async def _join_meeting_steps(
+        self,
+        room_url: str,
+        username: str,
+        password: Optional[str],
+        timeout: int,
+    ) -> bool:
+        """Run the individual join steps, marking step boundaries for the recorder."""
+        recorder = self.flight_recorder
+
+        async def step(name: str):
+            if recorder:
+                await recorder.step(name)
+
+        def fail(message: str):
+            logger.error(message)
+            if recorder:
+                recorder.record("error", message)
+
         try:
             # Navigate to room URL
             logger.debug(f"Navigating to {room_url}")
             await self.page.goto(room_url, wait_until="networkidle", timeout=timeout)
             await asyncio.sleep(2)  # Wait for page to stabilize
+            await step("navigate")
 
             # Handle room password if required
             if password:
                 if await self._enter_room_password(password, timeout):
                     logger.debug("Room password entered successfully")
+                await step("password")
 
             # Enter username
             if not await self._enter_username(username, timeout):
-                logger.error("Failed to enter username")
+                fail("Failed to enter username")
                 return False
+            await step("username")
 
             # Click join button
             if not await self._click_join_button(timeout):
-                logger.error("Failed to click join button")
+                fail("Failed to click join button")
                 return False
 
             # Wait for meeting to load
             await asyncio.sleep(3)
+            await step("join_button")
 
             # Handle audio setup
             if not await self._setup_audio(timeout):
                 logger.warning("Failed to setup audio, but continuing...")
+                if recorder:
+                    recorder.record("warning", "Failed to setup audio")
+            await step("audio")
 
             # Close any welcome/tutorial modals
             await self._close_modals(timeout)
+            await step("modals")
 
             logger.info("Successfully joined BBB meeting")
             return True
 
         except PlaywrightTimeoutError as e:
-            logger.error(f"Timeout while joining meeting: {e}")
+            fail(f"Timeout while joining meeting: {e}")
             return False
         except Exception as e:
-            logger.error(f"Error joining meeting: {e}")
+            fail(f"Error joining meeting: {e}")
             return False
 
     async def _enter_room_password(self, password: str, timeout: int) -> bool:
@@ -453,6 +593,71 @@ class BrowserController:
             logger.error(f"Error leaving meeting: {e}")
             return False
 
+    async def add_preview_viewer(self, callback: FrameCallback) -> bool:
+        """
+        Start streaming live preview frames to a viewer.
+
+        Args:
+            callback: Async function receiving base64-encoded JPEG frames
+
+        Returns:
+            True if the viewer was added, False if the browser is not running
+        """
+        if not self._is_running or not self.page:
+            logger.warning("Browser is not running - no preview available")
+            return False
+
+        await self.screencast.add_viewer(self.page, callback)
+        return True
+
+    async def remove_preview_viewer(self, callback: FrameCallback) -> None:
+        """
+        Stop streaming live preview frames to a viewer.
+
+        Args:
+            callback: Callback previously passed to add_preview_viewer()
+        """
+        await self.screencast.remove_viewer(callback)
+
+    async def screenshot(self, path: Optional[str] = None, full_page: bool = False) -> Optional[bytes]:
+        """
+        Take a screenshot of the current page.
+
+        Args:
+            path: File to write the PNG to (optional)
+            full_page: Capture the whole scrollable page
+
+        Returns:
+            PNG bytes, or None if the browser is not running
+        """
+        if not self._is_running or not self.page:
+            logger.warning("Browser is not running")
+            return None
+
+        return await self.page.screenshot(path=path, full_page=full_page)
+
+    async def evaluate(self, expression: str, arg: Any = None) -> Any:
+        """
+        Evaluate JavaScript in the current page.
+
+        Args:
+            expression: JavaScript expression or function source
+            arg: Optional JSON-serializable argument
+
+        Returns:
+            JSON-serializable result, or None if the browser is not running
+        """
+        if not self._is_running or not self.page:
+            logger.warning("Browser is not running")
+            return None
+
+        return await self.page.evaluate(expression, arg)
+
+    @property
+    def is_running(self) -> bool:
+        """True while the browser is running."""
+        return self._is_running
+
     async def is_in_meeting(self) -> bool:
         """Check if currently in a meeting."""
         if not self._is_running or not self.page:
@@ -487,6 +692,8 @@ class BrowserController:
         logger.info("Cleaning up browser resources")
 
         try:
+            await self.screencast.stop()
+
             if self.page:
                 await self.page.close()
                 self.page = None
@@ -496,7 +703,8 @@ class BrowserController:
                 self.context = None
 
             if self.browser:
-                await self.browser.close()
+                if not self.shared_browser:
+                    await self.browser.close()
                 self.browser = None
 
             if self.playwright:
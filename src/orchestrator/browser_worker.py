@@ -0,0 +1,498 @@
+"""
+Browser automation in a supervised worker process.
+
+Playwright driver traffic, screenshot encoding and large ``page.evaluate``
+payloads are handled in a dedicated process, so the orchestrator's event
+loop stays free for GPIO callbacks and calendar scheduling.
+
+``BrowserWorkerClient`` mirrors the ``BrowserController`` interface and
+talks to the worker over a compact RPC protocol on the worker's
+stdin/stdout: length-prefixed pickle frames carrying requests, responses
+and events (in-meeting state changes, preview frames). The client
+supervises the worker and restarts it with backoff when it dies or stops
+answering heartbeats.
+
+Worker entry point:
+    python -m src.orchestrator.browser_worker
+"""
+import asyncio
+import itertools
+import os
+import pickle
+import struct
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from src.orchestrator.screencast import FrameCallback
+from src.utils.config import PROJECT_ROOT, BigBlueButtonConfig
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+
+# Frame header: payload length (unsigned 32-bit, big endian)
+_HEADER = struct.Struct(">I")
+
+# Methods the client may call on the worker's BrowserController
+WORKER_METHODS = frozenset({
+    "start",
+    "join_meeting",
+    "leave_meeting",
+    "is_in_meeting",
+    "screenshot",
+    "evaluate",
+    "cleanup",
+})
+
+
+class BrowserWorkerError(RuntimeError):
+    """Raised when the browser worker fails or is restarted during a call."""
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> Any:
+    """Read one length-prefixed pickle frame."""
+    header = await reader.readexactly(_HEADER.size)
+    (length,) = _HEADER.unpack(header)
+    return pickle.loads(await reader.readexactly(length))
+
+
+def _encode_frame(message: Any) -> bytes:
+    """Encode one length-prefixed pickle frame."""
+    payload = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+    return _HEADER.pack(len(payload)) + payload
+
+
+class BrowserWorkerClient:
+    """
+    BrowserController stand-in that runs the browser in a worker process.
+
+    Only the ``start()`` arguments and RPC traffic live in this process;
+    the worker is restarted automatically if it crashes or hangs.
+    """
+
+    def __init__(
+        self,
+        bbb_config: BigBlueButtonConfig,
+        headless: bool = False,
+        kiosk_mode: bool = True,
+        call_timeout: float = 180.0,
+        heartbeat_interval: float = 10.0,
+        max_restart_delay: float = 30.0,
+    ):
+        """
+        Initialize worker client.
+
+        Args:
+            bbb_config: BigBlueButton configuration
+            headless: Run browser in headless mode (no GUI)
+            kiosk_mode: Run browser in fullscreen kiosk mode
+            call_timeout: Maximum time for a single RPC call in seconds
+            heartbeat_interval: Seconds between worker liveness checks
+            max_restart_delay: Upper bound for the restart backoff in seconds
+        """
+        self.bbb_config = bbb_config
+        self.headless = headless
+        self.kiosk_mode = kiosk_mode
+        self.call_timeout = call_timeout
+        self.heartbeat_interval = heartbeat_interval
+        self.max_restart_delay = max_restart_delay
+
+        # Diagnostics live in the worker process
+        self.flight_recorder = None
+
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._supervisor_task: Optional[asyncio.Task] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+        self._write_lock = asyncio.Lock()
+        self._stopping = False
+        self._browser_started = False
+
+        self._meeting_state_callback: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self._restart_callback: Optional[Callable[[], Awaitable[None]]] = None
+        self._preview_viewers: set = set()
+
+        # Statistics
+        self.restarts = 0
+        self.last_heartbeat_ms: Optional[float] = None
+
+    @property
+    def is_running(self) -> bool:
+        """True while the worker is alive and its browser is started."""
+        return self._browser_started and self._process is not None and self._process.returncode is None
+
+    def set_meeting_state_callback(self, callback: Callable[[Dict[str, Any]], Any]):
+        """
+        Set callback for in-meeting state changes (mute, participants, talking).
+
+        Args:
+            callback: Function (sync or async) receiving a dict of changed fields
+        """
+        self._meeting_state_callback = callback
+
+    def set_restart_callback(self, callback: Callable[[], Awaitable[None]]):
+        """
+        Set callback invoked after the worker was restarted (browser state is lost).
+
+        Args:
+            callback: Async function without arguments
+        """
+        self._restart_callback = callback
+
+    async def start(self) -> None:
+        """Spawn the worker, start its browser and begin supervision."""
+        if self.is_running:
+            logger.warning("Browser worker is already running")
+            return
+
+        self._stopping = False
+        try:
+            await self._spawn()
+            await self._call("start")
+        except Exception:
+            await self.cleanup()
+            raise
+        self._browser_started = True
+        self._supervisor_task = asyncio.create_task(self._supervise())
+        logger.info("Browser worker started")
+
+    async def _spawn(self) -> None:
+        """Start the worker process and its reader task."""
+        self._process = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", "src.orchestrator.browser_worker",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            cwd=str(PROJECT_ROOT),
+        )
+        self._reader_task = asyncio.create_task(self._read_loop(self._process))
+        await self._call("init", {
+            "bbb_config": self.bbb_config.model_dump(),
+            "headless": self.headless,
+            "kiosk_mode": self.kiosk_mode,
+        })
+        logger.info(f"Browser worker process spawned (pid {self._process.pid})")
+
+    async def _read_loop(self, process: asyncio.subprocess.Process) -> None:
+        """Dispatch responses and events from the worker."""
+        try:
+            while True:
+                message = await _read_frame(process.stdout)
+
+                if "id" in message:
+                    future = self._pending.pop(message["id"], None)
+                    if future and not future.done():
+                        if "e" in message:
+                            future.set_exception(BrowserWorkerError(message["e"]))
+                        else:
+                            future.set_result(message.get("r"))
+                else:
+                    await self._dispatch_event(message["ev"], message.get("d"))
+
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Browser worker protocol error: {e}")
+        finally:
+            self._fail_pending("Browser worker exited")
+
+    async def _dispatch_event(self, event: str, data: Any) -> None:
+        """Handle an event pushed by the worker."""
+        try:
+            if event == "meeting_state" and self._meeting_state_callback:
+                result = self._meeting_state_callback(data)
+                if asyncio.iscoroutine(result):
+                    await result
+
+            elif event == "preview_frame":
+                for viewer in list(self._preview_viewers):
+                    asyncio.create_task(viewer(data))
+
+        except Exception as e:
+            logger.error(f"Error handling browser worker event '{event}': {e}")
+
+    def _fail_pending(self, reason: str) -> None:
+        """Fail all outstanding calls."""
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(BrowserWorkerError(reason))
+
+    async def _call(self, method: str, *args: Any, timeout: Optional[float] = None, **kwargs: Any) -> Any:
+        """Call a method in the worker and wait for its result."""
+        process = self._process
+        if not process or process.returncode is not None:
+            raise BrowserWorkerError("Browser worker is not running")
+
+        call_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[call_id] = future
+
+        async with self._write_lock:
+            process.stdin.write(_encode_frame({"id": call_id, "m": method, "a": args, "k": kwargs}))
+            await process.stdin.drain()
+
+        try:
+            return await asyncio.wait_for(future, timeout or self.call_timeout)
+        finally:
+            self._pending.pop(call_id, None)
+
+    async def _supervise(self) -> None:
+        """Restart the worker when it exits or stops answering heartbeats."""
+        delay = 1.0
+        while not self._stopping:
+            process = self._process
+            try:
+                await asyncio.wait_for(process.wait(), self.heartbeat_interval)
+                logger.error(f"Browser worker exited with code {process.returncode}")
+            except asyncio.TimeoutError:
+                # Still running - check that it answers
+                try:
+                    t0 = time.perf_counter()
+                    await self._call("ping", timeout=self.heartbeat_interval)
+                    self.last_heartbeat_ms = round((time.perf_counter() - t0) * 1000, 2)
+                    delay = 1.0
+                    continue
+                except (BrowserWorkerError, asyncio.TimeoutError):
+                    logger.error("Browser worker not responding - killing it")
+                    process.kill()
+                    await process.wait()
+
+            if self._stopping:
+                break
+
+            await self._restart(delay)
+            delay = min(delay * 2, self.max_restart_delay)
+
+    async def _restart(self, delay: float) -> None:
+        """Respawn the worker after a delay and restart its browser."""
+        self._browser_started = False
+        self._fail_pending("Browser worker restarted")
+        if self._reader_task:
+            self._reader_task.cancel()
+
+        logger.info(f"Restarting browser worker in {delay:.0f}s...")
+        await asyncio.sleep(delay)
+
+        try:
+            await self._spawn()
+            await self._call("start")
+            self._browser_started = True
+            self.restarts += 1
+            if self._preview_viewers:
+                await self._call("preview", True)
+            logger.info("Browser worker restarted")
+        except Exception as e:
+            logger.error(f"Failed to restart browser worker: {e}")
+            if self._process and self._process.returncode is None:
+                self._process.kill()
+            return
+
+        if self._restart_callback:
+            try:
+                await self._restart_callback()
+            except Exception as e:
+                logger.error(f"Error in browser restart callback: {e}")
+
+    async def join_meeting(
+        self,
+        room_url: Optional[str] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        timeout: int = 30000,
+    ) -> bool:
+        """Join a BigBlueButton meeting (see BrowserController.join_meeting)."""
+        try:
+            return await self._call(
+                "join_meeting", room_url=room_url, username=username,
+                password=password, timeout=timeout,
+            )
+        except (BrowserWorkerError, asyncio.TimeoutError) as e:
+            logger.error(f"Join failed in browser worker: {e}")
+            return False
+
+    async def leave_meeting(self) -> bool:
+        """Leave the current meeting (see BrowserController.leave_meeting)."""
+        try:
+            return await self._call("leave_meeting")
+        except (BrowserWorkerError, asyncio.TimeoutError) as e:
+            logger.error(f"Leave failed in browser worker: {e}")
+            return False
+
+    async def is_in_meeting(self) -> bool:
+        """Check if currently in a meeting (see BrowserController.is_in_meeting)."""
+        try:
+            return await self._call("is_in_meeting")
+        except (BrowserWorkerError, asyncio.TimeoutError):
+            return False
+
+    async def screenshot(self, path: Optional[str] = None, full_page: bool = False) -> Optional[bytes]:
+        """Take a screenshot (see BrowserController.screenshot)."""
+        return await self._call("screenshot", path=path, full_page=full_page)
+
+    async def evaluate(self, expression: str, arg: Any = None) -> Any:
+        """Evaluate JavaScript in the page (see BrowserController.evaluate)."""
+        return await self._call("evaluate", expression, arg)
+
+    async def add_preview_viewer(self, callback: FrameCallback) -> bool:
+        """Start streaming live preview frames to a viewer."""
+        if not self.is_running:
+            return False
+
+        self._preview_viewers.add(callback)
+        if len(self._preview_viewers) == 1:
+            return await self._call("preview", True)
+        return True
+
+    async def remove_preview_viewer(self, callback: FrameCallback) -> None:
+        """Stop streaming live preview frames to a viewer."""
+        self._preview_viewers.discard(callback)
+        if not self._preview_viewers and self.is_running:
+            await self._call("preview", False)
+
+    async def cleanup(self) -> None:
+        """Stop supervision, the browser and the worker process."""
+        logger.info("Stopping browser worker")
+        self._stopping = True
+
+        if self._supervisor_task:
+            self._supervisor_task.cancel()
+            self._supervisor_task = None
+
+        process = self._process
+        if process and process.returncode is None:
+            try:
+                await self._call("cleanup", timeout=10)
+                process.stdin.close()
+                await asyncio.wait_for(process.wait(), 5)
+            except Exception:
+                process.kill()
+                await process.wait()
+
+        if self._reader_task:
+            self._reader_task.cancel()
+            self._reader_task = None
+
+        self._process = None
+        self._browser_started = False
+        self._preview_viewers.clear()
+        logger.info("Browser worker stopped")
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.cleanup()
+
+
+class _WorkerServer:
+    """Worker side: owns the BrowserController and serves RPC calls."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.browser = None
+
+    def _send(self, message: Dict[str, Any]) -> None:
+        self.writer.write(_encode_frame(message))
+
+    def _init(self, bbb_config: Dict[str, Any], headless: bool, kiosk_mode: bool) -> None:
+        from src.orchestrator.browser_controller import BrowserController
+        from src.orchestrator.flight_recorder import create_flight_recorder
+        from src.orchestrator.screencast import KioskScreencast
+        from src.utils.config import load_config
+
+        config = load_config()
+        self.browser = BrowserController(
+            bbb_config=BigBlueButtonConfig(**bbb_config),
+            headless=headless,
+            kiosk_mode=kiosk_mode,
+            screencast=KioskScreencast(
+                max_fps=config.web.preview_max_fps,
+                jpeg_quality=config.web.preview_jpeg_quality,
+                max_width=config.web.preview_max_width,
+                max_height=config.web.preview_max_width * 9 // 16,
+            ),
+            flight_recorder=create_flight_recorder(config.diagnostics),
+        )
+        self.browser.set_meeting_state_callback(
+            lambda changes: self._send({"ev": "meeting_state", "d": changes})
+        )
+
+    async def _preview_frame(self, frame: str) -> None:
+        self._send({"ev": "preview_frame", "d": frame})
+        await self.writer.drain()
+
+    async def _handle(self, message: Dict[str, Any]) -> None:
+        call_id = message["id"]
+        method = message["m"]
+        try:
+            if method == "ping":
+                result = None
+            elif method == "init":
+                self._init(**message["a"][0])
+                result = None
+            elif method == "preview":
+                if message["a"][0]:
+                    result = await self.browser.add_preview_viewer(self._preview_frame)
+                else:
+                    await self.browser.remove_preview_viewer(self._preview_frame)
+                    result = None
+            elif method in WORKER_METHODS:
+                result = await getattr(self.browser, method)(*message["a"], **message["k"])
+            else:
+                raise ValueError(f"Unknown method: {method}")
+
+            self._send({"id": call_id, "r": result})
+
+        except Exception as e:
+            self._send({"id": call_id, "e": f"{type(e).__name__}: {e}"})
+
+        await self.writer.drain()
+
+    async def serve(self) -> None:
+        """Serve requests until stdin is closed."""
+        tasks = set()
+        try:
+            while True:
+                message = await _read_frame(self.reader)
+                # Calls run concurrently, e.g. ping while joining
+                task = asyncio.create_task(self._handle(message))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except asyncio.IncompleteReadError:
+            pass
+        finally:
+            if self.browser:
+                await self.browser.cleanup()
+
+
+async def _worker_main() -> None:
+    """Worker entry point: RPC on the original stdout, logs to stderr."""
+    loop = asyncio.get_running_loop()
+
+    # Keep the real stdout for the protocol; route print()/logging to stderr
+    protocol_fd = os.dup(sys.stdout.fileno())
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    reader = asyncio.StreamReader(limit=2 ** 26)
+    await loop.connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(reader), sys.stdin.buffer
+    )
+    transport, protocol = await loop.connect_write_pipe(
+        asyncio.streams.FlowControlMixin, os.fdopen(protocol_fd, "wb")
+    )
+    writer = asyncio.StreamWriter(transport, protocol, None, loop)
+
+    await _WorkerServer(reader, writer).serve()
+
+
+if __name__ == "__main__":
+    asyncio.run(_worker_main())
@@ -0,0 +1,568 @@
+"""
+WebDAV/CalDAV protocol helpers for incremental calendar sync.
+
+Builds request bodies and parses multistatus responses for the WebDAV
+sync-collection REPORT (RFC 6578), the calendar-multiget and
+calendar-query REPORTs (RFC 4791) and the getctag/sync-token PROPFIND used
+to detect unchanged calendars. Kept free of any HTTP client so
+the same code works with every CalDAV transport. Also covers discovery
+and registration of WebDAV-Push subscriptions (draft-bitfire-webdav-push).
+"""
+import re
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Iterable, Iterator, List, Optional, Union
+from urllib.parse import quote, unquote, urlparse
+from xml.sax.saxutils import escape
+
+
+NS_DAV = "DAV:"
+NS_CALDAV = "urn:ietf:params:xml:ns:caldav"
+NS_CALSERVER = "http://calendarserver.org/ns/"
+NS_PUSH = "https://bitfire.at/webdav-push"
+
+# VEVENT properties the scheduler reads, plus the recurrence rules needed
+# for local expansion. With partial retrieval everything else (HTML
+# descriptions, attachments, alarms, attendee lists) stays on the server.
+EVENT_PROPERTIES = (
+    "UID", "DTSTART", "DTEND", "SUMMARY", "LOCATION", "DESCRIPTION",
+    "ORGANIZER", "RECURRENCE-ID", "RRULE", "RDATE", "EXDATE",
+)
+
+# DTSTAMP is mandatory in every VEVENT but never requested: if it is in the
+# response, the server ignored the property selection
+_UNREQUESTED_PROPERTY = re.compile(r"^DTSTAMP[:;]", re.MULTILINE)
+
+
+def _tag(namespace: str, name: str) -> str:
+    """Clark notation tag name as used by ElementTree."""
+    return f"{{{namespace}}}{name}"
+
+
+class CalDAVProtocolError(Exception):
+    """Unexpected response from the CalDAV server."""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+class InvalidSyncTokenError(CalDAVProtocolError):
+    """The server no longer accepts the stored sync token (full resync needed)."""
+
+
+@dataclass
+class SyncObject:
+    """A changed calendar object reported by the server."""
+
+    href: str
+    etag: Optional[str] = None
+    data: Optional[str] = None
+
+
+@dataclass
+class SyncCollectionResult:
+    """Parsed sync-collection REPORT response."""
+
+    sync_token: Optional[str] = None
+    changed: List[SyncObject] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    truncated: bool = False
+
+
+@dataclass
+class CollectionState:
+    """Change markers of a calendar collection."""
+
+    ctag: Optional[str] = None
+    sync_token: Optional[str] = None
+
+
+@dataclass
+class PushSupport:
+    """WebDAV-Push capabilities of a collection."""
+
+    transports: List[str] = field(default_factory=list)
+    topic: Optional[str] = None
+    vapid_public_key: Optional[str] = None
+
+    @property
+    def web_push(self) -> bool:
+        """True if the server delivers Web Push notifications."""
+        return "web-push" in self.transports
+
+
+def normalize_href(href: str) -> str:
+    """
+    Normalize an href so the same resource always maps to the same key.
+
+    Args:
+        href: Absolute URL or path as returned by the server
+
+    Returns:
+        Unquoted URL path
+    """
+    return unquote(urlparse(href.strip()).path)
+
+
+def build_sync_collection(sync_token: Optional[str], with_data: bool = True) -> bytes:
+    """
+    Build a sync-collection REPORT body.
+
+    Args:
+        sync_token: Token from the previous sync, or None for an initial sync
+        with_data: Also request calendar-data (not only ETags)
+
+    Returns:
+        XML request body
+    """
+    token = escape(sync_token) if sync_token else ""
+    data_prop = "<C:calendar-data/>" if with_data else ""
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        f'<D:sync-collection xmlns:D="{NS_DAV}" xmlns:C="{NS_CALDAV}">'
+        f"<D:sync-token>{token}</D:sync-token>"
+        "<D:sync-level>1</D:sync-level>"
+        f"<D:prop><D:getetag/>{data_prop}</D:prop>"
+        "</D:sync-collection>"
+    ).encode("utf-8")
+
+
+def _utc_stamp(value: datetime) -> str:
+    """Format a datetime as iCalendar UTC time (naive values are local time)."""
+    if value.tzinfo is None:
+        value = value.astimezone()
+    return value.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def build_calendar_data(
+    partial: bool = False,
+    expand_start: Optional[datetime] = None,
+    expand_end: Optional[datetime] = None
+) -> str:
+    """
+    Build the calendar-data element of a REPORT.
+
+    Args:
+        partial: Only request EVENT_PROPERTIES of VEVENTs (plus time zones)
+        expand_start: Let the server expand recurrences from this time
+        expand_end: ... until this time
+
+    Returns:
+        calendar-data XML element
+    """
+    parts = []
+    if partial:
+        props = "".join(f'<C:prop name="{name}"/>' for name in EVENT_PROPERTIES)
+        parts.append(
+            '<C:comp name="VCALENDAR"><C:prop name="VERSION"/>'
+            f'<C:comp name="VEVENT">{props}</C:comp>'
+            '<C:comp name="VTIMEZONE"><C:allprop/><C:allcomp/></C:comp>'
+            "</C:comp>"
+        )
+    if expand_start and expand_end:
+        parts.append(
+            f'<C:expand start="{_utc_stamp(expand_start)}" end="{_utc_stamp(expand_end)}"/>'
+        )
+    if not parts:
+        return "<C:calendar-data/>"
+    return f"<C:calendar-data>{''.join(parts)}</C:calendar-data>"
+
+
+def build_calendar_multiget(hrefs: Iterable[str], partial: bool = False) -> bytes:
+    """
+    Build a calendar-multiget REPORT body.
+
+    Args:
+        hrefs: Normalized hrefs of the calendar objects to fetch
+        partial: Only request the VEVENT properties in EVENT_PROPERTIES
+
+    Returns:
+        XML request body asking for ETag and calendar data of every href
+    """
+    href_elements = "".join(f"<D:href>{escape(quote(href))}</D:href>" for href in hrefs)
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        f'<C:calendar-multiget xmlns:D="{NS_DAV}" xmlns:C="{NS_CALDAV}">'
+        f"<D:prop><D:getetag/>{build_calendar_data(partial)}</D:prop>"
+        f"{href_elements}"
+        "</C:calendar-multiget>"
+    ).encode("utf-8")
+
+
+def build_calendar_query(
+    start: datetime,
+    end: datetime,
+    partial: bool = False,
+    expand: bool = False
+) -> bytes:
+    """
+    Build a calendar-query REPORT body for VEVENTs overlapping a time range.
+
+    Args:
+        start: Start of time range
+        end: End of time range
+        partial: Only request the VEVENT properties in EVENT_PROPERTIES
+        expand: Let the server expand recurring events into instances
+
+    Returns:
+        XML request body
+    """
+    calendar_data = build_calendar_data(
+        partial, start if expand else None, end if expand else None
+    )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        f'<C:calendar-query xmlns:D="{NS_DAV}" xmlns:C="{NS_CALDAV}">'
+        f"<D:prop><D:getetag/>{calendar_data}</D:prop>"
+        '<C:filter><C:comp-filter name="VCALENDAR"><C:comp-filter name="VEVENT">'
+        f'<C:time-range start="{_utc_stamp(start)}" end="{_utc_stamp(end)}"/>'
+        "</C:comp-filter></C:comp-filter></C:filter>"
+        "</C:calendar-query>"
+    ).encode("utf-8")
+
+
+def partial_data_ignored(data: str) -> bool:
+    """
+    Check whether a server ignored the partial calendar-data selection.
+
+    Args:
+        data: Calendar data returned for a partial request
+
+    Returns:
+        True if the data contains properties that were not requested
+    """
+    return _UNREQUESTED_PROPERTY.search(data) is not None
+
+
+def build_propfind_collection_state() -> bytes:
+    """
+    Build a Depth: 0 PROPFIND body for the collection's change markers.
+
+    Returns:
+        XML request body asking for getctag and sync-token
+    """
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        f'<D:propfind xmlns:D="{NS_DAV}" xmlns:CS="{NS_CALSERVER}">'
+        "<D:prop><CS:getctag/><D:sync-token/></D:prop>"
+        "</D:propfind>"
+    ).encode("utf-8")
+
+
+def parse_collection_state(content: bytes) -> CollectionState:
+    """
+    Parse the PROPFIND response for getctag and sync-token.
+
+    Args:
+        content: Response body (207 Multi-Status)
+
+    Returns:
+        CollectionState (fields are None if the server lacks the property)
+
+    Raises:
+        CalDAVProtocolError: Response is not valid XML
+    """
+    try:
+        root = ET.fromstring(content)
+    except ET.ParseError as e:
+        raise CalDAVProtocolError(f"Invalid multistatus XML: {e}") from e
+
+    state = CollectionState()
+    for propstat in root.iter(_tag(NS_DAV, "propstat")):
+        if _status_code(propstat.findtext(_tag(NS_DAV, "status"))) != 200:
+            continue
+        ctag = propstat.findtext(f".//{_tag(NS_CALSERVER, 'getctag')}")
+        token = propstat.findtext(f".//{_tag(NS_DAV, 'sync-token')}")
+        if ctag and ctag.strip():
+            state.ctag = ctag.strip()
+        if token and token.strip():
+            state.sync_token = token.strip()
+
+    return state
+
+
+def build_propfind_push_support() -> bytes:
+    """
+    Build a Depth: 0 PROPFIND body for the collection's WebDAV-Push support.
+
+    Returns:
+        XML request body asking for transports and topic
+    """
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        f'<D:propfind xmlns:D="{NS_DAV}" xmlns:P="{NS_PUSH}">'
+        "<D:prop><P:transports/><P:topic/></D:prop>"
+        "</D:propfind>"
+    ).encode("utf-8")
+
+
+def parse_push_support(content: bytes) -> PushSupport:
+    """
+    Parse the PROPFIND response for WebDAV-Push transports and topic.
+
+    Args:
+        content: Response body (207 Multi-Status)
+
+    Returns:
+        PushSupport (empty if the server does not support WebDAV-Push)
+
+    Raises:
+        CalDAVProtocolError: Response is not valid XML
+    """
+    try:
+        root = ET.fromstring(content)
+    except ET.ParseError as e:
+        raise CalDAVProtocolError(f"Invalid multistatus XML: {e}") from e
+
+    support = PushSupport()
+    for propstat in root.iter(_tag(NS_DAV, "propstat")):
+        if _status_code(propstat.findtext(_tag(NS_DAV, "status"))) != 200:
+            continue
+        transports = propstat.find(f".//{_tag(NS_PUSH, 'transports')}")
+        if transports is not None:
+            for transport in transports:
+                if transport.tag.startswith(f"{{{NS_PUSH}}}"):
+                    support.transports.append(transport.tag[len(NS_PUSH) + 2:])
+            key = transports.findtext(f".//{_tag(NS_PUSH, 'vapid-public-key')}")
+            if key and key.strip():
+                support.vapid_public_key = key.strip()
+        topic = propstat.findtext(f".//{_tag(NS_PUSH, 'topic')}")
+        if topic and topic.strip():
+            support.topic = topic.strip()
+
+    return support
+
+
+def build_push_register(
+    push_resource: str,
+    expires: datetime,
+    public_key: Optional[str] = None,
+    auth_secret: Optional[str] = None
+) -> bytes:
+    """
+    Build a WebDAV-Push registration body for a Web Push subscription.
+
+    Args:
+        push_resource: URL the server delivers notifications to
+        expires: Requested end of the subscription
+        public_key: Base64url P-256 public key for message encryption
+        auth_secret: Base64url authentication secret for message encryption
+
+    Returns:
+        XML request body for a POST to the collection
+    """
+    keys = ""
+    if public_key and auth_secret:
+        keys = (
+            "<P:content-encoding>aes128gcm</P:content-encoding>"
+            f'<P:subscription-public-key type="p256dh">{escape(public_key)}</P:subscription-public-key>'
+            f"<P:auth-secret>{escape(auth_secret)}</P:auth-secret>"
+        )
+    expires_http = expires.astimezone(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S GMT")
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        f'<P:push-register xmlns:D="{NS_DAV}" xmlns:P="{NS_PUSH}">'
+        "<P:subscription><P:web-push-subscription>"
+        f"<P:push-resource>{escape(push_resource)}</P:push-resource>{keys}"
+        "</P:web-push-subscription></P:subscription>"
+        "<P:trigger><P:content-update><D:sync-level>1</D:sync-level></P:content-update></P:trigger>"
+        f"<P:expires>{expires_http}</P:expires>"
+        "</P:push-register>"
+    ).encode("utf-8")
+
+
+def _status_code(status_line: Optional[str]) -> Optional[int]:
+    """Extract the code from an 'HTTP/1.1 200 OK' status line."""
+    if not status_line:
+        return None
+    parts = status_line.split()
+    if len(parts) >= 2 and parts[1].isdigit():
+        return int(parts[1])
+    return None
+
+
+def check_sync_error(status: int, content: bytes, had_token: bool) -> None:
+    """
+    Raise the matching exception for a failed sync-collection REPORT.
+
+    Args:
+        status: HTTP status code
+        content: Response body
+        had_token: Whether the request carried a sync token
+
+    Raises:
+        InvalidSyncTokenError: Server rejected the sync token
+        CalDAVProtocolError: Any other non-multistatus response
+    """
+    if status == 207:
+        return
+
+    # RFC 6578 3.2: DAV:valid-sync-token precondition, usually 403 or 409
+    if had_token and (b"valid-sync-token" in content or status in (403, 409, 410)):
+        raise InvalidSyncTokenError(f"Sync token rejected (HTTP {status})", status)
+
+    raise CalDAVProtocolError(f"sync-collection REPORT failed (HTTP {status})", status)
+
+
+def parse_sync_collection(content: bytes, collection_href: str) -> SyncCollectionResult:
+    """
+    Parse a sync-collection multistatus response.
+
+    Args:
+        content: Response body (207 Multi-Status)
+        collection_href: URL of the synced calendar collection
+
+    Returns:
+        SyncCollectionResult with changed and deleted hrefs
+
+    Raises:
+        CalDAVProtocolError: Response is not a multistatus document
+    """
+    try:
+        root = ET.fromstring(content)
+    except ET.ParseError as e:
+        raise CalDAVProtocolError(f"Invalid multistatus XML: {e}") from e
+
+    if root.tag != _tag(NS_DAV, "multistatus"):
+        raise CalDAVProtocolError(f"Unexpected response root element: {root.tag}")
+
+    result = SyncCollectionResult(
+        sync_token=(root.findtext(_tag(NS_DAV, "sync-token")) or "").strip() or None
+    )
+    collection = normalize_href(collection_href).rstrip("/")
+
+    for response in root.iter(_tag(NS_DAV, "response")):
+        href_text = response.findtext(_tag(NS_DAV, "href"))
+        if not href_text:
+            continue
+        href = normalize_href(href_text)
+        status = _status_code(response.findtext(_tag(NS_DAV, "status")))
+
+        if href.rstrip("/") == collection:
+            # 507 on the collection itself: more changes than the server sends at once
+            if status == 507:
+                result.truncated = True
+            continue
+
+        if status == 404:
+            result.deleted.append(href)
+            continue
+
+        obj = _response_object(response, href)
+        if obj:
+            result.changed.append(obj)
+
+    return result
+
+
+class MultistatusStream:
+    """
+    Incremental parser for calendar-multiget and calendar-query responses.
+
+    Response bytes are fed in chunks as they arrive from the network; every
+    complete DAV:response is returned once and then dropped from the tree,
+    so memory use is bounded by the chunk size and the largest single
+    calendar object, not by the size of the response.
+    """
+
+    def __init__(self):
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._root: Optional[ET.Element] = None
+        self._response_tag = _tag(NS_DAV, "response")
+
+    def feed(self, chunk: bytes) -> List[SyncObject]:
+        """
+        Parse the next chunk of the response body.
+
+        Args:
+            chunk: Response bytes
+
+        Returns:
+            Calendar objects completed by this chunk
+
+        Raises:
+            CalDAVProtocolError: Response is not valid XML
+        """
+        try:
+            self._parser.feed(chunk)
+        except ET.ParseError as e:
+            raise CalDAVProtocolError(f"Invalid multistatus XML: {e}") from e
+        return self._collect()
+
+    def close(self) -> List[SyncObject]:
+        """
+        Finish parsing.
+
+        Returns:
+            Calendar objects completed by the end of the body
+
+        Raises:
+            CalDAVProtocolError: Response is truncated or not valid XML
+        """
+        try:
+            self._parser.close()
+        except ET.ParseError as e:
+            raise CalDAVProtocolError(f"Invalid multistatus XML: {e}") from e
+        return self._collect()
+
+    def _collect(self) -> List[SyncObject]:
+        """Turn finished DAV:response elements into objects and release them."""
+        objects = []
+        for event, element in self._parser.read_events():
+            if event == "start":
+                if self._root is None:
+                    self._root = element
+                continue
+            if element.tag != self._response_tag:
+                continue
+            href_text = element.findtext(_tag(NS_DAV, "href"))
+            obj = _response_object(element, normalize_href(href_text)) if href_text else None
+            element.clear()
+            # Responses are direct children of the multistatus root
+            if self._root is not None and len(self._root) and self._root[-1] is element:
+                self._root.remove(element)
+            if obj and obj.data is not None:
+                objects.append(obj)
+        return objects
+
+
+def iter_calendar_objects(content: Union[bytes, Iterable[bytes]]) -> Iterator[SyncObject]:
+    """
+    Stream calendar objects out of a calendar-multiget or calendar-query response.
+
+    Each DAV:response is yielded as soon as it is parsed and then released,
+    so memory use does not grow with the number of objects in the response.
+
+    Args:
+        content: Response body (207 Multi-Status), or an iterable of body chunks
+
+    Yields:
+        SyncObject with href, ETag and calendar data
+
+    Raises:
+        CalDAVProtocolError: Response is not valid XML
+    """
+    stream = MultistatusStream()
+    chunks = [content] if isinstance(content, (bytes, bytearray)) else content
+    for chunk in chunks:
+        yield from stream.feed(chunk)
+    yield from stream.close()
+
+
+def _response_object(response: ET.Element, href: str) -> Optional[SyncObject]:
+    """Extract ETag and calendar data from the 200 propstat of a DAV:response."""
+    for propstat in response.findall(_tag(NS_DAV, "propstat")):
+        if _status_code(propstat.findtext(_tag(NS_DAV, "status"))) != 200:
+            continue
+        prop = propstat.find(_tag(NS_DAV, "prop"))
+        if prop is None:
+            continue
+        etag = prop.findtext(_tag(NS_DAV, "getetag"))
+        return SyncObject(
+            href=href,
+            etag=etag.strip() if etag else None,
+            data=prop.findtext(_tag(NS_CALDAV, "calendar-data")),
+        )
+    return None
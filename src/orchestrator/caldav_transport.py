@@ -0,0 +1,356 @@
+"""
+HTTP transports for raw CalDAV requests.
+
+The caldav library covers discovery and legacy date searches; the
+incremental sync engine sends its own REPORT/PROPFIND requests through an
+async transport so the HTTP client can be swapped without touching sync
+logic. HttpxCalDAVTransport is native asyncio with a persistent connection
+pool; CaldavLibTransport reuses the synchronous caldav session in a thread.
+"""
+import asyncio
+import threading
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Optional, Union
+
+try:
+    from caldav.lib import error as caldav_error
+    CALDAV_AVAILABLE = True
+except ImportError:
+    CALDAV_AVAILABLE = False
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class DAVResult:
+    """Raw response of a CalDAV request."""
+
+    status: int
+    content: bytes = b""
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class DAVStream:
+    """Streamed response of a CalDAV request; the body arrives in chunks."""
+
+    status: int
+    chunks: AsyncIterator[bytes]
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+class CalDAVTransport(ABC):
+    """Base class for CalDAV transports."""
+
+    @abstractmethod
+    async def request(
+        self,
+        method: str,
+        url: str,
+        body: bytes = b"",
+        headers: Optional[Dict[str, str]] = None
+    ) -> DAVResult:
+        """
+        Send a request.
+
+        Args:
+            method: HTTP/WebDAV method (REPORT, PROPFIND, ...)
+            url: Absolute URL
+            body: Request body
+            headers: Additional request headers
+
+        Returns:
+            DAVResult with status, body and headers
+        """
+
+    async def report(self, url: str, body: bytes, depth: int = 1) -> DAVResult:
+        """Send a REPORT request with an XML body."""
+        return await self.request("REPORT", url, body, {
+            "Depth": str(depth),
+            "Content-Type": 'application/xml; charset="utf-8"',
+        })
+
+    @asynccontextmanager
+    async def stream_report(self, url: str, body: bytes, depth: int = 1) -> AsyncIterator[DAVStream]:
+        """
+        Send a REPORT request and stream the response body.
+
+        The base implementation reads the whole body and hands it out as a
+        single chunk; transports that can stream override it.
+
+        Args:
+            url: Absolute URL
+            body: XML request body
+            depth: Depth header
+
+        Yields:
+            DAVStream, valid until the context is left
+        """
+        result = await self.report(url, body, depth)
+
+        async def chunks():
+            yield result.content
+
+        yield DAVStream(status=result.status, chunks=chunks(), headers=result.headers)
+
+    async def propfind(self, url: str, body: bytes, depth: int = 0) -> DAVResult:
+        """Send a PROPFIND request with an XML body."""
+        return await self.request("PROPFIND", url, body, {
+            "Depth": str(depth),
+            "Content-Type": 'application/xml; charset="utf-8"',
+        })
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get transport statistics.
+
+        Returns:
+            Dictionary with transport name and counters
+        """
+        return {"transport": type(self).__name__}
+
+    async def close(self):
+        """Release connections."""
+
+
+class CaldavLibTransport(CalDAVTransport):
+    """Transport reusing the session and authentication of a caldav.DAVClient."""
+
+    def __init__(self, client: Any, request_lock: Optional[threading.Lock] = None):
+        """
+        Initialize transport.
+
+        Args:
+            client: Connected caldav.DAVClient
+            request_lock: Lock serialising requests on the client's session
+                (shared with other users of the client)
+        """
+        self.client = client
+        self.request_lock = request_lock if request_lock is not None else threading.Lock()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        body: bytes = b"",
+        headers: Optional[Dict[str, str]] = None
+    ) -> DAVResult:
+        return await asyncio.to_thread(self._request, method, url, body, headers)
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        body: bytes,
+        headers: Optional[Dict[str, str]]
+    ) -> DAVResult:
+        """Blocking request through the caldav session (runs in a thread)."""
+        try:
+            with self.request_lock:
+                response = self.client.request(url, method, body, headers or {})
+        except caldav_error.AuthorizationError as e:
+            # caldav raises on 401/403 and drops the body
+            logger.debug(f"CalDAV {method} {url} rejected: {e}")
+            return DAVResult(status=403)
+
+        content = response.raw
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+
+        return DAVResult(
+            status=response.status,
+            content=content or b"",
+            headers=dict(response.headers),
+        )
+
+
+class HttpxCalDAVTransport(CalDAVTransport):
+    """
+    Native asyncio transport on httpx.
+
+    Keeps connections alive between syncs, negotiates HTTP/2 when the h2
+    package is installed and the server offers it, decodes gzip responses
+    and enforces timeouts. Cancelling the awaiting task aborts the request.
+    """
+
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        timeout: float = 30.0,
+        verify: Union[bool, str] = True,
+        max_connections: int = 4,
+        keepalive_expiry: float = 600.0
+    ):
+        """
+        Initialize transport.
+
+        Args:
+            username: CalDAV username
+            password: CalDAV password or app token
+            timeout: Timeout in seconds for connect, read and write
+            verify: Verify TLS certificates (True/False or path to a CA bundle)
+            max_connections: Connection pool size
+            keepalive_expiry: Seconds an idle connection is kept open
+        """
+        if not HTTPX_AVAILABLE:
+            raise RuntimeError("httpx is not installed")
+
+        self.username = username
+        self.password = password
+        self._auth: "httpx.Auth" = httpx.BasicAuth(username, password)
+        self._client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            verify=verify,
+            timeout=httpx.Timeout(timeout, connect=min(timeout, 10.0)),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            headers={"Accept-Encoding": "gzip, deflate"},
+            follow_redirects=True,
+        )
+
+        # Statistics
+        self.requests = 0
+        self.connections_opened = 0
+        self.tls_handshakes = 0
+        self.http_version: Optional[str] = None
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        body: bytes = b"",
+        headers: Optional[Dict[str, str]] = None
+    ) -> DAVResult:
+        response = await self._send(method, url, body, headers)
+
+        if self._wants_digest(response):
+            logger.debug("CalDAV server requests Digest authentication")
+            self._auth = httpx.DigestAuth(self.username, self.password)
+            response = await self._send(method, url, body, headers)
+
+        self.http_version = response.http_version
+        return DAVResult(
+            status=response.status_code,
+            content=response.content,
+            headers=dict(response.headers),
+        )
+
+    @asynccontextmanager
+    async def stream_report(self, url: str, body: bytes, depth: int = 1) -> AsyncIterator[DAVStream]:
+        headers = {"Depth": str(depth), "Content-Type": 'application/xml; charset="utf-8"'}
+        response = await self._send("REPORT", url, body, headers, stream=True)
+
+        if self._wants_digest(response):
+            await response.aclose()
+            logger.debug("CalDAV server requests Digest authentication")
+            self._auth = httpx.DigestAuth(self.username, self.password)
+            response = await self._send("REPORT", url, body, headers, stream=True)
+
+        self.http_version = response.http_version
+        try:
+            yield DAVStream(
+                status=response.status_code,
+                chunks=response.aiter_bytes(),
+                headers=dict(response.headers),
+            )
+        finally:
+            await response.aclose()
+
+    def _wants_digest(self, response: "httpx.Response") -> bool:
+        """Check whether the server wants Digest instead of Basic authentication."""
+        return (
+            response.status_code == 401
+            and "digest" in response.headers.get("www-authenticate", "").lower()
+            and not isinstance(self._auth, httpx.DigestAuth)
+        )
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        body: bytes,
+        headers: Optional[Dict[str, str]],
+        stream: bool = False
+    ) -> "httpx.Response":
+        """Send one request, counting new connections via the httpcore trace hook."""
+        self.requests += 1
+        request = self._client.build_request(
+            method,
+            url,
+            content=body or None,
+            headers=headers,
+            extensions={"trace": self._trace},
+        )
+        return await self._client.send(request, auth=self._auth, stream=stream)
+
+    async def _trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        """Count TCP connects and TLS handshakes."""
+        if event_name == "connection.connect_tcp.complete":
+            self.connections_opened += 1
+        elif event_name == "connection.start_tls.complete":
+            self.tls_handshakes += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "transport": type(self).__name__,
+            "http_version": self.http_version,
+            "requests": self.requests,
+            "connections_opened": self.connections_opened,
+            "tls_handshakes": self.tls_handshakes,
+        }
+
+    async def close(self):
+        await self._client.aclose()
+
+
+def create_caldav_transport(
+    mode: str,
+    client: Any,
+    username: str,
+    password: str,
+    timeout: float = 30.0,
+    request_lock: Optional[threading.Lock] = None
+) -> CalDAVTransport:
+    """
+    Factory function to create the CalDAV transport.
+
+    Args:
+        mode: "httpx" (native asyncio) or "caldav" (caldav library session)
+        client: Connected caldav.DAVClient (used by the caldav transport)
+        username: CalDAV username
+        password: CalDAV password
+        timeout: Request timeout in seconds
+        request_lock: Lock serialising requests on the caldav session
+            (caldav transport)
+
+    Returns:
+        CalDAVTransport instance
+    """
+    if mode == "httpx":
+        if HTTPX_AVAILABLE:
+            # Same setting as the caldav session: a bool or a CA bundle path
+            verify = getattr(client, "ssl_verify_cert", True)
+            return HttpxCalDAVTransport(username, password, timeout=timeout, verify=verify)
+        logger.warning("httpx not installed - using caldav library transport")
+
+    return CaldavLibTransport(client, request_lock)
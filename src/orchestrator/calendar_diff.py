@@ -0,0 +1,225 @@
+"""
+Calendar event diffs for RaspberryMeet.
+
+Every sync delivers the complete event list. EventDiffTracker compares it
+with the previous one and publishes what actually changed - added, changed
+and removed events keyed by (UID, RECURRENCE-ID) - so subscribers (the
+scheduler's meeting table, join bookkeeping, the meeting URL cache) update
+in O(changes) instead of rescanning every event. Syncs that found every
+calendar unchanged skip the comparison: only the events that moved into
+the sync window are added (advance).
+"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.orchestrator.calendar_sync import MeetingEvent
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# (UID, RECURRENCE-ID): identifies a single meeting or one occurrence of a series
+EventKey = Tuple[str, Optional[str]]
+
+
+def event_key(event: MeetingEvent) -> EventKey:
+    """
+    Identity of an event across syncs and calendars.
+
+    Args:
+        event: Meeting event
+
+    Returns:
+        (UID, RECURRENCE-ID); events without UID fall back to summary and start
+    """
+    uid = event.uid or f"{event.summary}@{event.start_time.isoformat()}"
+    return uid, event.recurrence_id
+
+
+@dataclass
+class EventChange:
+    """An event that exists before and after a sync but differs."""
+
+    previous: MeetingEvent
+    current: MeetingEvent
+
+    @property
+    def key(self) -> EventKey:
+        """Key of the changed event."""
+        return event_key(self.current)
+
+    @property
+    def rescheduled(self) -> bool:
+        """True if the start time moved."""
+        return self.previous.start_ts != self.current.start_ts
+
+    @property
+    def url_changed(self) -> bool:
+        """True if the meeting link changed."""
+        return self.previous.bbb_url != self.current.bbb_url
+
+
+@dataclass
+class CalendarDiff:
+    """Difference between two consecutive event lists."""
+
+    added: List[MeetingEvent] = field(default_factory=list)
+    changed: List[EventChange] = field(default_factory=list)
+    removed: List[MeetingEvent] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.changed) + len(self.removed)
+
+    def current_events(self) -> Iterable[MeetingEvent]:
+        """Events that are new or changed (their current version)."""
+        yield from self.added
+        for change in self.changed:
+            yield change.current
+
+    def summary(self) -> str:
+        """Short description for logs."""
+        return f"{len(self.added)} added, {len(self.changed)} changed, {len(self.removed)} removed"
+
+    def to_dict(self) -> Dict[str, int]:
+        """Counts as a dictionary."""
+        return {"added": len(self.added), "changed": len(self.changed), "removed": len(self.removed)}
+
+
+class EventDiffTracker:
+    """Turns successive event lists into diffs and publishes them."""
+
+    def __init__(self):
+        """Initialize tracker with an empty calendar."""
+        self._events: Dict[EventKey, MeetingEvent] = {}
+        self._subscribers: List[Callable[[CalendarDiff], None]] = []
+
+        # Statistics
+        self.version = 0
+        self.updates = 0
+        self.skipped = 0  # updates without comparison (advance)
+        self.last_diff: Optional[CalendarDiff] = None
+        self.last_change: Optional[datetime] = None
+        self.totals = {"added": 0, "changed": 0, "removed": 0}
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def subscribe(self, callback: Callable[[CalendarDiff], None]):
+        """
+        Call a function with every non-empty diff.
+
+        Args:
+            callback: Receives the CalendarDiff; exceptions are logged, not raised
+        """
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[CalendarDiff], None]):
+        """Stop calling a subscriber."""
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def events(self) -> List[MeetingEvent]:
+        """Current events."""
+        return list(self._events.values())
+
+    def update(self, events: Iterable[MeetingEvent]) -> CalendarDiff:
+        """
+        Replace the current events, publish and return the difference.
+
+        Args:
+            events: Complete event list of a sync
+
+        Returns:
+            CalendarDiff (empty if nothing changed)
+        """
+        diff = CalendarDiff()
+        previous_get = self._events.get
+        current: Dict[EventKey, MeetingEvent] = {}
+        for event in events:
+            # event_key() inlined: this loop runs for every event of every sync
+            key = (event.uid or f"{event.summary}@{event.start_time.isoformat()}", event.recurrence_id)
+            current[key] = event
+            old = previous_get(key)
+            if old is None:
+                diff.added.append(event)
+            elif old is not event and old != event:
+                diff.changed.append(EventChange(old, event))
+        previous = self._events
+        if len(current) - len(diff.added) != len(previous):
+            diff.removed = [event for key, event in previous.items() if key not in current]
+
+        self._events = current
+        self.updates += 1
+        if diff:
+            self._publish(diff)
+        return diff
+
+    def advance(self, events: Iterable[MeetingEvent], since_ts: float) -> CalendarDiff:
+        """
+        Publish the events that moved into the sync window of an unchanged calendar.
+
+        Without calendar changes the only difference to the previous sync is
+        the window: events starting at or after the previous window end are
+        new, everything else is known. Events that left the window stay
+        until the next update() removes them.
+
+        Args:
+            events: Complete event list of the sync
+            since_ts: End of the previous sync window, epoch seconds
+
+        Returns:
+            CalendarDiff with the added events (empty if none)
+        """
+        diff = CalendarDiff()
+        for event in events:
+            if event.start_ts >= since_ts:
+                key = event_key(event)
+                if key not in self._events:
+                    self._events[key] = event
+                    diff.added.append(event)
+
+        self.updates += 1
+        self.skipped += 1
+        if diff:
+            self._publish(diff)
+        return diff
+
+    def clear(self):
+        """Forget all events without publishing."""
+        self._events = {}
+
+    def _publish(self, diff: CalendarDiff):
+        """Record a diff and hand it to the subscribers."""
+        self.version += 1
+        self.last_diff = diff
+        self.last_change = datetime.now()
+        for kind, count in diff.to_dict().items():
+            self.totals[kind] += count
+        logger.debug(f"Calendar diff: {diff.summary()}")
+
+        for callback in list(self._subscribers):
+            try:
+                callback(diff)
+            except Exception as e:
+                logger.error(f"Calendar diff subscriber failed: {e}", exc_info=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get diff statistics.
+
+        Returns:
+            Dictionary with event count, version and change counters
+        """
+        return {
+            "events": len(self._events),
+            "version": self.version,
+            "updates": self.updates,
+            "skipped": self.skipped,
+            "last_change": self.last_change.isoformat() if self.last_change else None,
+            "last_diff": self.last_diff.to_dict() if self.last_diff else None,
+            "totals": dict(self.totals),
+            "subscribers": len(self._subscribers),
+        }
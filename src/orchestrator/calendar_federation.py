@@ -0,0 +1,345 @@
+"""
+Calendar federation for RaspberryMeet.
+
+Syncs several CalDAV calendars (possibly on different servers and
+accounts) concurrently and merges them into one deduplicated event view.
+Each source connects, syncs and fails on its own: a bounded number of
+sources sync in parallel, every source has its own timeout, and a slow or
+unreachable source keeps serving its last known events.
+"""
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Collection, Dict, List, Optional
+
+from src.orchestrator.calendar_diff import EventKey, event_key
+from src.orchestrator.calendar_sync import (
+    CalDAVClient,
+    CalDAVConnectionPool,
+    MeetingEvent,
+    create_caldav_client,
+)
+from src.orchestrator.event_store import EventStore
+from src.orchestrator.ics_source import ICSFeedClient
+from src.orchestrator.parse_pool import CalendarParsePool
+from src.utils.config import CalDAVConfig, CalendarSourceConfig
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+PRIMARY_SOURCE = "primary"
+
+
+@dataclass
+class CalendarSource:
+    """One synced calendar and its sync state."""
+
+    name: str
+    client: CalDAVClient
+    connected: bool = False
+    events: List[MeetingEvent] = field(default_factory=list)
+    last_sync: Optional[datetime] = None
+    last_error: Optional[str] = None
+    last_duration_ms: Optional[float] = None
+    # False if the last sync found the calendar unchanged (or failed)
+    changed: bool = True
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get source status.
+
+        Returns:
+            Dictionary with connection, sync and metrics details
+        """
+        transport = self.client.transport
+        return {
+            "name": self.name,
+            "calendar": self.client.calendar_name,
+            "connected": self.connected,
+            "events": len(self.events),
+            "last_sync": self.last_sync.isoformat() if self.last_sync else None,
+            "last_error": self.last_error,
+            "last_duration_ms": self.last_duration_ms,
+            "sync_metrics": self.client.metrics.to_dict(),
+            "transport": transport.get_stats() if transport else None,
+        }
+
+
+class CalendarFederation:
+    """Concurrent sync of several calendars into one event view."""
+
+    def __init__(
+        self,
+        sources: List[CalendarSource],
+        max_parallel: int = 3,
+        source_timeout: float = 60.0,
+        on_update: Optional[Callable[[List[MeetingEvent]], None]] = None,
+        parse_pool: Optional[CalendarParsePool] = None,
+        connection_pool: Optional[CalDAVConnectionPool] = None
+    ):
+        """
+        Initialize federation.
+
+        Args:
+            sources: Calendar sources, in priority order (first wins on duplicates)
+            max_parallel: Maximum number of sources syncing at the same time
+            source_timeout: Seconds after which a source sync is abandoned
+            on_update: Called with the merged events whenever a source finished
+            parse_pool: Process pool shared by the sources (shut down on close)
+            connection_pool: CalDAV connections owned by the federation (closed on close)
+        """
+        if not sources:
+            raise ValueError("At least one calendar source is required")
+
+        self.sources = sources
+        self.source_timeout = source_timeout
+        self.on_update = on_update
+        self.parse_pool = parse_pool
+        self.connection_pool = connection_pool
+        self._semaphore = asyncio.Semaphore(max(1, max_parallel))
+
+    @property
+    def primary(self) -> CalendarSource:
+        """The first (highest priority) source."""
+        return self.sources[0]
+
+    @property
+    def changed(self) -> bool:
+        """True if the last sync changed at least one source."""
+        return any(source.changed for source in self.sources)
+
+    @property
+    def connected(self) -> bool:
+        """True if at least one source is connected."""
+        return any(source.connected for source in self.sources)
+
+    def load_cached(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[MeetingEvent]:
+        """
+        Fill all sources from their local event stores (no network).
+
+        Args:
+            start_date: Start of date range (default: now)
+            end_date: End of date range (default: now + 24 hours)
+
+        Returns:
+            Merged list of MeetingEvent objects
+        """
+        for source in self.sources:
+            source.events = source.client.cached_events(start_date, end_date)
+        return self.merged_events()
+
+    async def sync(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[MeetingEvent]:
+        """
+        Sync all sources concurrently.
+
+        Args:
+            start_date: Start of date range (default: now)
+            end_date: End of date range (default: now + 24 hours)
+
+        Returns:
+            Merged list of MeetingEvent objects
+        """
+        await asyncio.gather(
+            *(self._sync_source(source, start_date, end_date) for source in self.sources)
+        )
+        return self.merged_events()
+
+    async def _sync_source(
+        self,
+        source: CalendarSource,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ):
+        """Sync one source within its timeout, keeping old events on failure."""
+        async with self._semaphore:
+            started = time.perf_counter()
+            source.changed = False
+            try:
+                await asyncio.wait_for(
+                    self._connect_and_sync(source, start_date, end_date),
+                    timeout=self.source_timeout,
+                )
+                source.last_error = None
+            except asyncio.TimeoutError:
+                source.last_error = f"Sync timed out after {self.source_timeout:g}s"
+                logger.warning(f"Calendar '{source.name}': {source.last_error}")
+            except Exception as e:
+                source.last_error = str(e)
+                logger.error(f"Calendar '{source.name}' sync failed: {e}")
+            finally:
+                source.last_duration_ms = round((time.perf_counter() - started) * 1000, 1)
+
+        # Unchanged sources have nothing new to publish
+        if self.on_update and source.changed:
+            self.on_update(self.merged_events())
+
+    async def _connect_and_sync(
+        self,
+        source: CalendarSource,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ):
+        """Connect the source if needed, then sync it."""
+        if not source.connected:
+            source.connected = await asyncio.to_thread(source.client.connect)
+            if not source.connected:
+                raise ConnectionError("Failed to connect to CalDAV server")
+
+        source.events = await source.client.sync_events(start_date, end_date)
+        source.changed = not source.client.metrics.last_skipped
+        source.last_sync = datetime.now()
+
+    def merged_events(self, names: Optional[Collection[str]] = None) -> List[MeetingEvent]:
+        """
+        Merge the events of all sources.
+
+        Events are deduplicated by (UID, RECURRENCE-ID): the same meeting in
+        the room calendar and a team calendar appears once. The source listed
+        first wins, unless only a later copy carries a BBB link.
+
+        Args:
+            names: Only merge the sources with these names (default: all)
+
+        Returns:
+            List of MeetingEvent objects
+        """
+        merged: Dict[EventKey, MeetingEvent] = {}
+        for source in self.sources:
+            if names is not None and source.name not in names:
+                continue
+            for event in source.events:
+                key = event_key(event)
+                existing = merged.get(key)
+                if existing is None or (not existing.bbb_url and event.bbb_url):
+                    merged[key] = event
+        return list(merged.values())
+
+    def compact(self):
+        """Compact the local event stores of all sources."""
+        for source in self.sources:
+            source.client.event_store.compact()
+
+    def get_status(self) -> List[Dict[str, Any]]:
+        """
+        Get per-source status.
+
+        Returns:
+            List of source status dictionaries
+        """
+        return [source.get_status() for source in self.sources]
+
+    async def close(self):
+        """Close transports and event stores of all sources."""
+        for source in self.sources:
+            await source.client.close_transport()
+            source.client.disconnect()
+            await asyncio.to_thread(source.client.event_store.close)
+            source.connected = False
+        if self.parse_pool:
+            self.parse_pool.shutdown()
+        if self.connection_pool:
+            await self.connection_pool.close()
+
+
+def create_calendar_federation(
+    config: CalDAVConfig,
+    store_factory: Callable[[str], EventStore],
+    use_mock: bool = False,
+    pool: Optional[CalDAVConnectionPool] = None,
+    on_update: Optional[Callable[[List[MeetingEvent]], None]] = None,
+    include_primary: bool = True
+) -> CalendarFederation:
+    """
+    Factory function to create the calendar federation.
+
+    The primary calendar comes from the main CalDAV settings (or CALDAV_ICS_URL);
+    additional CalDAV sources inherit server, username and password unless
+    they set their own. ICS feed sources only use credentials they set.
+
+    Args:
+        config: CalDAV configuration
+        store_factory: Creates the event store for a source name
+        use_mock: Use mock CalDAV clients for testing
+        pool: Shared connection pool (calendars on the same account share discovery)
+        on_update: Called with the merged events whenever a source finished
+        include_primary: Sync the main calendar (False: only config.sources)
+
+    Returns:
+        CalendarFederation instance
+    """
+    # Without a pool from the room host the federation owns one
+    owned_pool = None if pool else CalDAVConnectionPool()
+    pool = pool or owned_pool
+    parse_pool = CalendarParsePool(
+        workers=config.parse_workers, threshold=config.parse_pool_threshold
+    )
+    if config.ics_url:
+        primary = CalendarSourceConfig(name=PRIMARY_SOURCE, type="ics", url=config.ics_url)
+    else:
+        primary = CalendarSourceConfig(name=PRIMARY_SOURCE, calendar_name=config.calendar_name)
+    source_configs = [primary] if include_primary else []
+    source_configs += config.sources
+
+    sources = []
+    seen = set()
+    for source_config in source_configs:
+        if source_config.name in seen:
+            logger.error(f"Duplicate calendar source name '{source_config.name}' - skipping")
+            continue
+        seen.add(source_config.name)
+
+        if source_config.type == "ics" and not use_mock:
+            if not source_config.url:
+                logger.error(f"Calendar source '{source_config.name}' has no feed URL - skipping")
+                continue
+            client = ICSFeedClient(
+                source_config.url,
+                username=source_config.username,
+                password=source_config.password,
+                name=source_config.calendar_name or source_config.name,
+                event_store=store_factory(source_config.name),
+                timeout=config.timeout_seconds,
+                parse_pool=parse_pool
+            )
+            sources.append(CalendarSource(name=source_config.name, client=client))
+            continue
+
+        client = create_caldav_client(
+            url=source_config.url or config.url,
+            username=source_config.username or config.username,
+            password=source_config.password or config.password,
+            calendar_name=source_config.calendar_name,
+            use_mock=use_mock,
+            pool=pool,
+            sync_mode=config.sync_mode,
+            multiget_batch_size=config.multiget_batch_size,
+            event_store=store_factory(source_config.name),
+            transport_mode=config.transport,
+            timeout=config.timeout_seconds,
+            expand_mode=config.expand_mode,
+            partial_retrieval=config.partial_retrieval,
+            parse_pool=parse_pool
+        )
+        sources.append(CalendarSource(name=source_config.name, client=client))
+
+    if len(sources) > 1:
+        logger.info(f"Calendar federation: {', '.join(source.name for source in sources)}")
+
+    return CalendarFederation(
+        sources,
+        max_parallel=config.max_parallel_sources,
+        source_timeout=config.source_timeout_seconds,
+        on_update=on_update,
+        parse_pool=parse_pool,
+        connection_pool=owned_pool,
+    )
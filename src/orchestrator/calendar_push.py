@@ -0,0 +1,663 @@
+"""
+Calendar change notifications for RaspberryMeet.
+
+Instead of waiting for the next poll, the scheduler syncs as soon as it
+hears that a calendar changed. Notifications arrive over three channels:
+
+- NotificationReceiver: a small HTTP endpoint on localhost, started only
+  when a push token is configured. Webhooks and WebDAV-Push messages reach
+  it through the web app (POST /api/calendar/notify), local tools can post
+  to it directly. In multi-room mode the rooms share one receiver, which
+  passes every notification on to all of them.
+- LongPollWatcher: a generic HTTP long-poll client (ETag / If-None-Match),
+  e.g. against a fleet proxy or the offline stand-in server in scripts/.
+- WebDAVPushSubscription: registers a Web Push subscription on the CalDAV
+  collection if the server supports WebDAV-Push
+  (draft-bitfire-webdav-push), with the web app's notify URL as push
+  resource, and renews it before it expires.
+
+CalendarPushManager coalesces bursts of notifications into one
+incremental sync. Polling stays on as a slow fallback.
+"""
+import asyncio
+import base64
+import os
+import secrets
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    CRYPTOGRAPHY_AVAILABLE = True
+except ImportError:
+    CRYPTOGRAPHY_AVAILABLE = False
+
+from src.orchestrator.caldav_protocol import (
+    build_propfind_push_support,
+    build_push_register,
+    parse_push_support,
+)
+from src.orchestrator.caldav_transport import CalDAVTransport
+from src.utils.config import CalDAVConfig
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+NOTIFY_PATH = "/notify"
+TOKEN_HEADER = "X-Notify-Token"
+
+# Request bodies (Web Push messages, webhook payloads) are not needed
+_MAX_BODY = 64 * 1024
+
+
+def token_matches(expected: Optional[str], provided: Optional[str]) -> bool:
+    """
+    Check a notification token in constant time.
+
+    Args:
+        expected: Configured token (None: no token required)
+        provided: Token sent with the notification
+
+    Returns:
+        True if the notification is authorized
+    """
+    if not expected:
+        return True
+    return bool(provided) and secrets.compare_digest(expected.encode(), provided.encode())
+
+
+class NotificationReceiver:
+    """Minimal HTTP endpoint that turns POST /notify into change notifications."""
+
+    def __init__(
+        self,
+        on_notify: Optional[Callable[[str], None]] = None,
+        host: str = "127.0.0.1",
+        port: int = 8766,
+        token: Optional[str] = None
+    ):
+        """
+        Initialize receiver.
+
+        Args:
+            on_notify: Called with the channel name for every accepted notification
+                (more listeners can be added with add_listener)
+            host: Bind address (keep on localhost unless a token is set)
+            port: TCP port (0: any free port)
+            token: Shared secret expected as ?token= or X-Notify-Token header
+        """
+        self._listeners: List[Callable[[str], None]] = [on_notify] if on_notify else []
+        self.host = host
+        self.port = port
+        self.token = token
+        self._server: Optional[asyncio.AbstractServer] = None
+
+        # Statistics
+        self.accepted = 0
+        self.rejected = 0
+
+    @property
+    def healthy(self) -> bool:
+        """True while the endpoint is listening."""
+        return self._server is not None
+
+    def add_listener(self, on_notify: Callable[[str], None]):
+        """Also pass accepted notifications to another callback (another room)."""
+        self._listeners.append(on_notify)
+
+    def remove_listener(self, on_notify: Callable[[str], None]):
+        """Stop passing notifications to a callback."""
+        if on_notify in self._listeners:
+            self._listeners.remove(on_notify)
+
+    async def start(self):
+        """Start listening."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"Calendar notification receiver listening on http://{self.host}:{self.port}{NOTIFY_PATH}")
+
+    async def stop(self):
+        """Stop listening."""
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve one HTTP/1.x request."""
+        status = 400
+        try:
+            request_line = (await asyncio.wait_for(reader.readline(), 10)).decode("latin-1")
+            headers: Dict[str, str] = {}
+            while True:
+                line = (await asyncio.wait_for(reader.readline(), 10)).decode("latin-1").strip()
+                if not line:
+                    break
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            length = min(int(headers.get("content-length", "0") or 0), _MAX_BODY)
+            if length:
+                await asyncio.wait_for(reader.readexactly(length), 10)
+
+            status = self._dispatch(request_line, headers)
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError):
+            status = 400
+        except Exception as e:
+            logger.debug(f"Notification request failed: {e}")
+            status = 500
+
+        reason = {204: "No Content", 400: "Bad Request", 403: "Forbidden",
+                  404: "Not Found", 405: "Method Not Allowed"}.get(status, "Error")
+        writer.write(f"HTTP/1.1 {status} {reason}\r\nContent-Length: 0\r\nConnection: close\r\n\r\n".encode())
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    def _dispatch(self, request_line: str, headers: Dict[str, str]) -> int:
+        """Check a request and raise the notification; returns the HTTP status."""
+        parts = request_line.split()
+        if len(parts) < 2:
+            return 400
+        method, target = parts[0], urlsplit(parts[1])
+        if target.path.rstrip("/") != NOTIFY_PATH:
+            return 404
+        if method != "POST":
+            return 405
+
+        provided = headers.get(TOKEN_HEADER.lower()) or parse_qs(target.query).get("token", [None])[0]
+        if not token_matches(self.token, provided):
+            self.rejected += 1
+            return 403
+
+        self.accepted += 1
+        channel = headers.get("x-notify-channel", "webhook")
+        for on_notify in list(self._listeners):
+            try:
+                on_notify(channel)
+            except Exception as e:
+                logger.error(f"Notification listener failed: {e}")
+        return 204
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Receiver statistics."""
+        return {
+            "listening": self.healthy,
+            "port": self.port,
+            "listeners": len(self._listeners),
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+        }
+
+
+class LongPollWatcher:
+    """Waits for changes on a generic HTTP long-poll endpoint."""
+
+    def __init__(
+        self,
+        url: str,
+        on_notify: Callable[[str], None],
+        token: Optional[str] = None,
+        wait_seconds: float = 300.0,
+        retry_seconds: float = 15.0,
+        verify: bool = True
+    ):
+        """
+        Initialize watcher.
+
+        The endpoint answers GET requests with an ETag. With If-None-Match it
+        holds the request until the resource changes (200, new ETag) or the
+        wait time is over (304).
+
+        Args:
+            url: Long-poll URL
+            on_notify: Called with the channel name for every change
+            token: Sent as X-Notify-Token header
+            wait_seconds: Requested hold time per request (?wait=)
+            retry_seconds: First retry delay after an error (doubles up to 5 minutes)
+            verify: Verify TLS certificates
+        """
+        if not HTTPX_AVAILABLE:
+            raise RuntimeError("httpx is not installed")
+
+        self.url = url
+        self.on_notify = on_notify
+        self.wait_seconds = wait_seconds
+        self.retry_seconds = retry_seconds
+        headers = {TOKEN_HEADER: token} if token else {}
+        self._client = httpx.AsyncClient(
+            verify=verify,
+            headers=headers,
+            timeout=httpx.Timeout(wait_seconds + 30.0, connect=10.0),
+        )
+        self._task: Optional[asyncio.Task] = None
+        self._etag: Optional[str] = None
+
+        # Statistics
+        self.healthy = False
+        self.polls = 0
+        self.changes = 0
+        self.errors = 0
+        self.last_error: Optional[str] = None
+
+    async def start(self):
+        """Start the long-poll loop."""
+        if not self._task:
+            self._task = asyncio.create_task(self._run(), name="calendar-long-poll")
+
+    async def stop(self):
+        """Stop the loop and close connections."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._client.aclose()
+
+    async def _run(self):
+        """Poll until cancelled, backing off after errors."""
+        delay = self.retry_seconds
+        while True:
+            try:
+                await self._poll_once()
+                delay = self.retry_seconds
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.healthy = False
+                self.errors += 1
+                self.last_error = str(e) or type(e).__name__
+                logger.debug(f"Long-poll request failed: {self.last_error} - retrying in {delay:.0f}s")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 300.0)
+
+    async def _poll_once(self):
+        """One long-poll request."""
+        headers = {"If-None-Match": self._etag} if self._etag else {}
+        self.polls += 1
+        response = await self._client.get(
+            self.url, params={"wait": int(self.wait_seconds)}, headers=headers
+        )
+        if response.status_code == 304:
+            self.healthy = True
+            return
+        if response.status_code != 200:
+            raise RuntimeError(f"HTTP {response.status_code}")
+
+        self.healthy = True
+        etag = response.headers.get("etag")
+        if self._etag is not None and etag != self._etag:
+            self.changes += 1
+            self.on_notify("long-poll")
+        self._etag = etag
+        if not etag:
+            # Without an ETag the server cannot hold the request: do not hammer it
+            await asyncio.sleep(self.retry_seconds)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Watcher statistics."""
+        return {
+            "url": self.url,
+            "healthy": self.healthy,
+            "polls": self.polls,
+            "changes": self.changes,
+            "errors": self.errors,
+            "last_error": self.last_error,
+        }
+
+
+def generate_push_keys() -> Optional[Dict[str, str]]:
+    """
+    Create the key pair and auth secret of a Web Push subscription.
+
+    Returns:
+        Dictionary with base64url "public_key" and "auth_secret", or None if
+        the cryptography package is missing
+    """
+    if not CRYPTOGRAPHY_AVAILABLE:
+        return None
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    public_key = private_key.public_key().public_bytes(
+        serialization.Encoding.X962, serialization.PublicFormat.UncompressedPoint
+    )
+
+    def encode(data: bytes) -> str:
+        return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+    return {"public_key": encode(public_key), "auth_secret": encode(os.urandom(16))}
+
+
+class WebDAVPushSubscription:
+    """Web Push subscription on a CalDAV collection (WebDAV-Push draft)."""
+
+    def __init__(
+        self,
+        transport: CalDAVTransport,
+        calendar_url: str,
+        push_resource: str,
+        lifetime: timedelta = timedelta(days=3)
+    ):
+        """
+        Initialize subscription.
+
+        Args:
+            transport: CalDAV transport of the calendar's client
+            calendar_url: Calendar collection URL
+            push_resource: URL the server posts notifications to
+            lifetime: Requested subscription lifetime (renewed at half-time)
+        """
+        self.transport = transport
+        self.calendar_url = calendar_url
+        self.push_resource = push_resource
+        self.lifetime = lifetime
+        self.registration_url: Optional[str] = None
+        self.expires: Optional[datetime] = None
+        self.topic: Optional[str] = None
+        self.supported: Optional[bool] = None
+        self._task: Optional[asyncio.Task] = None
+        self._keys = generate_push_keys()
+
+    @property
+    def healthy(self) -> bool:
+        """True while a registration is in place."""
+        return bool(self.registration_url and self.expires and self.expires > datetime.now(timezone.utc))
+
+    async def start(self) -> bool:
+        """
+        Register and keep the subscription renewed.
+
+        Returns:
+            True if the server accepted the subscription
+        """
+        if not await self.register():
+            return False
+        self._task = asyncio.create_task(self._renew_loop(), name="webdav-push-renew")
+        return True
+
+    async def register(self) -> bool:
+        """
+        Discover WebDAV-Push support and register the subscription.
+
+        Returns:
+            True if the server accepted the subscription
+        """
+        response = await self.transport.propfind(self.calendar_url, build_propfind_push_support())
+        support = parse_push_support(response.content) if response.status == 207 else None
+        self.supported = bool(support and support.web_push)
+        if not self.supported:
+            logger.info("CalDAV server does not offer WebDAV-Push - using polling")
+            return False
+        self.topic = support.topic
+
+        expires = datetime.now(timezone.utc) + self.lifetime
+        body = build_push_register(
+            self.push_resource,
+            expires,
+            public_key=self._keys["public_key"] if self._keys else None,
+            auth_secret=self._keys["auth_secret"] if self._keys else None,
+        )
+        response = await self.transport.request(
+            "POST", self.calendar_url, body, {"Content-Type": 'application/xml; charset="utf-8"'}
+        )
+        if response.status not in (201, 204):
+            logger.warning(f"WebDAV-Push registration rejected (HTTP {response.status})")
+            return False
+
+        location = {k.lower(): v for k, v in response.headers.items()}.get("location")
+        self.registration_url = location or self.registration_url
+        self.expires = expires
+        logger.info(f"Registered WebDAV-Push subscription (topic {self.topic}) until {expires:%Y-%m-%d %H:%M} UTC")
+        return True
+
+    async def _renew_loop(self):
+        """Renew the registration at half of its lifetime."""
+        while True:
+            await asyncio.sleep(self.lifetime.total_seconds() / 2)
+            try:
+                await self.register()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"WebDAV-Push renewal failed: {e}")
+
+    async def stop(self):
+        """Stop renewing and remove the registration from the server."""
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        if self.registration_url:
+            try:
+                await self.transport.request("DELETE", self.registration_url)
+            except Exception as e:
+                logger.debug(f"WebDAV-Push unregistration failed: {e}")
+            self.registration_url = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Subscription status."""
+        return {
+            "supported": self.supported,
+            "healthy": self.healthy,
+            "topic": self.topic,
+            "expires": self.expires.isoformat() if self.expires else None,
+            "encrypted": self._keys is not None,
+        }
+
+
+class CalendarPushManager:
+    """Collects change notifications and turns each burst into one sync."""
+
+    def __init__(
+        self,
+        on_change: Callable[[], Awaitable[None]],
+        debounce_seconds: float = 2.0
+    ):
+        """
+        Initialize manager.
+
+        Args:
+            on_change: Runs one incremental sync
+            debounce_seconds: Wait for further notifications before syncing
+        """
+        self.on_change = on_change
+        self.debounce_seconds = debounce_seconds
+        self.receiver: Optional[NotificationReceiver] = None
+        # False: the receiver belongs to the room host and serves other rooms too
+        self.owns_receiver = True
+        self.long_poll: Optional[LongPollWatcher] = None
+        self.subscriptions: List[WebDAVPushSubscription] = []
+        self._sync_task: Optional[asyncio.Task] = None
+        self._pending = False
+
+        # Statistics
+        self.notifications = 0
+        self.syncs_triggered = 0
+        self.last_notification: Optional[datetime] = None
+        self.last_channel: Optional[str] = None
+        self.last_latency_ms: Optional[float] = None
+        self._first_pending: Optional[float] = None
+
+    @property
+    def active(self) -> bool:
+        """True if a channel that reports remote changes is working."""
+        return bool(
+            (self.long_poll and self.long_poll.healthy)
+            or any(subscription.healthy for subscription in self.subscriptions)
+            or (self.receiver and self.receiver.healthy and self.receiver.accepted)
+        )
+
+    def notify(self, channel: str = "manual"):
+        """
+        Report a calendar change (safe to call repeatedly).
+
+        Args:
+            channel: Where the notification came from (for logs and stats)
+        """
+        self.notifications += 1
+        self.last_notification = datetime.now()
+        self.last_channel = channel
+        logger.info(f"Calendar change notification ({channel})")
+
+        if self._first_pending is None:
+            self._first_pending = time.perf_counter()
+        if self._sync_task and not self._sync_task.done():
+            # Sync already scheduled or running: run one more afterwards
+            self._pending = True
+            return
+        self._sync_task = asyncio.get_running_loop().create_task(
+            self._sync_after_debounce(), name="calendar-push-sync"
+        )
+
+    async def _sync_after_debounce(self):
+        """Coalesce a burst of notifications into one sync (plus one if more arrive meanwhile)."""
+        while True:
+            await asyncio.sleep(self.debounce_seconds)
+            self._pending = False
+            started = self._first_pending
+            self._first_pending = None
+            self.syncs_triggered += 1
+            try:
+                await self.on_change()
+            except Exception as e:
+                logger.error(f"Notification-triggered sync failed: {e}")
+            if started is not None:
+                self.last_latency_ms = round((time.perf_counter() - started) * 1000, 1)
+            if not self._pending:
+                return
+
+    async def start(self):
+        """Start the receiver and the long-poll watcher."""
+        if self.receiver and self.owns_receiver:
+            try:
+                await self.receiver.start()
+            except OSError as e:
+                logger.error(f"Cannot start calendar notification receiver: {e}")
+                self.receiver = None
+        if self.long_poll:
+            await self.long_poll.start()
+
+    async def subscribe(self, transport: CalDAVTransport, calendar_url: str, push_resource: str) -> bool:
+        """
+        Register a WebDAV-Push subscription for a calendar.
+
+        Args:
+            transport: CalDAV transport of the calendar's client
+            calendar_url: Calendar collection URL
+            push_resource: URL the CalDAV server delivers notifications to
+
+        Returns:
+            True if the server accepted the subscription
+        """
+        subscription = WebDAVPushSubscription(transport, calendar_url, push_resource)
+        try:
+            if await subscription.start():
+                self.subscriptions.append(subscription)
+                return True
+        except Exception as e:
+            logger.warning(f"WebDAV-Push subscription failed: {e}")
+        return False
+
+    async def stop(self):
+        """Stop all channels."""
+        if self._sync_task and not self._sync_task.done():
+            self._sync_task.cancel()
+        for subscription in self.subscriptions:
+            await subscription.stop()
+        self.subscriptions.clear()
+        if self.long_poll:
+            await self.long_poll.stop()
+        if self.receiver and self.owns_receiver:
+            await self.receiver.stop()
+        elif self.receiver:
+            self.receiver.remove_listener(self.notify)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get notification statistics.
+
+        Returns:
+            Dictionary with channel states and counters
+        """
+        return {
+            "active": self.active,
+            "notifications": self.notifications,
+            "syncs_triggered": self.syncs_triggered,
+            "last_notification": self.last_notification.isoformat() if self.last_notification else None,
+            "last_channel": self.last_channel,
+            "last_latency_ms": self.last_latency_ms,
+            "receiver": self.receiver.get_stats() if self.receiver else None,
+            "long_poll": self.long_poll.get_stats() if self.long_poll else None,
+            "webdav_push": [subscription.get_stats() for subscription in self.subscriptions],
+        }
+
+
+def create_notification_receiver(config: CalDAVConfig) -> Optional[NotificationReceiver]:
+    """
+    Factory function to create the local notification receiver.
+
+    The receiver is only needed for notifications forwarded by the web app,
+    which requires a push token; without one no port is bound.
+
+    Args:
+        config: CalDAV configuration
+
+    Returns:
+        NotificationReceiver (not started, without listeners), or None
+    """
+    if not config.push_enabled or not config.push_token or not config.push_receiver_port:
+        return None
+    return NotificationReceiver(
+        host=config.push_receiver_host,
+        port=config.push_receiver_port,
+        token=config.push_token,
+    )
+
+
+def create_calendar_push(
+    config: CalDAVConfig,
+    on_change: Callable[[], Awaitable[None]],
+    shared_receiver: Optional[NotificationReceiver] = None
+) -> Optional[CalendarPushManager]:
+    """
+    Factory function to create the notification channels from configuration.
+
+    Args:
+        config: CalDAV configuration
+        on_change: Runs one incremental sync
+        shared_receiver: Receiver run by the room host for all rooms
+            (None: create an own receiver if a push token is configured)
+
+    Returns:
+        CalendarPushManager, or None if change notifications are disabled
+    """
+    if not config.push_enabled:
+        return None
+
+    manager = CalendarPushManager(on_change)
+    if shared_receiver:
+        shared_receiver.add_listener(manager.notify)
+        manager.receiver = shared_receiver
+        manager.owns_receiver = False
+    else:
+        manager.receiver = create_notification_receiver(config)
+        if manager.receiver:
+            manager.receiver.add_listener(manager.notify)
+    if config.push_longpoll_url:
+        if HTTPX_AVAILABLE:
+            manager.long_poll = LongPollWatcher(
+                config.push_longpoll_url, manager.notify, token=config.push_token
+            )
+        else:
+            logger.warning("httpx not installed - long-poll change notifications disabled")
+    return manager
@@ -2,34 +2,67 @@
 Calendar-based meeting scheduler for RaspberryMeet.
 
 Automatically joins BigBlueButton meetings based on CalDAV calendar events.
+Each meeting gets a one-shot timer at its join time; the timers follow the
+calendar diff of every sync, so the scheduler sleeps between joins.
 """
 
 import asyncio
+import re
+import time
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Optional, Callable, List, Dict
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.interval import IntervalTrigger
 
-from src.orchestrator.calendar_sync import CalDAVClient, MeetingEvent, create_caldav_client
+from src.orchestrator.calendar_diff import CalendarDiff, EventDiffTracker, EventKey, event_key
+from src.orchestrator.calendar_federation import (
+    PRIMARY_SOURCE,
+    CalendarFederation,
+    create_calendar_federation,
+)
+from src.orchestrator.calendar_push import (
+    CalendarPushManager,
+    LongPollWatcher,
+    NotificationReceiver,
+    create_calendar_push,
+)
+from src.orchestrator.calendar_sync import (
+    CalDAVClient,
+    CalDAVConnectionPool,
+    MeetingEvent,
+)
+from src.orchestrator.event_index import MeetingIndex
+from src.orchestrator.event_store import EventStore, SQLiteEventStore
+from src.orchestrator.fleet_proxy import FleetProxyClient
+from src.orchestrator.sync_policy import AdaptiveSyncPolicy
+from src.orchestrator.triggers import TriggerScheduler
+from src.orchestrator.url_resolver import HTTPX_AVAILABLE, MeetingURLResolver
 from src.utils.config import CalDAVConfig
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# A join timer that fires a moment after the meeting started still joins
+_JOIN_GRACE_SECONDS = 60
+# Resolve the meeting URL again this long before the join: cache entries
+# of meetings synced hours ahead have expired by then
+_URL_REFRESH_SECONDS = 120
+
 
 class CalendarScheduler:
     """
     Scheduler for automatic meeting joins based on calendar events.
 
     Periodically syncs with CalDAV server, detects upcoming meetings,
-    and triggers automatic joins at the appropriate time.
+    and triggers automatic joins exactly at the join time.
     """
 
     def __init__(
         self,
         caldav_config: CalDAVConfig,
         on_meeting_start: Optional[Callable[[MeetingEvent], asyncio.Future]] = None,
-        use_mock: bool = False
+        use_mock: bool = False,
+        connection_pool: Optional[CalDAVConnectionPool] = None,
+        notification_receiver: Optional[NotificationReceiver] = None
     ):
         """
         Initialize calendar scheduler.
@@ -38,24 +71,56 @@ class CalendarScheduler:
             caldav_config: CalDAV configuration
             on_meeting_start: Async callback when meeting should be joined
             use_mock: Use mock CalDAV client for testing
+            connection_pool: Shared CalDAV connections (multi-room mode)
+            notification_receiver: Change notification receiver shared by all rooms (multi-room mode)
         """
         self.config = caldav_config
         self.on_meeting_start = on_meeting_start
         self.use_mock = use_mock
+        self.connection_pool = connection_pool
+        self.notification_receiver = notification_receiver
 
-        # CalDAV client
+        # Calendar sources (primary calendar plus configured extra calendars)
+        self.federation: Optional[CalendarFederation] = None
+        # Client of the primary calendar
         self.caldav_client: Optional[CalDAVClient] = None
+        # Fleet calendar proxy, tried before the calendar sources
+        self.proxy: Optional[FleetProxyClient] = None
+        # Follows meeting URL redirects ahead of the join
+        self.url_resolver: Optional[MeetingURLResolver] = None
+
+        # Timers for syncs and joins
+        self.scheduler: Optional[TriggerScheduler] = None
+        self.sync_policy = AdaptiveSyncPolicy(
+            base_interval=caldav_config.sync_interval_minutes * 60,
+            min_interval=caldav_config.sync_min_interval_minutes * 60,
+            max_interval=caldav_config.sync_max_interval_minutes * 60,
+            lead_fraction=caldav_config.sync_lead_fraction,
+            push_interval=caldav_config.push_fallback_interval_minutes * 60,
+            jitter=caldav_config.sync_jitter,
+            adaptive=caldav_config.sync_policy == "adaptive",
+        )
+        self._sync_lock = asyncio.Lock()
+
+        # Change notifications (webhooks, long-poll, WebDAV-Push)
+        self.push: Optional[CalendarPushManager] = None
 
-        # Scheduler
-        self.scheduler: Optional[AsyncIOScheduler] = None
+        # Every sync is turned into a diff; subscribers update incrementally
+        self.event_diff = EventDiffTracker()
+        self.event_diff.subscribe(self._apply_diff)
 
         # Tracking
-        self.upcoming_meetings: List[MeetingEvent] = []
-        self.joined_meetings: Dict[str, MeetingEvent] = {}  # uid -> event
+        self.meetings = MeetingIndex()  # BBB meetings by start time
+        # Where the last sync came from and the end of its window: an
+        # unchanged sync from the same place only advances the window
+        self._last_sync_path: Optional[str] = None
+        self._window_end_ts: Optional[float] = None
+        self.joined_meetings: Dict[EventKey, MeetingEvent] = {}
         self.last_sync: Optional[datetime] = None
 
         # State
         self.is_running = False
+        self._initial_sync_task: Optional[asyncio.Task] = None
 
     async def start(self):
         """Start the calendar scheduler."""
@@ -67,59 +132,145 @@ class CalendarScheduler:
             logger.info("CalDAV sync is disabled in configuration")
             return
 
-        if not self.config.url or not self.config.username or not self.config.password:
+        if not self.config.ics_url and not self.config.proxy_url and (
+            not self.config.url or not self.config.username or not self.config.password
+        ):
             logger.error("CalDAV credentials not configured")
             return
 
         logger.info("Starting calendar scheduler...")
 
-        # Create and connect CalDAV client
-        self.caldav_client = create_caldav_client(
-            url=self.config.url,
-            username=self.config.username,
-            password=self.config.password,
-            calendar_name=self.config.calendar_name,
-            use_mock=self.use_mock
+        if self.config.resolve_meeting_urls and HTTPX_AVAILABLE and not self.use_mock:
+            self.url_resolver = MeetingURLResolver(
+                ttl_seconds=self.config.url_cache_ttl_minutes * 60,
+                negative_ttl_seconds=self.config.url_cache_negative_ttl_minutes * 60,
+            )
+
+        if self.config.proxy_url and HTTPX_AVAILABLE and not self.use_mock:
+            self.proxy = FleetProxyClient(
+                self.config.proxy_url,
+                room=self.config.proxy_room or self.config.calendar_name,
+                token=self.config.proxy_token,
+                timeout=min(self.config.timeout_seconds, 10.0),
+                cache_path=self._proxy_cache_path(),
+            )
+
+        # Create CalDAV clients (connected on the first sync)
+        self.federation = await asyncio.to_thread(
+            create_calendar_federation,
+            self.config,
+            self._create_event_store,
+            use_mock=self.use_mock,
+            pool=self.connection_pool,
+            on_update=self._set_meetings
         )
+        self.caldav_client = self.federation.primary.client
 
-        if not self.caldav_client.connect():
-            logger.error("Failed to connect to CalDAV server")
-            return
+        # Created before the warm start: known meetings arm their join timers
+        self.scheduler = TriggerScheduler()
 
-        # Create scheduler
-        self.scheduler = AsyncIOScheduler()
-
-        # Schedule periodic sync
-        sync_interval = self.config.sync_interval_minutes
-        self.scheduler.add_job(
-            self._sync_calendar,
-            trigger=IntervalTrigger(minutes=sync_interval),
-            id="calendar_sync",
-            name="Sync calendar events",
-            replace_existing=True
+        # Warm start: schedule from the persisted stores before the first sync
+        cached = await asyncio.to_thread(self.proxy.load_cached) if self.proxy else []
+        if not cached:
+            cached = await asyncio.to_thread(self.federation.load_cached)
+        if cached:
+            self._set_meetings(cached)
+            logger.info(
+                f"Warm start: {len(self.upcoming_meetings)} BBB meeting(s) "
+                f"loaded from local event store"
+            )
+
+        # Each sync schedules the next one, see _schedule_next_sync
+        logger.info(
+            f"Calendar sync policy: {self.config.sync_policy}, "
+            f"base interval {self.config.sync_interval_minutes} minutes"
         )
-        logger.info(f"Scheduled calendar sync every {sync_interval} minutes")
 
-        # Schedule meeting check
+        # Optional sweep for joins the timers missed
         check_interval = self.config.check_interval_seconds
-        self.scheduler.add_job(
-            self._check_upcoming_meetings,
-            trigger=IntervalTrigger(seconds=check_interval),
-            id="meeting_check",
-            name="Check for upcoming meetings",
-            replace_existing=True
-        )
-        logger.info(f"Scheduled meeting check every {check_interval} seconds")
+        if check_interval > 0:
+            self.scheduler.call_every("meeting_check", check_interval, self._check_upcoming_meetings)
+            logger.info(f"Scheduled meeting check every {check_interval} seconds")
+
+        # Drop long-past events from the persistent store once a day
+        self.scheduler.call_every("event_store_compaction", 24 * 3600, self._compact_event_store)
 
-        # Start scheduler
-        self.scheduler.start()
         self.is_running = True
 
-        # Perform initial sync
-        await self._sync_calendar()
+        # Sync on change notifications; polling continues as a fallback
+        self.push = create_calendar_push(
+            self.config, self._on_calendar_change, shared_receiver=self.notification_receiver
+        )
+        if self.push and self.proxy and not self.push.long_poll:
+            # The proxy holds the request until the room's schedule changes
+            self.push.long_poll = LongPollWatcher(
+                self.proxy.changes_url, self.push.notify, token=self.config.proxy_token
+            )
+        if self.push:
+            await self.push.start()
+
+        # Cached meetings already armed their join timers; connect and sync
+        # in the background. With a warm cache the first sync waits a random
+        # moment, so devices that booted together do not hit the server at
+        # the same time.
+        delay = self.sync_policy.startup_delay(self.config.sync_startup_jitter_seconds) if cached else 0.0
+        self._initial_sync_task = asyncio.create_task(self._initial_sync(delay))
 
         logger.info("✅ Calendar scheduler started successfully")
 
+    @property
+    def upcoming_meetings(self) -> List[MeetingEvent]:
+        """Tracked BBB meetings in start order."""
+        return list(self.meetings)
+
+    def subscribe(self, callback: Callable[[CalendarDiff], None]):
+        """
+        Get notified about calendar changes.
+
+        Args:
+            callback: Called with a CalendarDiff whenever a sync adds,
+                changes or removes events
+        """
+        self.event_diff.subscribe(callback)
+
+    @property
+    def connected(self) -> bool:
+        """True if the calendar proxy answers or at least one calendar source is connected."""
+        if self.proxy and self.proxy.healthy:
+            return True
+        return bool(self.federation and self.federation.connected)
+
+    def _create_event_store(self, source_name: str = PRIMARY_SOURCE) -> EventStore:
+        """
+        Create the event store of a calendar source (persistent if a path is configured).
+
+        Args:
+            source_name: Calendar source name (extra sources get their own file)
+
+        Returns:
+            SQLiteEventStore, or an in-memory EventStore as fallback
+        """
+        if self.use_mock or not self.config.event_store_path:
+            return EventStore()
+
+        path = Path(self.config.event_store_path)
+        if source_name != PRIMARY_SOURCE:
+            suffix = re.sub(r"[^A-Za-z0-9_-]+", "_", source_name)
+            path = path.with_name(f"{path.stem}-{suffix}{path.suffix}")
+
+        try:
+            return SQLiteEventStore(path)
+        except Exception as e:
+            logger.error(f"Failed to open event store, using memory only: {e}")
+            return EventStore()
+
+    def _proxy_cache_path(self) -> Optional[Path]:
+        """File for the last proxy schedule, next to the event store."""
+        if not self.config.event_store_path:
+            return None
+        path = Path(self.config.event_store_path)
+        return path.with_name(f"{path.stem}-proxy.json")
+
     async def stop(self):
         """Stop the calendar scheduler."""
         if not self.is_running:
@@ -127,25 +278,84 @@ class CalendarScheduler:
 
         logger.info("Stopping calendar scheduler...")
 
-        # Shutdown scheduler
+        # Cancel sync and join timers
         if self.scheduler:
-            self.scheduler.shutdown(wait=False)
+            self.scheduler.shutdown()
             self.scheduler = None
 
+        if self._initial_sync_task and not self._initial_sync_task.done():
+            self._initial_sync_task.cancel()
+        self._initial_sync_task = None
+
+        # Before the federation closes: unregistering needs its connections
+        if self.push:
+            await self.push.stop()
+            self.push = None
+
         # Disconnect CalDAV
-        if self.caldav_client:
-            self.caldav_client.disconnect()
+        if self.federation:
+            await self.federation.close()
+            self.federation = None
             self.caldav_client = None
 
+        if self.proxy:
+            await self.proxy.close()
+            self.proxy = None
+
+        if self.url_resolver:
+            await self.url_resolver.close()
+            self.url_resolver = None
+
         self.is_running = False
         logger.info("Calendar scheduler stopped")
 
+    async def _initial_sync(self, delay: float):
+        """
+        Run the first sync after a startup delay.
+
+        Args:
+            delay: Seconds to wait before syncing
+        """
+        if delay:
+            logger.info(f"First calendar sync in {delay:.0f} seconds")
+            await asyncio.sleep(delay)
+        await self._sync_calendar()
+        await self._subscribe_webdav_push()
+
+    async def _subscribe_webdav_push(self):
+        """Register a WebDAV-Push subscription for the primary calendar, if configured."""
+        client = self.caldav_client
+        if not self.push or not self.config.push_public_url or not client or not client.transport:
+            return
+
+        calendar = client.get_calendar()
+        if not calendar:
+            return
+        push_resource = self.config.push_public_url
+        if self.config.push_token:
+            separator = "&" if "?" in push_resource else "?"
+            push_resource = f"{push_resource}{separator}token={self.config.push_token}"
+        await self.push.subscribe(client.transport, str(calendar.url), push_resource)
+
+    async def _on_calendar_change(self):
+        """Sync right away after a change notification (the diff re-arms join timers)."""
+        await self._sync_calendar()
+
     async def _sync_calendar(self):
-        """Sync calendar events from CalDAV server."""
-        if not self.caldav_client:
+        """Sync calendar events from all calendar sources and schedule the next sync."""
+        # Scheduled, manual and notification-triggered syncs never overlap
+        async with self._sync_lock:
+            await self._sync_sources()
+
+    async def _sync_sources(self):
+        """Run one sync of all calendar sources."""
+        if not self.federation:
             logger.error("CalDAV client not initialized")
             return
 
+        changed = True
+        version = self.event_diff.version
+        requests_before = self._request_count()
         try:
             logger.info("Syncing calendar events...")
 
@@ -153,73 +363,240 @@ class CalendarScheduler:
             start_date = datetime.now()
             end_date = start_date + timedelta(hours=24)
 
-            events = await asyncio.to_thread(
-                self.caldav_client.fetch_events,
-                start_date,
-                end_date
-            )
-
-            # Filter for BBB meetings only
-            bbb_meetings = [event for event in events if event.bbb_url]
-
-            self.upcoming_meetings = bbb_meetings
-            self.last_sync = datetime.now()
+            # The proxy serves the whole room; without it sync the sources directly.
+            # Failed sources keep their cached events and retry next sync.
+            events = await self.proxy.fetch(start_date, end_date) if self.proxy else None
+            if events is not None:
+                path, unchanged = "proxy", not self.proxy.last_changed
+            else:
+                events = await self.federation.sync(start_date, end_date)
+                path, unchanged = "federation", not self.federation.changed
+
+            if unchanged and path == self._last_sync_path and self._window_end_ts is not None:
+                self.event_diff.advance(events, self._window_end_ts)
+                bbb_meetings = self.upcoming_meetings
+            else:
+                # Sources also publish partial results while the sync runs
+                bbb_meetings = self._set_meetings(events)
+            self._last_sync_path = path
+            self._window_end_ts = end_date.timestamp()
+            changed = self.event_diff.version != version
+            if self.connected:
+                self.last_sync = datetime.now()
 
             logger.info(
                 f"✅ Calendar sync complete: {len(events)} total events, "
                 f"{len(bbb_meetings)} BBB meetings"
+                f"{'' if changed else ' (unchanged)'}"
             )
 
-            # Log upcoming meetings
-            for event in bbb_meetings:
-                time_until = event.time_until_start
+        except Exception as e:
+            logger.error(f"Failed to sync calendar: {e}", exc_info=True)
+
+        finally:
+            self.sync_policy.record_sync(self._request_count() - requests_before)
+            self._schedule_next_sync(changed)
+
+    def _schedule_next_sync(self, changed: bool):
+        """
+        Schedule the next sync according to the sync policy.
+
+        Args:
+            changed: True if the last sync changed the calendar
+        """
+        if not self.scheduler:
+            return
+
+        next_meeting = self.get_next_meeting()
+        join_time = None
+        if next_meeting:
+            join_time = datetime.fromtimestamp(next_meeting.start_ts - self.config.join_before_minutes * 60)
+        push_active = bool(self.push and self.push.active)
+        interval = self.sync_policy.next_interval(changed, join_time, push_active=push_active)
+
+        self.scheduler.call_later("calendar_sync", interval, self._sync_calendar)
+        logger.debug(f"Next calendar sync in {interval / 60:.1f} minutes")
+
+    def _request_count(self) -> int:
+        """Total CalDAV requests sent by all calendar sources."""
+        if not self.federation:
+            return 0
+        return sum(source.client.metrics.requests for source in self.federation.sources)
+
+    def _set_meetings(self, events: List[MeetingEvent]) -> List[MeetingEvent]:
+        """
+        Update the tracked meetings from the current calendar events.
+
+        Only the difference to the previous events is applied (see _apply_diff).
+
+        Args:
+            events: Calendar events
+
+        Returns:
+            List of BBB meetings
+        """
+        self.event_diff.update(events)
+        return self.upcoming_meetings
+
+    def _apply_diff(self, diff: CalendarDiff):
+        """
+        Apply calendar changes to the tracked meetings.
+
+        Args:
+            diff: Added, changed and removed events
+        """
+        for event in diff.removed:
+            key = event_key(event)
+            if self.meetings.remove(key):
+                logger.info(f"  🗑️  {event.summary} - removed from calendar")
+            self._disarm_join(key)
+            self._forget_join(event)
+
+        for change in diff.changed:
+            event = change.current
+            if change.rescheduled and event.bbb_url:
+                logger.info(
+                    f"  🔁 {event.summary} - moved to {event.start_time}"
+                )
+            if change.rescheduled:
+                self._forget_join(change.previous)
+
+        new_urls = []
+        for event in diff.current_events():
+            key = event_key(event)
+            if not event.bbb_url:
+                self.meetings.remove(key)
+                self._disarm_join(key)
+                continue
+            if key not in self.meetings:
                 logger.info(
                     f"  📅 {event.summary} - "
-                    f"Starts in {time_until.total_seconds() / 60:.0f} minutes"
+                    f"Starts in {event.time_until_start.total_seconds() / 60:.0f} minutes"
                 )
+            self.meetings.add(event)
+            self._arm_join(key, event)
+            new_urls.append(event.bbb_url)
 
-        except Exception as e:
-            logger.error(f"Failed to sync calendar: {e}", exc_info=True)
+        # Resolve redirects of new meeting URLs before anyone joins
+        if self.url_resolver and new_urls:
+            self.url_resolver.prefetch(new_urls)
 
-    async def _check_upcoming_meetings(self):
-        """Check if any meetings should be joined now."""
-        if not self.config.auto_join_enabled:
+    def _forget_join(self, event: MeetingEvent):
+        """
+        Allow a joined meeting to be joined again after it moved or vanished.
+
+        Meetings that are already running stay joined.
+
+        Args:
+            event: Previous version of the event
+        """
+        key = event_key(event)
+        joined = self.joined_meetings.get(key)
+        if joined is not None and not joined.is_active:
+            del self.joined_meetings[key]
+
+    def _arm_join(self, key: EventKey, event: MeetingEvent):
+        """
+        Set the join timer of a meeting to its join time.
+
+        Args:
+            key: Event key
+            event: Current version of the meeting
+        """
+        if not self.scheduler or not self.config.auto_join_enabled or key in self.joined_meetings:
+            return
+        if event.time_until_start.total_seconds() < 0:
+            # Already running: not auto-joined (as before), only cleaned up
+            self._disarm_join(key)
             return
+        join_ts = event.start_ts - self.config.join_before_minutes * 60
+        self.scheduler.call_at(_join_job_id(key), datetime.fromtimestamp(join_ts), self._join_due, key)
+        if self.url_resolver and join_ts - _URL_REFRESH_SECONDS > time.time():
+            self.scheduler.call_at(
+                _url_job_id(key),
+                datetime.fromtimestamp(join_ts - _URL_REFRESH_SECONDS),
+                self._refresh_url,
+                key,
+            )
+
+    def _disarm_join(self, key: EventKey):
+        """Cancel the join timer of a meeting."""
+        if self.scheduler:
+            self.scheduler.cancel(_join_job_id(key))
+            self.scheduler.cancel(_url_job_id(key))
+
+    def _refresh_url(self, key: EventKey):
+        """
+        Resolve a meeting URL shortly before the join unless the cache covers the join.
+
+        Args:
+            key: Event key
+        """
+        event = self.meetings.get(key)
+        if event is not None and event.bbb_url and self.url_resolver:
+            self.url_resolver.prefetch(
+                [event.bbb_url], min_ttl=_URL_REFRESH_SECONDS + _JOIN_GRACE_SECONDS
+            )
+
+    async def _compact_event_store(self):
+        """Remove long-past events from the local event store."""
+        if self.federation:
+            await asyncio.to_thread(self.federation.compact)
+
+    async def _join_due(self, key: EventKey):
+        """
+        Join timer of a meeting fired.
 
-        if not self.upcoming_meetings:
+        Args:
+            key: Event key
+        """
+        event = self.meetings.get(key)
+        if event is None or key in self.joined_meetings or not self.config.auto_join_enabled:
             return
+        await self._auto_join(key, event)
 
-        now = datetime.now()
-        join_threshold_minutes = self.config.join_before_minutes
+    async def _auto_join(self, key: EventKey, event: MeetingEvent):
+        """
+        Join a meeting if its join window is open.
 
-        for event in self.upcoming_meetings:
-            # Skip if already joined
-            if event.uid in self.joined_meetings:
-                continue
+        Args:
+            key: Event key
+            event: Meeting event
+        """
+        seconds_until = event.start_ts - time.time()
+        if not -_JOIN_GRACE_SECONDS <= seconds_until <= self.config.join_before_minutes * 60:
+            return
+        minutes_until = seconds_until / 60
 
-            # Check if meeting should be joined
-            time_until = event.time_until_start
-            minutes_until = time_until.total_seconds() / 60
+        logger.info(
+            f"🚀 Auto-joining meeting: {event.summary} "
+            f"(starts in {minutes_until:.1f} minutes)"
+        )
 
-            # Join if within threshold
-            if 0 <= minutes_until <= join_threshold_minutes:
-                logger.info(
-                    f"🚀 Auto-joining meeting: {event.summary} "
-                    f"(starts in {minutes_until:.1f} minutes)"
-                )
+        # Mark first: a sweep or notification during the join must not join twice
+        self.joined_meetings[key] = event
+        await self._join_meeting(event)
 
-                # Trigger meeting join
-                await self._join_meeting(event)
+    async def _check_upcoming_meetings(self):
+        """Sweep all meetings for missed joins and clean up past meetings."""
+        if not self.config.auto_join_enabled:
+            return
 
-                # Mark as joined
-                self.joined_meetings[event.uid] = event
+        now = time.time()
+        for event in list(self.meetings):
+            key = event_key(event)
+            # Skip if already joined
+            if key in self.joined_meetings:
+                continue
 
             # Clean up past meetings
-            elif time_until.total_seconds() < -3600:  # 1 hour past
+            if event.start_ts < now - 3600:  # 1 hour past
                 logger.debug(f"Removing past meeting: {event.summary}")
-                self.upcoming_meetings.remove(event)
-                if event.uid in self.joined_meetings:
-                    del self.joined_meetings[event.uid]
+                self.meetings.remove(key)
+                self._disarm_join(key)
+                continue
+
+            await self._auto_join(key, event)
 
     async def _join_meeting(self, event: MeetingEvent):
         """
@@ -251,6 +628,20 @@ class CalendarScheduler:
                 exc_info=True
             )
 
+    def join_url(self, event: MeetingEvent) -> Optional[str]:
+        """
+        Get the URL to open for a meeting.
+
+        Args:
+            event: Meeting event
+
+        Returns:
+            Resolved final URL if known, otherwise the URL from the calendar
+        """
+        if self.url_resolver and event.bbb_url:
+            return self.url_resolver.lookup(event.bbb_url)
+        return event.bbb_url
+
     def get_next_meeting(self) -> Optional[MeetingEvent]:
         """
         Get the next upcoming meeting.
@@ -258,22 +649,7 @@ class CalendarScheduler:
         Returns:
             Next MeetingEvent or None if no meetings scheduled
         """
-        if not self.upcoming_meetings:
-            return None
-
-        # Sort by start time
-        sorted_meetings = sorted(
-            self.upcoming_meetings,
-            key=lambda e: e.start_time
-        )
-
-        # Return first upcoming meeting
-        now = datetime.now()
-        for meeting in sorted_meetings:
-            if meeting.start_time > now:
-                return meeting
-
-        return None
+        return self.meetings.next_after(time.time())
 
     def get_current_meetings(self) -> List[MeetingEvent]:
         """
@@ -282,11 +658,20 @@ class CalendarScheduler:
         Returns:
             List of active MeetingEvent objects
         """
-        now = datetime.now()
-        return [
-            event for event in self.upcoming_meetings
-            if event.start_time <= now <= event.end_time
-        ]
+        return self.meetings.active_at(time.time())
+
+    def get_meetings_between(self, start: datetime, end: datetime) -> List[MeetingEvent]:
+        """
+        Get the meetings overlapping a time range.
+
+        Args:
+            start: Range start (naive local or timezone-aware)
+            end: Range end (naive local or timezone-aware)
+
+        Returns:
+            List of MeetingEvent objects in start order
+        """
+        return self.meetings.window(start.timestamp(), end.timestamp())
 
     def get_status(self) -> Dict[str, any]:
         """
@@ -300,10 +685,11 @@ class CalendarScheduler:
 
         status = {
             "running": self.is_running,
+            "connected": self.connected,
             "caldav_enabled": self.config.enabled,
             "auto_join_enabled": self.config.auto_join_enabled,
             "last_sync": self.last_sync.isoformat() if self.last_sync else None,
-            "upcoming_meetings_count": len(self.upcoming_meetings),
+            "upcoming_meetings_count": len(self.meetings),
             "joined_meetings_count": len(self.joined_meetings),
             "current_meetings_count": len(current_meetings),
             "next_meeting": {
@@ -313,7 +699,19 @@ class CalendarScheduler:
                 "bbb_url": next_meeting.bbb_url,
             } if next_meeting else None,
             "sync_interval_minutes": self.config.sync_interval_minutes,
+            "sync_policy": self.sync_policy.get_stats(),
+            "push": self.push.get_stats() if self.push else None,
+            "proxy": self.proxy.get_stats() if self.proxy else None,
             "check_interval_seconds": self.config.check_interval_seconds,
+            "triggers": self.scheduler.get_stats() if self.scheduler else None,
+            "sync_mode": self.config.sync_mode,
+            "sources": self.federation.get_status() if self.federation else [],
+            "parse_pool": (
+                self.federation.parse_pool.get_stats()
+                if self.federation and self.federation.parse_pool else None
+            ),
+            "url_resolver": self.url_resolver.get_stats() if self.url_resolver else None,
+            "calendar_diff": self.event_diff.get_stats(),
         }
 
         return status
@@ -367,3 +765,15 @@ class CalendarScheduler:
         logger.info(f"Added mock meeting: {summary}")
 
         return event
+
+
+def _join_job_id(key: EventKey) -> str:
+    """Timer ID of a meeting's join."""
+    uid, recurrence_id = key
+    return f"join:{uid}:{recurrence_id or ''}"
+
+
+def _url_job_id(key: EventKey) -> str:
+    """Timer ID of a meeting's URL refresh."""
+    uid, recurrence_id = key
+    return f"url:{uid}:{recurrence_id or ''}"
@@ -5,10 +5,12 @@ Connects to Nextcloud/Radicale CalDAV servers to sync calendar events
 and detect BigBlueButton meetings for automatic joining.
 """
 
-import re
-from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, tzinfo
+from typing import AsyncIterator, Iterable, List, Optional, Dict, Any, Tuple
+from dataclasses import asdict, dataclass, field
 from urllib.parse import urlparse
 
 try:
@@ -19,53 +21,256 @@ try:
 except ImportError:
     CALDAV_AVAILABLE = False
 
+from src.orchestrator.caldav_protocol import (
+    CalDAVProtocolError,
+    InvalidSyncTokenError,
+    CollectionState,
+    SyncCollectionResult,
+    MultistatusStream,
+    SyncObject,
+    build_calendar_multiget,
+    build_calendar_query,
+    build_propfind_collection_state,
+    build_sync_collection,
+    check_sync_error,
+    iter_calendar_objects,
+    parse_collection_state,
+    parse_sync_collection,
+    partial_data_ignored,
+)
+from src.orchestrator.caldav_transport import CalDAVTransport, create_caldav_transport
+from src.orchestrator.event_store import EventStore, ParsedObjectCache, StoredObject
+from src.orchestrator.ical_stream import (
+    UnsupportedICalendar,
+    VEventFields,
+    iter_vevents,
+    vevent_fields,
+)
+from src.orchestrator.meeting_links import extract_meeting_links
+from src.orchestrator.parse_pool import CalendarParsePool
+from src.orchestrator.recurrence import RecurrenceExpander
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Statuses with which servers reject a partial calendar-data selection
+_PARTIAL_REJECTED = {400, 403, 415, 422, 501}
 
-@dataclass
+
+@dataclass(slots=True)
 class MeetingEvent:
-    """Represents a calendar meeting event."""
+    """
+    Represents a calendar meeting event.
+
+    The start and end are stored once, as UTC epoch seconds (start_ts,
+    end_ts) plus the calendar's time zone (None for floating times, which
+    are local time). start_time and end_time are derived from them, so
+    naive and aware events compare correctly and a record carries two
+    ints instead of two datetimes. Events are not modified after creation
+    (use dataclasses.replace with both start_time and end_time).
+    """
 
     uid: str
     summary: str
     description: str
-    start_time: datetime
-    end_time: datetime
     location: str
     bbb_url: Optional[str] = None
     bbb_password: Optional[str] = None
     organizer: Optional[str] = None
     attendees: List[str] = None
+    recurrence_id: Optional[str] = None
+    start_ts: int = field(default=0, init=False, repr=False)
+    end_ts: int = field(default=0, init=False, repr=False)
+    tz: Optional[tzinfo] = field(default=None, init=False, repr=False, compare=False)
+
+    def __init__(
+        self,
+        uid: str,
+        summary: str,
+        description: str,
+        start_time: datetime,
+        end_time: datetime,
+        location: str,
+        bbb_url: Optional[str] = None,
+        bbb_password: Optional[str] = None,
+        organizer: Optional[str] = None,
+        attendees: Optional[List[str]] = None,
+        recurrence_id: Optional[str] = None,
+    ):
+        self.uid = uid
+        self.summary = summary
+        self.description = description
+        self.location = location
+        self.bbb_url = bbb_url
+        self.bbb_password = bbb_password
+        self.organizer = organizer
+        self.attendees = [] if attendees is None else attendees
+        self.recurrence_id = recurrence_id
+        # Naive (floating) times are local time
+        self.start_ts = int(start_time.timestamp())
+        self.end_ts = int(end_time.timestamp())
+        self.tz = start_time.tzinfo
+
+    @property
+    def start_time(self) -> datetime:
+        """Start in the calendar's time zone (naive local time if floating)."""
+        return datetime.fromtimestamp(self.start_ts, self.tz)
 
-    def __post_init__(self):
-        if self.attendees is None:
-            self.attendees = []
+    @property
+    def end_time(self) -> datetime:
+        """End in the calendar's time zone (naive local time if floating)."""
+        return datetime.fromtimestamp(self.end_ts, self.tz)
 
     @property
     def is_active(self) -> bool:
         """Check if the meeting is currently active."""
-        now = datetime.now(self.start_time.tzinfo)
-        return self.start_time <= now <= self.end_time
+        now = time.time()
+        return self.start_ts <= now <= self.end_ts
 
     @property
     def is_upcoming(self, minutes: int = 5) -> bool:
         """Check if the meeting starts within the specified minutes."""
-        now = datetime.now(self.start_time.tzinfo)
-        threshold = now + timedelta(minutes=minutes)
-        return now <= self.start_time <= threshold
+        now = time.time()
+        return now <= self.start_ts <= now + minutes * 60
 
     @property
     def time_until_start(self) -> timedelta:
         """Get time until meeting starts."""
-        now = datetime.now(self.start_time.tzinfo)
-        return self.start_time - now
+        return timedelta(seconds=self.start_ts - time.time())
 
     def __repr__(self) -> str:
         return f"<MeetingEvent: {self.summary} at {self.start_time}>"
 
 
+@dataclass
+class SyncMetrics:
+    """Counters of the incremental calendar sync."""
+
+    syncs: int = 0
+    syncs_skipped: int = 0
+    full_resyncs: int = 0
+    objects_changed: int = 0
+    objects_unchanged: int = 0
+    objects_deleted: int = 0
+    objects_fetched: int = 0
+    multiget_requests: int = 0
+    requests: int = 0
+    last_sync_ms: Optional[float] = None
+    last_skipped: bool = False
+    expansion_cache_hits: int = 0
+    expansion_cache_misses: int = 0
+    parse_cache_hits: int = 0
+    parse_cache_misses: int = 0
+    partial_retrieval: bool = False
+    bytes_received: int = 0
+    last_sync_bytes: Optional[int] = None
+    last_parse_ms: Optional[float] = None
+    objects_parsed_in_pool: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get metrics as a dictionary."""
+        return asdict(self)
+
+
+class CalDAVConnectionPool:
+    """
+    Shares CalDAV connections and calendar discovery between clients.
+
+    Used in multi-room mode, where several rooms sync calendars from the same
+    server account: the HTTP session, principal lookup and calendar listing
+    are done once per (url, username) instead of once per room, and the
+    rooms send their sync requests through one shared transport. Rooms
+    sync in their own threads, and a requests.Session is not thread-safe,
+    so each connection has a lock that serialises requests on its session.
+    """
+
+    def __init__(self):
+        self._connections: Dict[Tuple[str, str], Tuple[Any, Any, List[Any]]] = {}
+        self._request_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._transports: Dict[Tuple[str, str, str], CalDAVTransport] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str, username: str, password: str) -> Tuple[Any, Any, List[Any]]:
+        """
+        Get (or open) a shared connection.
+
+        Args:
+            url: CalDAV server URL
+            username: CalDAV username
+            password: CalDAV password
+
+        Returns:
+            Tuple of (DAVClient, principal, calendars)
+        """
+        key = (url, username)
+        with self._lock:
+            if key not in self._connections:
+                client = caldav.DAVClient(url=url, username=username, password=password)
+                principal = client.principal()
+                self._connections[key] = (client, principal, principal.calendars())
+                self._request_locks[key] = threading.Lock()
+                logger.info(f"Opened shared CalDAV connection: {username}@{url}")
+            return self._connections[key]
+
+    def request_lock(self, url: str, username: str) -> threading.Lock:
+        """
+        Get the lock serialising requests on a shared connection's session.
+
+        Args:
+            url: CalDAV server URL
+            username: CalDAV username
+
+        Returns:
+            Lock held around every request sent through the DAVClient
+        """
+        with self._lock:
+            return self._request_locks[(url, username)]
+
+    def transport(
+        self,
+        url: str,
+        username: str,
+        password: str,
+        mode: str,
+        timeout: float = 30.0
+    ) -> CalDAVTransport:
+        """
+        Get (or create) the shared sync transport of a connection.
+
+        Args:
+            url: CalDAV server URL
+            username: CalDAV username
+            password: CalDAV password
+            mode: Transport mode ("httpx" or "caldav")
+            timeout: Request timeout in seconds
+
+        Returns:
+            CalDAVTransport shared by all clients of the connection
+        """
+        client = self.get(url, username, password)[0]
+        request_lock = self.request_lock(url, username)
+        key = (url, username, mode)
+        with self._lock:
+            if key not in self._transports:
+                self._transports[key] = create_caldav_transport(
+                    mode, client, username, password, timeout, request_lock
+                )
+            return self._transports[key]
+
+    async def close(self):
+        """Close the shared transports and drop all shared connections."""
+        with self._lock:
+            transports = list(self._transports.values())
+            self._transports.clear()
+            self._connections.clear()
+            self._request_locks.clear()
+        for transport in transports:
+            try:
+                await transport.close()
+            except Exception as e:
+                logger.debug(f"Error closing shared CalDAV transport: {e}")
+
+
 class CalDAVClient:
     """CalDAV client for Nextcloud/Radicale calendar synchronization."""
 
@@ -74,7 +279,16 @@ class CalDAVClient:
         url: str,
         username: str,
         password: str,
-        calendar_name: Optional[str] = None
+        calendar_name: Optional[str] = None,
+        pool: Optional[CalDAVConnectionPool] = None,
+        sync_mode: str = "incremental",
+        multiget_batch_size: int = 100,
+        event_store: Optional[EventStore] = None,
+        transport_mode: str = "httpx",
+        timeout: float = 30.0,
+        expand_mode: str = "local",
+        partial_retrieval: bool = True,
+        parse_pool: Optional[CalendarParsePool] = None
     ):
         """
         Initialize CalDAV client.
@@ -84,15 +298,48 @@ class CalDAVClient:
             username: CalDAV username/email
             password: CalDAV password or app token
             calendar_name: Specific calendar name to sync (optional)
+            pool: Shared connection pool (optional, multi-room mode)
+            sync_mode: "incremental" (sync-collection REPORT) or "full" (date search)
+            multiget_batch_size: Maximum hrefs per calendar-multiget REPORT
+            event_store: Store for synced objects (default: in-memory)
+            transport_mode: "httpx" (async, pooled) or "caldav" for sync requests
+            timeout: Request timeout in seconds
+            expand_mode: "local" (cached rule evaluation) or "server" (CalDAV expand)
+            partial_retrieval: Only request the VEVENT properties that are used
+            parse_pool: Process pool for bulk parsing (optional, shared)
         """
         self.url = url
         self.username = username
         self.password = password
         self.calendar_name = calendar_name
+        self.pool = pool
         self.client: Optional[caldav.DAVClient] = None
+        self.request_lock = threading.Lock()
         self.principal = None
         self.calendars: List[caldav.Calendar] = []
 
+        # Incremental sync state
+        self.sync_mode = sync_mode
+        self.multiget_batch_size = max(1, multiget_batch_size)
+        self.transport_mode = transport_mode
+        self.timeout = timeout
+        self.transport: Optional[CalDAVTransport] = None
+        self.event_store = event_store if event_store is not None else EventStore()
+        self.metrics = SyncMetrics()
+        self._incremental_supported = True
+
+        # Recurrence expansion and parsed-object memo
+        self.expand_mode = expand_mode
+        self.expander = RecurrenceExpander(self._parse_vevent)
+        self.parse_cache = ParsedObjectCache()
+        self.parse_pool = parse_pool
+
+        # Partial calendar-data retrieval and per-sync accounting
+        self.partial_retrieval = partial_retrieval
+        self._partial_supported = True
+        self._sync_bytes = 0
+        self._sync_parse_seconds = 0.0
+
         if not CALDAV_AVAILABLE:
             logger.warning("CalDAV libraries not available. Using mock mode.")
 
@@ -109,17 +356,24 @@ class CalDAVClient:
 
         try:
             logger.info(f"Connecting to CalDAV server: {self.url}")
-            self.client = caldav.DAVClient(
-                url=self.url,
-                username=self.username,
-                password=self.password
-            )
-
-            # Get principal (user account)
-            self.principal = self.client.principal()
-
-            # Discover calendars
-            self.calendars = self.principal.calendars()
+            if self.pool:
+                self.client, self.principal, self.calendars = self.pool.get(
+                    self.url, self.username, self.password
+                )
+                self.request_lock = self.pool.request_lock(self.url, self.username)
+            else:
+                self.client = caldav.DAVClient(
+                    url=self.url,
+                    username=self.username,
+                    password=self.password,
+                    timeout=self.timeout
+                )
+
+                # Get principal (user account)
+                self.principal = self.client.principal()
+
+                # Discover calendars
+                self.calendars = self.principal.calendars()
 
             if not self.calendars:
                 logger.warning("No calendars found on server")
@@ -129,6 +383,15 @@ class CalDAVClient:
             for cal in self.calendars:
                 logger.info(f"  - {cal.name}")
 
+            if self.pool:
+                self.transport = self.pool.transport(
+                    self.url, self.username, self.password, self.transport_mode, self.timeout
+                )
+            else:
+                self.transport = create_caldav_transport(
+                    self.transport_mode, self.client, self.username, self.password,
+                    self.timeout, self.request_lock
+                )
             return True
 
         except Exception as e:
@@ -190,19 +453,18 @@ class CalDAVClient:
 
         try:
             logger.info(f"Fetching events from {start_date} to {end_date}")
+            self._begin_sync_accounting()
 
-            # Search for events in date range
-            events = calendar.date_search(
-                start=start_date,
-                end=end_date,
-                expand=True
-            )
+            # Search for events in date range; in local mode the server
+            # returns recurring masters and we expand them ourselves
+            content = self._calendar_query(str(calendar.url), start_date, end_date)
 
-            meeting_events = []
-            for event in events:
-                meeting_event = self._parse_event(event)
-                if meeting_event:
-                    meeting_events.append(meeting_event)
+            # Server-expanded objects hold one VEVENT per instance and no
+            # rules, so both modes go through the same (memoized) parsing
+            meeting_events = self._objects_events(
+                iter_calendar_objects(content), start_date, end_date
+            )
+            self._end_sync_accounting()
 
             logger.info(f"Found {len(meeting_events)} meeting event(s)")
             return meeting_events
@@ -211,131 +473,901 @@ class CalDAVClient:
             logger.error(f"Failed to fetch events: {e}")
             return []
 
-    def _parse_event(self, cal_event: caldav.CalendarObjectResource) -> Optional[MeetingEvent]:
+    async def iter_events(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> AsyncIterator[MeetingEvent]:
+        """
+        Stream the events within date range straight from the server.
+
+        Sends a calendar-query REPORT through the transport and parses the
+        multistatus response while it arrives: each calendar object is
+        tokenized on its own and its events are yielded before the next
+        chunk is read, so memory stays bounded however large the calendar
+        is. Nothing is written to the event store.
+
+        Args:
+            start_date: Start of date range (default: now)
+            end_date: End of date range (default: now + 24 hours)
+
+        Yields:
+            MeetingEvent objects, in server order
+
+        Raises:
+            CalDAVProtocolError: The REPORT failed
+        """
+        if not CALDAV_AVAILABLE or not self.client or not self.transport:
+            logger.warning("CalDAV not available - no events to stream")
+            return
+
+        if start_date is None:
+            start_date = datetime.now()
+        if end_date is None:
+            end_date = start_date + timedelta(hours=24)
+
+        calendar = self.get_calendar()
+        if not calendar:
+            return
+
+        calendar_url = str(calendar.url)
+        expand = self.expand_mode == "server"
+        while True:
+            partial = self._partial_active
+            self.metrics.requests += 1
+            body = build_calendar_query(start_date, end_date, partial=partial, expand=expand)
+            async with self.transport.stream_report(calendar_url, body) as response:
+                if partial and response.status in _PARTIAL_REJECTED:
+                    self._disable_partial(f"calendar-query rejected with HTTP {response.status}")
+                    continue
+                if response.status != 207:
+                    raise CalDAVProtocolError(
+                        f"calendar-query REPORT failed (HTTP {response.status})", response.status
+                    )
+
+                # Large responses are parsed in the process pool once they
+                # pass its threshold; the first objects always stay in-process
+                pool = self.parse_pool if self.parse_pool and self.parse_pool.enabled else None
+                received = 0
+                async for objects in self._stream_objects(
+                    response.chunks, pool.batch_size if pool else 1
+                ):
+                    received += len(objects)
+                    if pool and pool.use_for(received):
+                        stored = await self._parse_in_pool(objects)
+                        events = await asyncio.to_thread(
+                            self._stored_events, stored, start_date, end_date
+                        )
+                    else:
+                        events = await asyncio.to_thread(
+                            self._objects_events, objects, start_date, end_date
+                        )
+                    for event in events:
+                        yield event
+                return
+
+    async def _query_events(
+        self,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> List[MeetingEvent]:
         """
-        Parse CalDAV event into MeetingEvent object.
+        Full date search, streamed through the async transport.
 
         Args:
-            cal_event: CalDAV calendar event
+            start_date: Start of date range (default: now)
+            end_date: End of date range (default: now + 24 hours)
 
         Returns:
-            MeetingEvent object or None if parsing fails
+            List of MeetingEvent objects
         """
+        if not self.transport:
+            return await asyncio.to_thread(self.fetch_events, start_date, end_date)
+
+        self._begin_sync_accounting()
         try:
-            # Parse iCalendar data
-            ical = Calendar.from_ical(cal_event.data)
-
-            for component in ical.walk():
-                if component.name == "VEVENT":
-                    # Extract basic event info
-                    uid = str(component.get('uid', ''))
-                    summary = str(component.get('summary', 'Untitled Meeting'))
-                    description = str(component.get('description', ''))
-                    location = str(component.get('location', ''))
-
-                    # Extract dates
-                    dtstart = component.get('dtstart')
-                    dtend = component.get('dtend')
-
-                    if not dtstart or not dtend:
-                        logger.warning(f"Event {summary} missing start/end time")
-                        continue
-
-                    start_time = dtstart.dt
-                    end_time = dtend.dt
-
-                    # Ensure datetime objects (not just date)
-                    if not isinstance(start_time, datetime):
-                        start_time = datetime.combine(start_time, datetime.min.time())
-                    if not isinstance(end_time, datetime):
-                        end_time = datetime.combine(end_time, datetime.max.time())
-
-                    # Extract organizer
-                    organizer = None
-                    if component.get('organizer'):
-                        org_str = str(component.get('organizer'))
-                        # Extract email from mailto: URI
-                        if 'mailto:' in org_str.lower():
-                            organizer = org_str.lower().replace('mailto:', '').strip()
-
-                    # Extract attendees
-                    attendees = []
-                    for attendee in component.get('attendee', []):
-                        att_str = str(attendee)
-                        if 'mailto:' in att_str.lower():
-                            email = att_str.lower().replace('mailto:', '').strip()
-                            attendees.append(email)
-
-                    # Extract BBB URL and password
-                    bbb_url, bbb_password = self._extract_bbb_info(description, location)
-
-                    meeting_event = MeetingEvent(
-                        uid=uid,
-                        summary=summary,
-                        description=description,
-                        start_time=start_time,
-                        end_time=end_time,
-                        location=location,
-                        bbb_url=bbb_url,
-                        bbb_password=bbb_password,
-                        organizer=organizer,
-                        attendees=attendees
+            events = [event async for event in self.iter_events(start_date, end_date)]
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to fetch events: {e}")
+            return []
+
+        self._end_sync_accounting()
+        logger.info(f"Found {len(events)} meeting event(s)")
+        return events
+
+    async def _stream_objects(
+        self,
+        chunks: AsyncIterator[bytes],
+        min_batch: int = 1
+    ) -> AsyncIterator[List[SyncObject]]:
+        """
+        Parse a streamed multistatus body.
+
+        Args:
+            chunks: Response body chunks
+            min_batch: Collect at least this many objects per yielded list
+
+        Yields:
+            Lists of completed calendar objects
+        """
+        stream = MultistatusStream()
+        batch: List[SyncObject] = []
+        async for chunk in chunks:
+            self._count_bytes(len(chunk))
+            batch.extend(stream.feed(chunk))
+            if batch and len(batch) >= min_batch:
+                yield batch
+                batch = []
+        batch.extend(stream.close())
+        if batch:
+            yield batch
+
+    async def _parse_in_pool(self, objects: List[SyncObject]) -> List[StoredObject]:
+        """
+        Parse calendar objects in the process pool.
+
+        Unchanged objects still come from the parse cache; objects the
+        workers hand back (recurring, unreadable) are parsed in-process.
+
+        Args:
+            objects: Objects with calendar data
+
+        Returns:
+            Parsed StoredObjects
+        """
+        cached: Dict[str, StoredObject] = {}
+        pending = []
+        for fetched in objects:
+            self._check_partial_data(fetched.data)
+            obj = self.parse_cache.get(fetched.href, fetched.etag, fetched.data)
+            if obj is not None:
+                cached[fetched.href] = obj
+            else:
+                pending.append(fetched)
+
+        started = time.perf_counter()
+        records = await self.parse_pool.parse([fetched.data for fetched in pending])
+        self._sync_parse_seconds += time.perf_counter() - started
+        self.metrics.objects_parsed_in_pool += sum(1 for record in records if record is not None)
+
+        parsed = {fetched.href: fields for fetched, fields in zip(pending, records)}
+        return await asyncio.to_thread(self._objects_from_records, objects, parsed, cached)
+
+    def _objects_from_records(
+        self,
+        objects: List[SyncObject],
+        parsed: Dict[str, Optional[List[VEventFields]]],
+        cached: Dict[str, StoredObject]
+    ) -> List[StoredObject]:
+        """
+        Build StoredObjects from worker results.
+
+        Args:
+            objects: Objects with calendar data
+            parsed: href -> VEventFields from the pool (None: parse in-process)
+            cached: href -> unchanged object from the parse cache
+
+        Returns:
+            StoredObjects (unparseable objects are skipped)
+        """
+        stored = []
+        for fetched in objects:
+            fields = parsed.get(fetched.href)
+            if fetched.href in cached:
+                obj = cached[fetched.href]
+            elif fields is None:
+                # Recurring or not readable by the worker
+                obj = self._build_stored_object(fetched.href, fetched.etag, fetched.data)
+            else:
+                obj = StoredObject(
+                    href=fetched.href,
+                    etag=fetched.etag,
+                    data=fetched.data,
+                    events=[event for event in map(self._meeting_event, fields) if event],
+                )
+                self.parse_cache.put(obj)
+            if obj:
+                stored.append(obj)
+        return stored
+
+    def _stored_events(
+        self,
+        objects: List[StoredObject],
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[MeetingEvent]:
+        """Get the events of parsed objects overlapping a date range."""
+        events = []
+        for obj in objects:
+            events.extend(self._object_events(obj, start_date, end_date))
+        return events
+
+    def _objects_events(
+        self,
+        objects: Iterable[SyncObject],
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[MeetingEvent]:
+        """
+        Parse fetched calendar objects and get their events within date range.
+
+        Args:
+            objects: Objects with calendar data
+            start_date: Start of date range
+            end_date: End of date range
+
+        Returns:
+            List of MeetingEvent objects (recurrences expanded)
+        """
+        events = []
+        for fetched in objects:
+            self._check_partial_data(fetched.data)
+            obj = self._build_stored_object(fetched.href, fetched.etag, fetched.data)
+            if obj:
+                events.extend(self._object_events(obj, start_date, end_date))
+        return events
+
+    def _calendar_query(self, calendar_url: str, start_date: datetime, end_date: datetime) -> bytes:
+        """
+        Send a calendar-query REPORT for a date range through the caldav session.
+
+        Retries without partial retrieval if the server rejects it.
+
+        Args:
+            calendar_url: Calendar collection URL
+            start_date: Start of date range
+            end_date: End of date range
+
+        Returns:
+            Multistatus response body
+
+        Raises:
+            CalDAVProtocolError: The REPORT failed
+        """
+        expand = self.expand_mode == "server"
+        while True:
+            partial = self._partial_active
+            self.metrics.requests += 1
+            with self.request_lock:
+                response = self.client.request(
+                    calendar_url,
+                    "REPORT",
+                    build_calendar_query(start_date, end_date, partial=partial, expand=expand),
+                    {"Depth": "1", "Content-Type": 'application/xml; charset="utf-8"'},
+                )
+            content = response.raw or b""
+            if isinstance(content, str):
+                content = content.encode("utf-8")
+            self._count_bytes(len(content))
+
+            if response.status == 207:
+                return content
+            if partial and response.status in _PARTIAL_REJECTED:
+                self._disable_partial(f"calendar-query rejected with HTTP {response.status}")
+                continue
+            raise CalDAVProtocolError(
+                f"calendar-query REPORT failed (HTTP {response.status})", response.status
+            )
+
+    @property
+    def _partial_active(self) -> bool:
+        """True if REPORTs should request partial calendar data."""
+        return self.partial_retrieval and self._partial_supported
+
+    def _disable_partial(self, reason: str):
+        """Stop requesting partial calendar data from this server."""
+        logger.info(f"Partial calendar-data retrieval disabled: {reason}")
+        self._partial_supported = False
+
+    def _check_partial_data(self, data: str):
+        """Disable partial retrieval if the server ignores the property selection."""
+        if self._partial_active and partial_data_ignored(data):
+            self._disable_partial("server ignores the property selection")
+
+    def _count_bytes(self, count: int):
+        """Account received response bytes."""
+        self._sync_bytes += count
+        self.metrics.bytes_received += count
+
+    def _begin_sync_accounting(self):
+        """Reset the per-sync byte and parse time counters."""
+        self._sync_bytes = 0
+        self._sync_parse_seconds = 0.0
+
+    def _end_sync_accounting(self):
+        """Publish the per-sync counters in the sync metrics."""
+        self.metrics.last_sync_bytes = self._sync_bytes
+        self.metrics.last_parse_ms = round(self._sync_parse_seconds * 1000, 1)
+        self.metrics.partial_retrieval = self._partial_active
+        self._update_cache_metrics()
+
+    async def sync_events(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[MeetingEvent]:
+        """
+        Incrementally sync the calendar and return events within date range.
+
+        Runs on the event loop: requests go through the (async) transport,
+        parsing and store writes run in worker threads.
+
+        A cheap PROPFIND of the calendar's getctag/sync-token comes first; if
+        neither changed since the last sync, no REPORT is sent at all.
+        Otherwise the WebDAV sync-collection REPORT (RFC 6578) lists only
+        the ETags of objects changed since the last sync token; objects whose
+        ETag differs from the stored one are then fetched in bulk with
+        chunked calendar-multiget REPORTs. Falls back to a full resync
+        when the server invalidates the token, and to a streamed full date
+        search when the server does not support sync-collection.
+
+        Args:
+            start_date: Start of date range (default: now)
+            end_date: End of date range (default: now + 24 hours)
+
+        Returns:
+            List of MeetingEvent objects
+        """
+        if self.sync_mode != "incremental" or not self._incremental_supported:
+            return await self._query_events(start_date, end_date)
+
+        if not CALDAV_AVAILABLE or not self.client or not self.transport:
+            logger.warning("CalDAV not available - returning empty event list")
+            return []
+
+        if start_date is None:
+            start_date = datetime.now()
+        if end_date is None:
+            end_date = start_date + timedelta(hours=24)
+
+        calendar = self.get_calendar()
+        if not calendar:
+            return []
+
+        started = time.perf_counter()
+        previously_synced = self.event_store.sync_token is not None
+        self._begin_sync_accounting()
+        self.metrics.syncs += 1
+        self.metrics.last_skipped = False
+
+        try:
+            calendar_url = str(calendar.url)
+            state = await self._fetch_collection_state(calendar_url)
+
+            if self._collection_unchanged(state):
+                self.metrics.syncs_skipped += 1
+                self.metrics.last_skipped = True
+                logger.info("Calendar unchanged since last sync - skipping fetch")
+            else:
+                try:
+                    await self._sync_collection(calendar_url)
+                except InvalidSyncTokenError as e:
+                    logger.warning(f"{e} - performing full resync")
+                    self.metrics.full_resyncs += 1
+                    await self._full_resync(calendar_url)
+
+                if state:
+                    self.event_store.ctag = state.ctag
+
+        except CalDAVProtocolError as e:
+            if not previously_synced:
+                logger.warning(
+                    f"Server does not support incremental sync ({e}), "
+                    f"falling back to full date search"
+                )
+                self._incremental_supported = False
+                return await self._query_events(start_date, end_date)
+            logger.error(f"Incremental sync failed, using cached events: {e}")
+
+        except asyncio.CancelledError:
+            logger.info("Calendar sync cancelled")
+            raise
+
+        except Exception as e:
+            logger.error(f"Incremental sync failed, using cached events: {e}")
+
+        finally:
+            await asyncio.to_thread(self.event_store.flush)
+            self.metrics.last_sync_ms = round((time.perf_counter() - started) * 1000, 1)
+
+        events = await asyncio.to_thread(self._events_in_window, start_date, end_date)
+        self._end_sync_accounting()
+        logger.info(f"Found {len(events)} meeting event(s)")
+        return events
+
+    def cached_events(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[MeetingEvent]:
+        """
+        Get events within date range from the local store, without a sync.
+
+        Args:
+            start_date: Start of date range (default: now)
+            end_date: End of date range (default: now + 24 hours)
+
+        Returns:
+            List of MeetingEvent objects
+        """
+        if start_date is None:
+            start_date = datetime.now()
+        if end_date is None:
+            end_date = start_date + timedelta(hours=24)
+        return self._events_in_window(start_date, end_date)
+
+    async def _fetch_collection_state(self, calendar_url: str) -> Optional[CollectionState]:
+        """
+        PROPFIND the calendar's getctag and sync-token.
+
+        Args:
+            calendar_url: Calendar collection URL
+
+        Returns:
+            CollectionState or None if the server did not answer usefully
+        """
+        self.metrics.requests += 1
+        try:
+            response = await self.transport.propfind(
+                calendar_url, build_propfind_collection_state()
+            )
+            self._count_bytes(len(response.content))
+            if response.status != 207:
+                logger.debug(f"Collection state PROPFIND returned HTTP {response.status}")
+                return None
+            return parse_collection_state(response.content)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug(f"Collection state PROPFIND failed: {e}")
+            return None
+
+    def _collection_unchanged(self, state: Optional[CollectionState]) -> bool:
+        """
+        Check whether the calendar is unchanged since the last sync.
+
+        Args:
+            state: Current collection state from the server
+
+        Returns:
+            True if the stored data is known to be current
+        """
+        store = self.event_store
+        if not state or store.sync_token is None:
+            return False
+
+        if state.sync_token:
+            return state.sync_token == store.sync_token
+        if state.ctag:
+            return state.ctag == store.ctag
+        return False
+
+    async def _full_resync(self, calendar_url: str):
+        """
+        Resync without a token, keeping stored objects whose ETag is unchanged.
+
+        Args:
+            calendar_url: Calendar collection URL
+        """
+        self.event_store.sync_token = None
+        self.event_store.ctag = None
+
+        reported = await self._sync_collection(calendar_url)
+        if reported is None:
+            return
+
+        # A tokenless sync lists every object: anything not listed is gone
+        for obj in self.event_store.objects():
+            if obj.href not in reported:
+                self.event_store.delete(obj.href)
+                self.metrics.objects_deleted += 1
+
+    async def _sync_collection(self, calendar_url: str, max_rounds: int = 20) -> Optional[set]:
+        """
+        Run sync-collection REPORTs until the server reports no more changes.
+
+        Args:
+            calendar_url: Calendar collection URL
+            max_rounds: Upper bound for truncated (507) responses
+
+        Returns:
+            Set of hrefs reported as present, or None if still truncated
+
+        Raises:
+            InvalidSyncTokenError: Stored sync token was rejected
+            CalDAVProtocolError: Server does not support sync-collection
+        """
+        reported = set()
+        for _ in range(max_rounds):
+            token = self.event_store.sync_token
+            self.metrics.requests += 1
+            response = await self.transport.report(
+                calendar_url, build_sync_collection(token, with_data=False)
+            )
+            self._count_bytes(len(response.content))
+            check_sync_error(response.status, response.content, had_token=token is not None)
+
+            result = parse_sync_collection(response.content, calendar_url)
+            await self._apply_sync_result(calendar_url, result)
+            reported.update(change.href for change in result.changed)
+
+            if not result.truncated:
+                return reported
+
+        logger.warning("Sync still truncated after maximum rounds - continuing next sync")
+        return None
+
+    async def _apply_sync_result(self, calendar_url: str, result: SyncCollectionResult):
+        """
+        Apply changed and deleted objects to the event store.
+
+        The sync token is only advanced after all changed objects were
+        fetched, so a failed multiget is retried on the next sync.
+
+        Args:
+            calendar_url: Calendar collection URL
+            result: Parsed sync-collection response
+        """
+        deleted = sum(1 for href in result.deleted if self.event_store.delete(href))
+
+        unchanged = 0
+        inline = []
+        to_fetch = []
+        for change in result.changed:
+            stored = self.event_store.get(change.href)
+            if stored and change.etag and stored.etag == change.etag:
+                # Reported (e.g. after a token reset) but identical to our copy
+                unchanged += 1
+            elif change.data is None:
+                to_fetch.append(change.href)
+            else:
+                inline.append(change)
+
+        updated = await asyncio.to_thread(self._store_objects, inline) if inline else 0
+        if to_fetch:
+            updated += await self._multiget(calendar_url, to_fetch)
+
+        if result.sync_token:
+            self.event_store.sync_token = result.sync_token
+
+        self.metrics.objects_changed += updated
+        self.metrics.objects_unchanged += unchanged
+        self.metrics.objects_deleted += deleted
+
+        logger.info(
+            f"Incremental sync: {updated} changed, {unchanged} unchanged, "
+            f"{deleted} deleted, {len(self.event_store)} object(s) stored"
+        )
+
+    async def _multiget(self, calendar_url: str, hrefs: List[str]) -> int:
+        """
+        Fetch calendar objects in chunked calendar-multiget REPORTs.
+
+        Responses are parsed as a stream straight into the event store.
+
+        Args:
+            calendar_url: Calendar collection URL
+            hrefs: Normalized hrefs to fetch
+
+        Returns:
+            Number of objects stored
+
+        Raises:
+            CalDAVProtocolError: A multiget REPORT failed
+        """
+        use_pool = self.parse_pool is not None and self.parse_pool.use_for(len(hrefs))
+        stored = 0
+        for offset in range(0, len(hrefs), self.multiget_batch_size):
+            batch = hrefs[offset:offset + self.multiget_batch_size]
+            stored += await self._multiget_batch(calendar_url, batch, use_pool)
+
+        self.metrics.objects_fetched += stored
+        logger.debug(
+            f"Fetched {stored} of {len(hrefs)} changed object(s) "
+            f"in {-(-len(hrefs) // self.multiget_batch_size)} multiget request(s)"
+        )
+        return stored
+
+    async def _multiget_batch(self, calendar_url: str, hrefs: List[str], use_pool: bool = False) -> int:
+        """
+        Fetch one batch, without partial retrieval if the server rejects it.
+
+        Objects are stored while the response is still arriving.
+
+        Args:
+            calendar_url: Calendar collection URL
+            hrefs: Normalized hrefs of this batch
+            use_pool: Parse in the process pool (bulk fetch)
+
+        Returns:
+            Number of objects stored
+
+        Raises:
+            CalDAVProtocolError: The REPORT failed
+        """
+        while True:
+            partial = self._partial_active
+            self.metrics.requests += 1
+            self.metrics.multiget_requests += 1
+            body = build_calendar_multiget(hrefs, partial=partial)
+            async with self.transport.stream_report(calendar_url, body) as response:
+                if partial and response.status in _PARTIAL_REJECTED:
+                    self._disable_partial(f"calendar-multiget rejected with HTTP {response.status}")
+                    continue
+                if response.status != 207:
+                    raise CalDAVProtocolError(
+                        f"calendar-multiget REPORT failed (HTTP {response.status})",
+                        response.status,
                     )
 
-                    logger.debug(f"Parsed event: {meeting_event}")
-                    return meeting_event
+                stored = 0
+                min_batch = self.parse_pool.batch_size if use_pool else 1
+                async for objects in self._stream_objects(response.chunks, min_batch):
+                    if use_pool:
+                        parsed = await self._parse_in_pool(objects)
+                        stored += await asyncio.to_thread(self._put_objects, parsed)
+                    else:
+                        stored += await asyncio.to_thread(self._store_objects, objects)
+                return stored
+
+    def _store_objects(self, objects: Iterable[SyncObject]) -> int:
+        """
+        Parse calendar objects and put them into the event store.
+
+        Args:
+            objects: Objects with calendar data
+
+        Returns:
+            Number of objects stored
+        """
+        stored = 0
+        for fetched in objects:
+            self._check_partial_data(fetched.data)
+            obj = self._build_stored_object(fetched.href, fetched.etag, fetched.data)
+            if obj:
+                self.event_store.put(obj)
+                stored += 1
+        return stored
+
+    def _put_objects(self, objects: List[StoredObject]) -> int:
+        """
+        Put parsed objects into the event store.
+
+        Args:
+            objects: Parsed objects
+
+        Returns:
+            Number of objects stored
+        """
+        for obj in objects:
+            self.event_store.put(obj)
+        return len(objects)
+
+    def _build_stored_object(
+        self,
+        href: str,
+        etag: Optional[str],
+        data: str
+    ) -> Optional[StoredObject]:
+        """
+        Parse calendar data into a StoredObject.
+
+        Unchanged objects (same href, ETag and data) are served from the
+        parse cache without touching the iCalendar text. Single events go
+        through the streaming tokenizer; recurring objects (and anything the
+        tokenizer cannot read) are parsed into an icalendar tree, which local
+        recurrence expansion needs.
+
+        Args:
+            href: Normalized href
+            etag: Object ETag
+            data: iCalendar text
+
+        Returns:
+            StoredObject or None if parsing fails
+        """
+        cached = self.parse_cache.get(href, etag, data)
+        if cached is not None:
+            return cached
+
+        started = time.perf_counter()
+        try:
+            fields = list(iter_vevents(data))
+        except UnsupportedICalendar:
+            fields = None
+
+        if fields is not None:
+            obj = StoredObject(
+                href=href,
+                etag=etag,
+                data=data,
+                events=[event for event in map(self._meeting_event, fields) if event],
+            )
+            self._sync_parse_seconds += time.perf_counter() - started
+            self.parse_cache.put(obj)
+            return obj
 
+        try:
+            ical = Calendar.from_ical(data)
+        except Exception as e:
+            logger.error(f"Failed to parse calendar object {href}: {e}")
             return None
 
+        events = []
+        recurring = False
+        for component in ical.walk("VEVENT"):
+            if component.get("rrule") or component.get("rdate"):
+                recurring = True
+            meeting_event = self._parse_vevent(component)
+            if meeting_event:
+                events.append(meeting_event)
+
+        obj = StoredObject(
+            href=href,
+            etag=etag,
+            data=data,
+            events=events,
+            calendar=ical if recurring else None,
+        )
+        self._sync_parse_seconds += time.perf_counter() - started
+        self.parse_cache.put(obj)
+        return obj
+
+    def _events_in_window(self, start_date: datetime, end_date: datetime) -> List[MeetingEvent]:
+        """
+        Get stored events overlapping a date range, expanding recurrences.
+
+        Args:
+            start_date: Start of date range
+            end_date: End of date range
+
+        Returns:
+            List of MeetingEvent objects
+        """
+        events = []
+        for obj in self.event_store.objects():
+            events.extend(self._object_events(obj, start_date, end_date))
+        self._update_cache_metrics()
+        return events
+
+    def _update_cache_metrics(self):
+        """Copy the parse and recurrence cache counters into the sync metrics."""
+        self.metrics.expansion_cache_hits = self.expander.hits
+        self.metrics.expansion_cache_misses = self.expander.misses
+        self.metrics.parse_cache_hits = self.parse_cache.hits
+        self.metrics.parse_cache_misses = self.parse_cache.misses
+
+    def _object_events(
+        self,
+        obj: StoredObject,
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[MeetingEvent]:
+        """
+        Get the events of one calendar object overlapping a date range.
+
+        Args:
+            obj: Stored calendar object
+            start_date: Start of date range
+            end_date: End of date range
+
+        Returns:
+            List of MeetingEvent objects (recurrences expanded)
+        """
+        if obj.is_recurring:
+            return self.expander.expand(obj, start_date, end_date)
+
+        window_start = start_date.timestamp()
+        window_end = end_date.timestamp()
+        return [
+            event for event in obj.events
+            if event.start_ts < window_end and event.end_ts > window_start
+        ]
+
+    def _parse_vevent(self, component: Event) -> Optional[MeetingEvent]:
+        """
+        Parse a VEVENT component into a MeetingEvent object.
+
+        Args:
+            component: iCalendar VEVENT component
+
+        Returns:
+            MeetingEvent object or None if parsing fails
+        """
+        try:
+            fields = vevent_fields(component)
         except Exception as e:
             logger.error(f"Failed to parse event: {e}")
             return None
 
-    def _extract_bbb_info(self, description: str, location: str) -> tuple[Optional[str], Optional[str]]:
+        return self._meeting_event(fields)
+
+    def _meeting_event(self, fields: VEventFields) -> Optional[MeetingEvent]:
         """
-        Extract BigBlueButton URL and password from event description or location.
+        Build a MeetingEvent from the VEVENT properties.
+
+        Shared by the icalendar parser and the streaming tokenizer.
 
         Args:
-            description: Event description text
-            location: Event location text
+            fields: Property values of one VEVENT
 
         Returns:
-            Tuple of (bbb_url, bbb_password)
+            MeetingEvent object or None if parsing fails
         """
-        bbb_url = None
-        bbb_password = None
+        try:
+            if fields.dtstart is None or fields.dtend is None:
+                logger.warning(f"Event {fields.summary} missing start/end time")
+                return None
+
+            start_time = fields.dtstart
+            end_time = fields.dtend
+
+            # Ensure datetime objects (not just date)
+            if not isinstance(start_time, datetime):
+                start_time = datetime.combine(start_time, datetime.min.time())
+            if not isinstance(end_time, datetime):
+                end_time = datetime.combine(end_time, datetime.max.time())
+
+            # Expanded or overridden instance of a recurring event
+            recurrence_id = None
+            if fields.recurrence_id is not None:
+                recurrence_id = fields.recurrence_id.isoformat()
+
+            # Extract organizer email from mailto: URI
+            organizer = None
+            if fields.organizer and 'mailto:' in fields.organizer.lower():
+                organizer = fields.organizer.lower().replace('mailto:', '').strip()
+
+            # Extract attendees
+            attendees = []
+            for attendee in fields.attendees:
+                if 'mailto:' in attendee.lower():
+                    attendees.append(attendee.lower().replace('mailto:', '').strip())
+
+            # Extract BBB URL and password
+            bbb_url, bbb_password = self._extract_bbb_info(fields.description, fields.location)
+
+            meeting_event = MeetingEvent(
+                uid=fields.uid,
+                summary=fields.summary,
+                description=fields.description,
+                start_time=start_time,
+                end_time=end_time,
+                location=fields.location,
+                bbb_url=bbb_url,
+                bbb_password=bbb_password,
+                organizer=organizer,
+                attendees=attendees,
+                recurrence_id=recurrence_id
+            )
 
-        # Combine description and location for searching
-        search_text = f"{description}\n{location}"
+            logger.debug(f"Parsed event: {meeting_event}")
+            return meeting_event
 
-        # BBB URL patterns
-        url_patterns = [
-            r'https?://[^\s]+/b/[a-z0-9-]+',  # Standard BBB room URL
-            r'https?://[^\s]+/bigbluebutton/[^\s]+',  # Direct BBB URL
-            r'https?://bbb\.[^\s]+',  # BBB subdomain
-        ]
+        except Exception as e:
+            logger.error(f"Failed to parse event: {e}")
+            return None
 
-        for pattern in url_patterns:
-            match = re.search(pattern, search_text, re.IGNORECASE)
-            if match:
-                bbb_url = match.group(0).strip('.,;:)')
-                logger.debug(f"Found BBB URL: {bbb_url}")
-                break
-
-        # Password patterns
-        password_patterns = [
-            r'(?:password|passwort|kennwort|code)[\s:]+([a-zA-Z0-9_-]+)',
-            r'(?:pin|access code)[\s:]+([0-9]+)',
-        ]
+    def _extract_bbb_info(self, description: str, location: str) -> tuple[Optional[str], Optional[str]]:
+        """
+        Extract BigBlueButton URL and password from event description or location.
 
-        for pattern in password_patterns:
-            match = re.search(pattern, search_text, re.IGNORECASE)
-            if match:
-                bbb_password = match.group(1).strip()
-                logger.debug(f"Found BBB password: {'*' * len(bbb_password)}")
-                break
+        Args:
+            description: Event description text
+            location: Event location text
 
-        return bbb_url, bbb_password
+        Returns:
+            Tuple of (bbb_url, bbb_password) - the highest ranked link
+        """
+        info = extract_meeting_links(description, location)
+        best = info.best
+        if best:
+            logger.debug(f"Found BBB URL ({best.provider}): {best.url}")
+        if info.access_code:
+            logger.debug(f"Found BBB password: {'*' * len(info.access_code)}")
+        return (best.url if best else None), info.access_code
 
     def get_current_meetings(self) -> List[MeetingEvent]:
         """
@@ -358,26 +1390,27 @@ class CalDAVClient:
             List of upcoming MeetingEvent objects
         """
         events = self.fetch_events()
-        now = datetime.now()
-        upcoming = []
-
-        for event in events:
-            # Make sure event start time is timezone-aware for comparison
-            event_start = event.start_time
-            if event_start.tzinfo is None:
-                event_start = event_start.replace(tzinfo=now.tzinfo)
-
-            threshold = now + timedelta(minutes=minutes)
-            if now <= event_start <= threshold:
-                upcoming.append(event)
-
-        return upcoming
+        now = time.time()
+        threshold = now + minutes * 60
+        return [event for event in events if now <= event.start_ts <= threshold]
+
+    async def close_transport(self):
+        """Close the sync transport and its pooled connections."""
+        transport = self.transport
+        self.transport = None
+        # A pooled transport is shared with other clients; the pool closes it
+        if transport and not self.pool:
+            try:
+                await transport.close()
+            except Exception as e:
+                logger.debug(f"Error closing CalDAV transport: {e}")
 
     def disconnect(self):
         """Disconnect from CalDAV server and cleanup resources."""
         self.client = None
         self.principal = None
         self.calendars = []
+        self.transport = None
         logger.info("Disconnected from CalDAV server")
 
 
@@ -403,6 +1436,14 @@ class MockCalDAVClient(CalDAVClient):
         logger.info(f"Mock CalDAV: Returning {len(self._mock_events)} mock events")
         return self._mock_events
 
+    async def sync_events(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[MeetingEvent]:
+        """Return mock events (no incremental sync in mock mode)."""
+        return self.fetch_events(start_date, end_date)
+
     def add_mock_event(self, event: MeetingEvent):
         """Add a mock event for testing."""
         self._mock_events.append(event)
@@ -419,7 +1460,16 @@ def create_caldav_client(
     username: str,
     password: str,
     calendar_name: Optional[str] = None,
-    use_mock: bool = False
+    use_mock: bool = False,
+    pool: Optional[CalDAVConnectionPool] = None,
+    sync_mode: str = "incremental",
+    multiget_batch_size: int = 100,
+    event_store: Optional[EventStore] = None,
+    transport_mode: str = "httpx",
+    timeout: float = 30.0,
+    expand_mode: str = "local",
+    partial_retrieval: bool = True,
+    parse_pool: Optional[CalendarParsePool] = None
 ) -> CalDAVClient:
     """
     Factory function to create CalDAV client.
@@ -430,6 +1480,15 @@ def create_caldav_client(
         password: CalDAV password
         calendar_name: Specific calendar to use (optional)
         use_mock: Use mock client for testing
+        pool: Shared connection pool (optional)
+        sync_mode: "incremental" or "full"
+        multiget_batch_size: Maximum hrefs per calendar-multiget REPORT
+        event_store: Store for synced objects (optional)
+        transport_mode: "httpx" or "caldav"
+        timeout: Request timeout in seconds
+        expand_mode: "local" or "server" recurrence expansion
+        partial_retrieval: Only request the VEVENT properties that are used
+        parse_pool: Process pool for bulk parsing (optional)
 
     Returns:
         CalDAVClient or MockCalDAVClient instance
@@ -437,4 +1496,8 @@ def create_caldav_client(
     if use_mock or not CALDAV_AVAILABLE:
         return MockCalDAVClient(url, username, password, calendar_name)
     else:
-        return CalDAVClient(url, username, password, calendar_name)
+        return CalDAVClient(
+            url, username, password, calendar_name, pool, sync_mode,
+            multiget_batch_size, event_store, transport_mode, timeout, expand_mode,
+            partial_retrieval, parse_pool
+        )
@@ -0,0 +1,150 @@
+"""
+Time-ordered meeting index for RaspberryMeet.
+
+MeetingIndex keeps the tracked meetings sorted by start time in compact
+arrays of UTC epoch seconds next to the event objects. The next meeting,
+the meetings running at a moment and the meetings overlapping a window are
+found by binary search instead of sorting or scanning all meetings on each
+call. It is updated one meeting at a time from the calendar diff.
+"""
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Iterator, List, Optional
+
+from src.orchestrator.calendar_diff import EventKey, event_key
+from src.orchestrator.calendar_sync import MeetingEvent
+
+
+class MeetingIndex:
+    """Meetings sorted by start time, addressable by event key."""
+
+    def __init__(self):
+        """Initialize empty index."""
+        self._starts = array("q")  # start_ts, ascending
+        self._ends = array("q")  # end_ts of the same position
+        self._events: List[MeetingEvent] = []
+        self._by_key: Dict[EventKey, MeetingEvent] = {}
+        # Durations of the indexed meetings, ascending: the longest one
+        # bounds the search for running meetings
+        self._durations = array("q")
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __contains__(self, key: EventKey) -> bool:
+        return key in self._by_key
+
+    def __iter__(self) -> Iterator[MeetingEvent]:
+        """Meetings in start order."""
+        return iter(self._events)
+
+    def get(self, key: EventKey) -> Optional[MeetingEvent]:
+        """
+        Get a meeting by key.
+
+        Args:
+            key: Event key (UID, RECURRENCE-ID)
+
+        Returns:
+            MeetingEvent or None
+        """
+        return self._by_key.get(key)
+
+    def add(self, event: MeetingEvent):
+        """
+        Add a meeting or replace the meeting with the same key.
+
+        Args:
+            event: Meeting event
+        """
+        key = event_key(event)
+        if key in self._by_key:
+            self._remove_event(self._by_key[key])
+        position = bisect_right(self._starts, event.start_ts)
+        self._starts.insert(position, event.start_ts)
+        self._ends.insert(position, event.end_ts)
+        self._events.insert(position, event)
+        self._by_key[key] = event
+        insort(self._durations, event.end_ts - event.start_ts)
+
+    def remove(self, key: EventKey) -> Optional[MeetingEvent]:
+        """
+        Remove a meeting.
+
+        Args:
+            key: Event key
+
+        Returns:
+            The removed meeting, or None if it was not indexed
+        """
+        event = self._by_key.pop(key, None)
+        if event is not None:
+            self._remove_event(event)
+        return event
+
+    def _remove_event(self, event: MeetingEvent):
+        """Delete an event from the sorted arrays."""
+        position = bisect_left(self._starts, event.start_ts)
+        while self._events[position] is not event:
+            position += 1
+        del self._starts[position]
+        del self._ends[position]
+        del self._events[position]
+        del self._durations[bisect_left(self._durations, event.end_ts - event.start_ts)]
+
+    def clear(self):
+        """Remove all meetings."""
+        self._starts = array("q")
+        self._ends = array("q")
+        self._events = []
+        self._by_key = {}
+        self._durations = array("q")
+
+    def next_after(self, timestamp: float) -> Optional[MeetingEvent]:
+        """
+        Get the first meeting starting after a moment.
+
+        Args:
+            timestamp: Epoch seconds
+
+        Returns:
+            MeetingEvent or None
+        """
+        position = bisect_right(self._starts, timestamp)
+        return self._events[position] if position < len(self._events) else None
+
+    def active_at(self, timestamp: float) -> List[MeetingEvent]:
+        """
+        Get the meetings running at a moment.
+
+        Args:
+            timestamp: Epoch seconds
+
+        Returns:
+            Meetings with start <= timestamp <= end, in start order
+        """
+        return self._overlapping(timestamp, timestamp, inclusive=True)
+
+    def window(self, start: float, end: float) -> List[MeetingEvent]:
+        """
+        Get the meetings overlapping a time range.
+
+        Args:
+            start: Range start, epoch seconds
+            end: Range end, epoch seconds (exclusive)
+
+        Returns:
+            Meetings with start < end and end > start, in start order
+        """
+        return self._overlapping(start, end, inclusive=False)
+
+    def _overlapping(self, start: float, end: float, inclusive: bool) -> List[MeetingEvent]:
+        """Binary search the candidates, then check their end times."""
+        max_duration = self._durations[-1] if self._durations else 0
+        first = bisect_left(self._starts, start - max_duration)
+        ends, events = self._ends, self._events
+        if inclusive:
+            last = bisect_right(self._starts, end)
+            return [events[i] for i in range(first, last) if ends[i] >= start]
+        last = bisect_left(self._starts, end)
+        return [events[i] for i in range(first, last) if ends[i] > start]
@@ -0,0 +1,428 @@
+"""
+Local store of synced calendar objects.
+
+Holds the calendar objects of one CalDAV collection keyed by href, together
+with their ETags and the collection's sync token, so that each sync only has
+to apply what changed on the server. SQLiteEventStore additionally persists
+everything, so the scheduler knows its meetings right after a reboot.
+"""
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+try:
+    from icalendar import Calendar
+    ICALENDAR_AVAILABLE = True
+except ImportError:
+    ICALENDAR_AVAILABLE = False
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class StoredObject:
+    """A calendar object (one .ics resource) as last seen on the server."""
+
+    href: str
+    etag: Optional[str]
+    data: str
+    # Parsed, unexpanded events (master and overridden instances)
+    events: List[Any] = field(default_factory=list)
+    # Parsed iCalendar, only kept for recurring objects (needed for expansion)
+    calendar: Any = None
+
+    @property
+    def is_recurring(self) -> bool:
+        """True if the object needs expansion into occurrences."""
+        return self.calendar is not None
+
+
+class ParsedObjectCache:
+    """
+    Bounded LRU of parsed calendar objects keyed by href and ETag.
+
+    Lets a sync reuse the StoredObject (parsed events, BBB links, iCalendar
+    for recurring objects) of an unchanged resource instead of parsing the
+    iCalendar text again.
+    """
+
+    def __init__(self, max_entries: int = 2048):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum number of cached objects
+        """
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[tuple, StoredObject]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, href: str, etag: Optional[str], data: str) -> Optional[StoredObject]:
+        """
+        Get the parsed object for unchanged calendar data.
+
+        Args:
+            href: Normalized href
+            etag: Object ETag
+            data: iCalendar text (guards against weak or missing ETags)
+
+        Returns:
+            Cached StoredObject, or None on a miss
+        """
+        key = (href, etag)
+        with self._lock:
+            obj = self._entries.get(key)
+            if obj is None or obj.data != data:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return obj
+
+    def put(self, obj: StoredObject):
+        """Cache a parsed object, evicting the least recently used ones."""
+        with self._lock:
+            self._entries[(obj.href, obj.etag)] = obj
+            self._entries.move_to_end((obj.href, obj.etag))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached objects."""
+        with self._lock:
+            self._entries.clear()
+
+
+class EventStore:
+    """In-memory store of calendar objects for one collection."""
+
+    def __init__(self):
+        self.sync_token: Optional[str] = None
+        # Collection CTag seen at the last successful sync
+        self.ctag: Optional[str] = None
+        self._objects: Dict[str, StoredObject] = {}
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def __contains__(self, href: str) -> bool:
+        return href in self._objects
+
+    def get(self, href: str) -> Optional[StoredObject]:
+        """
+        Get a stored object.
+
+        Args:
+            href: Normalized href
+
+        Returns:
+            StoredObject or None if unknown
+        """
+        return self._objects.get(href)
+
+    def put(self, obj: StoredObject):
+        """Insert or replace an object."""
+        self._objects[obj.href] = obj
+
+    def delete(self, href: str) -> bool:
+        """
+        Remove an object.
+
+        Args:
+            href: Normalized href
+
+        Returns:
+            True if the object was stored
+        """
+        return self._objects.pop(href, None) is not None
+
+    def objects(self) -> Iterator[StoredObject]:
+        """Iterate over all stored objects."""
+        return iter(list(self._objects.values()))
+
+    def clear(self):
+        """Drop all objects and the sync token (forces a full resync)."""
+        self._objects.clear()
+        self.sync_token = None
+        self.ctag = None
+        logger.debug("Event store cleared")
+
+    def flush(self):
+        """Persist pending changes (no-op for the in-memory store)."""
+
+    def compact(self, retention_days: int = 7) -> int:
+        """
+        Drop objects whose events all ended long ago.
+
+        Args:
+            retention_days: Keep objects that ended within this many days
+
+        Returns:
+            Number of objects removed
+        """
+        return 0
+
+    def close(self):
+        """Release resources."""
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    href TEXT PRIMARY KEY,
+    etag TEXT,
+    data TEXT NOT NULL,
+    recurring INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS events (
+    href TEXT NOT NULL,
+    uid TEXT NOT NULL,
+    recurrence_id TEXT,
+    summary TEXT,
+    description TEXT,
+    location TEXT,
+    start_time TEXT NOT NULL,
+    end_time TEXT NOT NULL,
+    start_ts REAL NOT NULL,
+    end_ts REAL NOT NULL,
+    bbb_url TEXT,
+    bbb_password TEXT,
+    organizer TEXT,
+    attendees TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_events_start ON events (start_ts);
+CREATE INDEX IF NOT EXISTS idx_events_href ON events (href);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class SQLiteEventStore(EventStore):
+    """
+    Event store persisted in SQLite.
+
+    The in-memory view is loaded once on startup and stays authoritative;
+    changes are collected and written in one transaction per sync (flush),
+    in WAL mode with relaxed fsync, to keep SD card writes small.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialize and load the persistent store.
+
+        Args:
+            path: SQLite database file
+        """
+        super().__init__()
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._dirty: Dict[str, StoredObject] = {}
+        self._deleted: Set[str] = set()
+        self._cleared = False
+        self._persisted_meta: Dict[str, Optional[str]] = {}
+
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        # auto_vacuum must be set before the first table is created
+        self._db.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute("PRAGMA synchronous = NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._db.commit()
+
+        self._load()
+
+    def _load(self):
+        """Load objects, events and sync state from the database."""
+        # Imported here: calendar_sync imports this module
+        from src.orchestrator.calendar_sync import MeetingEvent
+
+        started = time.perf_counter()
+
+        events_by_href: Dict[str, List[Any]] = {}
+        for row in self._db.execute(
+            "SELECT href, uid, recurrence_id, summary, description, location, "
+            "start_time, end_time, bbb_url, bbb_password, organizer, attendees "
+            "FROM events ORDER BY start_ts"
+        ):
+            events_by_href.setdefault(row[0], []).append(MeetingEvent(
+                uid=row[1],
+                recurrence_id=row[2],
+                summary=row[3],
+                description=row[4],
+                location=row[5],
+                start_time=datetime.fromisoformat(row[6]),
+                end_time=datetime.fromisoformat(row[7]),
+                bbb_url=row[8],
+                bbb_password=row[9],
+                organizer=row[10],
+                attendees=json.loads(row[11]) if row[11] else [],
+            ))
+
+        for href, etag, data, recurring in self._db.execute(
+            "SELECT href, etag, data, recurring FROM objects"
+        ):
+            calendar = None
+            if recurring:
+                if not ICALENDAR_AVAILABLE:
+                    continue
+                try:
+                    calendar = Calendar.from_ical(data)
+                except Exception as e:
+                    logger.error(f"Dropping unreadable stored object {href}: {e}")
+                    continue
+            self._objects[href] = StoredObject(
+                href=href,
+                etag=etag,
+                data=data,
+                events=events_by_href.get(href, []),
+                calendar=calendar,
+            )
+
+        meta = dict(self._db.execute("SELECT key, value FROM meta"))
+        self.sync_token = meta.get("sync_token")
+        self.ctag = meta.get("ctag")
+        self._persisted_meta = {"sync_token": self.sync_token, "ctag": self.ctag}
+
+        logger.info(
+            f"Loaded {len(self._objects)} calendar object(s) from {self.path} "
+            f"in {(time.perf_counter() - started) * 1000:.0f}ms"
+        )
+
+    def put(self, obj: StoredObject):
+        """Insert or replace an object (persisted on the next flush)."""
+        with self._lock:
+            super().put(obj)
+            self._dirty[obj.href] = obj
+            self._deleted.discard(obj.href)
+
+    def delete(self, href: str) -> bool:
+        """Remove an object (persisted on the next flush)."""
+        with self._lock:
+            self._dirty.pop(href, None)
+            existed = super().delete(href)
+            if existed:
+                self._deleted.add(href)
+            return existed
+
+    def clear(self):
+        """Drop all objects and the sync state (persisted on the next flush)."""
+        with self._lock:
+            super().clear()
+            self._dirty.clear()
+            self._deleted.clear()
+            self._cleared = True
+
+    def flush(self):
+        """Write all pending changes in a single transaction."""
+        with self._lock:
+            meta = {"sync_token": self.sync_token, "ctag": self.ctag}
+            if (not self._dirty and not self._deleted and not self._cleared
+                    and meta == self._persisted_meta):
+                return
+
+            dirty = list(self._dirty.values())
+            hrefs = [(href,) for href in list(self._deleted) + [obj.href for obj in dirty]]
+
+            event_rows = [
+                (
+                    obj.href, event.uid, event.recurrence_id, event.summary,
+                    event.description, event.location,
+                    event.start_time.isoformat(), event.end_time.isoformat(),
+                    event.start_ts, event.end_ts,
+                    event.bbb_url, event.bbb_password, event.organizer,
+                    json.dumps(event.attendees) if event.attendees else None,
+                )
+                for obj in dirty
+                for event in obj.events
+            ]
+
+            try:
+                with self._db:
+                    if self._cleared:
+                        self._db.execute("DELETE FROM events")
+                        self._db.execute("DELETE FROM objects")
+                    self._db.executemany("DELETE FROM events WHERE href = ?", hrefs)
+                    self._db.executemany("DELETE FROM objects WHERE href = ?", hrefs)
+                    self._db.executemany(
+                        "INSERT INTO objects (href, etag, data, recurring) VALUES (?, ?, ?, ?)",
+                        [(obj.href, obj.etag, obj.data, int(obj.is_recurring)) for obj in dirty],
+                    )
+                    self._db.executemany(
+                        "INSERT INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        event_rows,
+                    )
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                        list(meta.items()),
+                    )
+            except sqlite3.Error as e:
+                logger.error(f"Failed to persist event store: {e}")
+                return
+
+            logger.debug(
+                f"Event store flushed: {len(dirty)} written, {len(self._deleted)} deleted"
+            )
+            self._dirty.clear()
+            self._deleted.clear()
+            self._cleared = False
+            self._persisted_meta = meta
+
+    def compact(self, retention_days: int = 7) -> int:
+        """
+        Drop non-recurring objects that ended long ago and reclaim space.
+
+        Args:
+            retention_days: Keep objects that ended within this many days
+
+        Returns:
+            Number of objects removed
+        """
+        cutoff = time.time() - retention_days * 86400
+        removed = 0
+
+        with self._lock:
+            for obj in list(self._objects.values()):
+                if obj.is_recurring or not obj.events:
+                    continue
+                if max(event.end_ts for event in obj.events) < cutoff:
+                    del self._objects[obj.href]
+                    self._dirty.pop(obj.href, None)
+                    self._deleted.add(obj.href)
+                    removed += 1
+
+        self.flush()
+
+        with self._lock:
+            try:
+                self._db.execute("PRAGMA incremental_vacuum")
+                self._db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error as e:
+                logger.warning(f"Event store compaction failed: {e}")
+
+        if removed:
+            logger.info(f"Event store compacted: {removed} past object(s) removed")
+        return removed
+
+    def close(self):
+        """Flush pending changes and close the database."""
+        self.flush()
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,289 @@
+"""
+Fleet calendar proxy client for RaspberryMeet.
+
+In larger installations a central calendar proxy (src/proxy) syncs the
+CalDAV server once for all devices and serves each room a compact JSON
+schedule. FleetProxyClient fetches that schedule with conditional GETs;
+the scheduler falls back to direct CalDAV sync whenever the proxy cannot
+be reached, and returns to the proxy once it answers again.
+
+The schedule format is shared with the proxy: see event_to_dict and
+event_from_dict.
+"""
+import json
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import quote
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+from src.orchestrator.calendar_push import TOKEN_HEADER
+from src.orchestrator.calendar_sync import MeetingEvent
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def schedule_path(room: str) -> str:
+    """URL path of a room's schedule on the proxy."""
+    return f"/rooms/{quote(room, safe='')}/schedule"
+
+
+def changes_path(room: str) -> str:
+    """URL path of a room's long-poll change endpoint on the proxy."""
+    return f"/rooms/{quote(room, safe='')}/changes"
+
+
+def event_to_dict(event: MeetingEvent) -> Dict[str, Any]:
+    """
+    Encode an event for the schedule (without description and attendees).
+
+    Args:
+        event: Meeting event
+
+    Returns:
+        JSON-serializable dictionary; empty fields are left out
+    """
+    data = {
+        "uid": event.uid,
+        "summary": event.summary,
+        "start": event.start_time.isoformat(),
+        "end": event.end_time.isoformat(),
+        "location": event.location,
+        "url": event.bbb_url,
+        "password": event.bbb_password,
+        "organizer": event.organizer,
+        "rid": event.recurrence_id,
+    }
+    return {key: value for key, value in data.items() if value}
+
+
+def event_from_dict(data: Dict[str, Any]) -> MeetingEvent:
+    """
+    Decode an event of the schedule.
+
+    Args:
+        data: Dictionary from event_to_dict
+
+    Returns:
+        MeetingEvent object
+    """
+    return MeetingEvent(
+        uid=data.get("uid", ""),
+        summary=data.get("summary", ""),
+        description="",
+        start_time=datetime.fromisoformat(data["start"]),
+        end_time=datetime.fromisoformat(data["end"]),
+        location=data.get("location", ""),
+        bbb_url=data.get("url"),
+        bbb_password=data.get("password"),
+        organizer=data.get("organizer"),
+        recurrence_id=data.get("rid"),
+    )
+
+
+class FleetProxyClient:
+    """Fetches a room's schedule from the fleet calendar proxy."""
+
+    def __init__(
+        self,
+        url: str,
+        room: str,
+        token: Optional[str] = None,
+        timeout: float = 10.0,
+        retry_seconds: float = 60.0,
+        cache_path: Optional[Path] = None
+    ):
+        """
+        Initialize proxy client.
+
+        Args:
+            url: Base URL of the proxy (e.g. http://calendar-proxy:8768)
+            room: Room name configured on the proxy
+            token: Sent as X-Notify-Token header
+            timeout: Request timeout in seconds
+            retry_seconds: After a failure, use direct CalDAV for this long
+                before asking the proxy again
+            cache_path: File keeping the last schedule for a warm start (optional)
+        """
+        if not HTTPX_AVAILABLE:
+            raise RuntimeError("httpx is not installed")
+
+        self.url = url.rstrip("/")
+        self.room = room
+        self.retry_seconds = retry_seconds
+        self.cache_path = cache_path
+        headers = {"Accept-Encoding": "gzip"}
+        if token:
+            headers[TOKEN_HEADER] = token
+        self._client = httpx.AsyncClient(
+            headers=headers,
+            timeout=httpx.Timeout(timeout, connect=min(timeout, 5.0)),
+        )
+        self._etag: Optional[str] = None
+        self._events: List[MeetingEvent] = []
+        self._retry_at = 0.0
+        # False if the last fetch got 304 Not Modified
+        self.last_changed = True
+
+        # Statistics
+        self.healthy = False
+        self.requests = 0
+        self.not_modified = 0
+        self.failures = 0
+        self.fallbacks = 0
+        self.bytes_received = 0
+        self.last_error: Optional[str] = None
+        self.last_fetch: Optional[datetime] = None
+
+    @property
+    def schedule_url(self) -> str:
+        """URL of the room's schedule."""
+        return self.url + schedule_path(self.room)
+
+    @property
+    def changes_url(self) -> str:
+        """Long-poll URL signalling changes of the room's schedule."""
+        return self.url + changes_path(self.room)
+
+    def load_cached(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[MeetingEvent]:
+        """
+        Load the last saved schedule (no network).
+
+        Args:
+            start_date: Start of date range (default: now)
+            end_date: End of date range (default: now + 24 hours)
+
+        Returns:
+            List of MeetingEvent objects (empty without a saved schedule)
+        """
+        if not self.cache_path or not self.cache_path.exists():
+            return []
+        try:
+            body = self.cache_path.read_bytes()
+            self._events = self._decode(body)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable proxy schedule cache: {e}")
+            return []
+        return self._in_window(start_date, end_date)
+
+    async def fetch(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> Optional[List[MeetingEvent]]:
+        """
+        Fetch the room's schedule if it changed.
+
+        Args:
+            start_date: Start of date range (default: now)
+            end_date: End of date range (default: now + 24 hours)
+
+        Returns:
+            List of MeetingEvent objects, or None if the proxy is unavailable
+            and the caller should sync directly
+        """
+        if time.monotonic() < self._retry_at:
+            self.fallbacks += 1
+            return None
+
+        headers = {"If-None-Match": self._etag} if self._etag else {}
+        self.requests += 1
+        try:
+            response = await self._client.get(self.schedule_url, headers=headers)
+            self.bytes_received += response.num_bytes_downloaded
+            self.last_changed = response.status_code != 304
+            if response.status_code == 304:
+                self.not_modified += 1
+            elif response.status_code == 200:
+                self._events = self._decode(response.content)
+                self._etag = response.headers.get("etag")
+                self._save(response.content)
+            else:
+                raise RuntimeError(f"HTTP {response.status_code}")
+        except Exception as e:
+            self.healthy = False
+            self.failures += 1
+            self.fallbacks += 1
+            self.last_error = str(e) or type(e).__name__
+            self._retry_at = time.monotonic() + self.retry_seconds
+            logger.warning(
+                f"Calendar proxy unavailable ({self.last_error}) - "
+                f"syncing directly for {self.retry_seconds:.0f}s"
+            )
+            return None
+
+        if not self.healthy:
+            logger.info(f"Using calendar proxy {self.url} for room '{self.room}'")
+        self.healthy = True
+        self.last_error = None
+        self.last_fetch = datetime.now()
+        return self._in_window(start_date, end_date)
+
+    def _decode(self, body: bytes) -> List[MeetingEvent]:
+        """Parse a schedule document."""
+        data = json.loads(body)
+        return [event_from_dict(item) for item in data.get("events", [])]
+
+    def _save(self, body: bytes):
+        """Keep the schedule for the next warm start."""
+        if not self.cache_path:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp = self.cache_path.with_suffix(".tmp")
+            temp.write_bytes(body)
+            temp.replace(self.cache_path)
+        except OSError as e:
+            logger.debug(f"Cannot save proxy schedule: {e}")
+
+    def _in_window(
+        self,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> List[MeetingEvent]:
+        """Events overlapping a date range."""
+        if start_date is None:
+            start_date = datetime.now()
+        if end_date is None:
+            end_date = start_date + timedelta(hours=24)
+        window_start = start_date.timestamp()
+        window_end = end_date.timestamp()
+        return [
+            event for event in self._events
+            if event.start_ts < window_end and event.end_ts > window_start
+        ]
+
+    async def close(self):
+        """Close connections."""
+        await self._client.aclose()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get proxy client statistics.
+
+        Returns:
+            Dictionary with health and request counters
+        """
+        return {
+            "url": self.url,
+            "room": self.room,
+            "healthy": self.healthy,
+            "requests": self.requests,
+            "not_modified": self.not_modified,
+            "failures": self.failures,
+            "fallbacks": self.fallbacks,
+            "bytes_received": self.bytes_received,
+            "last_fetch": self.last_fetch.isoformat() if self.last_fetch else None,
+            "last_error": self.last_error,
+        }
@@ -0,0 +1,320 @@
+"""
+Join flight recorder for diagnosing failed or slow meeting joins.
+
+Keeps a bounded ring buffer of join step events, browser console messages,
+network failures and downscaled screenshots (taken only at step
+boundaries). When a join fails or is slow the buffer is written out as a
+compact zip bundle, otherwise it is discarded. Old bundles are rotated out
+automatically.
+"""
+import asyncio
+import base64
+import json
+import time
+import zipfile
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from playwright.async_api import CDPSession, ConsoleMessage, Page, Request
+
+from src.utils.config import DiagnosticsConfig
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+
+class JoinFlightRecorder:
+    """
+    Always-on, bounded-cost recorder for the join path.
+
+    Memory is bounded by the event and screenshot ring buffers, and the
+    time spent recording is measured for every join.
+    """
+
+    def __init__(
+        self,
+        bundle_dir: Path,
+        max_bundles: int = 20,
+        max_events: int = 200,
+        max_screenshots: int = 8,
+        slow_join_seconds: float = 45.0,
+        screenshot_scale: float = 0.25,
+        screenshot_quality: int = 40,
+    ):
+        """
+        Initialize flight recorder.
+
+        Args:
+            bundle_dir: Directory for diagnostic bundles
+            max_bundles: Number of bundles to keep before rotating out the oldest
+            max_events: Size of the event ring buffer
+            max_screenshots: Size of the screenshot ring buffer
+            slow_join_seconds: Successful joins slower than this are also saved
+            screenshot_scale: Downscale factor for step screenshots
+            screenshot_quality: JPEG quality for step screenshots
+        """
+        self.bundle_dir = Path(bundle_dir)
+        self.max_bundles = max_bundles
+        self.slow_join_seconds = slow_join_seconds
+        self.screenshot_scale = screenshot_scale
+        self.screenshot_quality = screenshot_quality
+
+        self._events: Deque[Dict[str, Any]] = deque(maxlen=max_events)
+        self._screenshots: Deque[Tuple[str, str]] = deque(maxlen=max_screenshots)
+        self._page: Optional[Page] = None
+        self._session: Optional[CDPSession] = None
+        self._room_url: Optional[str] = None
+        self._started_at = 0.0
+        self._overhead = 0.0
+
+        # Statistics
+        self.joins_recorded = 0
+        self.bundles_written = 0
+        self.last_overhead_ms: Optional[float] = None
+        self.total_overhead_ms = 0.0
+
+    async def begin(self, page: Page, room_url: str) -> None:
+        """
+        Start recording a join attempt.
+
+        Args:
+            page: Page used for the join
+            room_url: Room being joined
+        """
+        self._events.clear()
+        self._screenshots.clear()
+        self._page = page
+        self._room_url = room_url
+        self._started_at = time.monotonic()
+        self._overhead = 0.0
+
+        t0 = time.perf_counter()
+        page.on("console", self._on_console)
+        page.on("requestfailed", self._on_request_failed)
+        page.on("pageerror", self._on_page_error)
+        try:
+            self._session = await page.context.new_cdp_session(page)
+        except Exception as e:
+            logger.debug(f"Flight recorder: no CDP session, screenshots disabled: {e}")
+            self._session = None
+        self._overhead += time.perf_counter() - t0
+
+        self.record("begin", room=_redact_url(room_url))
+
+    def record(self, kind: str, message: str = "", **data: Any) -> None:
+        """
+        Append an event to the ring buffer.
+
+        Args:
+            kind: Event type (step, console, requestfailed, error, ...)
+            message: Short description
+            **data: Additional JSON-serializable details
+        """
+        t0 = time.perf_counter()
+        event = {"t": round(time.monotonic() - self._started_at, 3), "kind": kind}
+        if message:
+            event["message"] = message[:500]
+        if data:
+            event.update(data)
+        self._events.append(event)
+        self._overhead += time.perf_counter() - t0
+
+    async def step(self, name: str) -> None:
+        """
+        Mark a join step boundary and take a downscaled screenshot.
+
+        Args:
+            name: Step name (navigate, username, join_button, ...)
+        """
+        self.record("step", name)
+
+        if not self._session:
+            return
+
+        t0 = time.perf_counter()
+        try:
+            metrics = await self._session.send("Page.getLayoutMetrics")
+            viewport = metrics["cssLayoutViewport"]
+            shot = await self._session.send("Page.captureScreenshot", {
+                "format": "jpeg",
+                "quality": self.screenshot_quality,
+                "clip": {
+                    "x": 0,
+                    "y": 0,
+                    "width": viewport["clientWidth"],
+                    "height": viewport["clientHeight"],
+                    "scale": self.screenshot_scale,
+                },
+            })
+            self._screenshots.append((name, shot["data"]))
+        except Exception as e:
+            logger.debug(f"Flight recorder: screenshot failed at step '{name}': {e}")
+        finally:
+            self._overhead += time.perf_counter() - t0
+
+    async def finish(self, success: bool) -> Optional[Path]:
+        """
+        Stop recording and write a bundle if the join failed or was slow.
+
+        Args:
+            success: Whether the join succeeded
+
+        Returns:
+            Path of the written bundle, or None if the recording was discarded
+        """
+        duration = time.monotonic() - self._started_at
+        slow = success and duration > self.slow_join_seconds
+
+        if not success:
+            await self.step("failed")
+        self.record("end", success=success, duration=round(duration, 3))
+
+        t0 = time.perf_counter()
+        if self._page:
+            self._page.remove_listener("console", self._on_console)
+            self._page.remove_listener("requestfailed", self._on_request_failed)
+            self._page.remove_listener("pageerror", self._on_page_error)
+        if self._session:
+            try:
+                await self._session.detach()
+            except Exception:
+                pass
+        self._overhead += time.perf_counter() - t0
+
+        self._page = None
+        self._session = None
+        self.joins_recorded += 1
+        self.last_overhead_ms = round(self._overhead * 1000, 2)
+        self.total_overhead_ms += self.last_overhead_ms
+
+        logger.debug(
+            f"Flight recorder: join took {duration:.1f}s, "
+            f"recording overhead {self.last_overhead_ms:.1f}ms"
+        )
+
+        if success and not slow:
+            self._events.clear()
+            self._screenshots.clear()
+            return None
+
+        reason = "slow" if slow else "failed"
+        meta = {
+            "reason": reason,
+            "room": _redact_url(self._room_url),
+            "recorded_at": datetime.now().isoformat(),
+            "duration_seconds": round(duration, 3),
+            "recorder_overhead_ms": self.last_overhead_ms,
+        }
+        events = list(self._events)
+        screenshots = list(self._screenshots)
+        self._events.clear()
+        self._screenshots.clear()
+
+        try:
+            path = await asyncio.to_thread(self._write_bundle, reason, meta, events, screenshots)
+        except Exception as e:
+            logger.error(f"Failed to write join diagnostics bundle: {e}")
+            return None
+
+        self.bundles_written += 1
+        logger.warning(f"Join {reason} - diagnostics bundle written to {path}")
+        return path
+
+    def _write_bundle(
+        self,
+        reason: str,
+        meta: Dict[str, Any],
+        events: List[Dict[str, Any]],
+        screenshots: List[Tuple[str, str]],
+    ) -> Path:
+        """Write a zip bundle and rotate out old ones (runs in a thread)."""
+        self.bundle_dir.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        path = self.bundle_dir / f"join-{stamp}-{reason}.zip"
+
+        with zipfile.ZipFile(path, "w") as bundle:
+            bundle.writestr(
+                "events.json",
+                json.dumps({**meta, "events": events}, indent=1, default=str),
+                compress_type=zipfile.ZIP_DEFLATED,
+            )
+            # JPEGs are already compressed
+            for index, (step, data) in enumerate(screenshots):
+                bundle.writestr(
+                    f"{index:02d}-{step}.jpg",
+                    base64.b64decode(data),
+                    compress_type=zipfile.ZIP_STORED,
+                )
+
+        bundles = sorted(self.bundle_dir.glob("join-*.zip"))
+        for old in bundles[:-self.max_bundles] if self.max_bundles > 0 else []:
+            old.unlink(missing_ok=True)
+
+        return path
+
+    def _on_console(self, message: ConsoleMessage) -> None:
+        """Record browser console warnings and errors."""
+        if message.type in ("error", "warning"):
+            self.record("console", message.text, level=message.type)
+
+    def _on_request_failed(self, request: Request) -> None:
+        """Record failed network requests."""
+        self.record(
+            "requestfailed",
+            request.failure or "",
+            url=_redact_url(request.url),
+            method=request.method,
+        )
+
+    def _on_page_error(self, error: Exception) -> None:
+        """Record uncaught page exceptions."""
+        self.record("pageerror", str(error))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get recorder statistics.
+
+        Returns:
+            Dictionary with join counts and recording overhead
+        """
+        return {
+            "joins_recorded": self.joins_recorded,
+            "bundles_written": self.bundles_written,
+            "last_overhead_ms": self.last_overhead_ms,
+            "avg_overhead_ms": (
+                round(self.total_overhead_ms / self.joins_recorded, 2)
+                if self.joins_recorded else None
+            ),
+        }
+
+
+def _redact_url(url: Optional[str]) -> Optional[str]:
+    """Drop query strings (may contain passwords or checksums) from URLs."""
+    if not url:
+        return url
+    parsed = urlparse(url)
+    return parsed._replace(query="", fragment="").geturl()
+
+
+def create_flight_recorder(config: DiagnosticsConfig) -> Optional[JoinFlightRecorder]:
+    """
+    Factory function to create the join flight recorder.
+
+    Args:
+        config: Diagnostics configuration
+
+    Returns:
+        JoinFlightRecorder instance, or None if disabled
+    """
+    if not config.join_recorder_enabled:
+        return None
+
+    return JoinFlightRecorder(
+        bundle_dir=Path(config.join_recorder_dir),
+        max_bundles=config.join_recorder_max_bundles,
+        slow_join_seconds=config.join_recorder_slow_seconds,
+    )
@@ -0,0 +1,265 @@
+"""
+Streaming iCalendar tokenizer for RaspberryMeet.
+
+Reads the VEVENTs of a calendar object line by line and yields only the
+properties the scheduler uses, without building an icalendar component
+tree. Covers the common case of single (non-recurring) meetings with UTC,
+floating, all-day or Olson-TZID times; everything else (recurrence rules,
+custom VTIMEZONE names, malformed values) raises UnsupportedICalendar so
+the caller can fall back to the full icalendar parser.
+"""
+import re
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    from zoneinfo import ZoneInfo
+    ZONEINFO_AVAILABLE = True
+except ImportError:
+    ZONEINFO_AVAILABLE = False
+
+
+# Folded continuation lines start with a single space or tab (RFC 5545 3.1)
+_FOLD = re.compile(r"\r?\n[ \t]")
+_TEXT_ESCAPE = re.compile(r"\\([\\;,nN])")
+_DATE_TIME = re.compile(r"^(\d{4})(\d{2})(\d{2})T(\d{2})(\d{2})(\d{2})(Z?)$")
+_DATE = re.compile(r"^(\d{4})(\d{2})(\d{2})$")
+
+# Properties that make an object recurring: left to the icalendar parser
+_RECURRENCE_PROPERTIES = {"RRULE", "RDATE", "EXRULE"}
+_TEXT_PROPERTIES = {"UID", "SUMMARY", "DESCRIPTION", "LOCATION"}
+_DATE_PROPERTIES = {"DTSTART", "DTEND", "RECURRENCE-ID"}
+
+
+class UnsupportedICalendar(Exception):
+    """Calendar data the tokenizer leaves to the full icalendar parser."""
+
+
+@dataclass
+class VEventFields:
+    """Values of the VEVENT properties the scheduler reads."""
+
+    uid: str = ""
+    summary: str = "Untitled Meeting"
+    description: str = ""
+    location: str = ""
+    dtstart: Any = None
+    dtend: Any = None
+    recurrence_id: Any = None
+    organizer: Optional[str] = None
+    attendees: List[str] = field(default_factory=list)
+
+
+def iter_content_lines(data: str) -> Iterator[str]:
+    """
+    Unfold iCalendar text into content lines.
+
+    Args:
+        data: iCalendar text
+
+    Yields:
+        Unfolded, non-empty content lines
+    """
+    for line in _FOLD.sub("", data).splitlines():
+        if line:
+            yield line
+
+
+def parse_content_line(line: str) -> Tuple[str, Dict[str, str], str]:
+    """
+    Split a content line into name, parameters and value.
+
+    Args:
+        line: Unfolded content line (NAME;PARAM=value:VALUE)
+
+    Returns:
+        Tuple of (upper-case name, parameters, raw value)
+
+    Raises:
+        UnsupportedICalendar: Line has no value separator
+    """
+    colon = line.find(":")
+    semicolon = line.find(";")
+    if colon == -1:
+        raise UnsupportedICalendar(f"Invalid content line: {line[:40]!r}")
+    if semicolon == -1 or semicolon > colon:
+        return line[:colon].upper(), {}, line[colon + 1:]
+
+    name = line[:semicolon].upper()
+    params: Dict[str, str] = {}
+    pos = semicolon
+    length = len(line)
+    while pos < length and line[pos] == ";":
+        equals = line.find("=", pos)
+        if equals == -1:
+            raise UnsupportedICalendar(f"Invalid parameter in {name}")
+        key = line[pos + 1:equals].upper()
+
+        # Parameter values end at ; or : outside double quotes
+        pos = equals + 1
+        start = pos
+        quoted = False
+        while pos < length:
+            char = line[pos]
+            if char == '"':
+                quoted = not quoted
+            elif not quoted and char in ";:":
+                break
+            pos += 1
+        params[key] = line[start:pos].strip('"')
+
+    if pos >= length or line[pos] != ":":
+        raise UnsupportedICalendar(f"Invalid content line for {name}")
+    return name, params, line[pos + 1:]
+
+
+def iter_vevents(data: str) -> Iterator[VEventFields]:
+    """
+    Tokenize the VEVENTs of a calendar object one at a time.
+
+    Nested components (VALARM) and all other top-level components are
+    skipped; only the VEVENT's own properties are read.
+
+    Args:
+        data: iCalendar text of one calendar object
+
+    Yields:
+        VEventFields per VEVENT
+
+    Raises:
+        UnsupportedICalendar: Recurring event or a value the tokenizer cannot read
+    """
+    fields: Optional[VEventFields] = None
+    depth = 0
+    for line in iter_content_lines(data):
+        name, params, value = parse_content_line(line)
+
+        if name == "BEGIN":
+            if fields is not None:
+                depth += 1
+            elif value.upper() == "VEVENT":
+                fields = VEventFields()
+                depth = 0
+            continue
+        if name == "END":
+            if fields is None:
+                continue
+            if depth:
+                depth -= 1
+            elif value.upper() == "VEVENT":
+                yield fields
+                fields = None
+            continue
+        if fields is None or depth:
+            continue
+
+        if name in _RECURRENCE_PROPERTIES:
+            raise UnsupportedICalendar(f"Recurring event ({name})")
+        if name in _TEXT_PROPERTIES:
+            setattr(fields, name.lower(), unescape_text(value))
+        elif name in _DATE_PROPERTIES:
+            parsed = parse_date_value(value, params)
+            if name == "DTSTART":
+                fields.dtstart = parsed
+            elif name == "DTEND":
+                fields.dtend = parsed
+            else:
+                fields.recurrence_id = parsed
+        elif name == "ORGANIZER":
+            fields.organizer = value
+        elif name == "ATTENDEE":
+            fields.attendees.append(value)
+
+    if fields is not None:
+        raise UnsupportedICalendar("Unterminated VEVENT")
+
+
+def vevent_fields(component: Any) -> VEventFields:
+    """
+    Read the same properties from an icalendar VEVENT component.
+
+    Args:
+        component: icalendar VEVENT
+
+    Returns:
+        VEventFields
+    """
+    raw_attendees = component.get("attendee", [])
+    if not isinstance(raw_attendees, list):
+        raw_attendees = [raw_attendees]
+
+    dtstart = component.get("dtstart")
+    dtend = component.get("dtend")
+    recurrence_id = component.get("recurrence-id")
+    organizer = component.get("organizer")
+    return VEventFields(
+        uid=str(component.get("uid", "")),
+        summary=str(component.get("summary", "Untitled Meeting")),
+        description=str(component.get("description", "")),
+        location=str(component.get("location", "")),
+        dtstart=dtstart.dt if dtstart else None,
+        dtend=dtend.dt if dtend else None,
+        recurrence_id=recurrence_id.dt if recurrence_id else None,
+        organizer=str(organizer) if organizer else None,
+        attendees=[str(attendee) for attendee in raw_attendees],
+    )
+
+
+def unescape_text(value: str) -> str:
+    """
+    Decode an iCalendar TEXT value.
+
+    Args:
+        value: Escaped value (\\n, \\, \\; \\\\)
+
+    Returns:
+        Plain text
+    """
+    if "\\" not in value:
+        return value
+    return _TEXT_ESCAPE.sub(lambda m: "\n" if m.group(1) in "nN" else m.group(1), value)
+
+
+def parse_date_value(value: str, params: Dict[str, str]) -> Any:
+    """
+    Parse a DATE or DATE-TIME value.
+
+    Args:
+        value: Raw value (20250301, 20250301T090000, 20250301T080000Z)
+        params: Property parameters (VALUE, TZID)
+
+    Returns:
+        date, naive (floating) datetime or aware datetime
+
+    Raises:
+        UnsupportedICalendar: Value or time zone cannot be read
+    """
+    value = value.strip()
+    match = _DATE.match(value)
+    if match:
+        return date(*map(int, match.groups()))
+    if params.get("VALUE", "DATE-TIME").upper() != "DATE-TIME":
+        raise UnsupportedICalendar(f"Unsupported value type {params['VALUE']}")
+
+    match = _DATE_TIME.match(value)
+    if not match:
+        raise UnsupportedICalendar(f"Invalid date-time {value!r}")
+    parsed = datetime(*map(int, match.groups()[:6]))
+    if match.group(7):
+        return parsed.replace(tzinfo=timezone.utc)
+    if "TZID" in params:
+        return parsed.replace(tzinfo=_zone(params["TZID"]))
+    return parsed
+
+
+@lru_cache(maxsize=64)
+def _zone(tzid: str) -> Any:
+    """Resolve an Olson TZID (custom VTIMEZONE names are not supported)."""
+    if not ZONEINFO_AVAILABLE:
+        raise UnsupportedICalendar("zoneinfo not available")
+    try:
+        return ZoneInfo(tzid)
+    except (ValueError, KeyError, OSError) as e:
+        raise UnsupportedICalendar(f"Unknown time zone {tzid!r}") from e
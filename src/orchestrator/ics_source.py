@@ -0,0 +1,336 @@
+"""
+Published iCalendar feed source for RaspberryMeet.
+
+Many calendars can only be shared as a published .ics / webcal URL instead
+of CalDAV credentials. ICSFeedClient syncs such a feed and produces the
+same MeetingEvent stream as CalDAVClient, so the federation and the
+scheduler treat both alike.
+
+Polling a feed stays cheap:
+
+- Conditional GET with If-None-Match / If-Modified-Since: an unchanged feed
+  costs one 304 response.
+- gzip transfer encoding.
+- A SHA-256 of the body catches servers that send no validators: the same
+  content is never parsed twice.
+- A changed feed is split per UID, and only the events whose text changed
+  are parsed again; the others are reused from the event store.
+"""
+import asyncio
+import hashlib
+import json
+import re
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+from src.orchestrator.calendar_sync import CalDAVClient, MeetingEvent
+from src.orchestrator.event_store import EventStore
+from src.orchestrator.parse_pool import CalendarParsePool
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_FOLD = re.compile(r"\r?\n[ \t]")
+_TZID_PARAM = re.compile(r";TZID=\"?([^\";:]+)")
+
+# Prefix of the synthetic hrefs under which the feed's events are stored
+HREF_PREFIX = "ics:"
+
+
+def feed_url(url: str) -> str:
+    """
+    Turn a webcal:// subscription link into the HTTP(S) URL to fetch.
+
+    Args:
+        url: Feed URL as published (webcal://, webcals://, http(s)://)
+
+    Returns:
+        HTTP(S) URL
+    """
+    lowered = url.lower()
+    if lowered.startswith("webcals://"):
+        return "https://" + url[len("webcals://"):]
+    if lowered.startswith("webcal://"):
+        return "https://" + url[len("webcal://"):]
+    return url
+
+
+def split_feed(data: str) -> Dict[str, str]:
+    """
+    Split a feed into one calendar object per UID.
+
+    Each object carries the VEVENTs of one UID (master and overridden
+    instances) plus the VTIMEZONEs they reference, so it can be parsed and
+    expanded on its own - like a resource of a CalDAV collection.
+
+    Args:
+        data: iCalendar text of the whole feed
+
+    Returns:
+        Dictionary of UID -> iCalendar text, in feed order
+    """
+    timezones: Dict[str, List[str]] = {}
+    events: Dict[str, List[str]] = {}
+    block: Optional[List[str]] = None
+    kind = None
+    depth = 0
+
+    for line in _FOLD.sub("", data).splitlines():
+        if not line:
+            continue
+        upper = line.upper()
+        if block is None:
+            if upper in ("BEGIN:VEVENT", "BEGIN:VTIMEZONE"):
+                block, kind, depth = [line], upper[6:], 0
+            continue
+
+        block.append(line)
+        if upper.startswith("BEGIN:"):
+            depth += 1
+        elif upper.startswith("END:"):
+            if depth:
+                depth -= 1
+                continue
+            text = "\r\n".join(block)
+            if kind == "VTIMEZONE":
+                tzid = next((l[5:] for l in block if l.upper().startswith("TZID:")), "")
+                timezones[tzid] = block
+            else:
+                uid = next((l.split(":", 1)[1] for l in block if l.upper().startswith("UID")), None)
+                uid = uid or hashlib.sha1(text.encode("utf-8")).hexdigest()
+                events.setdefault(uid, []).extend(block)
+            block = None
+
+    objects = {}
+    for uid, lines in events.items():
+        body = "\r\n".join(lines)
+        referenced = set(_TZID_PARAM.findall(body))
+        zones = [
+            "\r\n".join(zone) for tzid, zone in timezones.items() if tzid in referenced
+        ]
+        objects[uid] = "\r\n".join(
+            ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//RaspberryMeet//ICS feed//EN",
+             *zones, body, "END:VCALENDAR", ""]
+        )
+    return objects
+
+
+class ICSFeedClient(CalDAVClient):
+    """Syncs a published iCalendar feed with HTTP caching."""
+
+    def __init__(
+        self,
+        url: str,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        name: Optional[str] = None,
+        event_store: Optional[EventStore] = None,
+        timeout: float = 30.0,
+        parse_pool: Optional[CalendarParsePool] = None
+    ):
+        """
+        Initialize feed client.
+
+        Args:
+            url: Feed URL (webcal:// or http(s)://)
+            username: HTTP username if the feed is protected (optional)
+            password: HTTP password (optional)
+            name: Display name for logs and status
+            event_store: Store for the feed's events (default: in-memory)
+            timeout: Request timeout in seconds
+            parse_pool: Process pool for bulk parsing (optional, shared)
+        """
+        super().__init__(
+            feed_url(url), username or "", password or "", calendar_name=name,
+            event_store=event_store, timeout=timeout, parse_pool=parse_pool,
+        )
+        self._http: Optional["httpx.AsyncClient"] = None
+
+        # Validators of the last fetched feed, kept in the store's ctag slot so
+        # they survive a restart together with the events
+        self._validators: Dict[str, Optional[str]] = {}
+        if self.event_store.ctag:
+            try:
+                self._validators = json.loads(self.event_store.ctag)
+            except ValueError:
+                self._validators = {}
+
+    def connect(self) -> bool:
+        """
+        Prepare the HTTP client (the feed itself is fetched on sync).
+
+        Returns:
+            True if httpx is available
+        """
+        if not HTTPX_AVAILABLE:
+            logger.error("httpx is not installed - cannot fetch iCalendar feeds")
+            return False
+        if self._http is None:
+            auth = httpx.BasicAuth(self.username, self.password) if self.username else None
+            self._http = httpx.AsyncClient(
+                auth=auth,
+                timeout=httpx.Timeout(self.timeout, connect=min(self.timeout, 10.0)),
+                headers={"Accept": "text/calendar", "Accept-Encoding": "gzip, deflate"},
+                follow_redirects=True,
+            )
+        logger.info(f"Using iCalendar feed: {self.url}")
+        return True
+
+    def fetch_events(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[MeetingEvent]:
+        """Events from the last fetched feed (blocking API; no network)."""
+        return self.cached_events(start_date, end_date)
+
+    async def sync_events(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[MeetingEvent]:
+        """
+        Fetch the feed if it changed and return events within the date range.
+
+        Args:
+            start_date: Start of date range (default: now)
+            end_date: End of date range (default: now + 24 hours)
+
+        Returns:
+            List of MeetingEvent objects
+        """
+        if start_date is None:
+            start_date = datetime.now()
+        if end_date is None:
+            end_date = start_date + timedelta(hours=24)
+        if self._http is None and not self.connect():
+            return self.cached_events(start_date, end_date)
+
+        started = time.perf_counter()
+        self._begin_sync_accounting()
+        self.metrics.syncs += 1
+        self.metrics.last_skipped = False
+        try:
+            data, validators = await self._fetch()
+            if data is None:
+                self.metrics.syncs_skipped += 1
+                self.metrics.last_skipped = True
+                logger.info("iCalendar feed unchanged - skipping parse")
+            else:
+                await asyncio.to_thread(self._apply_feed, data)
+            # Only after the store holds this feed: a failed or cancelled
+            # update must not make the next poll skip it
+            if validators:
+                self._commit_validators(validators)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"iCalendar feed sync failed, using cached events: {e}")
+        finally:
+            await asyncio.to_thread(self.event_store.flush)
+            self.metrics.last_sync_ms = round((time.perf_counter() - started) * 1000, 1)
+
+        events = await asyncio.to_thread(self._events_in_window, start_date, end_date)
+        self._end_sync_accounting()
+        logger.info(f"Found {len(events)} meeting event(s)")
+        return events
+
+    async def _fetch(self) -> Tuple[Optional[str], Optional[Dict[str, Optional[str]]]]:
+        """
+        Conditional GET of the feed.
+
+        The validators of the response are returned, not stored: the caller
+        commits them once the feed is applied.
+
+        Returns:
+            Tuple of (feed text or None if unchanged (304 or same content
+            hash), validators of the response or None after a 304)
+
+        Raises:
+            RuntimeError: Server answered with an error status
+        """
+        headers = {}
+        if self._validators.get("etag"):
+            headers["If-None-Match"] = self._validators["etag"]
+        if self._validators.get("last_modified"):
+            headers["If-Modified-Since"] = self._validators["last_modified"]
+
+        self.metrics.requests += 1
+        response = await self._http.get(self.url, headers=headers)
+        self._count_bytes(response.num_bytes_downloaded)
+        if response.status_code == 304:
+            return None, None
+        if response.status_code != 200:
+            raise RuntimeError(f"HTTP {response.status_code}")
+
+        digest = hashlib.sha256(response.content).hexdigest()
+        validators = {
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "sha256": digest,
+        }
+        if digest == self._validators.get("sha256"):
+            return None, validators
+        return response.text, validators
+
+    def _commit_validators(self, validators: Dict[str, Optional[str]]):
+        """Remember the validators of the applied feed, also in the store's ctag slot."""
+        self._validators = validators
+        self.event_store.ctag = json.dumps(validators)
+
+    def _apply_feed(self, data: str) -> Tuple[int, int, int]:
+        """
+        Update the store from a changed feed, parsing only changed events.
+
+        Args:
+            data: Feed text
+
+        Returns:
+            Tuple of (updated, unchanged, deleted) object counts
+        """
+        updated = unchanged = 0
+        seen = set()
+        for uid, text in split_feed(data).items():
+            href = HREF_PREFIX + uid
+            etag = hashlib.sha256(text.encode("utf-8")).hexdigest()
+            seen.add(href)
+            existing = self.event_store.get(href)
+            if existing and existing.etag == etag:
+                unchanged += 1
+                continue
+            obj = self._build_stored_object(href, etag, text)
+            if obj:
+                self.event_store.put(obj)
+                updated += 1
+
+        gone = [obj.href for obj in self.event_store.objects() if obj.href not in seen]
+        for href in gone:
+            self.event_store.delete(href)
+
+        self.metrics.objects_changed += updated
+        self.metrics.objects_unchanged += unchanged
+        self.metrics.objects_deleted += len(gone)
+        self.metrics.objects_fetched += updated
+        logger.info(
+            f"iCalendar feed changed: {updated} updated, {unchanged} unchanged, "
+            f"{len(gone)} removed"
+        )
+        return updated, unchanged, len(gone)
+
+    async def close_transport(self):
+        """Close the HTTP client."""
+        http = self._http
+        self._http = None
+        if http:
+            await http.aclose()
+
+    def disconnect(self):
+        """Forget the HTTP client (closed by close_transport)."""
+        self._http = None
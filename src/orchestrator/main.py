@@ -5,7 +5,8 @@ This is the main service that runs on the Raspberry Pi and manages:
 - GPIO button/LED control
 - BigBlueButton browser automation
 - Meeting lifecycle management
-- (Future: Calendar sync, auto-join, etc.)
+- Calendar sync and auto-join
+- Multi-room hosting (several rooms from one host, see config/rooms.example.yaml)
 
 Usage:
     python -m src.orchestrator.main
@@ -17,8 +18,10 @@ import asyncio
 import signal
 import sys
 from pathlib import Path
+from typing import Union
 
 from src.orchestrator.meeting_manager import MeetingManager
+from src.orchestrator.room_host import RoomHost
 from src.utils.config import load_config
 from src.utils.logger import setup_logger
 
@@ -27,7 +30,7 @@ logger = setup_logger(__name__)
 
 
 # Global manager for signal handling
-manager: MeetingManager = None
+manager: Union[MeetingManager, RoomHost] = None
 shutdown_event = asyncio.Event()
 
 
@@ -61,9 +64,11 @@ async def main():
     logger.info(f"  CalDAV Enabled: {config.caldav.enabled}")
     logger.info(f"  Kiosk Mode: {config.kiosk_mode}")
     logger.info(f"  Auto-Join on Boot: {config.auto_join_on_boot}")
+    if config.rooms:
+        logger.info(f"  Multi-Room: {', '.join(room.name for room in config.rooms)}")
 
     # Validate required configuration
-    if not config.bbb.default_room_url:
+    if not config.bbb.default_room_url and not config.rooms:
         logger.error("\n❌ ERROR: BBB_DEFAULT_ROOM_URL not configured!")
         logger.error("Please configure your BigBlueButton room URL in .env")
         return 1
@@ -77,7 +82,7 @@ async def main():
     logger.info("Initializing meeting manager...")
     logger.info("=" * 70 + "\n")
 
-    manager = MeetingManager(config)
+    manager = RoomHost(config) if config.rooms else MeetingManager(config)
 
     try:
         # Start meeting manager
@@ -105,7 +110,12 @@ async def main():
         if config.auto_join_on_boot:
             logger.info("🚀 AUTO_JOIN_ON_BOOT enabled - joining default meeting...")
             await asyncio.sleep(2)  # Wait for browser to stabilize
-            await manager.join_default_meeting()
+            if isinstance(manager, RoomHost):
+                await asyncio.gather(
+                    *(m.join_default_meeting() for m in manager.managers.values())
+                )
+            else:
+                await manager.join_default_meeting()
 
         # Status monitoring loop
         async def status_monitor():
@@ -113,12 +123,18 @@ async def main():
             while not shutdown_event.is_set():
                 await asyncio.sleep(60)  # Every minute
 
-                status = manager.get_status()
-                logger.info(
-                    f"📊 Status: {status['state'].upper()} | "
-                    f"Room: {status['current_room'][:50] if status['current_room'] else 'None'} | "
-                    f"Duration: {status['meeting_duration'] or 0}s"
-                )
+                if isinstance(manager, RoomHost):
+                    statuses = manager.get_status().values()
+                else:
+                    statuses = [manager.get_status()]
+
+                for status in statuses:
+                    prefix = f"[{status['room']}] " if status.get("room") else ""
+                    logger.info(
+                        f"📊 {prefix}Status: {status['state'].upper()} | "
+                        f"Room: {status['current_room'][:50] if status['current_room'] else 'None'} | "
+                        f"Duration: {status['meeting_duration'] or 0}s"
+                    )
 
         # Start status monitor
         monitor_task = asyncio.create_task(status_monitor())
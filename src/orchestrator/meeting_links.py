@@ -0,0 +1,187 @@
+"""
+Meeting link extraction for RaspberryMeet.
+
+Finds BigBlueButton join links and access codes in the description and
+location of calendar events. Every provider (Greenlight rooms, Greenlight
+v3 rooms, direct API join links, generic BBB hosts) contributes one named
+group to a single precompiled pattern. Each text is scanned once for URLs
+(a plain substring search for "://", no regex over the whole text), every
+URL is classified by the combined pattern, and all candidates come back
+ranked by provider priority and position.
+"""
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class LinkProvider:
+    """One kind of meeting link."""
+
+    name: str
+    # Regex for the URL after "://", without capturing groups
+    pattern: str
+    # Lower ranks win when an event contains several links
+    rank: int
+
+
+# URL characters: no whitespace, quotes or angle brackets (Outlook wraps
+# links in <...>, HTML descriptions put them in href="...")
+_URL_CHAR = r"""[^\s<>"']"""
+
+DEFAULT_PROVIDERS: Tuple[LinkProvider, ...] = (
+    # Greenlight v2 room: https://bbb.example.org/b/abc-def-ghi
+    LinkProvider("greenlight", rf"{_URL_CHAR}+?/b/[a-z0-9][a-z0-9-]*", rank=0),
+    # Greenlight v3 room: https://bbb.example.org/rooms/abc-def-ghi/join
+    LinkProvider("greenlight_v3", rf"{_URL_CHAR}+?/rooms/[a-z0-9][a-z0-9-]*(?:/join)?", rank=1),
+    # Signed API join link: https://bbb.example.org/bigbluebutton/api/join?...
+    LinkProvider("api_join", rf"{_URL_CHAR}+?/bigbluebutton/api/join\?{_URL_CHAR}+", rank=2),
+    # Any other BBB path, e.g. a scalelite or LMS front end
+    LinkProvider("bbb_path", rf"{_URL_CHAR}+?/bigbluebutton/{_URL_CHAR}+", rank=3),
+    # Bare BBB host: https://bbb.example.org/
+    LinkProvider("bbb_host", rf"bbb\.{_URL_CHAR}+", rank=4),
+)
+
+# Rest of a URL after "://"
+_URL_TOKEN = re.compile(rf"{_URL_CHAR}+")
+
+# Access codes in German and English, matched on the lower-cased text. A
+# value needs a separator ("Passwort: x", "PIN = 1234", "Code lautet 42") or
+# has to contain a digit ("PIN 123456"), so "code of conduct" is not taken
+# for a code; keywords inside URLs ("?password=...") are ignored.
+_ACCESS_CODE = re.compile(
+    r"(?<![?&=/])\b(?:access[ -]?code|zugangs-?code|raum-?code|room[ -]?code|zugangs-?pin|"
+    r"passwor[dt]|kennwort|pin|code)\b"
+    r"(?:\s*[:=]\s*|\s+(?:lautet|ist|is)\s+|\s+(?=[a-z_-]*\d))"
+    r"([a-z0-9_-]+)"
+)
+_ACCESS_CODE_ANY_CASE = re.compile(_ACCESS_CODE.pattern, re.IGNORECASE)
+
+# Sentence punctuation that follows a link in prose
+_TRAILING = ".,;:)]>!?"
+
+
+@dataclass
+class LinkMatch:
+    """A meeting link found in an event."""
+
+    url: str
+    provider: str
+    rank: int
+    # "description" or "location"
+    field: str
+    position: int
+
+
+@dataclass
+class MeetingLinkInfo:
+    """All meeting links and the access code of one event."""
+
+    links: Tuple[LinkMatch, ...] = ()
+    access_code: Optional[str] = None
+
+    @property
+    def best(self) -> Optional[LinkMatch]:
+        """The highest ranked link."""
+        return self.links[0] if self.links else None
+
+
+class MeetingLinkExtractor:
+    """Scans event texts for meeting links with one combined pattern."""
+
+    def __init__(self, providers: Sequence[LinkProvider] = DEFAULT_PROVIDERS):
+        """
+        Initialize extractor.
+
+        Args:
+            providers: Link providers; at the same position, earlier ones win
+        """
+        self.providers = tuple(providers)
+        alternatives = "|".join(
+            f"(?P<p{i}>{provider.pattern})" for i, provider in enumerate(self.providers)
+        )
+        self._pattern = re.compile(alternatives, re.IGNORECASE)
+        self._by_group = {f"p{i}": provider for i, provider in enumerate(self.providers)}
+
+    def extract(self, description: str, location: str) -> MeetingLinkInfo:
+        """
+        Find meeting links and the access code of an event.
+
+        Args:
+            description: Event description text
+            location: Event location text
+
+        Returns:
+            MeetingLinkInfo with links ranked by provider, field and position
+        """
+        links: List[LinkMatch] = []
+        if description and "://" in description:
+            links = self._links(description, "description")
+        if location and "://" in location:
+            links += self._links(location, "location")
+        if len(links) > 1:
+            links.sort(key=lambda link: (link.rank, link.field != "description", link.position))
+
+        access_code = _access_code(description) if description else None
+        if access_code is None and location:
+            access_code = _access_code(location)
+
+        return MeetingLinkInfo(links=tuple(links), access_code=access_code)
+
+    def _links(self, text: str, field_name: str) -> List[LinkMatch]:
+        """All provider matches in one text."""
+        links = []
+        pos = text.find("://")
+        while pos != -1:
+            token = _URL_TOKEN.match(text, pos + 3)
+            scheme = text[max(0, pos - 5):pos].lower()
+            if scheme == "https":
+                scheme_start = pos - 5
+            elif scheme[-4:] == "http":
+                scheme_start = pos - 4
+            else:
+                scheme_start = None
+            if scheme_start is not None and token:
+                match = self._pattern.match(token.group(0))
+                if match:
+                    provider = self._by_group[match.lastgroup]
+                    links.append(LinkMatch(
+                        url=text[scheme_start:pos + 3] + match.group(0).rstrip(_TRAILING),
+                        provider=provider.name,
+                        rank=provider.rank,
+                        field=field_name,
+                        position=scheme_start,
+                    ))
+            pos = text.find("://", token.end() if token else pos + 3)
+        return links
+
+
+def _access_code(text: str) -> Optional[str]:
+    """First access code in a text, in its original case."""
+    # Every keyword contains one of these: texts without them skip the regex
+    lowered = text.lower()
+    if not ("code" in lowered or "pin" in lowered or "passwor" in lowered or "kennwort" in lowered):
+        return None
+    if len(lowered) != len(text):
+        # Rare characters change length when lower-cased: no position mapping
+        match = _ACCESS_CODE_ANY_CASE.search(text)
+        return match.group(1) if match else None
+    match = _ACCESS_CODE.search(lowered)
+    return text[match.start(1):match.end(1)] if match else None
+
+
+_default_extractor = MeetingLinkExtractor()
+
+
+def extract_meeting_links(description: str, location: str) -> MeetingLinkInfo:
+    """
+    Find meeting links and the access code of an event (default providers).
+
+    Args:
+        description: Event description text
+        location: Event location text
+
+    Returns:
+        MeetingLinkInfo
+    """
+    return _default_extractor.extract(description, location)
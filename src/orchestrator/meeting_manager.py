@@ -6,14 +6,20 @@ Orchestrates browser automation, GPIO control, and meeting state.
 import asyncio
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from playwright.async_api import Browser
 
 from src.orchestrator.browser_controller import BrowserController
+from src.orchestrator.browser_worker import BrowserWorkerClient
 from src.orchestrator.gpio_handler import GPIOHandler, LEDState
-from src.orchestrator.audio_manager import AudioVideoManager
+from src.orchestrator.audio_manager import AudioVideoManager, build_audio_routing_script
+from src.orchestrator.calendar_push import NotificationReceiver
 from src.orchestrator.calendar_scheduler import CalendarScheduler
-from src.orchestrator.calendar_sync import MeetingEvent
-from src.utils.config import AppConfig
+from src.orchestrator.calendar_sync import CalDAVConnectionPool, MeetingEvent
+from src.orchestrator.flight_recorder import create_flight_recorder
+from src.orchestrator.meeting_observer import InMeetingState, handle_remote_end
+from src.utils.config import AppConfig, RoomConfig
 from src.utils.logger import setup_logger
 
 
@@ -36,17 +42,32 @@ class MeetingManager:
     Coordinates browser automation, GPIO buttons/LEDs, and meeting state.
     """
 
-    def __init__(self, config: AppConfig):
+    def __init__(
+        self,
+        config: AppConfig,
+        room: Optional[RoomConfig] = None,
+        shared_browser: Optional[Browser] = None,
+        caldav_pool: Optional[CalDAVConnectionPool] = None,
+        notification_receiver: Optional[NotificationReceiver] = None,
+    ):
         """
         Initialize meeting manager.
 
         Args:
             config: Application configuration
+            room: Room this manager drives (multi-room mode only)
+            shared_browser: Chromium shared with other rooms (multi-room mode only)
+            caldav_pool: CalDAV connections shared with other rooms (optional)
+            notification_receiver: Calendar change notifications shared with other rooms (optional)
         """
         self.config = config
+        self.room = room
+        self.shared_browser = shared_browser
+        self.caldav_pool = caldav_pool
+        self.notification_receiver = notification_receiver
 
         # Components
-        self.browser: Optional[BrowserController] = None
+        self.browser: Optional[Union[BrowserController, BrowserWorkerClient]] = None
         self.gpio: Optional[GPIOHandler] = None
         self.audio: Optional[AudioVideoManager] = None
         self.calendar: Optional[CalendarScheduler] = None
@@ -56,6 +77,12 @@ class MeetingManager:
         self.current_room_url: Optional[str] = None
         self.current_meeting_event: Optional[MeetingEvent] = None
         self.meeting_start_time: Optional[datetime] = None
+        # Browser worker restarts before the current meeting was joined
+        self._meeting_generation = 0
+
+        # Live in-meeting state pushed by the browser observer
+        self.meeting_mirror = InMeetingState()
+        self._mirror_listeners: List[Callable[[Dict[str, Any]], Any]] = []
 
         # Lock for state transitions
         self._state_lock = asyncio.Lock()
@@ -66,25 +93,56 @@ class MeetingManager:
         """Start the meeting manager and initialize components."""
         logger.info("Starting meeting manager...")
 
-        # Initialize audio/video manager and configure devices
-        logger.info("Configuring audio/video devices...")
-        self.audio = AudioVideoManager()
-        if self.audio.configure_audio():
-            logger.info("Audio devices configured successfully")
+        init_scripts = []
+        window_bounds = None
+
+        if self.room:
+            # Multi-room: devices are routed per browser context, not system-wide
+            routing_script = build_audio_routing_script(
+                self.room.audio_input, self.room.audio_output
+            )
+            if routing_script:
+                init_scripts.append(routing_script)
+            window_bounds = {
+                "left": self.room.window_left,
+                "top": self.room.window_top,
+                "width": self.room.window_width,
+                "height": self.room.window_height,
+            }
         else:
-            logger.warning("Audio configuration failed or not needed")
+            # Initialize audio/video manager and configure devices
+            logger.info("Configuring audio/video devices...")
+            self.audio = AudioVideoManager()
+            if self.audio.configure_audio():
+                logger.info("Audio devices configured successfully")
+            else:
+                logger.warning("Audio configuration failed or not needed")
 
         # Initialize browser controller
-        self.browser = BrowserController(
-            bbb_config=self.config.bbb,
-            headless=False,  # Show browser for GPIO mode
-            kiosk_mode=self.config.kiosk_mode,
-        )
+        if self.config.browser_worker and not self.shared_browser:
+            # Browser runs in its own process, keeping this event loop free
+            self.browser = BrowserWorkerClient(
+                bbb_config=self.config.bbb,
+                headless=False,
+                kiosk_mode=self.config.kiosk_mode,
+            )
+            self.browser.set_restart_callback(self._handle_browser_restart)
+        else:
+            self.browser = BrowserController(
+                bbb_config=self.config.bbb,
+                headless=False,  # Show browser for GPIO mode
+                kiosk_mode=self.config.kiosk_mode,
+                flight_recorder=create_flight_recorder(self.config.diagnostics),
+                shared_browser=self.shared_browser,
+                window_bounds=window_bounds,
+                init_scripts=init_scripts,
+            )
+        self.browser.set_meeting_state_callback(self._handle_meeting_state_change)
         await self.browser.start()
         logger.info("Browser controller started")
 
-        # Initialize GPIO handler
-        if self.config.gpio.enabled:
+        # Initialize GPIO handler (single-room hardware only)
+        if self.config.gpio.enabled and not self.room:
             self.gpio = GPIOHandler(self.config.gpio)
             self.gpio.set_join_leave_callback(self._handle_join_leave_button)
             logger.info("GPIO handler started")
@@ -100,7 +158,9 @@ class MeetingManager:
             logger.info("Initializing calendar scheduler...")
             self.calendar = CalendarScheduler(
                 caldav_config=self.config.caldav,
-                on_meeting_start=self._handle_calendar_meeting_start
+                on_meeting_start=self._handle_calendar_meeting_start,
+                connection_pool=self.caldav_pool,
+                notification_receiver=self.notification_receiver,
             )
             await self.calendar.start()
             logger.info("Calendar scheduler started")
@@ -151,6 +211,58 @@ class MeetingManager:
             # Join the calendar meeting
             await self.join_calendar_meeting(event)
 
+    def add_meeting_state_listener(self, callback: Callable[[Dict[str, Any]], Any]):
+        """
+        Register a listener for in-meeting state changes.
+
+        Args:
+            callback: Function (sync or async) receiving the mirror as a dict
+        """
+        self._mirror_listeners.append(callback)
+
+    async def _handle_meeting_state_change(self, changes: Dict[str, Any]):
+        """
+        Apply a change event from the browser observer to the mirror.
+
+        Args:
+            changes: Changed in-meeting fields (muted, participant_count, ...)
+        """
+        if not self.meeting_mirror.apply(changes):
+            return
+
+        logger.debug(f"In-meeting state changed: {changes}")
+
+        handle_remote_end(changes, self._leave_ended_meeting)
+
+        mirror = self.meeting_mirror.to_dict()
+        for listener in self._mirror_listeners:
+            try:
+                result = listener(mirror)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Error in meeting state listener: {e}")
+
+    async def _leave_ended_meeting(self):
+        """Leave a meeting that was ended remotely (off the ended-meeting page)."""
+        async with self._state_lock:
+            if self.state != MeetingState.ACTIVE:
+                return
+            logger.info("Meeting ended remotely - leaving")
+            await self.leave_meeting()
+
+    async def _handle_browser_restart(self):
+        """Handle a restarted browser worker (any meeting in progress is gone)."""
+        generation = self.browser.restarts
+        logger.warning(f"Browser worker was restarted (state: {self.state})")
+
+        # Waits for a join that is still failing on the old worker
+        async with self._state_lock:
+            if self._meeting_generation >= generation:
+                # Joined on the new worker after the restart
+                return
+            self._reset_to_idle()
+
     async def _handle_join_leave_button(self):
         """
         Handle join/leave button press (toggle behavior).
@@ -206,9 +318,10 @@ class MeetingManager:
         # Store calendar event
         self.current_meeting_event = event
 
-        # Join using event details
+        # Join using event details (redirects resolved ahead of time if possible)
+        room_url = self.calendar.join_url(event) if self.calendar else event.bbb_url
         return await self.join_meeting(
-            room_url=event.bbb_url,
+            room_url=room_url,
             username=self.config.bbb.default_username,
             password=event.bbb_password or self.config.bbb.default_room_password,
         )
@@ -237,6 +350,8 @@ class MeetingManager:
         # Update state
         self.state = MeetingState.JOINING
         self.current_room_url = room_url or self.config.bbb.default_room_url
+        self._meeting_generation = getattr(self.browser, "restarts", 0)
+        self.meeting_mirror.reset()
 
         # Update LED to yellow (joining)
         if self.gpio:
@@ -315,14 +430,7 @@ class MeetingManager:
             await self.browser.leave_meeting()
 
             # Successfully left
-            self.state = MeetingState.IDLE
-            self.current_room_url = None
-            self.current_meeting_event = None
-            self.meeting_start_time = None
-
-            # Update LED to green (ready)
-            if self.gpio:
-                self.gpio.set_led_state(LEDState.GREEN)
+            self._reset_to_idle()
 
             logger.info("Successfully left meeting")
             return True
@@ -344,13 +452,19 @@ class MeetingManager:
 
         if self.state == MeetingState.ERROR:
             logger.info("Auto-resetting from error state to idle")
-            self.state = MeetingState.IDLE
-            self.current_room_url = None
-            self.current_meeting_event = None
-            self.meeting_start_time = None
+            self._reset_to_idle()
 
-            if self.gpio:
-                self.gpio.set_led_state(LEDState.GREEN)
+    def _reset_to_idle(self):
+        """Forget the current meeting and show ready."""
+        self.state = MeetingState.IDLE
+        self.current_room_url = None
+        self.current_meeting_event = None
+        self.meeting_start_time = None
+        self.meeting_mirror.reset()
+
+        # Update LED to green (ready)
+        if self.gpio:
+            self.gpio.set_led_state(LEDState.GREEN)
 
     def get_status(self) -> dict:
         """
@@ -379,6 +493,7 @@ class MeetingManager:
             }
 
         return {
+            "room": self.room.name if self.room else None,
             "state": self.state.value,
             "current_room": self.current_room_url,
             "meeting_duration": duration,
@@ -386,6 +501,15 @@ class MeetingManager:
             "led_state": self.gpio.current_led_state.value if self.gpio else None,
             "calendar": calendar_status,
             "current_meeting_event": meeting_event_info,
+            "meeting": self.meeting_mirror.to_dict(),
+            "browser_worker": {
+                "restarts": self.browser.restarts,
+                "last_heartbeat_ms": self.browser.last_heartbeat_ms,
+            } if isinstance(self.browser, BrowserWorkerClient) else None,
+            "join_recorder": (
+                self.browser.flight_recorder.get_stats()
+                if self.browser and self.browser.flight_recorder else None
+            ),
         }
 
     async def __aenter__(self):
@@ -0,0 +1,179 @@
+"""
+In-meeting state observer for BigBlueButton.
+
+Injects a small MutationObserver into the BBB client that watches the DOM
+for mute state, participant count and active speakers, and pushes compact
+change events back to Python through an exposed binding. The server side
+keeps a mirror of that state so LEDs and the web UI never have to poll
+selectors.
+"""
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+
+# Name of the function exposed to the page via Playwright
+OBSERVER_BINDING = "__raspberrymeetStateChanged"
+
+# Injected on every navigation (context.add_init_script). Only changed keys
+# are sent, and DOM mutations are coalesced into one read per 250 ms.
+OBSERVER_SCRIPT = """
+(() => {
+    if (window.__raspberrymeetObserver) {
+        return;
+    }
+    window.__raspberrymeetObserver = true;
+
+    const BINDING = "%(binding)s";
+    const FLUSH_DELAY_MS = 250;
+    let last = {};
+    let scheduled = false;
+
+    function readState() {
+        const q = (selector) => document.querySelector(selector);
+        let muted = null;
+        if (q("[data-test='unmuteMicButton']")) {
+            muted = true;
+        } else if (q("[data-test='muteMicButton']")) {
+            muted = false;
+        }
+
+        const participants = document.querySelectorAll(
+            "[data-test='userListItem'], [data-test='userListItemCurrent']"
+        ).length;
+
+        const talking = Array.from(
+            document.querySelectorAll("[data-test='isTalking']")
+        ).map((el) => (el.textContent || "").trim()).filter(Boolean).sort();
+
+        return {
+            in_meeting: !!q("[data-test='optionsButton']"),
+            ended: !!q("[data-test='meetingEndedModal'], [data-test='meetingEndedModalTitle']"),
+            muted: muted,
+            participant_count: participants > 0 ? participants : null,
+            talking: talking,
+        };
+    }
+
+    function flush() {
+        scheduled = false;
+        const current = readState();
+        const changes = {};
+        for (const key of Object.keys(current)) {
+            const a = JSON.stringify(current[key]);
+            const b = JSON.stringify(last[key]);
+            if (a !== b) {
+                changes[key] = current[key];
+            }
+        }
+        last = current;
+        if (Object.keys(changes).length > 0 && typeof window[BINDING] === "function") {
+            window[BINDING](changes);
+        }
+    }
+
+    function schedule() {
+        if (!scheduled) {
+            scheduled = true;
+            setTimeout(flush, FLUSH_DELAY_MS);
+        }
+    }
+
+    function start() {
+        new MutationObserver(schedule).observe(document.body, {
+            subtree: true,
+            childList: true,
+            attributes: true,
+            attributeFilter: ["data-test", "aria-pressed", "aria-label"],
+        });
+        schedule();
+    }
+
+    if (document.body) {
+        start();
+    } else {
+        document.addEventListener("DOMContentLoaded", start, { once: true });
+    }
+})();
+""" % {"binding": OBSERVER_BINDING}
+
+
+@dataclass
+class InMeetingState:
+    """Server-side mirror of the BBB client state reported by the observer."""
+
+    in_meeting: bool = False
+    ended: bool = False
+    muted: Optional[bool] = None
+    participant_count: Optional[int] = None
+    talking: List[str] = field(default_factory=list)
+    updated_at: Optional[datetime] = None
+
+    # Fields the observer is allowed to update
+    FIELDS = ("in_meeting", "ended", "muted", "participant_count", "talking")
+
+    def apply(self, changes: Dict[str, Any]) -> bool:
+        """
+        Apply a change event from the observer.
+
+        Args:
+            changes: Dictionary with changed fields only
+
+        Returns:
+            True if any mirrored field actually changed
+        """
+        changed = False
+        for key in self.FIELDS:
+            if key in changes and getattr(self, key) != changes[key]:
+                setattr(self, key, changes[key])
+                changed = True
+
+        if changed:
+            self.updated_at = datetime.now()
+        return changed
+
+    def reset(self) -> None:
+        """Forget all mirrored state (e.g. after leaving a meeting)."""
+        self.in_meeting = False
+        self.ended = False
+        self.muted = None
+        self.participant_count = None
+        self.talking = []
+        self.updated_at = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the mirror for status APIs and WebSocket clients."""
+        return {
+            "in_meeting": self.in_meeting,
+            "ended": self.ended,
+            "muted": self.muted,
+            "participant_count": self.participant_count,
+            "talking": list(self.talking),
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+
+def handle_remote_end(
+    changes: Dict[str, Any],
+    leave: Callable[[], Awaitable[Any]]
+) -> Optional[asyncio.Task]:
+    """
+    Leave the meeting if the observer reports it was ended remotely.
+
+    The meeting was ended by the moderator (or we were removed) and the
+    kiosk shows BBB's ended-meeting page; leave() takes it through the
+    normal leave path. It runs in its own task because change events are
+    delivered on the browser's event path, which must stay free while the
+    leave waits for the browser.
+
+    Args:
+        changes: Change event from the observer
+        leave: Coroutine function that leaves the meeting if one is active
+
+    Returns:
+        The leave task, or None if the meeting did not end
+    """
+    if not changes.get("ended"):
+        return None
+    return asyncio.create_task(leave())
@@ -0,0 +1,214 @@
+"""
+Process pool for bulk iCalendar parsing.
+
+A first sync or full resync of a large calendar parses hundreds of
+calendar objects at once, which keeps one core busy while the others idle.
+CalendarParsePool fans such bulk work out over worker processes: raw
+calendar data goes in, compact VEventFields records come back - no
+icalendar trees cross the process boundary. Recurring objects are handed
+back unparsed, because local expansion needs their component tree in the
+main process. Small batches (everyday incremental syncs) stay in-process.
+"""
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional
+
+try:
+    from icalendar import Calendar
+    ICALENDAR_AVAILABLE = True
+except ImportError:
+    ICALENDAR_AVAILABLE = False
+
+from src.orchestrator.ical_stream import (
+    UnsupportedICalendar,
+    VEventFields,
+    iter_vevents,
+    vevent_fields,
+)
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def parse_calendar_data(data: str) -> Optional[List[VEventFields]]:
+    """
+    Extract the VEVENT fields of a non-recurring calendar object.
+
+    Args:
+        data: iCalendar text
+
+    Returns:
+        VEventFields per VEVENT, or None if the object is recurring or
+        unreadable (the main process parses it itself)
+    """
+    try:
+        return list(iter_vevents(data))
+    except UnsupportedICalendar:
+        pass
+
+    if not ICALENDAR_AVAILABLE:
+        return None
+    try:
+        components = Calendar.from_ical(data).walk("VEVENT")
+    except Exception:
+        return None
+    if any(component.get("rrule") or component.get("rdate") for component in components):
+        return None
+    return [vevent_fields(component) for component in components]
+
+
+def parse_calendar_batch(datas: List[str]) -> List[Optional[List[VEventFields]]]:
+    """
+    Parse a batch of calendar objects (runs in a worker process).
+
+    Args:
+        datas: iCalendar texts
+
+    Returns:
+        Result of parse_calendar_data per object, in input order
+    """
+    return [parse_calendar_data(data) for data in datas]
+
+
+class CalendarParsePool:
+    """Parses large batches of calendar objects in worker processes."""
+
+    def __init__(self, workers: int = 0, threshold: int = 200, chunk_size: int = 32):
+        """
+        Initialize pool (worker processes are started on first use).
+
+        Args:
+            workers: Worker processes (0: CPU cores - 1; 1 disables the pool)
+            threshold: Minimum objects in a bulk parse to use the pool
+            chunk_size: Objects sent to a worker per task
+        """
+        self.workers = workers if workers > 0 else max(1, (os.cpu_count() or 1) - 1)
+        self.threshold = max(1, threshold)
+        self.chunk_size = max(1, chunk_size)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.batches = 0
+        self.objects = 0
+        self.fallbacks = 0
+        self.last_batch_ms: Optional[float] = None
+
+    @property
+    def enabled(self) -> bool:
+        """True if bulk parses are fanned out at all."""
+        return self.workers > 1
+
+    @property
+    def batch_size(self) -> int:
+        """Objects to collect before a pool parse, so every worker gets a chunk."""
+        return self.chunk_size * self.workers
+
+    def use_for(self, count: int) -> bool:
+        """
+        Decide whether a bulk parse goes to the pool.
+
+        Args:
+            count: Number of objects in the bulk operation
+
+        Returns:
+            True if the pool is enabled and count reaches the threshold
+        """
+        return self.enabled and count >= self.threshold
+
+    async def parse(self, datas: List[str]) -> List[Optional[List[VEventFields]]]:
+        """
+        Parse calendar objects in the worker processes.
+
+        Args:
+            datas: iCalendar texts
+
+        Returns:
+            VEventFields per object, or None for objects the main process
+            must parse (recurring, unreadable, or the worker failed)
+        """
+        if not datas:
+            return []
+
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        chunks = [datas[i:i + self.chunk_size] for i in range(0, len(datas), self.chunk_size)]
+
+        started = time.perf_counter()
+        try:
+            futures = [
+                loop.run_in_executor(executor, parse_calendar_batch, chunk) for chunk in chunks
+            ]
+        except Exception as e:
+            # Workers could not be started (or the pool broke between syncs)
+            logger.warning(f"Parse pool unavailable ({e}) - parsing in-process")
+            self._reset_executor()
+            self.fallbacks += len(datas)
+            return [None] * len(datas)
+
+        results = await asyncio.gather(*futures, return_exceptions=True)
+
+        records: List[Optional[List[VEventFields]]] = []
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, BaseException):
+                if isinstance(result, BrokenProcessPool):
+                    self._reset_executor()
+                logger.warning(
+                    f"Parse worker failed ({result!r}) - parsing {len(chunk)} object(s) in-process"
+                )
+                self.fallbacks += len(chunk)
+                records.extend([None] * len(chunk))
+            else:
+                records.extend(result)
+
+        self.batches += 1
+        self.objects += len(datas)
+        self.last_batch_ms = round((time.perf_counter() - started) * 1000, 1)
+        return records
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Start the worker processes on first use."""
+        with self._lock:
+            if self._executor is None:
+                # Never fork the orchestrator (threads, browser control): start
+                # workers from a clean server process
+                methods = multiprocessing.get_all_start_methods()
+                context = multiprocessing.get_context(
+                    "forkserver" if "forkserver" in methods else "spawn"
+                )
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+                logger.info(f"Started calendar parse pool with {self.workers} worker(s)")
+            return self._executor
+
+    def _reset_executor(self):
+        """Drop a broken executor; the next parse starts fresh workers."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dictionary with configuration and counters
+        """
+        return {
+            "workers": self.workers,
+            "threshold": self.threshold,
+            "running": self._executor is not None,
+            "batches": self.batches,
+            "objects": self.objects,
+            "fallbacks": self.fallbacks,
+            "last_batch_ms": self.last_batch_ms,
+        }
+
+    def shutdown(self):
+        """Stop the worker processes."""
+        self._reset_executor()
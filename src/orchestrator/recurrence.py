@@ -0,0 +1,307 @@
+"""
+Local expansion of recurring calendar events.
+
+Recurring objects are stored as master event plus overridden instances
+(RECURRENCE-ID). RecurrenceExpander evaluates the master's RRULE/RDATE/
+EXDATE with dateutil in the event's own time zone, replaces overridden
+instances and caches the occurrences per object ETag and day-aligned
+window, so an unchanged series is evaluated once a day instead of on every
+sync.
+"""
+import dataclasses
+import threading
+from collections import OrderedDict
+from datetime import datetime, time, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+try:
+    from dateutil.rrule import rruleset, rrulestr
+    DATEUTIL_AVAILABLE = True
+except ImportError:
+    DATEUTIL_AVAILABLE = False
+
+try:
+    import recurring_ical_events
+    RECURRING_ICAL_EVENTS_AVAILABLE = True
+except ImportError:
+    RECURRING_ICAL_EVENTS_AVAILABLE = False
+
+from src.orchestrator.event_store import StoredObject
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# Expansion windows are widened to whole UTC days so the cache survives
+# the sliding "now .. now + 24 h" sync window
+_WINDOW_ALIGNMENT = timedelta(days=1)
+# Extra wall-clock margin when searching rules (DST shifts, UTC offsets)
+_SEARCH_MARGIN = timedelta(days=1)
+
+
+class RecurrenceExpander:
+    """Expands recurring StoredObjects into occurrences, with an LRU cache."""
+
+    def __init__(
+        self,
+        parse_component: Callable[[Any], Optional[Any]],
+        max_entries: int = 1024
+    ):
+        """
+        Initialize expander.
+
+        Args:
+            parse_component: Parses a VEVENT into a MeetingEvent (fallback path)
+            max_entries: Maximum cached (object, ETag, window) expansions
+        """
+        self.parse_component = parse_component
+        self.max_entries = max(1, max_entries)
+        self._cache: "OrderedDict[Tuple, List[Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.fallbacks = 0
+
+    def expand(self, obj: StoredObject, start: datetime, end: datetime) -> List[Any]:
+        """
+        Get the occurrences of a recurring object overlapping a date range.
+
+        Args:
+            obj: Recurring stored object (master and overridden instances)
+            start: Start of date range
+            end: End of date range
+
+        Returns:
+            List of MeetingEvent objects, one per occurrence
+        """
+        window_start = _as_aware(start)
+        window_end = _as_aware(end)
+        aligned_start = _align_down(window_start)
+        aligned_end = _align_down(window_end) + _WINDOW_ALIGNMENT
+        etag = obj.etag if obj.etag is not None else hash(obj.data)
+        key = (obj.href, etag, aligned_start, aligned_end)
+
+        with self._lock:
+            occurrences = self._cache.get(key)
+            if occurrences is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+
+        if occurrences is None:
+            occurrences = self._expand_uncached(obj, aligned_start, aligned_end)
+            with self._lock:
+                self.misses += 1
+                self._cache[key] = occurrences
+                while len(self._cache) > self.max_entries:
+                    self._cache.popitem(last=False)
+
+        from_ts, to_ts = window_start.timestamp(), window_end.timestamp()
+        return [event for event in occurrences if event.start_ts < to_ts and event.end_ts > from_ts]
+
+    def clear(self):
+        """Drop all cached expansions."""
+        with self._lock:
+            self._cache.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with cache size, hits, misses and fallbacks
+        """
+        with self._lock:
+            return {
+                "cached": len(self._cache),
+                "hits": self.hits,
+                "misses": self.misses,
+                "fallbacks": self.fallbacks,
+            }
+
+    def _expand_uncached(self, obj: StoredObject, start: datetime, end: datetime) -> List[Any]:
+        """Expand with dateutil, falling back to recurring_ical_events."""
+        if DATEUTIL_AVAILABLE:
+            try:
+                return _expand_object(obj, start, end)
+            except Exception as e:
+                logger.debug(f"Local rule evaluation failed for {obj.href}: {e}")
+
+        if not RECURRING_ICAL_EVENTS_AVAILABLE:
+            logger.error(f"Cannot expand recurring event {obj.href}")
+            return []
+
+        with self._lock:
+            self.fallbacks += 1
+        try:
+            components = recurring_ical_events.of(obj.calendar).between(start, end)
+        except Exception as e:
+            logger.error(f"Failed to expand recurring event {obj.href}: {e}")
+            return []
+
+        occurrences = []
+        for component in components:
+            meeting_event = self.parse_component(component)
+            if meeting_event:
+                occurrences.append(meeting_event)
+        return occurrences
+
+
+def _expand_object(obj: StoredObject, start: datetime, end: datetime) -> List[Any]:
+    """
+    Expand all series of an object within an aware date range.
+
+    Args:
+        obj: Recurring stored object
+        start: Start of date range (aware)
+        end: End of date range (aware)
+
+    Returns:
+        List of MeetingEvent objects (occurrences and overrides), sorted by start
+    """
+    overrides = [event for event in obj.events if event.recurrence_id]
+    overridden: Set[Tuple[str, float]] = {
+        (event.uid, _instant(datetime.fromisoformat(event.recurrence_id)))
+        for event in overrides
+    }
+    masters = {event.uid: event for event in obj.events if not event.recurrence_id}
+
+    occurrences = []
+    excluded: Set[Tuple[str, float]] = set()
+    for component in obj.calendar.walk("VEVENT"):
+        if component.get("recurrence-id"):
+            continue
+        master = masters.get(str(component.get("uid", "")))
+        if master is None:
+            continue
+
+        # EXDATE also removes an overridden instance
+        excluded.update(
+            (master.uid, _instant(value)) for value in _date_values(component.get("exdate"))
+        )
+
+        duration = master.end_time - master.start_time
+        for occurrence in _occurrence_starts(component, start - duration, end):
+            if (master.uid, _instant(occurrence)) in overridden:
+                continue
+            occurrences.append(dataclasses.replace(
+                master,
+                start_time=occurrence,
+                end_time=occurrence + duration,
+                recurrence_id=occurrence.isoformat(),
+            ))
+
+    for event in overrides:
+        if (event.uid, _instant(datetime.fromisoformat(event.recurrence_id))) in excluded:
+            continue
+        if _as_aware(event.start_time) < end and _as_aware(event.end_time) > start:
+            occurrences.append(event)
+
+    occurrences.sort(key=lambda event: event.start_ts)
+    return occurrences
+
+
+def _occurrence_starts(component: Any, start: datetime, end: datetime) -> List[datetime]:
+    """
+    Evaluate RRULE, RDATE and EXDATE of a master VEVENT.
+
+    Rules are evaluated on wall-clock time in the event's time zone (so a
+    weekly 09:00 meeting stays at 09:00 across DST changes) and localized
+    afterwards.
+
+    Args:
+        component: Master VEVENT
+        start: Earliest occurrence start (aware)
+        end: Latest occurrence start, exclusive (aware)
+
+    Returns:
+        Occurrence start times, in the same form as the master's DTSTART
+    """
+    dtstart = component.get("dtstart").dt
+    if not isinstance(dtstart, datetime):
+        dtstart = datetime.combine(dtstart, time.min)
+    tz = dtstart.tzinfo
+    wall_start = dtstart.replace(tzinfo=None)
+
+    rules = rruleset()
+    rules.rdate(wall_start)
+    for recur in _as_list(component.get("rrule")):
+        rule = rrulestr(recur.to_ical().decode(), dtstart=wall_start, ignoretz=True)
+        until = recur.get("UNTIL")
+        if until and isinstance(until[0], datetime) and until[0].tzinfo is not None:
+            # UNTIL is given in UTC, the rule runs on wall-clock time
+            rule = rule.replace(until=_to_wall(until[0], tz, wall_start))
+        rules.rrule(rule)
+    for value in _date_values(component.get("rdate")):
+        rules.rdate(_to_wall(value, tz, wall_start))
+    for value in _date_values(component.get("exdate")):
+        rules.exdate(_to_wall(value, tz, wall_start))
+
+    search_start = _to_wall(start, tz, wall_start) - _SEARCH_MARGIN
+    search_end = _to_wall(end, tz, wall_start) + _SEARCH_MARGIN
+
+    occurrences = []
+    for wall in rules.between(search_start, search_end, inc=True):
+        occurrence = _localize(wall, tz)
+        if start <= _as_aware(occurrence) < end:
+            occurrences.append(occurrence)
+    return occurrences
+
+
+def _as_list(value: Any) -> List[Any]:
+    """Normalize a possibly repeated iCalendar property to a list."""
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _date_values(prop: Any) -> List[Any]:
+    """Dates of (possibly repeated) RDATE/EXDATE properties."""
+    values = []
+    for item in _as_list(prop):
+        for entry in item.dts:
+            value = entry.dt
+            # RDATE;VALUE=PERIOD: (start, end) or (start, duration)
+            values.append(value[0] if isinstance(value, tuple) else value)
+    return values
+
+
+def _to_wall(value: Any, tz: Any, reference: datetime) -> datetime:
+    """Convert a date or datetime to naive wall-clock time in the event's zone."""
+    if not isinstance(value, datetime):
+        return datetime.combine(value, reference.time())
+    if value.tzinfo is None:
+        return value
+    local = value.astimezone(tz) if tz is not None else value.astimezone()
+    return local.replace(tzinfo=None)
+
+
+def _localize(wall: datetime, tz: Any) -> datetime:
+    """Attach the event's time zone to a wall-clock time."""
+    if tz is None:
+        return wall
+    # pytz zones need localize() to pick the offset valid at that date
+    if hasattr(tz, "localize"):
+        return tz.localize(wall)
+    return wall.replace(tzinfo=tz)
+
+
+def _align_down(value: datetime) -> datetime:
+    """Round an aware datetime down to the start of its UTC day."""
+    utc = value.astimezone(timezone.utc)
+    return datetime.combine(utc.date(), time.min, tzinfo=timezone.utc)
+
+
+def _as_aware(value: Any) -> datetime:
+    """Interpret naive datetimes (and dates) as local time."""
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, time.min)
+    if value.tzinfo is None:
+        return value.astimezone()
+    return value
+
+
+def _instant(value: Any) -> float:
+    """Epoch seconds identifying an occurrence."""
+    return _as_aware(value).timestamp()
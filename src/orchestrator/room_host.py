@@ -0,0 +1,209 @@
+"""
+Multi-room hosting.
+
+Drives several meeting rooms from one host (e.g. an x86 mini-PC with one
+display per room): one Playwright driver and one Chromium process, one
+isolated browser context per room, and a MeetingManager per room with its
+own state machine, calendar scheduler and audio routing. Everything runs
+on the same asyncio event loop; CalDAV connections are pooled between rooms
+and one calendar notification receiver passes change notifications on to
+every room.
+"""
+import asyncio
+import re
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from playwright.async_api import Browser, Playwright, async_playwright
+
+from src.orchestrator.browser_controller import LAUNCH_ARGS
+from src.orchestrator.calendar_push import create_notification_receiver
+from src.orchestrator.calendar_sync import CalDAVConnectionPool
+from src.orchestrator.meeting_manager import MeetingManager
+from src.utils.config import AppConfig, RoomConfig
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+
+class SharedBrowser:
+    """One Playwright driver and one Chromium process shared by all rooms."""
+
+    def __init__(self, headless: bool = False):
+        """
+        Initialize shared browser.
+
+        Args:
+            headless: Run Chromium in headless mode (benchmarks/testing)
+        """
+        self.headless = headless
+        self.playwright: Optional[Playwright] = None
+        self.browser: Optional[Browser] = None
+
+    async def start(self) -> Browser:
+        """
+        Launch Chromium.
+
+        Returns:
+            Running Browser instance
+        """
+        if self.browser:
+            return self.browser
+
+        logger.info("Starting shared Chromium for multi-room mode...")
+        self.playwright = await async_playwright().start()
+        # No --kiosk here: each room fullscreens its own window on its display
+        self.browser = await self.playwright.chromium.launch(
+            headless=self.headless,
+            args=LAUNCH_ARGS,
+        )
+        logger.info("Shared Chromium started")
+        return self.browser
+
+    async def stop(self):
+        """Close Chromium and the Playwright driver."""
+        try:
+            if self.browser:
+                await self.browser.close()
+                self.browser = None
+            if self.playwright:
+                await self.playwright.stop()
+                self.playwright = None
+        except Exception as e:
+            logger.error(f"Error stopping shared browser: {e}")
+
+
+class RoomHost:
+    """
+    Runs one MeetingManager per configured room on a single host.
+
+    Rooms are independent: a failing room does not stop the others.
+    """
+
+    def __init__(self, config: AppConfig, rooms: Optional[List[RoomConfig]] = None):
+        """
+        Initialize room host.
+
+        Args:
+            config: Application configuration (shared settings)
+            rooms: Rooms to host (defaults to config.rooms)
+        """
+        self.config = config
+        self.rooms = rooms if rooms is not None else config.rooms
+
+        self.shared_browser = SharedBrowser()
+        self.caldav_pool = CalDAVConnectionPool()
+        # One port for all rooms; /api/calendar/notify forwards to it
+        self.notification_receiver = create_notification_receiver(config.caldav)
+        self.managers: Dict[str, MeetingManager] = {}
+
+    def _room_app_config(self, room: RoomConfig) -> AppConfig:
+        """Derive a per-room AppConfig from the shared configuration."""
+        bbb = self.config.bbb.model_copy(update={
+            "default_room_url": room.room_url,
+            "default_room_password": room.password,
+            "default_username": room.username or self.config.bbb.default_username,
+        })
+
+        # Without its own calendar a room would auto-join every room's meetings
+        caldav = self.config.caldav.model_copy(update={
+            "enabled": self.config.caldav.enabled and bool(room.calendar_name),
+            "calendar_name": room.calendar_name or self.config.caldav.calendar_name,
+            # Shared extra calendars would make every room join the same meetings
+            "sources": room.calendar_sources,
+        })
+
+        # One event store file per room
+        if caldav.event_store_path:
+            store = Path(caldav.event_store_path)
+            suffix = re.sub(r"[^A-Za-z0-9_-]+", "_", room.name)
+            caldav = caldav.model_copy(update={
+                "event_store_path": str(store.with_name(f"{store.stem}-{suffix}{store.suffix}")),
+            })
+
+        return self.config.model_copy(update={"bbb": bbb, "caldav": caldav})
+
+    async def start(self):
+        """Launch the shared browser and start all rooms concurrently."""
+        if not self.rooms:
+            raise RuntimeError("No rooms configured for multi-room mode")
+
+        logger.info(f"Starting multi-room host with {len(self.rooms)} room(s)")
+        browser = await self.shared_browser.start()
+
+        if self.notification_receiver:
+            try:
+                await self.notification_receiver.start()
+            except OSError as e:
+                logger.error(f"Cannot start calendar notification receiver: {e}")
+                self.notification_receiver = None
+
+        for room in self.rooms:
+            if room.name in self.managers:
+                logger.error(f"Duplicate room name '{room.name}' - skipping")
+                continue
+            self.managers[room.name] = MeetingManager(
+                self._room_app_config(room),
+                room=room,
+                shared_browser=browser,
+                caldav_pool=self.caldav_pool,
+                notification_receiver=self.notification_receiver,
+            )
+
+        results = await asyncio.gather(
+            *(manager.start() for manager in self.managers.values()),
+            return_exceptions=True,
+        )
+
+        for name, result in zip(list(self.managers), results):
+            if isinstance(result, Exception):
+                logger.error(f"Room '{name}' failed to start: {result}")
+
+        logger.info("Multi-room host started")
+
+    async def stop(self):
+        """Stop all rooms, then the shared browser."""
+        logger.info("Stopping multi-room host...")
+
+        await asyncio.gather(
+            *(manager.stop() for manager in self.managers.values()),
+            return_exceptions=True,
+        )
+        self.managers.clear()
+
+        if self.notification_receiver:
+            await self.notification_receiver.stop()
+        await self.shared_browser.stop()
+        await self.caldav_pool.close()
+        logger.info("Multi-room host stopped")
+
+    def get_manager(self, room_name: str) -> Optional[MeetingManager]:
+        """
+        Get the meeting manager of a room.
+
+        Args:
+            room_name: Room name from the rooms configuration
+
+        Returns:
+            MeetingManager or None if the room is unknown
+        """
+        return self.managers.get(room_name)
+
+    def get_status(self) -> Dict[str, dict]:
+        """
+        Get status of all rooms.
+
+        Returns:
+            Dictionary of room name -> MeetingManager status
+        """
+        return {name: manager.get_status() for name, manager in self.managers.items()}
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.stop()
@@ -0,0 +1,220 @@
+"""
+Live kiosk preview via the Chrome DevTools Protocol screencast.
+
+Uses ``Page.startScreencast`` so Chromium encodes JPEG frames itself, and
+throttles at the source: each frame is acknowledged only when the next
+frame is due, so Chromium never renders or encodes frames nobody will see.
+Frames are handed to viewers as the base64 string CDP delivers, without
+decoding, re-encoding or copying. The screencast only runs while at least
+one viewer is connected.
+"""
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from playwright.async_api import CDPSession, Page
+
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+
+# Viewer callback: receives one base64-encoded JPEG frame
+FrameCallback = Callable[[str], Awaitable[None]]
+
+
+class KioskScreencast:
+    """
+    Reference-counted CDP screencast of the kiosk page.
+
+    The first viewer starts the screencast, the last one leaving stops it.
+    Slow viewers drop frames instead of queueing them.
+    """
+
+    def __init__(
+        self,
+        max_fps: float = 2.0,
+        jpeg_quality: int = 50,
+        max_width: int = 640,
+        max_height: int = 360,
+    ):
+        """
+        Initialize screencast.
+
+        Args:
+            max_fps: Maximum frames per second delivered to viewers
+            jpeg_quality: JPEG quality (0-100) used by Chromium
+            max_width: Maximum frame width in pixels
+            max_height: Maximum frame height in pixels
+        """
+        self.max_fps = max(0.1, max_fps)
+        self.jpeg_quality = max(0, min(100, jpeg_quality))
+        self.max_width = max_width
+        self.max_height = max_height
+
+        self._page: Optional[Page] = None
+        self._session: Optional[CDPSession] = None
+        self._viewers: Dict[FrameCallback, Optional[asyncio.Task]] = {}
+        self._last_frame_at = 0.0
+        self._lock = asyncio.Lock()
+
+        # Statistics
+        self.frames_received = 0
+        self.frames_sent = 0
+        self.frames_dropped = 0
+        self.bytes_sent = 0
+
+    @property
+    def is_active(self) -> bool:
+        """True while the screencast is running."""
+        return self._session is not None
+
+    @property
+    def viewer_count(self) -> int:
+        """Number of connected viewers."""
+        return len(self._viewers)
+
+    async def add_viewer(self, page: Page, callback: FrameCallback) -> None:
+        """
+        Register a viewer and start the screencast if it is the first one.
+
+        Args:
+            page: Page to capture
+            callback: Async function receiving base64 JPEG frames
+        """
+        async with self._lock:
+            self._viewers[callback] = None
+
+            # Page was replaced (e.g. after leaving a meeting) - restart
+            if self._session and self._page is not page:
+                await self._stop()
+
+            if not self._session:
+                await self._start(page)
+
+    async def remove_viewer(self, callback: FrameCallback) -> None:
+        """
+        Unregister a viewer and stop the screencast if none are left.
+
+        Args:
+            callback: Callback previously passed to add_viewer()
+        """
+        async with self._lock:
+            task = self._viewers.pop(callback, None)
+            if task and not task.done():
+                task.cancel()
+
+            if not self._viewers:
+                await self._stop()
+
+    async def stop(self) -> None:
+        """Stop the screencast and drop all viewers."""
+        async with self._lock:
+            for task in self._viewers.values():
+                if task and not task.done():
+                    task.cancel()
+            self._viewers.clear()
+            await self._stop()
+
+    async def _start(self, page: Page) -> None:
+        """Open a CDP session and start the screencast."""
+        self._page = page
+        self._session = await page.context.new_cdp_session(page)
+        self._session.on("Page.screencastFrame", self._on_frame)
+        self._last_frame_at = 0.0
+
+        await self._session.send("Page.startScreencast", {
+            "format": "jpeg",
+            "quality": self.jpeg_quality,
+            "maxWidth": self.max_width,
+            "maxHeight": self.max_height,
+        })
+        logger.info(
+            f"Screencast started ({self.max_fps} fps max, "
+            f"quality {self.jpeg_quality}, {self.max_width}x{self.max_height})"
+        )
+
+    async def _stop(self) -> None:
+        """Stop the screencast and detach the CDP session."""
+        session = self._session
+        self._session = None
+        self._page = None
+
+        if not session:
+            return
+
+        try:
+            await session.send("Page.stopScreencast")
+            await session.detach()
+        except Exception as e:
+            logger.debug(f"Error stopping screencast (page closed?): {e}")
+
+        logger.info("Screencast stopped")
+
+    def _on_frame(self, params: Dict[str, Any]) -> None:
+        """Handle a frame from Chromium: fan out, then ack when the next is due."""
+        session = self._session
+        if not session:
+            return
+
+        self.frames_received += 1
+        data: str = params["data"]
+
+        for callback, task in self._viewers.items():
+            if task and not task.done():
+                # Viewer is still sending the previous frame
+                self.frames_dropped += 1
+                continue
+            self._viewers[callback] = asyncio.create_task(self._deliver(callback, data))
+
+        # Delay the ack: Chromium won't produce the next frame before it
+        now = time.monotonic()
+        delay = max(0.0, self._last_frame_at + 1.0 / self.max_fps - now)
+        self._last_frame_at = now + delay
+
+        loop = asyncio.get_running_loop()
+        loop.call_later(delay, self._ack, session, params["sessionId"])
+
+    def _ack(self, session: CDPSession, frame_session_id: int) -> None:
+        """Acknowledge a frame so Chromium sends the next one."""
+        if session is not self._session:
+            return
+
+        asyncio.create_task(self._send_ack(session, frame_session_id))
+
+    async def _send_ack(self, session: CDPSession, frame_session_id: int) -> None:
+        """Send the screencast frame ack."""
+        try:
+            await session.send("Page.screencastFrameAck", {"sessionId": frame_session_id})
+        except Exception as e:
+            logger.debug(f"Failed to ack screencast frame: {e}")
+
+    async def _deliver(self, callback: FrameCallback, data: str) -> None:
+        """Send one frame to one viewer."""
+        try:
+            await callback(data)
+            self.frames_sent += 1
+            self.bytes_sent += len(data)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug(f"Failed to deliver screencast frame: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get screencast statistics.
+
+        Returns:
+            Dictionary with frame counters and viewer count
+        """
+        return {
+            "active": self.is_active,
+            "viewers": self.viewer_count,
+            "max_fps": self.max_fps,
+            "jpeg_quality": self.jpeg_quality,
+            "frames_received": self.frames_received,
+            "frames_sent": self.frames_sent,
+            "frames_dropped": self.frames_dropped,
+            "bytes_sent": self.bytes_sent,
+        }
@@ -0,0 +1,186 @@
+"""
+Adaptive calendar sync policy for RaspberryMeet.
+
+A fixed sync interval polls the CalDAV server at 3 a.m. as often as five
+minutes before a meeting, and a fleet of devices that booted together
+after a site power cycle keeps syncing in lockstep. AdaptiveSyncPolicy
+syncs at the base interval while the calendar changes, backs off
+exponentially while it stays quiet, shortens the interval in proportion to
+the time left until the next meeting, and spreads every interval with
+random jitter.
+While change notifications arrive (WebDAV-Push, long-poll, webhooks),
+polling drops to a slow fallback interval. It also keeps a rolling 24-hour count of syncs and CalDAV requests.
+"""
+import math
+import random
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_DAY_SECONDS = 24 * 3600
+
+
+class AdaptiveSyncPolicy:
+    """Decides when the next calendar sync runs."""
+
+    def __init__(
+        self,
+        base_interval: float = 300.0,
+        min_interval: float = 60.0,
+        max_interval: float = 1800.0,
+        lead_fraction: float = 0.1,
+        push_interval: float = 1800.0,
+        backoff_factor: float = 2.0,
+        jitter: float = 0.2,
+        adaptive: bool = True,
+        rng: Optional[random.Random] = None
+    ):
+        """
+        Initialize policy.
+
+        Args:
+            base_interval: Seconds between syncs while the calendar changes
+            min_interval: Seconds between syncs shortly before a meeting
+            max_interval: Upper bound of the backed-off interval in seconds
+            lead_fraction: Cap on the interval as a fraction of the time left
+                until the next meeting (0.1: every 6 minutes one hour before)
+            push_interval: Fallback interval in seconds while change notifications work
+            backoff_factor: Interval growth per sync without changes
+            jitter: Random spread of each interval (0.2: +-20 %)
+            adaptive: False keeps the base interval (jitter still applies)
+            rng: Random generator (for reproducible simulations)
+        """
+        self.base_interval = base_interval
+        self.min_interval = min(min_interval, base_interval)
+        self.max_interval = max(max_interval, base_interval)
+        self.lead_fraction = lead_fraction
+        self.push_interval = max(push_interval, base_interval)
+        self.backoff_factor = max(1.0, backoff_factor)
+        self.jitter = min(max(jitter, 0.0), 0.5)
+        self.adaptive = adaptive
+        self._rng = rng or random.Random()
+
+        # Syncs in a row without calendar changes, counted only up to the
+        # point where the backed-off interval reaches max_interval
+        self.quiet_syncs = 0
+        self.max_quiet_syncs = (
+            math.ceil(math.log(self.max_interval / base_interval, self.backoff_factor))
+            if self.backoff_factor > 1.0 and base_interval > 0 else 0
+        )
+        self.last_interval: Optional[float] = None
+        self.next_sync: Optional[datetime] = None
+        self.push_active = False
+        self._history: Deque[Tuple[float, int]] = deque()
+
+    def startup_delay(self, max_delay: float) -> float:
+        """
+        Random delay for the first sync, so devices that booted together spread out.
+
+        Args:
+            max_delay: Upper bound in seconds
+
+        Returns:
+            Delay in seconds
+        """
+        return self._rng.uniform(0.0, max_delay) if max_delay > 0 else 0.0
+
+    def next_interval(
+        self,
+        changed: bool,
+        next_meeting: Optional[datetime] = None,
+        now: Optional[datetime] = None,
+        push_active: bool = False
+    ) -> float:
+        """
+        Compute the delay until the next sync.
+
+        Args:
+            changed: True if the last sync changed the calendar
+            next_meeting: Start of the next meeting to join (None: none known)
+            now: Current time (default: datetime.now())
+            push_active: True if change notifications trigger syncs
+
+        Returns:
+            Seconds until the next sync
+        """
+        now = now or datetime.now()
+        self.push_active = push_active
+        if push_active:
+            # Notifications bring changes in; polling only catches lost ones
+            interval = self.push_interval
+        elif not self.adaptive:
+            interval = self.base_interval
+        else:
+            self.quiet_syncs = 0 if changed else min(self.quiet_syncs + 1, self.max_quiet_syncs)
+            interval = min(
+                self.base_interval * self.backoff_factor ** self.quiet_syncs,
+                self.max_interval,
+            )
+
+            if next_meeting is not None:
+                # Sync more often the closer the meeting gets
+                until_meeting = (next_meeting - now).total_seconds()
+                interval = min(interval, max(until_meeting * self.lead_fraction, self.min_interval))
+
+        if self.jitter:
+            interval *= self._rng.uniform(1.0 - self.jitter, 1.0 + self.jitter)
+
+        self.last_interval = interval
+        self.next_sync = now + timedelta(seconds=interval)
+        return interval
+
+    def record_sync(self, requests: int, timestamp: Optional[float] = None):
+        """
+        Count a sync and the CalDAV requests it made.
+
+        Args:
+            requests: Requests sent during the sync
+            timestamp: Wall-clock time of the sync (default: now)
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        self._history.append((timestamp, requests))
+        self._prune(timestamp)
+
+    def _prune(self, now: float):
+        """Drop history older than 24 hours."""
+        while self._history and self._history[0][0] <= now - _DAY_SECONDS:
+            self._history.popleft()
+
+    def daily_counts(self, now: Optional[float] = None) -> Tuple[int, int]:
+        """
+        Get syncs and requests of the last 24 hours.
+
+        Args:
+            now: Wall-clock time (default: now)
+
+        Returns:
+            Tuple of (syncs, requests)
+        """
+        self._prune(time.time() if now is None else now)
+        return len(self._history), sum(requests for _, requests in self._history)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get policy statistics.
+
+        Returns:
+            Dictionary with the current interval and 24-hour counts
+        """
+        syncs, requests = self.daily_counts()
+        return {
+            "mode": "adaptive" if self.adaptive else "fixed",
+            "base_interval_seconds": self.base_interval,
+            "last_interval_seconds": round(self.last_interval, 1) if self.last_interval else None,
+            "next_sync": self.next_sync.isoformat() if self.next_sync else None,
+            "quiet_syncs": self.quiet_syncs,
+            "push_active": self.push_active,
+            "syncs_last_24h": syncs,
+            "requests_last_24h": requests,
+            # What the plain fixed interval would cost, for comparison
+            "fixed_syncs_per_day": round(_DAY_SECONDS / self.base_interval),
+        }
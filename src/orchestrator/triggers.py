@@ -0,0 +1,252 @@
+"""
+Lightweight timers for RaspberryMeet.
+
+TriggerScheduler runs callbacks at a wall-clock time or at a fixed interval
+directly on the asyncio event loop, replacing APScheduler for the calendar
+scheduler. Jobs sit in a heap ordered by due time and only the earliest one
+holds an event loop timer, so the loop sleeps until the next job is due.
+Long sleeps are cut into pieces of at most max_sleep seconds and re-checked
+against the wall clock: a clock that jumps (NTP setting the time after boot
+on a Pi without RTC) delays a job by at most one piece. Every one-shot job
+records how late it fired compared to its scheduled time.
+"""
+import asyncio
+import heapq
+import inspect
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class _Job:
+    """A scheduled callback."""
+
+    id: str
+    when: datetime
+    at: float  # due time as Unix timestamp
+    callback: Callable[..., Any]
+    args: tuple
+    interval: Optional[float] = None
+    catch_up: bool = False  # time was already due when scheduled
+    cancelled: bool = False
+
+
+class TriggerScheduler:
+    """One-shot and interval timers on the asyncio event loop."""
+
+    def __init__(self, max_sleep: float = 600.0, history: int = 100):
+        """
+        Initialize scheduler.
+
+        Args:
+            max_sleep: Longest single sleep in seconds before the wall clock is checked again
+            history: Number of recent one-shot jobs kept for accuracy statistics
+        """
+        self.max_sleep = max_sleep
+        self._jobs: Dict[str, _Job] = {}
+        self._heap: List[Tuple[float, int, _Job]] = []
+        self._seq = 0
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._handle_at: Optional[float] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+        # Statistics
+        self.fired = 0
+        self.catch_up = 0
+        self.wakeups = 0
+        self._lateness: Deque[float] = deque(maxlen=history)
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._jobs
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def call_at(self, job_id: str, when: datetime, callback: Callable[..., Any], *args):
+        """
+        Run a callback once at a wall-clock time.
+
+        A job with the same ID is replaced. Times in the past run right away.
+
+        Args:
+            job_id: Job identifier
+            when: Naive local or timezone-aware time
+            callback: Function or coroutine function
+            *args: Arguments for the callback
+        """
+        at = when.timestamp()
+        self._add(_Job(job_id, when, at, callback, args, catch_up=at <= time.time()))
+
+    def call_later(self, job_id: str, seconds: float, callback: Callable[..., Any], *args):
+        """
+        Run a callback once after a delay.
+
+        Args:
+            job_id: Job identifier (replaces a job with the same ID)
+            seconds: Delay in seconds
+            callback: Function or coroutine function
+            *args: Arguments for the callback
+        """
+        self.call_at(job_id, datetime.now() + timedelta(seconds=seconds), callback, *args)
+
+    def call_every(self, job_id: str, seconds: float, callback: Callable[..., Any], *args):
+        """
+        Run a callback repeatedly, first after one interval.
+
+        Args:
+            job_id: Job identifier (replaces a job with the same ID)
+            seconds: Interval in seconds
+            callback: Function or coroutine function
+            *args: Arguments for the callback
+        """
+        when = datetime.now() + timedelta(seconds=seconds)
+        self._add(_Job(job_id, when, when.timestamp(), callback, args, interval=seconds))
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a job.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            True if the job existed
+        """
+        job = self._jobs.pop(job_id, None)
+        if job is None:
+            return False
+        # Left in the heap and skipped when it comes up
+        job.cancelled = True
+        return True
+
+    def next_run(self, job_id: str) -> Optional[datetime]:
+        """
+        Get the scheduled time of a job.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Scheduled time, or None if there is no such job
+        """
+        job = self._jobs.get(job_id)
+        return job.when if job else None
+
+    def shutdown(self):
+        """Cancel all jobs and running callbacks."""
+        for job in self._jobs.values():
+            job.cancelled = True
+        self._jobs.clear()
+        self._heap.clear()
+        if self._handle:
+            self._handle.cancel()
+            self._handle = self._handle_at = None
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+
+    def _add(self, job: _Job):
+        """Insert a job and wake up earlier if it is the next one due."""
+        self.cancel(job.id)
+        self._jobs[job.id] = job
+        self._push(job)
+        self._arm()
+
+    def _push(self, job: _Job):
+        """Put a job on the heap."""
+        self._seq += 1
+        heapq.heappush(self._heap, (job.at, self._seq, job))
+        if len(self._heap) > 2 * len(self._jobs) + 64:
+            # Many rescheduled jobs: drop the cancelled entries
+            self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+            heapq.heapify(self._heap)
+
+    def _arm(self):
+        """Sleep until the earliest job is due, at most max_sleep seconds."""
+        while self._heap and self._heap[0][2].cancelled:
+            heapq.heappop(self._heap)
+        if not self._heap:
+            if self._handle:
+                self._handle.cancel()
+                self._handle = self._handle_at = None
+            return
+
+        now = time.time()
+        wake_at = min(self._heap[0][0], now + self.max_sleep)
+        if self._handle and self._handle_at <= wake_at:
+            return
+        if self._handle:
+            self._handle.cancel()
+        self._handle_at = wake_at
+        self._handle = asyncio.get_running_loop().call_later(max(wake_at - now, 0.0), self._wake)
+
+    def _wake(self):
+        """Run all due jobs and sleep again."""
+        self._handle = self._handle_at = None
+        self.wakeups += 1
+        now = time.time()
+        while self._heap and self._heap[0][0] <= now:
+            _, _, job = heapq.heappop(self._heap)
+            if not job.cancelled:
+                self._fire(job, now)
+        self._arm()
+
+    def _fire(self, job: _Job, now: float):
+        """Run a due job."""
+        if job.interval:
+            job.at = max(job.at + job.interval, now)
+            job.when = datetime.fromtimestamp(job.at)
+            self._push(job)
+        else:
+            self._jobs.pop(job.id, None)
+            self.fired += 1
+            if job.catch_up:
+                self.catch_up += 1
+            else:
+                self._lateness.append(now - job.at)
+
+        try:
+            result = job.callback(*job.args)
+        except Exception as e:
+            logger.error(f"Timer '{job.id}' failed: {e}", exc_info=True)
+            return
+        if inspect.isawaitable(result):
+            task = asyncio.ensure_future(result)
+            self._tasks.add(task)
+            task.add_done_callback(lambda done: self._task_done(job.id, done))
+
+    def _task_done(self, job_id: str, task: asyncio.Task):
+        """Log failures of coroutine callbacks."""
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.error(f"Timer '{job_id}' failed: {task.exception()}", exc_info=task.exception())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get timer statistics.
+
+        Returns:
+            Dictionary with job counts, wakeups and firing accuracy
+        """
+        lateness = sorted(self._lateness)
+        next_wakeup = datetime.fromtimestamp(self._handle_at).isoformat() if self._handle_at else None
+        return {
+            "jobs": len(self._jobs),
+            "next_wakeup": next_wakeup,
+            "fired": self.fired,
+            "catch_up": self.catch_up,
+            "wakeups": self.wakeups,
+            "lateness_ms": {
+                "samples": len(lateness),
+                "mean": round(sum(lateness) / len(lateness) * 1000, 1),
+                "p95": round(lateness[min(len(lateness) - 1, int(len(lateness) * 0.95))] * 1000, 1),
+                "max": round(lateness[-1] * 1000, 1),
+            } if lateness else None,
+        }
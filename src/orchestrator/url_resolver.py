@@ -0,0 +1,246 @@
+"""
+Meeting URL resolver for RaspberryMeet.
+
+Organisers often paste links that redirect before they reach the room:
+friendly Greenlight aliases, link shorteners, SSO bounce URLs. Every hop
+costs a round trip while the browser is joining. MeetingURLResolver
+follows the redirects of newly synced meeting URLs in the background over
+pooled connections and caches the final URL, so the join opens the room
+directly. Failed lookups are cached for a shorter time, so a dead
+shortener is not retried on every sync.
+
+Signed BigBlueButton API join links are never requested: opening one joins
+the meeting. A redirect chain that leads to such a link stops in front of
+it, and a chain that ends outside a meeting room (an SSO login page) keeps
+the original URL, so the browser runs the login flow itself.
+"""
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional
+from urllib.parse import urljoin, urlsplit
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+from src.orchestrator.meeting_links import extract_meeting_links
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_REDIRECT_STATUS = {301, 302, 303, 307, 308}
+
+
+def is_api_join_url(url: str) -> bool:
+    """
+    Check for a signed BigBlueButton API join link.
+
+    Args:
+        url: Meeting URL
+
+    Returns:
+        True if requesting the URL would join the meeting
+    """
+    return "/bigbluebutton/api/join" in url.lower()
+
+
+def _is_room_url(url: str) -> bool:
+    """Check whether a redirect target is a meeting room (query ignored)."""
+    if is_api_join_url(url):
+        return True
+    parts = urlsplit(url)
+    return extract_meeting_links("", f"{parts.scheme}://{parts.netloc}{parts.path}").best is not None
+
+
+@dataclass
+class _CacheEntry:
+    """Resolved URL (None: lookup failed) and its expiry (monotonic time)."""
+
+    url: Optional[str]
+    expires: float
+
+
+class MeetingURLResolver:
+    """Follows meeting URL redirects ahead of the join and caches the result."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = 3600.0,
+        negative_ttl_seconds: float = 300.0,
+        max_redirects: int = 5,
+        timeout: float = 10.0,
+        max_connections: int = 4,
+        verify: bool = True
+    ):
+        """
+        Initialize resolver.
+
+        Args:
+            ttl_seconds: Seconds a resolved URL is reused
+            negative_ttl_seconds: Seconds before a failed URL is tried again
+            max_redirects: Maximum redirect hops followed per URL
+            timeout: Timeout in seconds per request
+            max_connections: Connection pool size
+            verify: Verify TLS certificates
+        """
+        if not HTTPX_AVAILABLE:
+            raise RuntimeError("httpx is not installed")
+
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_redirects = max_redirects
+        self._client = httpx.AsyncClient(
+            verify=verify,
+            timeout=httpx.Timeout(timeout, connect=min(timeout, 5.0)),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            follow_redirects=False,
+        )
+        self._cache: Dict[str, _CacheEntry] = {}
+        self._pending: Dict[str, asyncio.Task] = {}
+
+        # Statistics
+        self.lookups = 0
+        self.hits = 0
+        self.resolved = 0
+        self.rewritten = 0
+        self.failures = 0
+        self.hops = 0
+
+    def lookup(self, url: str) -> str:
+        """
+        Get the URL to open at join time (never blocks on the network).
+
+        Args:
+            url: Meeting URL from the calendar
+
+        Returns:
+            Cached final URL, or url itself if it is not resolved (yet)
+        """
+        self.lookups += 1
+        entry = self._cache.get(url)
+        if entry and entry.url and entry.expires > time.monotonic():
+            self.hits += 1
+            return entry.url
+        return url
+
+    def prefetch(self, urls: Iterable[str], min_ttl: float = 0.0) -> int:
+        """
+        Resolve URLs without a fresh cache entry in background tasks.
+
+        Args:
+            urls: Meeting URLs
+            min_ttl: Also resolve again if the cache entry expires within this many seconds
+
+        Returns:
+            Number of lookups started
+        """
+        now = time.monotonic()
+        for cached_url in [u for u, entry in self._cache.items() if entry.expires <= now]:
+            del self._cache[cached_url]
+
+        started = 0
+        for url in set(urls):
+            if not url or url in self._pending or is_api_join_url(url):
+                continue
+            entry = self._cache.get(url)
+            if entry and entry.expires > now + min_ttl:
+                continue
+            task = asyncio.create_task(self.resolve(url), name=f"resolve-url:{url}")
+            self._pending[url] = task
+            task.add_done_callback(lambda _, url=url: self._pending.pop(url, None))
+            started += 1
+        return started
+
+    async def resolve(self, url: str) -> str:
+        """
+        Follow the redirects of a URL and cache the final URL.
+
+        Args:
+            url: Meeting URL
+
+        Returns:
+            Final URL (url itself if it does not redirect or the lookup failed)
+        """
+        if is_api_join_url(url):
+            return url
+
+        try:
+            final = await self._follow(url)
+        except Exception as e:
+            self.failures += 1
+            self._cache[url] = _CacheEntry(None, time.monotonic() + self.negative_ttl_seconds)
+            logger.debug(f"Could not resolve meeting URL {url}: {e}")
+            return url
+
+        if final != url and not _is_room_url(final):
+            # Redirected to something that is not a room (SSO login page)
+            logger.debug(f"Meeting URL {url} leads to {final} - keeping original")
+            final = url
+
+        self.resolved += 1
+        if final != url:
+            self.rewritten += 1
+            logger.info(f"Resolved meeting URL {url} -> {final}")
+        self._cache[url] = _CacheEntry(final, time.monotonic() + self.ttl_seconds)
+        return final
+
+    async def _follow(self, url: str) -> str:
+        """Follow redirects hop by hop, stopping in front of API join links."""
+        current = url
+        for _ in range(self.max_redirects):
+            # Only the status line and headers are read, never the page body
+            request = self._client.build_request("GET", current)
+            response = await self._client.send(request, stream=True)
+            await response.aclose()
+
+            location = response.headers.get("location")
+            if response.status_code not in _REDIRECT_STATUS or not location:
+                if response.status_code >= 400:
+                    raise RuntimeError(f"HTTP {response.status_code}")
+                return current
+
+            self.hops += 1
+            current = urljoin(current, location)
+            if is_api_join_url(current):
+                return current
+        raise RuntimeError(f"More than {self.max_redirects} redirects")
+
+    def invalidate(self, url: str):
+        """
+        Forget the cached result of a URL.
+
+        Args:
+            url: Meeting URL
+        """
+        self._cache.pop(url, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get resolver statistics.
+
+        Returns:
+            Dictionary with cache size and counters
+        """
+        return {
+            "cached": len(self._cache),
+            "pending": len(self._pending),
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "resolved": self.resolved,
+            "rewritten": self.rewritten,
+            "failures": self.failures,
+            "redirect_hops": self.hops,
+        }
+
+    async def close(self):
+        """Cancel pending lookups and close the connection pool."""
+        for task in list(self._pending.values()):
+            task.cancel()
+        self._pending.clear()
+        await self._client.aclose()
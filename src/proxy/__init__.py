@@ -0,0 +1,3 @@
+"""
+Fleet calendar proxy for RaspberryMeet
+"""
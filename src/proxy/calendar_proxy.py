@@ -0,0 +1,455 @@
+"""
+Fleet calendar proxy.
+
+Runs on a central host for installations with many RaspberryMeet devices.
+Instead of every device polling the CalDAV server, the proxy syncs each
+upstream calendar once (incrementally, with persistent event stores) and
+serves every room a compact JSON schedule:
+
+- GET /rooms/<room>/schedule: the room's events within the horizon, gzipped,
+  with an ETag. If-None-Match answers 304 while nothing changed; with
+  ?wait=<seconds> the request is held until the schedule changes.
+- GET /rooms/<room>/changes: the same long-poll with a tiny body, for the
+  devices' change notification watcher.
+- GET /health: sync and request statistics.
+
+Calendars shared by several rooms are synced once. Devices fall back to
+direct CalDAV when the proxy does not answer (see FleetProxyClient).
+"""
+import asyncio
+import gzip
+import hashlib
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from email.utils import formatdate
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from src.orchestrator.calendar_federation import CalendarFederation, create_calendar_federation
+from src.orchestrator.calendar_push import TOKEN_HEADER, token_matches
+from src.orchestrator.calendar_sync import MeetingEvent
+from src.orchestrator.event_store import EventStore, SQLiteEventStore
+from src.orchestrator.fleet_proxy import event_to_dict
+from src.utils.config import AppConfig, CalendarSourceConfig
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_ROOM_PATH = re.compile(r"^/rooms/([^/]+)/(schedule|changes)/?$")
+_REASONS = {
+    200: "OK", 304: "Not Modified", 400: "Bad Request", 403: "Forbidden",
+    404: "Not Found", 405: "Method Not Allowed", 503: "Service Unavailable",
+}
+
+
+@dataclass
+class RoomSchedule:
+    """Encoded schedule of one room and the devices waiting for it."""
+
+    name: str
+    sources: List[str]
+    body: bytes = b""
+    gzipped: bytes = b""
+    etag: Optional[str] = None
+    version: int = 0
+    last_modified: Optional[str] = None
+    events: int = 0
+    ready: bool = False
+    changed: asyncio.Event = field(default_factory=asyncio.Event)
+    clients: Set[str] = field(default_factory=set)
+
+    def update(self, events: List[MeetingEvent]) -> bool:
+        """
+        Encode the room's events and wake waiting devices if they changed.
+
+        Args:
+            events: Merged events of the room's calendars
+
+        Returns:
+            True if the schedule changed
+        """
+        events = sorted(events, key=lambda e: (e.start_ts, e.uid, e.recurrence_id or ""))
+        body = json.dumps(
+            {"room": self.name, "events": [event_to_dict(event) for event in events]},
+            separators=(",", ":"), ensure_ascii=False,
+        ).encode("utf-8")
+        etag = f'"{hashlib.sha256(body).hexdigest()[:20]}"'
+        if etag == self.etag:
+            return False
+
+        self.body = body
+        self.gzipped = gzip.compress(body, compresslevel=6)
+        self.etag = etag
+        self.version += 1
+        self.events = len(events)
+        self.last_modified = formatdate(usegmt=True)
+        # Wake everyone waiting on the old version, new waiters get a fresh event
+        self.changed.set()
+        self.changed = asyncio.Event()
+        return True
+
+
+class CalendarProxy:
+    """Syncs the fleet's calendars once and serves per-room schedules."""
+
+    def __init__(
+        self,
+        federation: CalendarFederation,
+        rooms: Dict[str, List[str]],
+        host: str = "0.0.0.0",
+        port: int = 8768,
+        token: Optional[str] = None,
+        sync_interval: float = 60.0,
+        horizon_hours: float = 48.0,
+        max_wait: float = 300.0
+    ):
+        """
+        Initialize proxy.
+
+        Args:
+            federation: Federation of all distinct upstream calendars
+            rooms: Room name -> names of the federation sources of that room
+            host: Bind address
+            port: TCP port (0: any free port)
+            token: Shared secret expected as ?token= or X-Notify-Token header
+            sync_interval: Seconds between upstream syncs
+            horizon_hours: Serve events within this many hours from now
+            max_wait: Longest long-poll hold in seconds
+        """
+        self.federation = federation
+        self.rooms = {name: RoomSchedule(name, sources) for name, sources in rooms.items()}
+        self.host = host
+        self.port = port
+        self.token = token
+        self.sync_interval = sync_interval
+        self.horizon = timedelta(hours=horizon_hours)
+        self.max_wait = max_wait
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._handlers: Set[asyncio.Task] = set()
+        self._sync_task: Optional[asyncio.Task] = None
+        self._sync_lock = asyncio.Lock()
+
+        # Statistics
+        self.syncs = 0
+        self.last_sync: Optional[datetime] = None
+        self.last_sync_ms: Optional[float] = None
+        self.requests = 0
+        self.not_modified = 0
+        self.bytes_sent = 0
+        self.waiting = 0
+
+    async def start(self):
+        """Serve cached schedules, start listening and start syncing."""
+        cached = await asyncio.to_thread(self.federation.load_cached, *self._window())
+        if cached:
+            self._update_rooms()
+            logger.info(f"Warm start: {len(cached)} cached event(s)")
+
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._sync_task = asyncio.create_task(self._sync_loop(), name="calendar-proxy-sync")
+        logger.info(
+            f"Calendar proxy listening on http://{self.host}:{self.port} "
+            f"({len(self.rooms)} room(s), {len(self.federation.sources)} calendar(s))"
+        )
+
+    async def stop(self):
+        """Stop serving and syncing, close the calendar sources."""
+        if self._sync_task:
+            self._sync_task.cancel()
+            try:
+                await self._sync_task
+            except asyncio.CancelledError:
+                pass
+            self._sync_task = None
+        if self._server:
+            self._server.close()
+            # Idle keep-alive and held long-poll connections would keep the server open
+            handlers = list(self._handlers)
+            for task in handlers:
+                task.cancel()
+            await asyncio.gather(*handlers, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+        await self.federation.close()
+
+    async def _sync_loop(self):
+        """Sync the upstream calendars until cancelled."""
+        while True:
+            await self.sync()
+            await asyncio.sleep(self.sync_interval)
+
+    async def sync(self):
+        """Sync all upstream calendars once and update the room schedules."""
+        async with self._sync_lock:
+            started = time.perf_counter()
+            try:
+                await self.federation.sync(*self._window())
+            except Exception as e:
+                logger.error(f"Calendar proxy sync failed: {e}", exc_info=True)
+                return
+            finally:
+                self.syncs += 1
+                self.last_sync_ms = round((time.perf_counter() - started) * 1000, 1)
+
+            changed = self._update_rooms()
+            self.last_sync = datetime.now()
+            if changed:
+                logger.info(f"Schedule changed for: {', '.join(changed)}")
+
+    def _window(self) -> Tuple[datetime, datetime]:
+        """Date range of the served events."""
+        start = datetime.now()
+        return start, start + self.horizon
+
+    def _update_rooms(self) -> List[str]:
+        """Rebuild the room schedules from the synced events; returns the changed rooms."""
+        sources = {source.name: source for source in self.federation.sources}
+        changed = []
+        for room in self.rooms.values():
+            if room.update(self.federation.merged_events(room.sources)):
+                changed.append(room.name)
+            # Serve a room once all its calendars were synced (or had cached events)
+            room.ready = all(
+                sources[name].last_sync or sources[name].events for name in room.sources
+            )
+        return changed
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve HTTP/1.1 requests of one connection (keep-alive)."""
+        peer = writer.get_extra_info("peername")
+        client = peer[0] if peer else "?"
+        task = asyncio.current_task()
+        self._handlers.add(task)
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                method, target, headers = request
+                status, body, extra = await self._dispatch(method, target, headers, client)
+
+                close = headers.get("connection", "").lower() == "close"
+                lines = [f"HTTP/1.1 {status} {_REASONS.get(status, 'Error')}"]
+                lines += [f"{name}: {value}" for name, value in extra.items()]
+                lines.append(f"Content-Length: {len(body)}")
+                if close:
+                    lines.append("Connection: close")
+                writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+                await writer.drain()
+                self.bytes_sent += len(body)
+                if close:
+                    break
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except asyncio.CancelledError:
+            # Proxy stopping: end the connection quietly
+            pass
+        except Exception as e:
+            logger.debug(f"Proxy request failed: {e}")
+        finally:
+            self._handlers.discard(task)
+            writer.close()
+
+    async def _read_request(
+        self, reader: asyncio.StreamReader
+    ) -> Optional[Tuple[str, str, Dict[str, str]]]:
+        """Read one request head; None when the client closed an idle connection."""
+        line = await asyncio.wait_for(reader.readline(), self.max_wait + 60)
+        if not line:
+            return None
+        parts = line.decode("latin-1").split()
+        if len(parts) < 2:
+            raise ValueError("Malformed request line")
+
+        headers: Dict[str, str] = {}
+        while True:
+            header = (await asyncio.wait_for(reader.readline(), 10)).decode("latin-1").strip()
+            if not header:
+                break
+            name, _, value = header.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        # Devices only send GETs; drain a body anyway to keep the connection usable
+        length = int(headers.get("content-length", "0") or 0)
+        if length:
+            await asyncio.wait_for(reader.readexactly(min(length, 64 * 1024)), 10)
+        return parts[0], parts[1], headers
+
+    async def _dispatch(
+        self,
+        method: str,
+        target: str,
+        headers: Dict[str, str],
+        client: str
+    ) -> Tuple[int, bytes, Dict[str, str]]:
+        """Answer one request; returns status, body and extra headers."""
+        self.requests += 1
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+        if method != "GET":
+            return 405, b"", {}
+
+        provided = headers.get(TOKEN_HEADER.lower()) or query.get("token", [None])[0]
+        if not token_matches(self.token, provided):
+            return 403, b"", {}
+
+        json_headers = {"Content-Type": "application/json", "Cache-Control": "no-cache"}
+        if url.path.rstrip("/") == "/health":
+            return 200, json.dumps(self.get_stats()).encode(), json_headers
+
+        match = _ROOM_PATH.match(url.path)
+        room = self.rooms.get(unquote(match.group(1))) if match else None
+        if room is None:
+            return 404, b"", {}
+        if not room.ready:
+            # Devices sync directly until the proxy has a schedule to offer
+            return 503, b"", {"Retry-After": "30"}
+        room.clients.add(client)
+
+        try:
+            wait = min(float(query.get("wait", ["0"])[0]), self.max_wait)
+        except ValueError:
+            wait = 0.0
+        if headers.get("if-none-match") == room.etag:
+            changed = wait > 0 and await self._wait_for_change(room, wait)
+            if not changed:
+                self.not_modified += 1
+                return 304, b"", {"ETag": room.etag}
+
+        extra = {**json_headers, "ETag": room.etag, "Last-Modified": room.last_modified}
+        if match.group(2) == "changes":
+            return 200, json.dumps({"version": room.version}).encode(), extra
+
+        if "gzip" in headers.get("accept-encoding", ""):
+            extra["Content-Encoding"] = "gzip"
+            return 200, room.gzipped, extra
+        return 200, room.body, extra
+
+    async def _wait_for_change(self, room: RoomSchedule, timeout: float) -> bool:
+        """Hold a long-poll request until the room's schedule changes."""
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(room.changed.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self.waiting -= 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get proxy statistics.
+
+        Returns:
+            Dictionary with upstream sync, request and per-room details
+        """
+        return {
+            "syncs": self.syncs,
+            "last_sync": self.last_sync.isoformat() if self.last_sync else None,
+            "last_sync_ms": self.last_sync_ms,
+            "upstream_requests": sum(
+                source.client.metrics.requests for source in self.federation.sources
+            ),
+            "requests": self.requests,
+            "not_modified": self.not_modified,
+            "bytes_sent": self.bytes_sent,
+            "waiting": self.waiting,
+            "rooms": {
+                room.name: {
+                    "ready": room.ready,
+                    "events": room.events,
+                    "version": room.version,
+                    "bytes": len(room.gzipped),
+                    "devices": len(room.clients),
+                }
+                for room in self.rooms.values()
+            },
+            "sources": self.federation.get_status(),
+        }
+
+
+def create_calendar_proxy(config: AppConfig) -> CalendarProxy:
+    """
+    Factory function to create the proxy from configuration.
+
+    Every room syncs its calendar (calendar_name, defaults to the room name)
+    plus its calendar_sources. A calendar used by several rooms is synced
+    once. Credentials default to the main CalDAV settings.
+
+    Args:
+        config: Application configuration (caldav and proxy sections)
+
+    Returns:
+        CalendarProxy instance
+
+    Raises:
+        ValueError: No rooms configured
+    """
+    proxy_config = config.proxy
+    caldav = config.caldav
+    if not proxy_config.rooms:
+        raise ValueError("No rooms configured for the calendar proxy (CALENDAR_PROXY_ROOMS_FILE)")
+
+    sources: List[CalendarSourceConfig] = []
+    by_key: Dict[Tuple, str] = {}
+    rooms: Dict[str, List[str]] = {}
+    for room in proxy_config.rooms:
+        room_sources = [CalendarSourceConfig(name=room.name, calendar_name=room.calendar_name or room.name)]
+        room_sources += [
+            source.model_copy(update={"name": f"{room.name}/{source.name}"})
+            for source in room.calendar_sources
+        ]
+        names = []
+        for source in room_sources:
+            key = _source_key(source, config)
+            if key not in by_key:
+                by_key[key] = source.name
+                sources.append(source)
+            names.append(by_key[key])
+        rooms[room.name] = names
+
+    store_dir = Path(proxy_config.event_store_dir) if proxy_config.event_store_dir else None
+
+    def store_factory(name: str) -> EventStore:
+        if not store_dir:
+            return EventStore()
+        try:
+            return SQLiteEventStore(store_dir / f"{re.sub(r'[^A-Za-z0-9_-]+', '_', name)}.db")
+        except Exception as e:
+            logger.error(f"Failed to open event store for '{name}', using memory only: {e}")
+            return EventStore()
+
+    federation = create_calendar_federation(
+        caldav.model_copy(update={"sources": sources}),
+        store_factory,
+        include_primary=False,
+    )
+    logger.info(f"Calendar proxy: {len(rooms)} room(s) on {len(sources)} distinct calendar(s)")
+
+    return CalendarProxy(
+        federation,
+        rooms,
+        host=proxy_config.host,
+        port=proxy_config.port,
+        token=proxy_config.token,
+        sync_interval=proxy_config.sync_interval_seconds,
+        horizon_hours=proxy_config.horizon_hours,
+        max_wait=proxy_config.max_wait_seconds,
+    )
+
+
+def _source_key(source: CalendarSourceConfig, config: AppConfig) -> Tuple:
+    """Identity of an upstream calendar (same server, account and calendar)."""
+    if source.type == "ics":
+        return source.type, source.url, source.username
+    return (
+        source.type,
+        source.url or config.caldav.url,
+        source.username or config.caldav.username,
+        source.calendar_name,
+    )
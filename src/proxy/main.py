@@ -0,0 +1,69 @@
+"""
+RaspberryMeet fleet calendar proxy service.
+
+Syncs the calendars of all rooms once on a central host and serves each
+device its room's schedule (see src/proxy/calendar_proxy.py). Devices use
+it with CALDAV_PROXY_URL and fall back to direct CalDAV when it is down.
+
+Usage:
+    python -m src.proxy.main
+
+Or as systemd service:
+    sudo systemctl start raspberrymeet-calendar-proxy
+"""
+import asyncio
+import signal
+import sys
+
+from src.orchestrator.fleet_proxy import schedule_path
+from src.proxy.calendar_proxy import create_calendar_proxy
+from src.utils.config import load_config
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+
+async def main() -> int:
+    """Calendar proxy entry point."""
+    try:
+        config = load_config()
+    except Exception as e:
+        logger.error(f"Failed to load configuration: {e}", exc_info=True)
+        return 1
+
+    if not config.caldav.url:
+        logger.error("❌ CALDAV_URL not configured - the proxy has no calendar server to sync")
+        return 1
+
+    try:
+        proxy = await asyncio.to_thread(create_calendar_proxy, config)
+    except ValueError as e:
+        logger.error(f"❌ {e}")
+        return 1
+
+    shutdown_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, shutdown_event.set)
+
+    try:
+        await proxy.start()
+        logger.info("✅ Calendar proxy is READY")
+        for room in proxy.rooms:
+            logger.info(f"   {room}: http://<host>:{proxy.port}{schedule_path(room)}")
+        await shutdown_event.wait()
+        logger.info("Shutting down calendar proxy...")
+        return 0
+    except Exception as e:
+        logger.error(f"Fatal error in calendar proxy: {e}", exc_info=True)
+        return 1
+    finally:
+        await proxy.stop()
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(asyncio.run(main()))
+    except KeyboardInterrupt:
+        sys.exit(0)
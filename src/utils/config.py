@@ -3,8 +3,9 @@ Configuration management for RaspberryMeet
 """
 import os
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
+import yaml
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings
@@ -28,6 +29,16 @@ class BigBlueButtonConfig(BaseModel):
     default_username: str = Field(default="RaspberryMeet", description="Default username")
 
 
+class CalendarSourceConfig(BaseModel):
+    """Additional calendar synced alongside the primary CalDAV calendar"""
+    name: str = Field(..., description="Source name (used in logs and status)")
+    type: str = Field(default="caldav", description="Source type: caldav or ics (published .ics / webcal feed)")
+    url: Optional[str] = Field(None, description="CalDAV server URL (defaults to CALDAV_URL) or feed URL")
+    username: Optional[str] = Field(None, description="CalDAV username (defaults to CALDAV_USERNAME)")
+    password: Optional[str] = Field(None, description="CalDAV password (defaults to CALDAV_PASSWORD)")
+    calendar_name: Optional[str] = Field(None, description="Calendar name on that server")
+
+
 class CalDAVConfig(BaseModel):
     """CalDAV calendar configuration"""
     enabled: bool = Field(default=False, description="Enable CalDAV sync")
@@ -35,10 +46,48 @@ class CalDAVConfig(BaseModel):
     username: Optional[str] = Field(None, description="CalDAV username")
     password: Optional[str] = Field(None, description="CalDAV password")
     calendar_name: str = Field(default="Meetings", description="Calendar name")
+    ics_url: Optional[str] = Field(None, description="Published .ics / webcal feed used as main calendar instead of CalDAV")
     sync_interval_minutes: int = Field(default=5, description="Sync interval")
     auto_join_enabled: bool = Field(default=True, description="Enable automatic meeting joins")
     join_before_minutes: int = Field(default=2, description="Join meeting X minutes before start")
-    check_interval_seconds: int = Field(default=30, description="Check for upcoming meetings every X seconds")
+    check_interval_seconds: int = Field(
+        default=0,
+        description="Extra sweep for missed joins every X seconds (0: off, join timers fire at the join time)",
+    )
+    sync_mode: str = Field(default="incremental", description="Sync mode: incremental (sync-collection) or full (date search)")
+    multiget_batch_size: int = Field(default=100, description="Maximum events fetched per calendar-multiget request")
+    event_store_path: str = Field(
+        default=str(PROJECT_ROOT / "data" / "calendar-events.db"),
+        description="SQLite file for the persistent event store (empty: memory only)",
+    )
+    transport: str = Field(default="httpx", description="HTTP client for sync requests: httpx (async, pooled) or caldav")
+    timeout_seconds: float = Field(default=30.0, description="CalDAV request timeout")
+    expand_mode: str = Field(default="local", description="Recurrence expansion: local (cached rule evaluation) or server (CalDAV expand)")
+    partial_retrieval: bool = Field(default=True, description="Only request the event properties that are used")
+    sources: List[CalendarSourceConfig] = Field(default_factory=list, description="Additional calendars to merge")
+    max_parallel_sources: int = Field(default=3, description="Calendars synced in parallel")
+    source_timeout_seconds: float = Field(default=60.0, description="Give up on a calendar sync after X seconds")
+    parse_workers: int = Field(default=0, description="Processes for bulk iCalendar parsing (0: CPU cores - 1, 1: no pool)")
+    parse_pool_threshold: int = Field(default=200, description="Parse in the process pool from this many objects per sync")
+    resolve_meeting_urls: bool = Field(default=True, description="Follow meeting URL redirects in the background before the join")
+    url_cache_ttl_minutes: float = Field(default=60.0, description="Reuse a resolved meeting URL for X minutes")
+    url_cache_negative_ttl_minutes: float = Field(default=5.0, description="Retry a meeting URL that could not be resolved after X minutes")
+    sync_policy: str = Field(default="adaptive", description="Sync scheduling: adaptive (back off when quiet, sync often before meetings) or fixed")
+    sync_min_interval_minutes: float = Field(default=1.0, description="Sync interval shortly before a meeting")
+    sync_max_interval_minutes: float = Field(default=30.0, description="Longest sync interval while the calendar is quiet")
+    sync_lead_fraction: float = Field(default=0.1, description="Sync interval cap as a fraction of the time until the next meeting join")
+    sync_jitter: float = Field(default=0.2, description="Random spread of sync intervals (0.2: +-20 %)")
+    sync_startup_jitter_seconds: float = Field(default=120.0, description="Random delay of the first sync after a warm start")
+    push_enabled: bool = Field(default=True, description="Sync on calendar change notifications")
+    push_receiver_host: str = Field(default="127.0.0.1", description="Bind address of the local notification receiver")
+    push_receiver_port: int = Field(default=8766, description="Port of the local notification receiver (0: disabled)")
+    push_token: Optional[str] = Field(None, description="Shared secret for change notifications")
+    push_longpoll_url: Optional[str] = Field(None, description="HTTP long-poll URL that signals calendar changes")
+    push_public_url: Optional[str] = Field(None, description="Notify URL of the web app for WebDAV-Push subscriptions")
+    push_fallback_interval_minutes: float = Field(default=30.0, description="Polling interval while change notifications work")
+    proxy_url: Optional[str] = Field(None, description="Fleet calendar proxy to fetch the schedule from (direct CalDAV as fallback)")
+    proxy_room: Optional[str] = Field(None, description="Room name on the calendar proxy (defaults to the calendar name)")
+    proxy_token: Optional[str] = Field(None, description="Shared secret of the calendar proxy")
 
 
 class WebConfig(BaseModel):
@@ -50,6 +99,9 @@ class WebConfig(BaseModel):
     password: str = Field(default="admin", description="Admin password")
     secret_key: str = Field(default="change-me", description="JWT secret key")
     headless_browser: bool = Field(default=False, description="Run browser in headless mode")
+    preview_max_fps: float = Field(default=2.0, description="Maximum frame rate of the live kiosk preview")
+    preview_jpeg_quality: int = Field(default=50, description="JPEG quality (0-100) of the live kiosk preview")
+    preview_max_width: int = Field(default=640, description="Maximum width of the live kiosk preview")
 
 
 class GPIOConfig(BaseModel):
@@ -62,6 +114,55 @@ class GPIOConfig(BaseModel):
     status_led_red_pin: int = Field(default=24, description="Red status LED pin")
 
 
+class RoomConfig(BaseModel):
+    """Meeting room configuration for multi-room hosting"""
+    name: str = Field(..., description="Room name (used in logs and status)")
+    room_url: str = Field(..., description="Default BBB room URL for this room")
+    username: Optional[str] = Field(None, description="Display name (defaults to BBB_DEFAULT_USERNAME)")
+    password: Optional[str] = Field(None, description="Room password")
+    calendar_name: Optional[str] = Field(None, description="CalDAV calendar for this room")
+    calendar_sources: List[CalendarSourceConfig] = Field(default_factory=list, description="Additional calendars for this room")
+    window_left: int = Field(default=0, description="Window position (x) on the virtual desktop")
+    window_top: int = Field(default=0, description="Window position (y) on the virtual desktop")
+    window_width: int = Field(default=1920, description="Window width")
+    window_height: int = Field(default=1080, description="Window height")
+    audio_input: Optional[str] = Field(None, description="Microphone label (substring) for this room")
+    audio_output: Optional[str] = Field(None, description="Speaker label (substring) for this room")
+
+
+class ProxyRoomConfig(BaseModel):
+    """Room served by the fleet calendar proxy"""
+    name: str = Field(..., description="Room name requested by the devices")
+    calendar_name: Optional[str] = Field(None, description="CalDAV calendar of the room (defaults to the room name)")
+    calendar_sources: List[CalendarSourceConfig] = Field(default_factory=list, description="Additional calendars for this room")
+
+
+class ProxyConfig(BaseModel):
+    """Fleet calendar proxy configuration"""
+    host: str = Field(default="0.0.0.0", description="Bind address")
+    port: int = Field(default=8768, description="Port")
+    token: Optional[str] = Field(None, description="Shared secret expected from the devices")
+    sync_interval_seconds: float = Field(default=60.0, description="Sync the upstream calendars every X seconds")
+    horizon_hours: float = Field(default=48.0, description="Serve events starting within the next X hours")
+    max_wait_seconds: float = Field(default=300.0, description="Longest long-poll hold")
+    event_store_dir: str = Field(
+        default=str(PROJECT_ROOT / "data" / "calendar-proxy"),
+        description="Directory for the persistent event stores (empty: memory only)",
+    )
+    rooms: List[ProxyRoomConfig] = Field(default_factory=list, description="Rooms served to the devices")
+
+
+class DiagnosticsConfig(BaseModel):
+    """Diagnostics configuration"""
+    join_recorder_enabled: bool = Field(default=True, description="Record join attempts for diagnostics")
+    join_recorder_dir: str = Field(
+        default=str(PROJECT_ROOT / "data" / "join-bundles"),
+        description="Directory for join diagnostics bundles",
+    )
+    join_recorder_max_bundles: int = Field(default=20, description="Number of join bundles to keep")
+    join_recorder_slow_seconds: float = Field(default=45.0, description="Save bundles for joins slower than this")
+
+
 class AppConfig(BaseSettings):
     """Main application configuration"""
 
@@ -82,9 +183,19 @@ class AppConfig(BaseSettings):
     # GPIO
     gpio: GPIOConfig = Field(default_factory=GPIOConfig)
 
+    # Diagnostics
+    diagnostics: DiagnosticsConfig = Field(default_factory=DiagnosticsConfig)
+
+    # Multi-room hosting (empty = single room)
+    rooms: List[RoomConfig] = Field(default_factory=list)
+
+    # Fleet calendar proxy (src/proxy, runs on a central host)
+    proxy: ProxyConfig = Field(default_factory=ProxyConfig)
+
     # Kiosk
     kiosk_mode: bool = Field(default=True, description="Enable kiosk mode")
     auto_join_on_boot: bool = Field(default=False, description="Auto-join on boot")
+    browser_worker: bool = Field(default=False, description="Run browser automation in a supervised worker process")
 
     class Config:
         env_prefix = ""
@@ -92,6 +203,63 @@ class AppConfig(BaseSettings):
         case_sensitive = False
 
 
+def load_rooms_config(path: Path) -> List[RoomConfig]:
+    """
+    Load multi-room configuration from a YAML file.
+
+    Args:
+        path: YAML file with a top-level ``rooms`` list
+
+    Returns:
+        List of RoomConfig (empty if the file does not exist)
+    """
+    if not path.exists():
+        return []
+
+    with open(path) as f:
+        data = yaml.safe_load(f) or {}
+
+    return [RoomConfig(**room) for room in data.get("rooms", [])]
+
+
+def load_calendar_sources(path: Path) -> List[CalendarSourceConfig]:
+    """
+    Load additional calendar sources from a YAML file.
+
+    Args:
+        path: YAML file with a top-level ``sources`` list
+
+    Returns:
+        List of CalendarSourceConfig (empty if the file does not exist)
+    """
+    if not path.exists():
+        return []
+
+    with open(path) as f:
+        data = yaml.safe_load(f) or {}
+
+    return [CalendarSourceConfig(**source) for source in data.get("sources", [])]
+
+
+def load_proxy_rooms(path: Path) -> List[ProxyRoomConfig]:
+    """
+    Load the rooms of the fleet calendar proxy from a YAML file.
+
+    Args:
+        path: YAML file with a top-level ``rooms`` list
+
+    Returns:
+        List of ProxyRoomConfig (empty if the file does not exist)
+    """
+    if not path.exists():
+        return []
+
+    with open(path) as f:
+        data = yaml.safe_load(f) or {}
+
+    return [ProxyRoomConfig(**room) for room in data.get("rooms", [])]
+
+
 def load_config() -> AppConfig:
     """
     Load configuration from environment variables.
@@ -116,10 +284,44 @@ def load_config() -> AppConfig:
         username=os.getenv("CALDAV_USERNAME"),
         password=os.getenv("CALDAV_PASSWORD"),
         calendar_name=os.getenv("CALDAV_CALENDAR_NAME", "Meetings"),
+        ics_url=os.getenv("CALDAV_ICS_URL") or None,
         sync_interval_minutes=int(os.getenv("CALDAV_SYNC_INTERVAL_MINUTES", "5")),
         auto_join_enabled=os.getenv("CALDAV_AUTO_JOIN_ENABLED", "true").lower() == "true",
         join_before_minutes=int(os.getenv("CALDAV_JOIN_BEFORE_MINUTES", "2")),
-        check_interval_seconds=int(os.getenv("CALDAV_CHECK_INTERVAL_SECONDS", "30")),
+        check_interval_seconds=int(os.getenv("CALDAV_CHECK_INTERVAL_SECONDS", "0")),
+        sync_mode=os.getenv("CALDAV_SYNC_MODE", "incremental").lower(),
+        multiget_batch_size=int(os.getenv("CALDAV_MULTIGET_BATCH_SIZE", "100")),
+        event_store_path=os.getenv("CALDAV_EVENT_STORE", str(PROJECT_ROOT / "data" / "calendar-events.db")),
+        transport=os.getenv("CALDAV_TRANSPORT", "httpx").lower(),
+        timeout_seconds=float(os.getenv("CALDAV_TIMEOUT_SECONDS", "30")),
+        expand_mode=os.getenv("CALDAV_EXPAND_MODE", "local"),
+        partial_retrieval=os.getenv("CALDAV_PARTIAL_RETRIEVAL", "true").lower() == "true",
+        sources=load_calendar_sources(
+            Path(os.getenv("CALDAV_SOURCES_FILE", str(PROJECT_ROOT / "config" / "calendar_sources.yaml")))
+        ),
+        max_parallel_sources=int(os.getenv("CALDAV_MAX_PARALLEL_SOURCES", "3")),
+        source_timeout_seconds=float(os.getenv("CALDAV_SOURCE_TIMEOUT_SECONDS", "60")),
+        parse_workers=int(os.getenv("CALDAV_PARSE_WORKERS", "0")),
+        parse_pool_threshold=int(os.getenv("CALDAV_PARSE_POOL_THRESHOLD", "200")),
+        resolve_meeting_urls=os.getenv("CALDAV_RESOLVE_MEETING_URLS", "true").lower() == "true",
+        url_cache_ttl_minutes=float(os.getenv("CALDAV_URL_CACHE_TTL_MINUTES", "60")),
+        url_cache_negative_ttl_minutes=float(os.getenv("CALDAV_URL_CACHE_NEGATIVE_TTL_MINUTES", "5")),
+        sync_policy=os.getenv("CALDAV_SYNC_POLICY", "adaptive"),
+        sync_min_interval_minutes=float(os.getenv("CALDAV_SYNC_MIN_INTERVAL_MINUTES", "1")),
+        sync_max_interval_minutes=float(os.getenv("CALDAV_SYNC_MAX_INTERVAL_MINUTES", "30")),
+        sync_lead_fraction=float(os.getenv("CALDAV_SYNC_LEAD_FRACTION", "0.1")),
+        sync_jitter=float(os.getenv("CALDAV_SYNC_JITTER", "0.2")),
+        sync_startup_jitter_seconds=float(os.getenv("CALDAV_SYNC_STARTUP_JITTER_SECONDS", "120")),
+        push_enabled=os.getenv("CALDAV_PUSH_ENABLED", "true").lower() == "true",
+        push_receiver_host=os.getenv("CALDAV_PUSH_RECEIVER_HOST", "127.0.0.1"),
+        push_receiver_port=int(os.getenv("CALDAV_PUSH_RECEIVER_PORT", "8766")),
+        push_token=os.getenv("CALDAV_PUSH_TOKEN") or None,
+        push_longpoll_url=os.getenv("CALDAV_PUSH_LONGPOLL_URL") or None,
+        push_public_url=os.getenv("CALDAV_PUSH_PUBLIC_URL") or None,
+        push_fallback_interval_minutes=float(os.getenv("CALDAV_PUSH_FALLBACK_INTERVAL_MINUTES", "30")),
+        proxy_url=os.getenv("CALDAV_PROXY_URL") or None,
+        proxy_room=os.getenv("CALDAV_PROXY_ROOM") or None,
+        proxy_token=os.getenv("CALDAV_PROXY_TOKEN") or None,
     )
 
     # Build Web config
@@ -131,6 +333,9 @@ def load_config() -> AppConfig:
         password=os.getenv("WEB_PASSWORD", "admin"),
         secret_key=os.getenv("WEB_SECRET_KEY", "change-me"),
         headless_browser=os.getenv("WEB_HEADLESS_BROWSER", "false").lower() == "true",
+        preview_max_fps=float(os.getenv("WEB_PREVIEW_MAX_FPS", "2")),
+        preview_jpeg_quality=int(os.getenv("WEB_PREVIEW_JPEG_QUALITY", "50")),
+        preview_max_width=int(os.getenv("WEB_PREVIEW_MAX_WIDTH", "640")),
     )
 
     # Build GPIO config
@@ -143,6 +348,33 @@ def load_config() -> AppConfig:
         status_led_red_pin=int(os.getenv("GPIO_STATUS_LED_RED_PIN", "24")),
     )
 
+    # Build diagnostics config
+    diagnostics_config = DiagnosticsConfig(
+        join_recorder_enabled=os.getenv("JOIN_RECORDER_ENABLED", "true").lower() == "true",
+        join_recorder_dir=os.getenv("JOIN_RECORDER_DIR", str(PROJECT_ROOT / "data" / "join-bundles")),
+        join_recorder_max_bundles=int(os.getenv("JOIN_RECORDER_MAX_BUNDLES", "20")),
+        join_recorder_slow_seconds=float(os.getenv("JOIN_RECORDER_SLOW_SECONDS", "45")),
+    )
+
+    # Multi-room hosting
+    rooms = load_rooms_config(
+        Path(os.getenv("ROOMS_CONFIG_FILE", str(PROJECT_ROOT / "config" / "rooms.yaml")))
+    )
+
+    # Fleet calendar proxy
+    proxy_config = ProxyConfig(
+        host=os.getenv("CALENDAR_PROXY_HOST", "0.0.0.0"),
+        port=int(os.getenv("CALENDAR_PROXY_PORT", "8768")),
+        token=os.getenv("CALENDAR_PROXY_TOKEN") or None,
+        sync_interval_seconds=float(os.getenv("CALENDAR_PROXY_SYNC_INTERVAL_SECONDS", "60")),
+        horizon_hours=float(os.getenv("CALENDAR_PROXY_HORIZON_HOURS", "48")),
+        max_wait_seconds=float(os.getenv("CALENDAR_PROXY_MAX_WAIT_SECONDS", "300")),
+        event_store_dir=os.getenv("CALENDAR_PROXY_EVENT_STORE_DIR", str(PROJECT_ROOT / "data" / "calendar-proxy")),
+        rooms=load_proxy_rooms(
+            Path(os.getenv("CALENDAR_PROXY_ROOMS_FILE", str(PROJECT_ROOT / "config" / "calendar_proxy.yaml")))
+        ),
+    )
+
     # Build main config
     config = AppConfig(
         environment=os.getenv("ENVIRONMENT", "development"),
@@ -152,8 +384,12 @@ def load_config() -> AppConfig:
         caldav=caldav_config,
         web=web_config,
         gpio=gpio_config,
+        diagnostics=diagnostics_config,
+        rooms=rooms,
+        proxy=proxy_config,
         kiosk_mode=os.getenv("KIOSK_MODE", "true").lower() == "true",
         auto_join_on_boot=os.getenv("AUTO_JOIN_ON_BOOT", "false").lower() == "true",
+        browser_worker=os.getenv("BROWSER_WORKER", "false").lower() == "true",
     )
 
     return config
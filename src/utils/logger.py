@@ -52,5 +52,18 @@ def setup_logger(
     return logger
 
 
+def get_logger(name: str) -> logging.Logger:
+    """
+    Get a configured logger for a module.
+
+    Args:
+        name: Logger name (usually __name__)
+
+    Returns:
+        Configured logger instance
+    """
+    return setup_logger(name)
+
+
 # Default logger instance
 logger = setup_logger()
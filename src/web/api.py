@@ -8,16 +8,21 @@ from enum import Enum
 from pathlib import Path
 from typing import Optional
 
-from fastapi import Depends, FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse
+import httpx
+from fastapi import Depends, FastAPI, Header, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
 
 from src.orchestrator.browser_controller import BrowserController
+from src.orchestrator.calendar_push import NOTIFY_PATH, TOKEN_HEADER, token_matches
+from src.orchestrator.flight_recorder import create_flight_recorder
+from src.orchestrator.meeting_observer import InMeetingState, handle_remote_end
+from src.orchestrator.screencast import KioskScreencast
 from src.utils.config import load_config
 from src.utils.logger import setup_logger
-from src.web.auth import get_current_user
+from src.web.auth import get_current_user, verify_websocket_credentials
 
 
 logger = setup_logger(__name__)
@@ -32,6 +37,7 @@ class AppState:
         self.meeting_state: MeetingState = MeetingState.IDLE
         self.current_room_url: Optional[str] = None
         self.meeting_start_time: Optional[datetime] = None
+        self.meeting_mirror = InMeetingState()
         self.websocket_connections: list[WebSocket] = []
 
 
@@ -53,6 +59,7 @@ class StatusResponse(BaseModel):
     state: MeetingState
     current_room: Optional[str] = None
     meeting_duration: Optional[int] = None  # seconds
+    meeting: Optional[dict] = None  # live in-meeting state (mute, participants, talking)
     uptime: int
     timestamp: datetime
 
@@ -83,7 +90,15 @@ async def lifespan(app: FastAPI):
         bbb_config=state.config.bbb,
         headless=state.config.web.headless_browser,
         kiosk_mode=False,  # Kiosk mode controlled via config later
+        screencast=KioskScreencast(
+            max_fps=state.config.web.preview_max_fps,
+            jpeg_quality=state.config.web.preview_jpeg_quality,
+            max_width=state.config.web.preview_max_width,
+            max_height=state.config.web.preview_max_width * 9 // 16,
+        ),
+        flight_recorder=create_flight_recorder(state.config.diagnostics),
     )
+    state.browser.set_meeting_state_callback(on_meeting_state_change)
 
     yield
 
@@ -122,15 +137,72 @@ def get_meeting_duration() -> Optional[int]:
     return None
 
 
-async def broadcast_status():
-    """Broadcast status update to all WebSocket connections."""
-    status_data = {
+def get_status_data() -> dict:
+    """Build the status payload sent to WebSocket clients."""
+    return {
         "state": state.meeting_state.value,
         "current_room": state.current_room_url,
         "duration": get_meeting_duration(),
+        "meeting": state.meeting_mirror.to_dict(),
         "timestamp": datetime.now().isoformat(),
     }
 
+
+async def on_meeting_state_change(changes: dict):
+    """Apply in-meeting state pushed by the browser and stream it to clients."""
+    if not state.meeting_mirror.apply(changes):
+        return
+
+    handle_remote_end(changes, leave_ended_meeting)
+    await broadcast_status()
+
+
+async def leave_ended_meeting():
+    """Leave a meeting that was ended remotely (off the ended-meeting page)."""
+    if state.meeting_state != MeetingState.ACTIVE:
+        return
+    logger.info("Meeting ended remotely - leaving")
+    await leave_current_meeting()
+
+
+async def leave_current_meeting() -> JoinResponse:
+    """Leave the active meeting and update the shared state."""
+    # Update state
+    state.meeting_state = MeetingState.LEAVING
+    await broadcast_status()
+
+    try:
+        logger.info("Leaving meeting")
+        await state.browser.leave_meeting()
+
+        state.meeting_state = MeetingState.IDLE
+        state.current_room_url = None
+        state.meeting_start_time = None
+        state.meeting_mirror.reset()
+        await broadcast_status()
+
+        return JoinResponse(
+            success=True,
+            message="Successfully left meeting",
+            state=state.meeting_state,
+        )
+
+    except Exception as e:
+        logger.error(f"Error leaving meeting: {e}", exc_info=True)
+        state.meeting_state = MeetingState.ERROR
+        await broadcast_status()
+
+        return JoinResponse(
+            success=False,
+            message=f"Error: {str(e)}",
+            state=state.meeting_state,
+        )
+
+
+async def broadcast_status():
+    """Broadcast status update to all WebSocket connections."""
+    status_data = get_status_data()
+
     # Send to all connected clients
     disconnected = []
     for ws in state.websocket_connections:
@@ -173,6 +245,7 @@ async def get_status(username: str = Depends(get_current_user)) -> StatusRespons
         state=state.meeting_state,
         current_room=state.current_room_url,
         meeting_duration=get_meeting_duration(),
+        meeting=state.meeting_mirror.to_dict(),
         uptime=0,  # TODO: Track actual uptime
         timestamp=datetime.now(),
     )
@@ -202,6 +275,7 @@ async def join_meeting(
     # Update state
     state.meeting_state = MeetingState.JOINING
     state.current_room_url = request.room_url or state.config.bbb.default_room_url
+    state.meeting_mirror.reset()
     await broadcast_status()
 
     try:
@@ -266,35 +340,7 @@ async def leave_meeting(username: str = Depends(get_current_user)) -> JoinRespon
             state=state.meeting_state,
         )
 
-    # Update state
-    state.meeting_state = MeetingState.LEAVING
-    await broadcast_status()
-
-    try:
-        logger.info("Leaving meeting")
-        await state.browser.leave_meeting()
-
-        state.meeting_state = MeetingState.IDLE
-        state.current_room_url = None
-        state.meeting_start_time = None
-        await broadcast_status()
-
-        return JoinResponse(
-            success=True,
-            message="Successfully left meeting",
-            state=state.meeting_state,
-        )
-
-    except Exception as e:
-        logger.error(f"Error leaving meeting: {e}", exc_info=True)
-        state.meeting_state = MeetingState.ERROR
-        await broadcast_status()
-
-        return JoinResponse(
-            success=False,
-            message=f"Error: {str(e)}",
-            state=state.meeting_state,
-        )
+    return await leave_current_meeting()
 
 
 @app.post("/api/meeting/join-default")
@@ -338,12 +384,7 @@ async def websocket_status(websocket: WebSocket):
 
     try:
         # Send initial status
-        await websocket.send_json({
-            "state": state.meeting_state.value,
-            "current_room": state.current_room_url,
-            "duration": get_meeting_duration(),
-            "timestamp": datetime.now().isoformat(),
-        })
+        await websocket.send_json(get_status_data())
 
         # Keep connection alive and handle incoming messages
         while True:
@@ -360,6 +401,90 @@ async def websocket_status(websocket: WebSocket):
             state.websocket_connections.remove(websocket)
 
 
+@app.websocket("/ws/preview")
+async def websocket_preview(websocket: WebSocket):
+    """
+    WebSocket endpoint for the live kiosk preview.
+
+    Each message is a base64-encoded JPEG frame. The screencast only runs
+    while at least one client is connected. The frames show the running
+    meeting, so the handshake needs the web interface credentials.
+    """
+    if not verify_websocket_credentials(websocket.headers.get("authorization")):
+        logger.warning("Preview WebSocket rejected: missing or invalid credentials")
+        await websocket.close(code=1008, reason="Authentication required")
+        return
+
+    await websocket.accept()
+
+    async def send_frame(frame: str):
+        await websocket.send_text(frame)
+
+    if not state.browser or not await state.browser.add_preview_viewer(send_frame):
+        await websocket.close(code=1013, reason="Browser not running")
+        return
+
+    logger.info("Preview viewer connected")
+
+    try:
+        while True:
+            await websocket.receive_text()
+
+    except WebSocketDisconnect:
+        logger.info("Preview viewer disconnected")
+    except Exception as e:
+        logger.error(f"Preview WebSocket error: {e}")
+    finally:
+        await state.browser.remove_preview_viewer(send_frame)
+
+
+@app.get("/api/preview/stats")
+async def get_preview_stats(username: str = Depends(get_current_user)):
+    """
+    Get live preview screencast statistics.
+
+    Returns:
+        Frame counters, viewer count and screencast settings
+    """
+    return state.browser.screencast.get_stats() if state.browser else {"active": False}
+
+
+@app.post("/api/calendar/notify", status_code=202)
+async def notify_calendar_change(
+    token: Optional[str] = None,
+    x_notify_token: Optional[str] = Header(None),
+):
+    """
+    Receive a calendar change notification (webhook or WebDAV-Push message).
+
+    Authenticated with CALDAV_PUSH_TOKEN (query parameter or X-Notify-Token
+    header) instead of the admin login, so CalDAV servers and push services
+    can call it. Forwarded to the orchestrator's local notification receiver,
+    which triggers one incremental sync.
+
+    Returns:
+        Empty 202 response
+    """
+    caldav = state.config.caldav
+    if not caldav.push_enabled or not caldav.push_token or not caldav.push_receiver_port:
+        raise HTTPException(status_code=404, detail="Change notifications not configured")
+    if not token_matches(caldav.push_token, x_notify_token or token):
+        raise HTTPException(status_code=403, detail="Invalid notification token")
+
+    host = "127.0.0.1" if caldav.push_receiver_host in ("0.0.0.0", "") else caldav.push_receiver_host
+    try:
+        async with httpx.AsyncClient(timeout=5.0) as client:
+            await client.post(
+                f"http://{host}:{caldav.push_receiver_port}{NOTIFY_PATH}",
+                headers={TOKEN_HEADER: caldav.push_token, "X-Notify-Channel": "web"},
+            )
+    except httpx.HTTPError as e:
+        logger.warning(f"Could not forward calendar notification: {e}")
+        raise HTTPException(status_code=503, detail="Orchestrator not reachable")
+
+    return Response(status_code=202)
+
+
 @app.get("/health")
 async def health_check():
     """
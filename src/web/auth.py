@@ -1,6 +1,8 @@
 """
 Authentication and authorization for the web interface.
 """
+import base64
+import binascii
 import hashlib
 import secrets
 from typing import Optional
@@ -116,3 +118,31 @@ async def get_current_user(username: str = Depends(verify_credentials)) -> str:
         Username
     """
     return username
+
+
+def verify_websocket_credentials(authorization: Optional[str]) -> Optional[str]:
+    """
+    Verify the HTTP Basic Auth header of a WebSocket handshake.
+
+    Browsers send the credentials of the page along with the handshake.
+
+    Args:
+        authorization: Value of the Authorization header
+
+    Returns:
+        Username if authenticated, None otherwise
+    """
+    scheme, _, encoded = (authorization or "").partition(" ")
+    if scheme.lower() != "basic" or not encoded:
+        return None
+    try:
+        username, separator, password = base64.b64decode(encoded).decode("utf-8").partition(":")
+    except (binascii.Error, UnicodeDecodeError):
+        return None
+    if not separator:
+        return None
+
+    try:
+        return verify_credentials(HTTPBasicCredentials(username=username, password=password))
+    except HTTPException:
+        return None